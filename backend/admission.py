@@ -0,0 +1,492 @@
+# -------------------------------------------------------------------------
+# File: admission.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/admission.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module implements admission control and load shedding for the MRCA
+# backend. Downstream capacity (LLM rate limits, the retrieval pool, the Neo4j
+# connection pool) is small, so unbounded concurrent requests all slow down
+# together until they time out. The admission controller bounds the number of
+# requests processed at once, holds a bounded number of additional requests in
+# a wait queue for a limited time, and rejects everything else immediately with
+# 503 Service Unavailable and a Retry-After hint.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: AdmissionMetrics - Counters and recent wait times for monitoring
+# - Class: AdmissionRejectedError - Raised when a request is shed
+# - Class: AdmissionController - Concurrency semaphore with a bounded wait queue
+# - Class: AdmissionControlMiddleware - ASGI middleware applying admission control to API paths
+# - Function: get_admission_controller() - Singleton accessor configured from BackendConfig
+# - Global Variables: _admission_controller, _admission_lock - Thread-safe singleton
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - asyncio: Concurrency semaphore and queue wait timeouts
+#   - logging: Load shedding logging
+#   - math: Retry-After rounding
+#   - time: Wait and service time measurement
+#   - collections.deque: Bounded window of recent wait times
+#   - contextlib.asynccontextmanager: admit() context manager
+#   - dataclasses: Metrics data structure
+#   - threading.Lock: Thread-safe singleton creation
+#   - typing: Type hints (Any, Dict, Iterable, Optional)
+# - Third-Party:
+#   - fastapi.responses.JSONResponse: 503 responses from the middleware
+# - Local Project Modules:
+#   - .config.get_config: Admission limits from BackendConfig
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# main.py installs AdmissionControlMiddleware for the response generation
+# endpoints and reports get_admission_controller().get_stats() from
+# /parallel_hybrid/health. Health and documentation endpoints are never
+# queued or shed.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Admission Control and Load Shedding for the MRCA API
+
+Bounds concurrent request processing, queues a limited number of requests for a
+limited time, and sheds the rest with 503 + Retry-After.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional
+
+# Third-party library imports
+from fastapi.responses import JSONResponse
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .config import get_config
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from config import get_config
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Number of recent queue wait times kept for percentile reporting
+WAIT_TIME_WINDOW = 1000
+
+# Upper bound for the Retry-After hint in seconds
+MAX_RETRY_AFTER_SECONDS = 120
+
+# Global admission controller instance and thread lock for singleton pattern
+_admission_controller: Optional['AdmissionController'] = None
+_admission_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class AdmissionMetrics
+@dataclass
+class AdmissionMetrics:
+    """Metrics tracking for admission control.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        admitted (int): Requests admitted for processing.
+        admitted_immediately (int): Requests admitted without waiting in the queue.
+        rejected_queue_full (int): Requests shed because the wait queue was full.
+        rejected_queue_timeout (int): Requests shed after waiting max_queue_wait_seconds.
+        peak_queue_depth (int): Largest observed wait queue depth.
+        avg_service_seconds (float): Exponential moving average of slot hold time.
+        recent_waits_ms (deque): Queue wait times of recently admitted requests.
+
+    Methods:
+        None (dataclass with automatic methods)
+    """
+    admitted: int = 0
+    admitted_immediately: int = 0
+    rejected_queue_full: int = 0
+    rejected_queue_timeout: int = 0
+    peak_queue_depth: int = 0
+    avg_service_seconds: float = 0.0
+    recent_waits_ms: deque = field(default_factory=lambda: deque(maxlen=WAIT_TIME_WINDOW))
+# ------------------------------------------------------------------------- end class AdmissionMetrics
+
+# ------------------------------------------------------------------------- class AdmissionRejectedError
+class AdmissionRejectedError(Exception):
+    """Exception raised when a request is shed by admission control.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        reason (str): "queue_full" or "queue_timeout".
+        retry_after_seconds (int): Suggested client back-off for the Retry-After header.
+
+    Methods:
+        Inherits from Exception
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, reason: str, retry_after_seconds: int) -> None:
+        """Initialize AdmissionRejectedError with the rejection reason.
+
+        Args:
+            reason (str): Why the request was shed.
+            retry_after_seconds (int): Suggested client back-off in seconds.
+        """
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"Server busy ({reason}). Retry in {retry_after_seconds}s"
+        )
+    # ------------------------------------------------------------------------- end __init__()
+
+# ------------------------------------------------------------------------- end class AdmissionRejectedError
+
+# ------------------------------------------------------------------------- class AdmissionController
+class AdmissionController:
+    """Bounded concurrency with a bounded, time-limited wait queue.
+
+    Up to max_concurrent requests are processed at once. Up to max_queue_size
+    more wait for a slot, each for at most max_queue_wait_seconds. A request
+    arriving while the queue is full, or one that waits too long, is rejected
+    with AdmissionRejectedError so the API can answer 503 immediately instead
+    of letting every request time out together.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        max_concurrent (int): Maximum requests processed concurrently.
+        max_queue_size (int): Maximum requests waiting for a slot.
+        max_queue_wait_seconds (float): Maximum time a request waits for a slot.
+        retry_after_seconds (int): Minimum Retry-After hint for rejected requests.
+        metrics (AdmissionMetrics): Counters and recent wait times.
+        _semaphore (asyncio.Semaphore): Processing slots.
+        _active (int): Requests currently holding a slot.
+        _waiting (int): Requests currently queued.
+
+    Methods:
+        admit(): Async context manager holding a processing slot.
+        acquire(): Wait for a processing slot or raise AdmissionRejectedError.
+        release(): Return a processing slot.
+        get_stats(): Queue depth, in-flight count and wait-time metrics.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, max_concurrent: int = 8, max_queue_size: int = 32,
+                 max_queue_wait_seconds: float = 15.0, retry_after_seconds: int = 5) -> None:
+        """Initialize the admission controller.
+
+        Args:
+            max_concurrent (int): Maximum requests processed concurrently. Defaults to 8.
+            max_queue_size (int): Maximum requests waiting for a slot. Defaults to 32.
+            max_queue_wait_seconds (float): Maximum time a request waits for a slot. Defaults to 15.0.
+            retry_after_seconds (int): Minimum Retry-After hint in seconds. Defaults to 5.
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue_size = max(0, max_queue_size)
+        self.max_queue_wait_seconds = max(0.0, max_queue_wait_seconds)
+        self.retry_after_seconds = max(1, retry_after_seconds)
+        self.metrics = AdmissionMetrics()
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._active = 0
+        self._waiting = 0
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+
+    # ------------------------------------------------------------------------- _estimate_retry_after()
+    def _estimate_retry_after(self) -> int:
+        """Estimate when a slot is likely to free up for a rejected client.
+
+        Uses the average slot hold time scaled by the queue ahead of the client,
+        never less than the configured retry_after_seconds.
+
+        Returns:
+            int: Retry-After hint in whole seconds.
+        """
+        backlog = (self._waiting + 1) / self.max_concurrent
+        estimate = math.ceil(self.metrics.avg_service_seconds * backlog)
+        return min(MAX_RETRY_AFTER_SECONDS, max(self.retry_after_seconds, estimate))
+    # ------------------------------------------------------------------------- end _estimate_retry_after()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- acquire()
+    async def acquire(self) -> float:
+        """Wait for a processing slot.
+
+        Returns:
+            float: Time spent waiting in the queue, in milliseconds.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait exceeded
+                                    max_queue_wait_seconds.
+        """
+        start_time = time.time()
+
+        if self._active < self.max_concurrent and not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._active += 1
+            self.metrics.admitted += 1
+            self.metrics.admitted_immediately += 1
+            self.metrics.recent_waits_ms.append(0.0)
+            return 0.0
+
+        if self._waiting >= self.max_queue_size:
+            self.metrics.rejected_queue_full += 1
+            retry_after = self._estimate_retry_after()
+            logger.warning(f"⚠️ Load shedding: queue full ({self._waiting} waiting), Retry-After {retry_after}s")
+            raise AdmissionRejectedError("queue_full", retry_after)
+
+        self._waiting += 1
+        self.metrics.peak_queue_depth = max(self.metrics.peak_queue_depth, self._waiting)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_queue_wait_seconds)
+        except asyncio.TimeoutError:
+            self.metrics.rejected_queue_timeout += 1
+            retry_after = self._estimate_retry_after()
+            logger.warning(
+                f"⚠️ Load shedding: queued {self.max_queue_wait_seconds:.1f}s without a slot, "
+                f"Retry-After {retry_after}s"
+            )
+            raise AdmissionRejectedError("queue_timeout", retry_after)
+        finally:
+            self._waiting -= 1
+
+        wait_ms = (time.time() - start_time) * 1000
+        self._active += 1
+        self.metrics.admitted += 1
+        self.metrics.recent_waits_ms.append(wait_ms)
+        return wait_ms
+    # ------------------------------------------------------------------------- end acquire()
+
+    # ------------------------------------------------------------------------- release()
+    def release(self, service_seconds: Optional[float] = None) -> None:
+        """Return a processing slot.
+
+        Args:
+            service_seconds (Optional[float]): How long the slot was held, used for
+                                               Retry-After estimates. Defaults to None.
+        """
+        self._active -= 1
+        self._semaphore.release()
+        if service_seconds is not None:
+            if self.metrics.avg_service_seconds == 0.0:
+                self.metrics.avg_service_seconds = service_seconds
+            else:
+                self.metrics.avg_service_seconds = 0.8 * self.metrics.avg_service_seconds + 0.2 * service_seconds
+    # ------------------------------------------------------------------------- end release()
+
+    # ------------------------------------------------------------------------- admit()
+    @asynccontextmanager
+    async def admit(self):
+        """Hold a processing slot for the duration of the block.
+
+        Yields:
+            float: Time spent waiting in the queue, in milliseconds.
+
+        Raises:
+            AdmissionRejectedError: If the request is shed.
+
+        Examples:
+            >>> async with get_admission_controller().admit():
+            ...     await handle_request()
+        """
+        wait_ms = await self.acquire()
+        service_start = time.time()
+        try:
+            yield wait_ms
+        finally:
+            self.release(time.time() - service_start)
+    # ------------------------------------------------------------------------- end admit()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, in-flight count and wait-time metrics.
+
+        Returns:
+            Dict[str, Any]: Limits, current load, counters and wait-time percentiles.
+
+        Examples:
+            >>> stats = get_admission_controller().get_stats()
+            >>> print(f"Queue depth: {stats['queue_depth']}, p95 wait: {stats['wait_ms_p95']}ms")
+        """
+        waits = sorted(self.metrics.recent_waits_ms)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))], 1)
+
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue_size": self.max_queue_size,
+            "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            "in_flight": self._active,
+            "queue_depth": self._waiting,
+            "peak_queue_depth": self.metrics.peak_queue_depth,
+            "admitted": self.metrics.admitted,
+            "admitted_immediately": self.metrics.admitted_immediately,
+            "rejected_queue_full": self.metrics.rejected_queue_full,
+            "rejected_queue_timeout": self.metrics.rejected_queue_timeout,
+            "wait_ms_avg": round(sum(waits) / len(waits), 1) if waits else 0.0,
+            "wait_ms_p50": percentile(0.50),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": round(waits[-1], 1) if waits else 0.0,
+            "avg_service_seconds": round(self.metrics.avg_service_seconds, 3),
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class AdmissionController
+
+# ------------------------------------------------------------------------- class AdmissionControlMiddleware
+class AdmissionControlMiddleware:
+    """ASGI middleware applying admission control to selected API paths.
+
+    Implemented as plain ASGI middleware (not BaseHTTPMiddleware) so that a
+    streaming response keeps its processing slot until the last byte is sent.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        app: The wrapped ASGI application.
+        paths (frozenset): Request paths subject to admission control.
+
+    Methods:
+        __call__(): ASGI entry point.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, app, paths: Iterable[str]) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            paths (Iterable[str]): Request paths subject to admission control.
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- __call__()
+    async def __call__(self, scope, receive, send) -> None:
+        """Admit, queue or shed the request before passing it to the application."""
+        controller = get_admission_controller()
+        if scope["type"] != "http" or scope["path"] not in self.paths or controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with controller.admit():
+                await self.app(scope, receive, send)
+        except AdmissionRejectedError as e:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": str(e), "reason": e.reason, "retry_after_seconds": e.retry_after_seconds},
+                headers={"Retry-After": str(e.retry_after_seconds)}
+            )
+            await response(scope, receive, send)
+    # ------------------------------------------------------------------------- end __call__()
+
+# ------------------------------------------------------------------------- end class AdmissionControlMiddleware
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_admission_controller()
+def get_admission_controller() -> Optional[AdmissionController]:
+    """Get the process-wide admission controller (singleton).
+
+    Returns:
+        Optional[AdmissionController]: The controller, or None if admission
+                                       control is disabled in BackendConfig.
+
+    Examples:
+        >>> controller = get_admission_controller()
+        >>> if controller:
+        ...     print(controller.get_stats()["queue_depth"])
+    """
+    global _admission_controller
+
+    config = get_config()
+    if not getattr(config, "admission_control_enabled", True):
+        return None
+
+    if _admission_controller is None:
+        with _admission_lock:
+            if _admission_controller is None:
+                _admission_controller = AdmissionController(
+                    max_concurrent=getattr(config, "admission_max_concurrent", 8),
+                    max_queue_size=getattr(config, "admission_max_queue_size", 32),
+                    max_queue_wait_seconds=getattr(config, "admission_max_queue_wait_seconds", 15.0),
+                    retry_after_seconds=getattr(config, "admission_retry_after_seconds", 5),
+                )
+                logger.info(
+                    f"✅ Admission control enabled: {_admission_controller.max_concurrent} concurrent, "
+                    f"{_admission_controller.max_queue_size} queued"
+                )
+    return _admission_controller
+# ------------------------------------------------------------------------- end get_admission_controller()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
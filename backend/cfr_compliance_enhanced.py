@@ -24,6 +24,13 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
+try:
+    # Try relative imports first (when run as module)
+    from .context_packing import pack_context, get_context_budget
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from context_packing import pack_context, get_context_budget
+
 logger = logging.getLogger(__name__)
 
 class CFRHierarchyLevel(Enum):
@@ -97,6 +104,16 @@ class ComplianceRequirement:
         if self.related_citations is None:
             self.related_citations = []
 
+@dataclass
+class CFRHeading:
+    """Part, subpart or section heading in CFR document text"""
+    level: CFRHierarchyLevel                     # PART, SUBPART or SECTION
+    part: int                                    # e.g., 75
+    subpart: Optional[str] = None                # e.g., "D" (enclosing subpart of a section)
+    section: Optional[str] = None                # e.g., "75.400"
+    title: str = ""                              # e.g., "Accumulation of combustible materials"
+    start: int = 0                               # Offset of the heading in the text
+
 class EnhancedCFRParser:
     """
     Advanced CFR citation parser and structure analyzer
@@ -127,6 +144,49 @@ class EnhancedCFRParser:
             'multiple': r'(?P<title>\d+)\s+CFR\s+§§\s*(?P<sections>[\d\.,\s]+(?:and\s+[\d\.]+)?)'
         }
         
+        # Precompiled patterns and the single-pass anchor scanner. Every pattern can
+        # only start at one anchor kind, so trying it at its anchors (and never before
+        # the end of its previous match) finds exactly the matches of a separate
+        # re.finditer() pass per pattern. The scanner spells out the IGNORECASE case
+        # folds (including 'ſ', 'İ' and 'ı') instead of using the flag, and its
+        # lookahead lets the regex engine skip non-anchor characters quickly.
+        self._compiled_patterns = {
+            name: re.compile(pattern, re.IGNORECASE) for name, pattern in self.cfr_patterns.items()
+        }
+        self._anchor_scanner = re.compile(
+            r'(?=[\d§Ssſ])(?:(?P<cfr>\d+\s+[Cc][Ff][Rr])|(?P<symbol>§)'
+            r'|(?P<section>[Ssſ][Ee][Cc][Tt][Iiİı][Oo][Nn])'
+            r'|(?P<subpart>[Ssſ][Uu][Bb][Pp][Aa][Rr][Tt]))'
+        )
+        self._anchor_patterns = {
+            'cfr': ('complete', 'part_only', 'multiple'),
+            'symbol': ('section_only',),
+            'section': ('cross_ref',),
+            'subpart': ('subpart',),
+        }
+        
+        # End of a heading title: its period, a question mark or "[Reserved]", or the
+        # next heading, contents entry ("75.300 Scope.") or contents marker when the
+        # title has no period
+        self._title_end = re.compile(r'[.?\]]|\s(?:§|\d+\.\d+\s|(?:Subpart|Sec|AUTHORITY|SOURCE)\b)')
+        
+        # Part-qualified section number ("75.400") for section indexing
+        self._section_number = re.compile(r'\d+\.\d+')
+        
+        # Title-qualified section without "§" ("30 CFR 75.400(a)"), for section indexing
+        self._bare_cfr_section = re.compile(r'\d+\s+CFR\s+(?P<section>\d+\.\d+)', re.IGNORECASE)
+        
+        # Structure headings of the CFR volumes: "PART 75—MANDATORY SAFETY ...",
+        # "Subpart D—Ventilation" and "§ 75.400 Accumulation of ..." at the start of a
+        # line. Running page heads ("... Edition) § 75.400") end a line and tables of
+        # contents omit the "§", so neither is taken for a section heading.
+        self._structure_pattern = re.compile(
+            r'^[ \t]*PART[ \t]+(?P<part>\d+)[ \t]*[—–][ \t]*(?P<part_title>[^\n]*)'
+            r'|Subpart[ \t]+(?P<subpart>[A-Z]{1,3})[ \t]*[—–][ \t]*(?P<subpart_title>[^\n]*)'
+            r'|^[ \t]*§[ \t]*(?P<section>\d+\.\d+)[ \t]*(?P<section_title>[A-Z][^\n]*)',
+            re.MULTILINE
+        )
+        
         # MSHA-specific mining terminology with enhanced categories
         self.msha_terminology = {
             'safety_equipment': [
@@ -173,25 +233,34 @@ class EnhancedCFRParser:
         """
         Parse CFR citations from text with enhanced pattern recognition
         
+        One scan over the text finds the citation anchors, and each pattern is
+        matched only at its anchors. Matches are processed in pattern order, as
+        with one pass per pattern. The text-level urgency and mine-type signals
+        are computed once per text, not once per citation.
+        
         Args:
             text: Text containing CFR citations
             
         Returns:
             List of parsed CFRCitation objects
         """
+        matches_by_pattern = self._scan_matches(text)
         citations = []
+        mine_type_signals = None
+        urgency = None
         
-        for pattern_name, pattern in self.cfr_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            
+        for pattern_name, matches in matches_by_pattern.items():
             for match in matches:
                 try:
                     citation = self._create_citation_from_match(match, pattern_name)
                     if citation:
+                        if mine_type_signals is None:
+                            mine_type_signals = self._mine_type_signals(text.lower())
+                            urgency = self._determine_compliance_urgency(text)
                         # Determine mine type applicability
-                        citation.mine_type_applicability = self._determine_mine_type_applicability(citation, text)
+                        citation.mine_type_applicability = self._mine_types_from_signals(citation, mine_type_signals)
                         # Determine compliance urgency
-                        citation.compliance_urgency = self._determine_compliance_urgency(text)
+                        citation.compliance_urgency = urgency
                         citations.append(citation)
                 except Exception as e:
                     logger.warning(f"Failed to parse CFR citation: {str(e)}")
@@ -199,6 +268,104 @@ class EnhancedCFRParser:
         
         return self._deduplicate_citations(citations)
     
+    def extract_section_numbers(self, text: str) -> Dict[str, int]:
+        """
+        Count the CFR section numbers ("75.400") referenced in text
+        
+        Sections come from "§ 75.400", "section 75.400", "30 CFR 75.400" and
+        "30 CFR §§ 75.1, 75.2" references. Only part-qualified numbers are kept, since parse_cfr_citations()
+        folds the dot out of CFRCitation.section ("75.17" and "751.7" both become 7517).
+        
+        Args:
+            text: Text containing CFR citations
+            
+        Returns:
+            Section number -> number of references, in order of first reference
+        """
+        sections: Dict[str, int] = {}
+        matches_by_pattern = self._scan_matches(text)
+        # "§ 75.1" also matches inside "30 CFR §§ 75.1, 75.2"; count it once
+        lists = [(match.start(), match.end()) for match in matches_by_pattern['multiple']]
+        
+        bare_matches = list(self._bare_cfr_section.finditer(text))
+        for match in sorted(matches_by_pattern['section_only'] + matches_by_pattern['cross_ref']
+                            + matches_by_pattern['multiple'] + bare_matches, key=lambda match: match.start()):
+            groups = match.groupdict()
+            if groups.get('sections') is None and any(start < match.start() < end for start, end in lists):
+                continue
+            for number in self._section_number.findall(groups.get('sections') or groups.get('section') or ''):
+                sections[number] = sections.get(number, 0) + 1
+        
+        return sections
+    
+    def parse_cfr_structure(self, text: str) -> List[CFRHeading]:
+        """
+        Parse the part, subpart and section headings of CFR document text
+        
+        Headings are returned in text order. A section belongs to the subpart heading
+        that precedes it within its part; a new PART heading closes the subpart. Each
+        section is returned once (its first heading), and titles are cut at the first
+        period, since PDF text wraps long titles onto the next line.
+        
+        Args:
+            text: Full text of a CFR volume
+            
+        Returns:
+            Headings with their part, enclosing subpart, section number and title
+        """
+        headings: List[CFRHeading] = []
+        seen_sections: Set[str] = set()
+        part: Optional[int] = None
+        subpart: Optional[str] = None
+        
+        for match in self._structure_pattern.finditer(text):
+            if match.group('part'):
+                part, subpart = int(match.group('part')), None
+                headings.append(CFRHeading(CFRHierarchyLevel.PART, part, title=self._heading_title(text, match, 'part_title'),
+                                           start=match.start()))
+            elif match.group('subpart'):
+                if part is None:
+                    continue
+                subpart = match.group('subpart')
+                headings.append(CFRHeading(CFRHierarchyLevel.SUBPART, part, subpart,
+                                           title=self._heading_title(text, match, 'subpart_title'), start=match.start()))
+            else:
+                number = match.group('section')
+                if number in seen_sections:
+                    continue
+                seen_sections.add(number)
+                section_part = int(number.split('.')[0])
+                headings.append(CFRHeading(CFRHierarchyLevel.SECTION, section_part,
+                                           subpart if section_part == part else None, number,
+                                           self._heading_title(text, match, 'section_title'), match.start()))
+        
+        return headings
+    
+    def _heading_title(self, text: str, match: re.Match, group: str) -> str:
+        """Heading title (at most 200 characters) up to its end, on one line"""
+        title = text[match.start(group):match.start(group) + 200]
+        end = self._title_end.search(title)
+        if end:
+            title = title[:end.end() if end.group() in '?]' else end.start()]
+        return ' '.join(title.replace('-\n', '').split()).rstrip(' -—–')
+    
+    def _scan_matches(self, text: str) -> Dict[str, List[re.Match]]:
+        """Matches of every citation pattern, found with one anchor scan over the text"""
+        matches_by_pattern = {pattern_name: [] for pattern_name in self._compiled_patterns}
+        next_start = dict.fromkeys(self._compiled_patterns, 0)
+        
+        for anchor in self._anchor_scanner.finditer(text):
+            position = anchor.start()
+            for pattern_name in self._anchor_patterns[anchor.lastgroup]:
+                if position < next_start[pattern_name]:
+                    continue
+                match = self._compiled_patterns[pattern_name].match(text, position)
+                if match:
+                    matches_by_pattern[pattern_name].append(match)
+                    next_start[pattern_name] = match.end()
+        
+        return matches_by_pattern
+    
     def _create_citation_from_match(self, match: re.Match, pattern_name: str) -> Optional[CFRCitation]:
         """Create CFRCitation from regex match"""
         groups = match.groupdict()
@@ -224,8 +391,16 @@ class EnhancedCFRParser:
     
     def _determine_mine_type_applicability(self, citation: CFRCitation, context_text: str) -> List[MSHAMineType]:
         """Determine which mine types this citation applies to"""
+        return self._mine_types_from_signals(citation, self._mine_type_signals(context_text.lower()))
+    
+    def _mine_type_signals(self, context_lower: str) -> Tuple[bool, bool, bool]:
+        """Text-level mine type signals: (underground, surface, coal) mentioned"""
+        return 'underground' in context_lower, 'surface' in context_lower, 'coal' in context_lower
+    
+    def _mine_types_from_signals(self, citation: CFRCitation, signals: Tuple[bool, bool, bool]) -> List[MSHAMineType]:
+        """Mine types for a citation given the text-level signals of _mine_type_signals()"""
         applicable_types = []
-        context_lower = context_text.lower()
+        underground, surface, coal = signals
         
         # Part-based determination
         if citation.part:
@@ -237,14 +412,14 @@ class EnhancedCFRParser:
                 applicable_types = [MSHAMineType.UNDERGROUND_METAL, MSHAMineType.SURFACE_METAL]
             
         # Context-based determination
-        if 'underground' in context_lower:
-            if 'coal' in context_lower:
+        if underground:
+            if coal:
                 applicable_types.append(MSHAMineType.UNDERGROUND_COAL)
             else:
                 applicable_types.append(MSHAMineType.UNDERGROUND_METAL)
         
-        if 'surface' in context_lower:
-            if 'coal' in context_lower:
+        if surface:
+            if coal:
                 applicable_types.append(MSHAMineType.SURFACE_COAL)
             else:
                 applicable_types.append(MSHAMineType.SURFACE_METAL)
@@ -416,7 +591,7 @@ SAFETY COMPLIANCE QUERY: {user_query}
 MINE CLASSIFICATION: {mine_type.value.replace('_', ' ').title()}
 
 REGULATORY SAFETY ANALYSIS:
-{self._truncate_content(fusion_result.fused_content)}
+{self._pack_content(fusion_result)}
 
 CITATION ANALYSIS:
 {citation_summary}
@@ -486,7 +661,7 @@ EQUIPMENT COMPLIANCE QUERY: {user_query}
 MINE CLASSIFICATION: {mine_type.value.replace('_', ' ').title()}
 
 EQUIPMENT REGULATORY CONTEXT:
-{self._truncate_content(fusion_result.fused_content)}
+{self._pack_content(fusion_result)}
 
 APPLICABLE CFR CITATIONS:
 {citation_summary}
@@ -548,7 +723,7 @@ EMERGENCY COMPLIANCE QUERY: {user_query}
 MINE CLASSIFICATION: {mine_type.value.replace('_', ' ').title()}
 
 EMERGENCY REGULATORY REQUIREMENTS:
-{self._truncate_content(fusion_result.fused_content)}
+{self._pack_content(fusion_result)}
 
 EMERGENCY-RELATED CFR CITATIONS:
 {citation_summary}
@@ -610,7 +785,7 @@ ELECTRICAL COMPLIANCE QUERY: {user_query}
 MINE CLASSIFICATION: {mine_type.value.replace('_', ' ').title()}
 
 ELECTRICAL REGULATORY REQUIREMENTS:
-{self._truncate_content(fusion_result.fused_content)}
+{self._pack_content(fusion_result)}
 
 ELECTRICAL CFR CITATIONS:
 {citation_summary}
@@ -673,7 +848,7 @@ COMPLIANCE QUERY: {user_query}
 MINE CLASSIFICATION: {mine_type.value.replace('_', ' ').title()}
 
 COMPREHENSIVE REGULATORY ANALYSIS:
-{self._truncate_content(fusion_result.fused_content)}
+{self._pack_content(fusion_result)}
 
 CFR CITATION ANALYSIS:
 {citation_summary}
@@ -763,19 +938,21 @@ COMPREHENSIVE COMPLIANCE EXPERT RESPONSE:"""
         else:
             return "\n🟢 INFORMATIONAL: This involves general regulatory guidance and best practices."
     
-    def _truncate_content(self, content: str, max_length: int = 2000) -> str:
-        """Truncate content while preserving regulatory structure"""
-        if len(content) <= max_length:
-            return content
-        
-        # Try to end at a sentence boundary
-        truncated = content[:max_length]
-        last_period = truncated.rfind('.')
+    def _pack_content(self, fusion_result: Any, max_tokens: Optional[int] = None) -> str:
+        """Pack the fused content into the prompt token budget while preserving regulatory structure
         
-        if last_period > max_length * 0.8:
-            return truncated[:last_period + 1] + "\n\n[Content truncated for length - full regulatory text available for detailed analysis]"
-        else:
-            return truncated + "...\n\n[Content truncated for length - full regulatory text available for detailed analysis]"
+        Whole paragraphs, then leading whole sentences, are kept in order so CFR citations are
+        never cut (see context_packing.pack_context()). Tokens are counted with the
+        response model's tokenizer; max_tokens defaults to the per-model budget. The
+        used/available token report is stored in a copy of fusion_result.metadata.
+        """
+        packed = pack_context(
+            fusion_result.fused_content,
+            max_tokens or get_context_budget(),
+            truncation_marker="\n\n[Content truncated for length - full regulatory text available for detailed analysis]"
+        )
+        fusion_result.metadata = {**fusion_result.metadata, "context_packing": packed.get_stats()}
+        return packed.content
 
 # Integration functions for existing system
 def get_enhanced_cfr_parser() -> EnhancedCFRParser:
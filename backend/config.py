@@ -130,6 +130,41 @@ class BackendConfig(BaseSettings):
         log_format (str): Log format string template.
         request_timeout (int): Request timeout duration.
         agent_max_execution_time (int): Agent maximum execution time.
+        component_max_age_seconds (int): Maximum age of warm retrieval chains.
+        embedding_cache_enabled (bool): Whether embeddings are cached.
+        embedding_cache_max_entries (int): In-memory embedding LRU bound.
+        embedding_cache_path (str): SQLite embedding cache file path.
+        embedding_cache_disk_max_entries (int): SQLite embedding cache bound.
+        vector_retrieval_mode (str): Vector branch output, 'answer', 'chunks' or 'hybrid'.
+        local_vector_index_enabled (bool): Whether chunk vector search uses the in-process embedding mirror.
+        local_vector_index_path (str): Embedding mirror directory.
+        local_vector_index_check_seconds (float): Minimum time between mirror freshness checks.
+        local_vector_index_auto_export (bool): Whether a fallback exports the mirror in the serving process.
+        section_lookup_enabled (bool): Whether questions citing CFR sections are answered from the section index.
+        cypher_cache_enabled (bool): Whether validated generated Cypher is cached.
+        cypher_cache_path (str): SQLite generated-Cypher cache file path.
+        cypher_cache_max_entries (int): Generated-Cypher cache bound.
+        semantic_cache_enabled (bool): Whether the semantic response cache is used.
+        semantic_cache_similarity_threshold (float): Minimum similarity for a cache hit.
+        semantic_cache_ttl_seconds (int): Semantic cache entry lifetime.
+        semantic_cache_max_entries (int): Semantic cache size bound.
+        admission_control_enabled (bool): Whether generation endpoints are admission controlled.
+        admission_max_concurrent (int): Generation requests processed concurrently.
+        admission_max_queue_size (int): Generation requests allowed to wait for a slot.
+        admission_max_queue_wait_seconds (float): Maximum time a request waits for a slot.
+        admission_retry_after_seconds (int): Minimum Retry-After hint for shed requests.
+        single_flight_enabled (bool): Whether concurrent identical requests share one pipeline run.
+        single_flight_follower_timeout_seconds (float): Maximum time a coalesced request waits for its leader
+                                                        (never less than request_timeout).
+        batch_max_queries (int): Maximum questions accepted by the batch endpoint.
+        batch_max_concurrency (int): Batch questions processed concurrently.
+        tracing_enabled (bool): Whether per-request stage spans are recorded.
+        tracing_export_path (str): OTLP/JSON lines file for finished traces.
+        tracing_otlp_endpoint (str): OTLP/HTTP collector traces endpoint.
+        tracing_service_name (str): service.name resource attribute for exported traces.
+        fusion_extractive_max_tokens (int): Extractive fusion context budget in estimated tokens.
+        fusion_single_shot_enabled (bool): Whether advanced hybrid fusion is merged into the template LLM call.
+        prompt_context_max_tokens (int): Retrieved-context token budget per prompt (0 uses the per-model default).
         health_check_interval (int): Health check interval duration.
 
     Methods:
@@ -190,6 +225,65 @@ class BackendConfig(BaseSettings):
     request_timeout: int = Field(default=120, description="Request timeout in seconds (increased for complex queries)")
     agent_max_execution_time: int = Field(default=90, description="Agent max execution time (increased for Parallel Hybrid)")
     
+    # Parallel Retrieval Configuration - Async path, GraphRAG fallback strategies and branch deadlines
+    async_retrieval_enabled: bool = Field(default=True, description="Use asyncio LLM calls and the async Neo4j driver for retrieval (threaded path on failure)")
+    vector_retrieval_mode: str = Field(default="answer", description="Vector branch output: 'answer' (retrieval + answer LLM call), 'chunks' (ranked chunks for fusion, one LLM call fewer) or 'hybrid' (chunks from full-text keyword and vector search merged by reciprocal rank fusion; requires the chunkText index built by build_hybrid_store.py)")
+    graph_fallback_max_concurrency: int = Field(default=3, description="Maximum GraphRAG fallback strategies run concurrently")
+    retrieval_branch_grace_seconds: float = Field(default=5.0, description="Extra time the slower retrieval branch gets once the other returns a viable result")
+    section_lookup_enabled: bool = Field(default=True, description="Answer questions citing CFR sections (\"30 CFR § 75.400\") with one section index lookup instead of the parallel branches; requires the index built by build_hybrid_store.py")
+    local_vector_index_enabled: bool = Field(default=False, description="Answer 'chunks'/'hybrid' vector searches from an in-process memory-mapped mirror of the chunk embeddings (requires numpy); the Neo4j vector index is used while the mirror is missing or stale; export it with python -m backend.tools.local_vector_index")
+    local_vector_index_path: str = Field(default=".cache/local_vector_index", description="Directory of the chunk embedding mirror")
+    local_vector_index_check_seconds: float = Field(default=300.0, description="Minimum seconds between comparisons of the mirror with the store build marker written by build_hybrid_store.py")
+    local_vector_index_auto_export: bool = Field(default=False, description="Export a missing or stale mirror on a background thread of the serving process when a search falls back, instead of waiting for the explicit build step")
+    
+    # Component Registry Configuration - Warm retrieval chains shared across requests
+    component_max_age_seconds: int = Field(default=0, description="Rebuild warm retrieval chains after this many seconds (0 disables)")
+    
+    # Embedding Cache Configuration - Memory LRU plus SQLite tier shared across workers
+    embedding_cache_enabled: bool = Field(default=True, description="Cache query/document embeddings")
+    embedding_cache_max_entries: int = Field(default=1024, description="Maximum embeddings kept in the in-memory LRU")
+    embedding_cache_path: str = Field(default=".cache/embedding_cache.sqlite3", description="SQLite embedding cache file (empty disables the disk tier)")
+    embedding_cache_disk_max_entries: int = Field(default=50000, description="Maximum embeddings kept in the SQLite tier")
+    
+    # Generated-Cypher Cache Configuration - Validated LLM-generated Cypher reused across restarts
+    cypher_cache_enabled: bool = Field(default=True, description="Reuse validated generated Cypher for repeated graph questions")
+    cypher_cache_path: str = Field(default=".cache/cypher_cache.sqlite3", description="SQLite generated-Cypher cache file (empty disables persistence)")
+    cypher_cache_max_entries: int = Field(default=5000, description="Maximum cached Cypher statements")
+    
+    # Semantic Response Cache Configuration - Near-duplicate question answer reuse
+    semantic_cache_enabled: bool = Field(default=True, description="Serve cached responses for near-duplicate questions")
+    semantic_cache_similarity_threshold: float = Field(default=0.95, description="Minimum cosine similarity for a semantic cache hit")
+    semantic_cache_ttl_seconds: int = Field(default=3600, description="Semantic cache entry lifetime in seconds")
+    semantic_cache_max_entries: int = Field(default=1000, description="Maximum cached responses")
+    
+    # Admission Control Configuration - Bounded concurrency and wait queue for generation endpoints
+    admission_control_enabled: bool = Field(default=True, description="Queue or shed generation requests beyond downstream capacity")
+    admission_max_concurrent: int = Field(default=8, description="Generation requests processed concurrently")
+    admission_max_queue_size: int = Field(default=32, description="Generation requests allowed to wait for a processing slot")
+    admission_max_queue_wait_seconds: float = Field(default=15.0, description="Maximum time a request waits for a slot before a 503")
+    admission_retry_after_seconds: int = Field(default=5, description="Minimum Retry-After hint (seconds) sent with 503 responses")
+    
+    # Single-Flight Coalescing Configuration - Concurrent identical requests share one pipeline run
+    single_flight_enabled: bool = Field(default=True, description="Coalesce concurrent identical generation requests")
+    single_flight_follower_timeout_seconds: float = Field(default=120.0, description="Maximum time a coalesced request waits for its leader before failing with 503 (never less than request_timeout)")
+    
+    # Batch Endpoint Configuration - /generate_parallel_hybrid/batch limits
+    batch_max_queries: int = Field(default=500, description="Maximum questions per batch request")
+    batch_max_concurrency: int = Field(default=4, description="Batch questions processed concurrently (upper bound for max_concurrency)")
+    
+    # Tracing Configuration - Per-request stage spans, exported as OTLP/JSON when a destination is set
+    tracing_enabled: bool = Field(default=True, description="Record per-request stage spans and summarize them in response metadata")
+    tracing_export_path: str = Field(default="", description="Append finished traces as OTLP/JSON lines to this file (empty disables)")
+    tracing_otlp_endpoint: str = Field(default="", description="OTLP/HTTP traces endpoint, e.g. http://localhost:4318/v1/traces (empty disables)")
+    tracing_service_name: str = Field(default="mrca-backend", description="service.name resource attribute for exported traces")
+    
+    # Context Fusion Configuration - Extractive (LLM-free) fusion strategy
+    fusion_extractive_max_tokens: int = Field(default=1500, description="Fused-context budget (estimated tokens) for the extractive fusion strategy; sentences carrying CFR citations are always kept")
+    fusion_single_shot_enabled: bool = Field(default=False, description="Answer advanced hybrid requests with one LLM call: the template prompt receives both raw retrieval contexts and their adaptive weights instead of an LLM-fused context")
+    
+    # Prompt Context Configuration - Token-budget packing of retrieved context into response prompts
+    prompt_context_max_tokens: int = Field(default=0, description="Retrieved-context token budget per response prompt, counted with the model tokenizer; 0 uses the per-model default in context_packing.MODEL_CONTEXT_BUDGETS")
+    
     # Server Configuration - Uvicorn timeout settings (No disconnection for active sessions)
     server_timeout_keep_alive: int = Field(default=3600, description="Uvicorn keep-alive timeout - 1 hour for persistent sessions")
     server_timeout_graceful_shutdown: int = Field(default=30, description="Uvicorn graceful shutdown timeout")
@@ -0,0 +1,548 @@
+# -------------------------------------------------------------------------
+# File: content_analysis.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/content_analysis.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module provides the compiled regulatory-content scanner used by context
+# fusion to score retrieved and fused contexts. A single precompiled pattern
+# finds CFR citations, complete Part/section citations, section cross-references
+# and measurements in one pass over the text, and the regulatory, MSHA and
+# safety-critical vocabularies are checked against one lowercased copy, instead
+# of running a dozen regexes and lowercasing the content once per term.
+# The resulting scores are identical to the original per-pattern implementation.
+# It also provides the per-request content-analysis memo: each distinct context
+# string is analyzed at most once per request (characteristics, regulatory
+# quality, quality score, CFR citations), and every fusion strategy and the
+# response templates read the shared results. The analysis cost is recorded per
+# request in ContentAnalysisStats and as "content_analysis" tracing spans.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: RegulatoryScan - Citation, term and measurement counts with the quality score
+# - Class: ContentAnalysisStats - Per-request analysis counters and cost
+# - Class: ContentAnalysis - Lazily computed, cached analysis of one context string
+# - Class: ContentAnalyzer - Per-request memo of ContentAnalysis objects keyed by content
+# - Function: scan_regulatory_content() - Single-pass scan of a context
+# - Function: content_analysis_scope() - Makes an analyzer current for a with-block
+# - Function: get_content_analysis() - Analysis from an explicit, current or fresh analyzer
+# - Constants: REGULATORY_TERMS, MSHA_TERMS, SAFETY_CRITICAL_TERMS, MEASUREMENT_UNITS,
+#   CFR_CITATION_PATTERN
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - re: Compiled single-pass scan pattern
+#   - contextvars, contextlib: Current per-request analyzer
+#   - time: Analysis cost measurement
+#   - dataclasses: Scan result and statistics data structures
+#   - typing: Type hints (Any, Dict, Iterator, List, Optional, Tuple)
+# - Third-Party: None
+# - Local Project Modules:
+#   - .tracing.span: "content_analysis" spans in request traces
+#   - .cfr_compliance_enhanced.get_enhanced_cfr_parser: Structured CFR citation parsing (lazy)
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# HybridContextFusion.fuse_contexts() runs each fusion inside
+# content_analysis_scope() and attaches the analyzer to the FusionResult; the
+# fusion scoring helpers call get_content_analysis(content), and
+# hybrid_templates passes fusion_result.content_analysis explicitly. Benchmark
+# the scanner with python benchmarks/bench_regulatory_quality.py
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Regulatory Content Analysis for MRCA Context Fusion
+
+Counts CFR citations, cross-references, measurements and regulatory vocabulary
+in one compiled scan, and memoizes per-request analyses of each context so
+fusion strategies and response templates share one computation.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import contextvars
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .tracing import span
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from tracing import span
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# General regulatory vocabulary (presence of each term counts once)
+REGULATORY_TERMS: Tuple[str, ...] = (
+    'shall', 'must', 'required', 'compliance', 'standard',
+    'regulation', 'safety', 'equipment', 'operator', 'mine'
+)
+
+# MSHA-specific terminology (weighted higher than general terms)
+MSHA_TERMS: Tuple[str, ...] = (
+    'underground coal', 'surface coal', 'metal mine', 'mine operator',
+    'competent person', 'qualified person', 'permissible equipment',
+    'methane monitoring', 'ventilation plan', 'self-rescue device',
+    'mine rescue', 'electrical examination', 'roof control'
+)
+
+# Safety urgency indicators
+SAFETY_CRITICAL_TERMS: Tuple[str, ...] = ('immediate', 'emergency', 'danger', 'fatal', 'explosion', 'methane')
+
+# Units counted as specific measurements after a number
+MEASUREMENT_UNITS: Tuple[str, ...] = (
+    'feet', 'foot', 'ft', 'percent', '%', 'psi', 'cfm', 'rpm', 'volt', 'amp', 'degree'
+)
+
+# One pattern for every counted construct. Each match consumes a single
+# character: the first digit of a digit run, or the "s" of "section". The
+# constructs themselves are captured in lookaheads, so a citation never hides a
+# measurement that starts inside it (e.g. "section 5 feet"), just as when each
+# construct was found by its own re.findall(). Constructs starting at the same
+# digit are mutually exclusive ("CFR Part", "CFR §" and units differ), so one
+# alternation captures at most one of them per position.
+_REGULATORY_SCAN_PATTERN = re.compile(
+    r"""
+    (?i:[\ds])
+    (?:
+        (?<=\d)(?<!\d\d)
+        (?:
+            (?<=\b\d)(?=(?P<complete_citation>\d*\s+CFR\s+Part\s+\d+\s+§\s*\d+))
+          | (?<=\b\d)(?=(?P<cfr_citation>\d*\s+CFR\s+§\s*\d+))
+          | (?=(?P<measurement>(?i:\d*\s*(?:""" + "|".join(re.escape(unit) for unit in MEASUREMENT_UNITS) + r"""))))
+        )
+      | (?i:(?<=s)(?=(?P<cross_reference>ection\s+\d+(?:\.\d+)?(?:\([a-zA-Z0-9]+\))*)))
+    )
+    """,
+    re.VERBOSE
+)
+
+# Constructs counted by the scan pattern
+_SCAN_GROUPS: Tuple[str, ...] = ("complete_citation", "cfr_citation", "measurement", "cross_reference")
+
+# CFR citations listed in response prompts ("30 CFR § 75.1720(a)", "30 CFR Part 75 § 75.400")
+CFR_CITATION_PATTERN = re.compile(r'\b\d+\s+CFR\s+(?:Part\s+\d+\s+)?§\s*\d+(?:\([a-zA-Z0-9]+\))*')
+
+# Technical tokens counted for content specificity. The alternatives cannot
+# overlap (digits, "§" and words that share no prefix/suffix), so one scan
+# counts the same as one re.findall() per token.
+_TECHNICAL_PATTERN = re.compile(r'\d+|CFR|§|percent|psi|feet', re.IGNORECASE)
+
+# Analyzer of the request currently being fused
+_current_analyzer: contextvars.ContextVar[Optional['ContentAnalyzer']] = contextvars.ContextVar(
+    "mrca_content_analyzer", default=None
+)
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class RegulatoryScan
+@dataclass(frozen=True)
+class RegulatoryScan:
+    """Counts from one scan of a context.
+
+    Citation, cross-reference and measurement counts are non-overlapping
+    occurrence counts; term counts are the number of distinct vocabulary terms
+    present (case-insensitive substring match).
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        cfr_citations (int): "30 CFR § 75" style citations.
+        complete_citations (int): "30 CFR Part 75 § 75" style citations.
+        cross_references (int): "section 75.400(a)" style cross-references.
+        regulatory_terms (int): REGULATORY_TERMS present.
+        msha_terms (int): MSHA_TERMS present.
+        safety_terms (int): SAFETY_CRITICAL_TERMS present.
+        measurements (int): Numbers followed by a MEASUREMENT_UNITS unit.
+        length (int): Content length in characters.
+
+    Methods:
+        quality_score(): Regulatory quality score in [0, 1].
+    """
+    cfr_citations: int
+    complete_citations: int
+    cross_references: int
+    regulatory_terms: int
+    msha_terms: int
+    safety_terms: int
+    measurements: int
+    length: int
+
+    # ------------------------------------------------------------------------- quality_score()
+    def quality_score(self) -> float:
+        """Calculate the regulatory quality score used by context fusion.
+
+        Returns:
+            float: Score in [0, 1].
+        """
+        quality_score = 0.0
+
+        # Citations and cross-references
+        quality_score += min(0.3, self.cfr_citations * 0.1)
+        quality_score += min(0.15, self.complete_citations * 0.15)
+        quality_score += min(0.1, self.cross_references * 0.05)
+
+        # Vocabulary (MSHA-specific terms weigh more than general terms)
+        quality_score += min(0.25, self.regulatory_terms * 0.03)
+        quality_score += min(0.15, self.msha_terms * 0.05)
+        quality_score += min(0.1, self.safety_terms * 0.1)
+
+        # Length and structure
+        if self.length > 200:
+            quality_score += 0.15
+        if self.length > 500:
+            quality_score += 0.05
+
+        # Specific measurements
+        quality_score += min(0.1, self.measurements * 0.02)
+
+        return min(1.0, quality_score)
+    # ------------------------------------------------------------------------- end quality_score()
+
+# ------------------------------------------------------------------------- end class RegulatoryScan
+
+# ------------------------------------------------------------------------- class ContentAnalysisStats
+@dataclass
+class ContentAnalysisStats:
+    """Per-request content-analysis counters.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        contents (int): Distinct context strings analyzed.
+        lookups (int): Analysis requests made by fusion and templates.
+        reused (int): Lookups served by an existing analysis.
+        computations (int): Individual analyses computed (scan, characteristics, citations, ...).
+        analysis_ms (float): Time spent computing analyses.
+
+    Methods:
+        None (dataclass with automatic methods)
+    """
+    contents: int = 0
+    lookups: int = 0
+    reused: int = 0
+    computations: int = 0
+    analysis_ms: float = 0.0
+# ------------------------------------------------------------------------- end class ContentAnalysisStats
+
+# ------------------------------------------------------------------------- class ContentAnalysis
+class ContentAnalysis:
+    """Lazily computed, cached analysis of one context string.
+
+    Each property is computed on first access and reused afterwards.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        content (str): The analyzed context.
+        _stats (Optional[ContentAnalysisStats]): Counters of the owning analyzer, if any.
+        _values (Dict[str, Any]): Computed values by property name.
+
+    Methods:
+        lowered: Lowercased content.
+        regulatory_scan: Single-pass citation, term and measurement counts.
+        regulatory_quality: Regulatory quality score.
+        characteristics: Complexity, regulatory density, specificity and length scores.
+        quality_score: Overall fusion quality score.
+        cfr_citations: CFR citation strings in order of appearance.
+        parsed_citations: Structured citations from EnhancedCFRParser.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, content: str, stats: Optional[ContentAnalysisStats] = None) -> None:
+        """Initialize an empty analysis.
+
+        Args:
+            content (str): Context to analyze.
+            stats (Optional[ContentAnalysisStats]): Counters to charge computations to.
+        """
+        self.content = content
+        self._stats = stats
+        self._values: Dict[str, Any] = {}
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- lowered()
+    @property
+    def lowered(self) -> str:
+        """Lowercased content."""
+        return self._get("lowered", self.content.lower)
+    # ------------------------------------------------------------------------- end lowered()
+
+    # ------------------------------------------------------------------------- regulatory_scan()
+    @property
+    def regulatory_scan(self) -> RegulatoryScan:
+        """Single-pass citation, term and measurement counts."""
+        return self._get("regulatory_scan", lambda: scan_regulatory_content(self.content))
+    # ------------------------------------------------------------------------- end regulatory_scan()
+
+    # ------------------------------------------------------------------------- regulatory_quality()
+    @property
+    def regulatory_quality(self) -> float:
+        """Regulatory quality score in [0, 1]."""
+        return self.regulatory_scan.quality_score()
+    # ------------------------------------------------------------------------- end regulatory_quality()
+
+    # ------------------------------------------------------------------------- characteristics()
+    @property
+    def characteristics(self) -> Dict[str, float]:
+        """Content characteristics used by adaptive fusion (a copy, safe to modify)."""
+        return dict(self._get("characteristics", self._compute_characteristics))
+    # ------------------------------------------------------------------------- end characteristics()
+
+    # ------------------------------------------------------------------------- quality_score()
+    @property
+    def quality_score(self) -> float:
+        """Overall quality score combining regulatory quality and characteristics."""
+        characteristics = self._get("characteristics", self._compute_characteristics)
+        quality_score = (
+            self.regulatory_quality * 0.4 +
+            characteristics["complexity"] * 0.2 +
+            characteristics["specificity"] * 0.3 +
+            characteristics["length_score"] * 0.1
+        )
+        return min(1.0, quality_score)
+    # ------------------------------------------------------------------------- end quality_score()
+
+    # ------------------------------------------------------------------------- cfr_citations()
+    @property
+    def cfr_citations(self) -> List[str]:
+        """CFR citation strings in order of appearance."""
+        return self._get("cfr_citations", lambda: CFR_CITATION_PATTERN.findall(self.content))
+    # ------------------------------------------------------------------------- end cfr_citations()
+
+    # ------------------------------------------------------------------------- parsed_citations()
+    @property
+    def parsed_citations(self) -> List[Any]:
+        """Structured, deduplicated citations from EnhancedCFRParser."""
+        try:
+            from .cfr_compliance_enhanced import get_enhanced_cfr_parser
+        except ImportError:
+            from cfr_compliance_enhanced import get_enhanced_cfr_parser
+        return self._get("parsed_citations", lambda: get_enhanced_cfr_parser().parse_cfr_citations(self.content))
+    # ------------------------------------------------------------------------- end parsed_citations()
+
+    # ------------------------------------------------------------------------- _get()
+    def _get(self, name: str, compute: Any) -> Any:
+        """Return a cached value, computing and timing it on first access.
+
+        Args:
+            name (str): Value name.
+            compute (Callable[[], Any]): Computes the value.
+
+        Returns:
+            Any: The cached value.
+        """
+        if name in self._values:
+            return self._values[name]
+        start = time.perf_counter()
+        with span("content_analysis", value=name, chars=len(self.content)):
+            value = compute()
+        if self._stats is not None:
+            self._stats.computations += 1
+            self._stats.analysis_ms += (time.perf_counter() - start) * 1000
+        self._values[name] = value
+        return value
+    # ------------------------------------------------------------------------- end _get()
+
+    # ------------------------------------------------------------------------- _compute_characteristics()
+    def _compute_characteristics(self) -> Dict[str, float]:
+        """Compute complexity, regulatory density, specificity and length scores."""
+        content = self.content
+
+        # Complexity based on sentence structure and vocabulary
+        sentences = content.split('.')
+        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(1, len(sentences))
+
+        return {
+            "complexity": min(1.0, avg_sentence_length / 25.0),
+            "regulatory_density": self.regulatory_quality,
+            # Specificity based on numbers and technical terms
+            "specificity": min(1.0, len(_TECHNICAL_PATTERN.findall(content)) / 10.0),
+            "length_score": min(1.0, len(content) / 1000.0),
+        }
+    # ------------------------------------------------------------------------- end _compute_characteristics()
+
+# ------------------------------------------------------------------------- end class ContentAnalysis
+
+# ------------------------------------------------------------------------- class ContentAnalyzer
+class ContentAnalyzer:
+    """Per-request memo of content analyses keyed by content.
+
+    One analyzer is created per fusion (i.e. per request) and travels with the
+    FusionResult to response generation, so a context string that appears in
+    several stages (vector, graph and fused content) is analyzed once.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        stats (ContentAnalysisStats): Counters and analysis cost for the request.
+        _analyses (Dict[str, ContentAnalysis]): Analyses by content (dict-hashed).
+
+    Methods:
+        analyze(): Get the shared analysis of a context.
+        get_stats(): Counters and cost for response metadata.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self) -> None:
+        """Initialize an empty memo."""
+        self.stats = ContentAnalysisStats()
+        self._analyses: Dict[str, ContentAnalysis] = {}
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- analyze()
+    def analyze(self, content: str) -> ContentAnalysis:
+        """Get the shared analysis of a context, creating it on first use.
+
+        Args:
+            content (str): Context string.
+
+        Returns:
+            ContentAnalysis: Analysis shared by every lookup of the same content.
+        """
+        self.stats.lookups += 1
+        analysis = self._analyses.get(content)
+        if analysis is not None:
+            self.stats.reused += 1
+            return analysis
+        analysis = ContentAnalysis(content, self.stats)
+        self._analyses[content] = analysis
+        self.stats.contents += 1
+        return analysis
+    # ------------------------------------------------------------------------- end analyze()
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and analysis cost for the request.
+
+        Returns:
+            Dict[str, Any]: contents, lookups, reused, computations and analysis_ms.
+        """
+        stats = asdict(self.stats)
+        stats["analysis_ms"] = round(stats["analysis_ms"], 3)
+        return stats
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class ContentAnalyzer
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- scan_regulatory_content()
+def scan_regulatory_content(content: str) -> RegulatoryScan:
+    """Scan a context once for citations, measurements and regulatory vocabulary.
+
+    Args:
+        content (str): Retrieved or fused context.
+
+    Returns:
+        RegulatoryScan: Counts for the content.
+
+    Examples:
+        >>> scan = scan_regulatory_content("Per 30 CFR § 75.400 the operator shall clean up coal dust.")
+        >>> scan.cfr_citations, scan.regulatory_terms
+        (1, 2)
+    """
+    counts: Dict[str, int] = dict.fromkeys(_SCAN_GROUPS, 0)
+    ends: Dict[str, int] = dict.fromkeys(_SCAN_GROUPS, -1)
+    for match in _REGULATORY_SCAN_PATTERN.finditer(content):
+        group = match.lastgroup
+        # Count non-overlapping occurrences per construct, as re.findall() would
+        if match.start() >= ends[group]:
+            counts[group] += 1
+            ends[group] = match.end(group)
+
+    lowered = content.lower()
+    return RegulatoryScan(
+        cfr_citations=counts["cfr_citation"],
+        complete_citations=counts["complete_citation"],
+        cross_references=counts["cross_reference"],
+        regulatory_terms=sum(1 for term in REGULATORY_TERMS if term in lowered),
+        msha_terms=sum(1 for term in MSHA_TERMS if term in lowered),
+        safety_terms=sum(1 for term in SAFETY_CRITICAL_TERMS if term in lowered),
+        measurements=counts["measurement"],
+        length=len(content),
+    )
+# ------------------------------------------------------------------------- end scan_regulatory_content()
+
+# ------------------------------------------------------------------------- content_analysis_scope()
+@contextmanager
+def content_analysis_scope(analyzer: Optional[ContentAnalyzer] = None) -> Iterator[ContentAnalyzer]:
+    """Make an analyzer current for the with-block.
+
+    Args:
+        analyzer (Optional[ContentAnalyzer]): Analyzer to use; a new one if None.
+
+    Yields:
+        ContentAnalyzer: The current analyzer.
+
+    Examples:
+        >>> with content_analysis_scope() as analyzer:
+        ...     get_content_analysis(text).quality_score
+        >>> analyzer.get_stats()["reused"]
+    """
+    analyzer = analyzer or ContentAnalyzer()
+    token = _current_analyzer.set(analyzer)
+    try:
+        yield analyzer
+    finally:
+        _current_analyzer.reset(token)
+# ------------------------------------------------------------------------- end content_analysis_scope()
+
+# ------------------------------------------------------------------------- get_content_analysis()
+def get_content_analysis(content: str, analyzer: Optional[ContentAnalyzer] = None) -> ContentAnalysis:
+    """Get the analysis of a context from the given or current analyzer.
+
+    Outside any analyzer scope a fresh, unshared analysis is returned.
+
+    Args:
+        content (str): Context string.
+        analyzer (Optional[ContentAnalyzer]): Explicit analyzer (e.g. FusionResult.content_analysis).
+
+    Returns:
+        ContentAnalysis: The analysis.
+    """
+    analyzer = analyzer or _current_analyzer.get()
+    if analyzer is None:
+        return ContentAnalysis(content)
+    return analyzer.analyze(content)
+# ------------------------------------------------------------------------- end get_content_analysis()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
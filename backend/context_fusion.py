@@ -12,13 +12,14 @@
 # Parallel Hybrid system. It provides sophisticated techniques for combining
 # VectorRAG and GraphRAG results using research-based fusion strategies including
 # weighted linear combination, maximum confidence selection, advanced hybrid fusion,
-# and adaptive dynamic weighting. The module is designed to optimize the quality
+# adaptive dynamic weighting and LLM-free extractive fusion. The module is designed to optimize the quality
 # and relevance of combined retrieval results for enhanced regulatory query processing.
 # -------------------------------------------------------------------------
 
 # --- Module Contents Overview ---
 # - Enum: FusionStrategy - Available fusion strategies (weighted_linear, max_confidence, etc.)
 # - Class: FusionWeights - Weight configuration dataclass for fusion algorithms
+# - Class: SingleShotContext - Raw contexts and weights for single-shot generation
 # - Class: FusionResult - Result dataclass containing fusion output and metadata
 # - Class: HybridContextFusion - Main fusion engine implementing multiple strategies
 # - Function: get_fusion_engine() - Factory function for fusion engine instances
@@ -29,7 +30,6 @@
 # - Standard Library:
 #   - logging: For fusion operation logging and debugging
 #   - math: For mathematical calculations in fusion algorithms
-#   - re: For regular expression pattern matching in content analysis
 #   - asyncio: For asynchronous fusion operations
 #   - typing: For type hints (Dict, List, Any, Optional, Tuple)
 #   - dataclasses: For fusion configuration and result data structures
@@ -38,6 +38,10 @@
 # - Local Project Modules:
 #   - .parallel_hybrid: RetrievalResult, ParallelRetrievalResponse data structures
 #   - .llm: get_llm function for LLM-based fusion enhancement
+#   - .tracing: fuse_contexts and fusion LLM spans for request tracing
+#   - .content_analysis: Per-request memoized content analysis (regulatory quality, characteristics)
+#   - .extractive_fusion: LLM-free sentence extraction for the extractive strategy
+#   - .config: Extractive fusion token budget and single-shot generation switch
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -68,10 +72,9 @@ selection, advanced hybrid fusion, and adaptive dynamic weighting for regulatory
 # Standard library imports
 import logging
 import math
-import re
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Third-party library imports
@@ -82,10 +85,18 @@ try:
     # Try relative imports first (when run as module)
     from .parallel_hybrid import RetrievalResult, ParallelRetrievalResponse
     from .llm import get_llm
+    from .tracing import traced, span
+    from .content_analysis import content_analysis_scope, get_content_analysis
+    from .extractive_fusion import extractive_fuse, DEFAULT_BUDGET_TOKENS
+    from .config import get_config
 except ImportError:
     # Fall back to absolute imports (when run directly from backend directory)
     from parallel_hybrid import RetrievalResult, ParallelRetrievalResponse
     from llm import get_llm
+    from tracing import traced, span
+    from content_analysis import content_analysis_scope, get_content_analysis
+    from extractive_fusion import extractive_fuse, DEFAULT_BUDGET_TOKENS
+    from config import get_config
 
 # =========================================================================
 # Global Constants / Variables
@@ -112,6 +123,7 @@ class FusionStrategy(Enum):
         MAX_CONFIDENCE: Maximum confidence selection strategy.
         ADVANCED_HYBRID: Research-based advanced hybrid fusion strategy.
         ADAPTIVE_FUSION: Dynamic adaptive weighting strategy.
+        EXTRACTIVE: LLM-free sentence extraction preserving CFR citations.
 
     Instance Attributes:
         Inherits from Enum
@@ -123,6 +135,7 @@ class FusionStrategy(Enum):
     MAX_CONFIDENCE = "max_confidence"
     ADVANCED_HYBRID = "advanced_hybrid"
     ADAPTIVE_FUSION = "adaptive_fusion"
+    EXTRACTIVE = "extractive"
 # ------------------------------------------------------------------------- end class FusionStrategy
 
 # ------------------------------------------------------------------------- class FusionWeights 
@@ -159,6 +172,39 @@ class FusionWeights:
     
     # ------------------------------------------------------------------------- end class FusionWeights
 
+# ------------------------------------------------------------------------- class SingleShotContext 
+@dataclass
+class SingleShotContext:
+    """Raw retrieval contexts handed to the template for single-shot generation.
+
+    Set on FusionResult.single_shot when advanced hybrid fusion skips its LLM
+    call; the template prompt then merges and answers in one generation.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        vector_content (str): VectorRAG content (answer or ranked passages).
+        graph_content (str): GraphRAG content.
+        vector_weight (float): Adaptive vector weight.
+        graph_weight (float): Adaptive graph weight.
+        vector_is_chunks (bool): True when vector_content is ranked source passages.
+
+    Methods:
+        None (dataclass for data storage)
+    """
+    
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    vector_content: str
+    graph_content: str
+    vector_weight: float
+    graph_weight: float
+    vector_is_chunks: bool = False
+    
+    # ------------------------------------------------------------------------- end class SingleShotContext
+
 # ------------------------------------------------------------------------- class FusionResult 
 @dataclass
 class FusionResult:
@@ -179,6 +225,10 @@ class FusionResult:
         final_confidence (float): Final confidence score of fused result.
         fusion_quality_score (float): Quality metric for fusion evaluation.
         metadata (Dict[str, Any]): Additional metadata about the fusion process.
+        content_analysis (Optional[ContentAnalyzer]): Per-request content analyses shared
+                                                      with response generation.
+        single_shot (Optional[SingleShotContext]): Raw contexts for single-shot generation,
+                                                   None when the fused content is final.
 
     Methods:
         None (dataclass for data storage)
@@ -194,6 +244,8 @@ class FusionResult:
     final_confidence: float
     fusion_quality_score: float
     metadata: Dict[str, Any]
+    content_analysis: Optional[Any] = field(default=None, repr=False, compare=False)
+    single_shot: Optional[SingleShotContext] = field(default=None, repr=False, compare=False)
     
     # ------------------------------------------------------------------------- end class FusionResult
 
@@ -219,6 +271,7 @@ class HybridContextFusion:
         _max_confidence_fusion(): Maximum confidence selection implementation.
         _advanced_hybrid_fusion(): Research-based advanced hybrid implementation.
         _adaptive_fusion(): Dynamic adaptive weighting implementation.
+        _extractive_fusion(): LLM-free extractive implementation.
         Various private helper methods for quality scoring and content analysis.
     """
 
@@ -246,11 +299,13 @@ class HybridContextFusion:
     # ---------------------------
     
     # ------------------------------------------------------------------------- fuse_contexts()
+    @traced("fuse_contexts")
     async def fuse_contexts(
         self, 
         parallel_response: ParallelRetrievalResponse,
         strategy: FusionStrategy = FusionStrategy.ADVANCED_HYBRID,
-        custom_weights: Optional[FusionWeights] = None
+        custom_weights: Optional[FusionWeights] = None,
+        single_shot: Optional[bool] = None
     ) -> FusionResult:
         """Fuse the parallel retrieval results using specified strategy.
 
@@ -262,6 +317,9 @@ class HybridContextFusion:
             parallel_response (ParallelRetrievalResponse): Results from parallel retrieval.
             strategy (FusionStrategy): Fusion strategy to use. Defaults to ADVANCED_HYBRID.
             custom_weights (Optional[FusionWeights]): Optional custom weights for this fusion.
+            single_shot (Optional[bool]): Defer the advanced hybrid fusion LLM call to the
+                                          template (see SingleShotContext). None uses
+                                          BackendConfig.fusion_single_shot_enabled.
 
         Returns:
             FusionResult: Combined context with fusion metadata and quality metrics.
@@ -271,9 +329,39 @@ class HybridContextFusion:
             >>> result = await fusion_engine.fuse_contexts(parallel_response)
             >>> print(f"Fusion confidence: {result.final_confidence}")
         """
+        if single_shot is None:
+            single_shot = getattr(get_config(), "fusion_single_shot_enabled", False)
+        
+        # Content analyses are shared by every stage of this request
+        with content_analysis_scope() as analyzer:
+            result = await self._dispatch_fusion(parallel_response, strategy, custom_weights, single_shot)
+
+        result.content_analysis = analyzer
+        result.metadata["content_analysis"] = analyzer.get_stats()
+        return result
+    # ------------------------------------------------------------------------- end fuse_contexts()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+    
+    # ------------------------------------------------------------------------- _dispatch_fusion()
+    async def _dispatch_fusion(
+        self,
+        parallel_response: ParallelRetrievalResponse,
+        strategy: FusionStrategy,
+        custom_weights: Optional[FusionWeights],
+        single_shot: bool = False
+    ) -> FusionResult:
+        """Run the fusion strategy, or the fallback if the response is not fusion ready."""
         if not parallel_response.fusion_ready:
             logger.warning("Parallel response not fusion ready, using fallback")
             return self._create_fallback_fusion(parallel_response)
+        
+        # Without a graph result there is nothing to fuse; the override is recorded in metadata
+        if (parallel_response.section_lookup is not None
+                and (parallel_response.graph_result.metadata or {}).get("skipped")):
+            return self._create_section_lookup_fusion(parallel_response, strategy)
             
         weights = custom_weights or self.weights
         
@@ -284,18 +372,16 @@ class HybridContextFusion:
         elif strategy == FusionStrategy.MAX_CONFIDENCE:
             return await self._max_confidence_fusion(parallel_response)
         elif strategy == FusionStrategy.ADVANCED_HYBRID:
-            return await self._advanced_hybrid_fusion(parallel_response, weights)
+            return await self._advanced_hybrid_fusion(parallel_response, weights, single_shot)
         elif strategy == FusionStrategy.ADAPTIVE_FUSION:
-            return await self._adaptive_fusion(parallel_response, weights)
+            return await self._adaptive_fusion(parallel_response, weights, single_shot)
+        elif strategy == FusionStrategy.EXTRACTIVE:
+            return await self._extractive_fusion(parallel_response, weights)
         else:
             logger.error(f"❌ Unknown fusion strategy: {strategy}")
             return self._create_fallback_fusion(parallel_response)
-    # ------------------------------------------------------------------------- end fuse_contexts()
+    # ------------------------------------------------------------------------- end _dispatch_fusion()
 
-    # ---------------------------------------------
-    # --- Internal/Private Methods ---
-    # ---------------------------------------------
-    
     # ------------------------------------------------------------------------- _weighted_linear_fusion()
     async def _weighted_linear_fusion(
         self, 
@@ -403,7 +489,8 @@ class HybridContextFusion:
     async def _advanced_hybrid_fusion(
         self, 
         response: ParallelRetrievalResponse, 
-        weights: FusionWeights
+        weights: FusionWeights,
+        single_shot: bool = False
     ) -> FusionResult:
         """
         Advanced hybrid fusion based on research literature
@@ -413,45 +500,43 @@ class HybridContextFusion:
         2. Regulatory domain-specific fusion
         3. Quality-based weighting
         4. Semantic coherence optimization
+        
+        With single_shot, step 4 is left to the template LLM call: the result
+        carries the raw contexts and weights in FusionResult.single_shot and a
+        locally weighted fused_content for quality scoring and fallbacks.
         """
         vector_result = response.vector_result
         graph_result = response.graph_result
         
-        # Step 1: Analyze complementary information
-        complementarity_score = self._calculate_complementarity(
-            vector_result.content, 
-            graph_result.content
-        )
-        
-        # Step 2: Calculate domain-specific weights
-        vector_regulatory_score = self._calculate_regulatory_quality(vector_result.content)
-        graph_regulatory_score = self._calculate_regulatory_quality(graph_result.content)
-        
-        # Step 3: Adaptive weighting based on content quality
-        adaptive_vector_weight = self._calculate_adaptive_weight(
-            vector_result, vector_regulatory_score, complementarity_score
-        )
-        adaptive_graph_weight = self._calculate_adaptive_weight(
-            graph_result, graph_regulatory_score, complementarity_score
-        )
-        
-        # Normalize weights
-        total_weight = adaptive_vector_weight + adaptive_graph_weight
-        if total_weight > 0:
-            adaptive_vector_weight /= total_weight
-            adaptive_graph_weight /= total_weight
+        # Steps 1-3: Complementarity, domain-specific quality and adaptive weights
+        (complementarity_score, vector_regulatory_score, graph_regulatory_score,
+         adaptive_vector_weight, adaptive_graph_weight) = self._calculate_source_weights(response)
         
         # Step 4: Create semantically coherent fusion
-        if self.llm is None:
-            self.llm = get_llm()
-            
-        fused_content = await self._create_semantic_fusion(
-            vector_result.content,
-            graph_result.content,
-            adaptive_vector_weight,
-            adaptive_graph_weight,
-            response.query
-        )
+        single_shot_context = None
+        if single_shot:
+            single_shot_context = SingleShotContext(
+                vector_content=vector_result.content,
+                graph_content=graph_result.content,
+                vector_weight=adaptive_vector_weight,
+                graph_weight=adaptive_graph_weight,
+                vector_is_chunks=vector_result.chunks is not None
+            )
+            fused_content = self._create_weighted_content(
+                vector_result.content, graph_result.content, adaptive_vector_weight, adaptive_graph_weight
+            )
+        else:
+            if self.llm is None:
+                self.llm = get_llm()
+                
+            fused_content = await self._create_semantic_fusion(
+                vector_result.content,
+                graph_result.content,
+                adaptive_vector_weight,
+                adaptive_graph_weight,
+                response.query,
+                vector_is_chunks=vector_result.chunks is not None
+            )
         
         # Step 5: Calculate advanced fusion confidence
         final_confidence = self._calculate_advanced_confidence(
@@ -486,16 +571,98 @@ class HybridContextFusion:
                 "complementarity_score": complementarity_score,
                 "vector_regulatory_score": vector_regulatory_score,
                 "graph_regulatory_score": graph_regulatory_score,
-                "fusion_method": "advanced_semantic_coherence"
-            }
+                "vector_input": "chunks" if vector_result.chunks is not None else "answer",
+                "fusion_method": "single_shot_deferred" if single_shot else "advanced_semantic_coherence"
+            },
+            single_shot=single_shot_context
         )
     # ------------------------------------------------------------------------- end _advanced_hybrid_fusion()
 
+    # ------------------------------------------------------------------------- _extractive_fusion()
+    async def _extractive_fusion(
+        self, 
+        response: ParallelRetrievalResponse, 
+        weights: FusionWeights
+    ) -> FusionResult:
+        """
+        Extractive fusion without an LLM call
+        
+        Sentences from both contexts are deduplicated, ranked by query overlap,
+        regulatory density and adaptive source weight, and packed into the
+        fusion_extractive_max_tokens budget. The sentences carrying every CFR
+        citation found by EnhancedCFRParser are always kept (see
+        extractive_fusion.py). Weights and confidence use the same formulas as
+        advanced hybrid fusion.
+        """
+        vector_result = response.vector_result
+        graph_result = response.graph_result
+        
+        (complementarity_score, vector_regulatory_score, graph_regulatory_score,
+         adaptive_vector_weight, adaptive_graph_weight) = self._calculate_source_weights(response)
+        
+        budget_tokens = getattr(get_config(), "fusion_extractive_max_tokens", DEFAULT_BUDGET_TOKENS)
+        with span("fusion.extractive"):
+            extraction = extractive_fuse(
+                vector_result.content,
+                graph_result.content,
+                response.query,
+                adaptive_vector_weight,
+                adaptive_graph_weight,
+                budget_tokens=budget_tokens,
+                vector_chunks=vector_result.chunks
+            )
+        
+        fused_content = extraction.content
+        if not fused_content:
+            fused_content = self._create_weighted_content(
+                vector_result.content, graph_result.content, adaptive_vector_weight, adaptive_graph_weight
+            )
+        
+        # Contributions are the shares of the packed context
+        selected_tokens = extraction.vector_tokens + extraction.graph_tokens
+        if selected_tokens > 0:
+            vector_contribution = extraction.vector_tokens / selected_tokens
+            graph_contribution = extraction.graph_tokens / selected_tokens
+        else:
+            vector_contribution = adaptive_vector_weight
+            graph_contribution = adaptive_graph_weight
+        
+        final_confidence = self._calculate_advanced_confidence(
+            vector_result.confidence,
+            graph_result.confidence,
+            complementarity_score,
+            vector_regulatory_score,
+            graph_regulatory_score
+        )
+        
+        logger.info(f"Extractive fusion: {extraction.selected_sentences}/{extraction.input_sentences} sentences, "
+                    f"{extraction.output_tokens}/{extraction.budget_tokens} tokens, "
+                    f"{extraction.citations_kept}/{extraction.citations_total} citations kept")
+        
+        return FusionResult(
+            fused_content=fused_content,
+            fusion_strategy="extractive",
+            vector_contribution=vector_contribution,
+            graph_contribution=graph_contribution,
+            final_confidence=final_confidence,
+            fusion_quality_score=self._calculate_quality_score(fused_content),
+            metadata={
+                "complementarity_score": complementarity_score,
+                "vector_regulatory_score": vector_regulatory_score,
+                "graph_regulatory_score": graph_regulatory_score,
+                "vector_input": "chunks" if vector_result.chunks is not None else "answer",
+                "fusion_method": "extractive_sentence_packing",
+                "extraction": extraction.get_stats()
+            }
+        )
+    # ------------------------------------------------------------------------- end _extractive_fusion()
+
     # ------------------------------------------------------------------------- _adaptive_fusion()
     async def _adaptive_fusion(
         self, 
         response: ParallelRetrievalResponse, 
-        weights: FusionWeights
+        weights: FusionWeights,
+        single_shot: bool = False
     ) -> FusionResult:
         """
         Adaptive fusion that dynamically adjusts strategy based on content analysis
@@ -513,7 +680,7 @@ class HybridContextFusion:
         # Decide on best strategy based on analysis
         if vector_analysis["complexity"] > 0.7 and graph_analysis["complexity"] > 0.7:
             # Both are complex, use advanced hybrid
-            return await self._advanced_hybrid_fusion(response, weights)
+            return await self._advanced_hybrid_fusion(response, weights, single_shot)
         elif abs(vector_result.confidence - graph_result.confidence) > 0.3:
             # Large confidence difference, use max confidence
             return await self._max_confidence_fusion(response)
@@ -560,15 +727,22 @@ class HybridContextFusion:
         graph_content: str,
         vector_weight: float,
         graph_weight: float,
-        original_query: str
+        original_query: str,
+        vector_is_chunks: bool = False
     ) -> str:
-        """Create semantically coherent fusion using LLM"""
+        """Create semantically coherent fusion using LLM
+
+        When vector_is_chunks is True the vector content is the ranked source
+        passages from retrieval-only mode rather than an LLM-written answer.
+        """
+        
+        vector_label = "Vector Search Passages, ranked by similarity" if vector_is_chunks else "Vector Search Results"
         
         fusion_prompt = f"""You are an expert at combining regulatory information from multiple sources.
 
 Original Question: {original_query}
 
-Vector Search Results (Weight: {vector_weight:.2f}):
+{vector_label} (Weight: {vector_weight:.2f}):
 {vector_content}
 
 Graph Analysis Results (Weight: {graph_weight:.2f}):
@@ -596,10 +770,11 @@ Combined Response:"""
                 logger.error("❌ LLM initialization failed in semantic fusion")
                 raise ValueError("LLM not available for semantic fusion")
                 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm.invoke(fusion_prompt) if self.llm else None
-            )
+            with span("fusion.llm"):
+                response = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: self.llm.invoke(fusion_prompt) if self.llm else None
+                )
             
             # Handle different response types properly
             if response is not None and hasattr(response, 'content'):
@@ -643,66 +818,57 @@ Combined Response:"""
 
     # ------------------------------------------------------------------------- _calculate_regulatory_quality()
     def _calculate_regulatory_quality(self, content: str) -> float:
-        """Calculate regulatory quality score for content"""
-        
-        quality_score = 0.0
-        
-        # Enhanced CFR citations with hierarchical awareness
-        # Basic CFR citations (existing)
-        cfr_matches = len(re.findall(r'\b\d+\s+CFR\s+§\s*\d+', content))
-        quality_score += min(0.3, cfr_matches * 0.1)
-        
-        # ENHANCEMENT: Advanced CFR citation patterns
-        # Complete citations with parts and subparts
-        complete_citations = len(re.findall(r'\b\d+\s+CFR\s+Part\s+\d+\s+§\s*\d+', content))
-        quality_score += min(0.15, complete_citations * 0.15)
-        
-        # Cross-references and related sections
-        cross_refs = len(re.findall(r'section\s+\d+(?:\.\d+)?(?:\([a-zA-Z0-9]+\))*', content, re.IGNORECASE))
-        quality_score += min(0.1, cross_refs * 0.05)
-        
-        # Enhanced regulatory keywords with mining-specific terms
-        regulatory_terms = [
-            'shall', 'must', 'required', 'compliance', 'standard',
-            'regulation', 'safety', 'equipment', 'operator', 'mine'
-        ]
-        
-        # ENHANCEMENT: MSHA-specific terminology
-        msha_terms = [
-            'underground coal', 'surface coal', 'metal mine', 'mine operator',
-            'competent person', 'qualified person', 'permissible equipment',
-            'methane monitoring', 'ventilation plan', 'self-rescue device',
-            'mine rescue', 'electrical examination', 'roof control'
-        ]
-        
-        term_count = sum(1 for term in regulatory_terms if term.lower() in content.lower())
-        msha_term_count = sum(1 for term in msha_terms if term.lower() in content.lower())
-        
-        quality_score += min(0.25, term_count * 0.03)
-        quality_score += min(0.15, msha_term_count * 0.05)  # Higher weight for MSHA-specific terms
-        
-        # ENHANCEMENT: Safety urgency indicators
-        safety_critical_terms = ['immediate', 'emergency', 'danger', 'fatal', 'explosion', 'methane']
-        safety_count = sum(1 for term in safety_critical_terms if term.lower() in content.lower())
-        quality_score += min(0.1, safety_count * 0.1)  # Higher penalty for safety-critical content
-        
-        # Length and structure (existing)
-        if len(content) > 200:
-            quality_score += 0.15  # Reduced from 0.2 to accommodate new scoring
-        if len(content) > 500:
-            quality_score += 0.05  # Reduced from 0.1
-            
-        # Enhanced specific details with mining measurements
-        detail_patterns = [
-            r'\d+\s*(feet|foot|ft)', r'\d+\s*(percent|%)', r'\d+\s*psi',
-            r'\d+\s*cfm', r'\d+\s*rpm', r'\d+\s*(volt|amp)', r'\d+\s*degree'
-        ]
-        detail_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) for pattern in detail_patterns)
-        quality_score += min(0.1, detail_count * 0.02)
-        
-        return min(1.0, quality_score)
+        """Calculate regulatory quality score for content
+
+        Citations, cross-references, measurements and regulatory vocabulary are
+        counted in a single compiled pass, once per content per request
+        (see content_analysis.py).
+        """
+        return get_content_analysis(content).regulatory_quality
     # ------------------------------------------------------------------------- end _calculate_regulatory_quality()
 
+    # ------------------------------------------------------------------------- _calculate_source_weights()
+    def _calculate_source_weights(
+        self, 
+        response: ParallelRetrievalResponse
+    ) -> Tuple[float, float, float, float, float]:
+        """Calculate complementarity, regulatory scores and normalized adaptive weights
+
+        Returns:
+            Tuple[float, float, float, float, float]: complementarity, vector and graph
+            regulatory scores, and normalized vector and graph weights.
+        """
+        vector_result = response.vector_result
+        graph_result = response.graph_result
+        
+        # Analyze complementary information
+        complementarity_score = self._calculate_complementarity(
+            vector_result.content, 
+            graph_result.content
+        )
+        
+        # Calculate domain-specific weights
+        vector_regulatory_score = self._calculate_regulatory_quality(vector_result.content)
+        graph_regulatory_score = self._calculate_regulatory_quality(graph_result.content)
+        
+        # Adaptive weighting based on content quality
+        adaptive_vector_weight = self._calculate_adaptive_weight(
+            vector_result, vector_regulatory_score, complementarity_score
+        )
+        adaptive_graph_weight = self._calculate_adaptive_weight(
+            graph_result, graph_regulatory_score, complementarity_score
+        )
+        
+        # Normalize weights
+        total_weight = adaptive_vector_weight + adaptive_graph_weight
+        if total_weight > 0:
+            adaptive_vector_weight /= total_weight
+            adaptive_graph_weight /= total_weight
+        
+        return (complementarity_score, vector_regulatory_score, graph_regulatory_score,
+                adaptive_vector_weight, adaptive_graph_weight)
+    # ------------------------------------------------------------------------- end _calculate_source_weights()
+
     # ------------------------------------------------------------------------- _calculate_adaptive_weight()
     def _calculate_adaptive_weight(
         self, 
@@ -754,52 +920,45 @@ Combined Response:"""
 
     # ------------------------------------------------------------------------- _analyze_content_characteristics()
     def _analyze_content_characteristics(self, content: str) -> Dict[str, float]:
-        """Analyze content characteristics for adaptive fusion"""
-        
-        characteristics = {
-            "complexity": 0.0,
-            "regulatory_density": 0.0,
-            "specificity": 0.0,
-            "length_score": 0.0
-        }
-        
-        # Complexity based on sentence structure and vocabulary
-        sentences = content.split('.')
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / max(1, len(sentences))
-        characteristics["complexity"] = min(1.0, avg_sentence_length / 25.0)
-        
-        # Regulatory density
-        characteristics["regulatory_density"] = self._calculate_regulatory_quality(content)
-        
-        # Specificity based on numbers and technical terms
-        technical_patterns = [r'\d+', r'CFR', r'§', r'percent', r'psi', r'feet']
-        tech_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) for pattern in technical_patterns)
-        characteristics["specificity"] = min(1.0, tech_count / 10.0)
-        
-        # Length score
-        characteristics["length_score"] = min(1.0, len(content) / 1000.0)
-        
-        return characteristics
+        """Analyze content characteristics for adaptive fusion
+
+        Returns complexity, regulatory_density, specificity and length_score,
+        computed once per content per request (see content_analysis.py).
+        """
+        return get_content_analysis(content).characteristics
     # ------------------------------------------------------------------------- end _analyze_content_characteristics()
 
     # ------------------------------------------------------------------------- _calculate_quality_score()
     def _calculate_quality_score(self, content: str) -> float:
         """Calculate overall quality score for fused content"""
-        
-        # Combine multiple quality metrics
-        reg_quality = self._calculate_regulatory_quality(content)
-        characteristics = self._analyze_content_characteristics(content)
-        
-        quality_score = (
-            reg_quality * 0.4 +
-            characteristics["complexity"] * 0.2 +
-            characteristics["specificity"] * 0.3 +
-            characteristics["length_score"] * 0.1
-        )
-        
-        return min(1.0, quality_score)
+        return get_content_analysis(content).quality_score
     # ------------------------------------------------------------------------- end _calculate_quality_score()
 
+    # ------------------------------------------------------------------------- _create_section_lookup_fusion()
+    def _create_section_lookup_fusion(self, response: ParallelRetrievalResponse,
+                                      requested_strategy: FusionStrategy) -> FusionResult:
+        """Use the section index chunks as the context; there is no graph result to fuse"""
+        vector_result = response.vector_result
+        return FusionResult(
+            fused_content=vector_result.content,
+            fusion_strategy="section_lookup",
+            vector_contribution=1.0,
+            graph_contribution=0.0,
+            final_confidence=vector_result.confidence,
+            fusion_quality_score=self._calculate_quality_score(vector_result.content),
+            metadata={
+                "fusion_method": "section_lookup",
+                "sections": response.section_lookup,
+                "vector_input": "chunks",
+                "strategy_override": {
+                    "requested": requested_strategy.value,
+                    "applied": "section_lookup",
+                    "reason": "graph branch skipped for a CFR section index hit"
+                }
+            }
+        )
+    # ------------------------------------------------------------------------- end _create_section_lookup_fusion()
+
     # ------------------------------------------------------------------------- _create_fallback_fusion()
     def _create_fallback_fusion(self, response: ParallelRetrievalResponse) -> FusionResult:
         """Create fallback fusion when parallel response is not fusion ready"""
@@ -891,7 +1050,8 @@ async def test_context_fusion():
         FusionStrategy.WEIGHTED_LINEAR,
         FusionStrategy.MAX_CONFIDENCE,
         FusionStrategy.ADVANCED_HYBRID,
-        FusionStrategy.ADAPTIVE_FUSION
+        FusionStrategy.ADAPTIVE_FUSION,
+        FusionStrategy.EXTRACTIVE
     ]
     
     for strategy in strategies:
@@ -0,0 +1,552 @@
+# -------------------------------------------------------------------------
+# File: context_packing.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/context_packing.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module fits retrieved context into the prompt token budget of the
+# response LLM. Tokens are counted with the model's local tiktoken encoding
+# (four characters per token if tiktoken or its encoding file is unavailable),
+# and counts are cached per chunk, so the chunks and sentences that recur across
+# templates and requests are encoded once. The packer fills the budget with
+# whole paragraphs (chunks) in priority order. When a paragraph does not fit,
+# its leading sentences are packed instead, so a CFR citation is never cut in half.
+# Only chunk and sentence counts are cached: whole contexts and packed outputs
+# are unique per request and are counted without filling the cache.
+# Each packing reports the tokens used against the tokens available.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: TokenCountStats - Token count cache counters
+# - Class: TokenCounter - Cached token counting with a local tokenizer
+# - Class: PackedContext - Packed text with used/available token report
+# - Function: get_token_counter() - Per-model TokenCounter singletons
+# - Function: get_context_budget() - Per-model context token budget
+# - Function: pack_context() - Fill a token budget with whole chunks or sentences
+# - Function: estimate_tokens() - Approximate prompt token count (tokenizer fallback)
+# - Constants: MODEL_CONTEXT_BUDGETS, DEFAULT_CONTEXT_BUDGET, TRUNCATION_MARKER, SENTENCE_BOUNDARY
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - logging: Tokenizer fallback warnings
+#   - re: Sentence, paragraph and heading detection
+#   - collections.OrderedDict: Token count LRU
+#   - dataclasses: Stats and result data structures
+#   - threading.Lock: Thread-safe cache and singleton access
+#   - typing: Type hints (Any, Dict, List, Optional, Tuple)
+# - Third-Party:
+#   - tiktoken (optional, installed with langchain-openai): Local BPE tokenizer
+# - Local Project Modules:
+#   - .config.get_config: Response model name and context budget override
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# HybridPromptTemplate (hybrid_templates.py) and EnhancedComplianceTemplateSystem
+# (cfr_compliance_enhanced.py) pack their context blocks with pack_context()
+# instead of cutting at a character count. The budget comes from
+# TemplateConfig.max_context_tokens, BackendConfig.prompt_context_max_tokens or
+# MODEL_CONTEXT_BUDGETS, in that order.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Token-Budget Context Packing for MRCA
+
+Counts prompt tokens with a cached local tokenizer and fills a per-model token
+budget with whole chunks or sentences, reporting used versus available tokens.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-party library imports
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .config import get_config
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from config import get_config
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Retrieved-context tokens per prompt, by response model (longest prefix wins)
+MODEL_CONTEXT_BUDGETS = {
+    "gpt-4o": 1500,
+    "gpt-4o-mini": 1500,
+    "gpt-4-turbo": 1500,
+    "gpt-4": 1000,
+    "gpt-3.5-turbo": 1000,
+}
+
+# Budget for models missing from MODEL_CONTEXT_BUDGETS
+DEFAULT_CONTEXT_BUDGET = 1000
+
+# Encoding used when tiktoken does not know the model name
+DEFAULT_ENCODING = "o200k_base"
+
+# Token counts kept per TokenCounter
+TOKEN_COUNT_CACHE_SIZE = 4096
+
+# Appended when content was left out
+TRUNCATION_MARKER = "\n\n[Content truncated for length]"
+
+# Sentence boundaries: ., ! or ? followed by whitespace and a capital, digit,
+# "§", bracket or quote. Section numbers ("§ 75.1720(a)") have no whitespace
+# after their periods, so a citation is never split. Common abbreviations are
+# excluded. Shared with extractive_fusion.
+SENTENCE_BOUNDARY = re.compile(
+    r'(?<=[.!?])(?<!\bSec\.)(?<!\bNo\.)(?<!\bPt\.)(?<!\be\.g\.)(?<!\bi\.e\.)(?<!\bU\.S\.)'
+    r'\s+(?=[A-Z0-9§(\["\'])'
+)
+
+# Separator between packed paragraphs
+_PARAGRAPH_SEPARATOR = "\n\n"
+
+# Paragraph breaks (chunk boundaries)
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Markdown heading line at the start of a paragraph
+_HEADING_LINE = re.compile(r'^#{1,6}\s')
+
+# Global per-model counters and thread lock for singleton pattern
+_token_counters: Dict[str, 'TokenCounter'] = {}
+_token_counters_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class TokenCountStats
+@dataclass
+class TokenCountStats:
+    """Counters for token count cache activity.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        hits (int): Counts served from the cache.
+        misses (int): Counts that ran the tokenizer.
+        evictions (int): Entries evicted from the cache.
+
+    Methods:
+        None
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+# ------------------------------------------------------------------------- end class TokenCountStats
+
+# ------------------------------------------------------------------------- class TokenCounter
+class TokenCounter:
+    """Token counting for one model with a bounded per-text LRU cache.
+
+    The tiktoken encoding is loaded on first use. If tiktoken is not installed,
+    or its encoding file cannot be loaded (e.g. offline), counts fall back to
+    estimate_tokens().
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        model (str): Model name used to pick the encoding.
+        max_entries (int): Maximum number of cached counts.
+        stats (TokenCountStats): Cache counters.
+        _cache (OrderedDict): LRU of text -> token count.
+        _lock (Lock): Protects the cache, counters and encoding load.
+        _encoding (Any): tiktoken encoding, None when estimating.
+        _encoding_loaded (bool): Whether the encoding load was attempted.
+
+    Methods:
+        count(): Count the tokens of a text.
+        tokenizer: Name of the tokenizer in use.
+        get_stats(): Get counters, cache size and hit rate.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, model: str, max_entries: int = TOKEN_COUNT_CACHE_SIZE) -> None:
+        """Initialize an empty counter.
+
+        Args:
+            model (str): Model name, e.g. "gpt-4o".
+            max_entries (int): Cache bound. Defaults to TOKEN_COUNT_CACHE_SIZE.
+        """
+        self.model = model
+        self.max_entries = max(1, max_entries)
+        self.stats = TokenCountStats()
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = Lock()
+        self._encoding: Any = None
+        self._encoding_loaded = False
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+
+    # ------------------------------------------------------------------------- _get_encoding()
+    def _get_encoding(self) -> Any:
+        """Load the model's tiktoken encoding once; None if unavailable."""
+        with self._lock:
+            if self._encoding_loaded:
+                return self._encoding
+            self._encoding_loaded = True
+            if tiktoken is None:
+                logger.info("tiktoken not installed, estimating prompt tokens from characters")
+                return None
+            try:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+            except Exception as e:
+                logger.warning(f"⚠️ tiktoken encoding for {self.model} unavailable, estimating tokens: {e}")
+                self._encoding = None
+            return self._encoding
+    # ------------------------------------------------------------------------- end _get_encoding()
+
+    # ------------------------------------------------------------------------- _encode_count()
+    def _encode_count(self, text: str) -> int:
+        """Run the tokenizer (or the character estimate) on a text."""
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        return estimate_tokens(text)
+    # ------------------------------------------------------------------------- end _encode_count()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- count()
+    def count(self, text: str, cache: bool = True) -> int:
+        """Count the tokens of a text, serving repeated texts from the cache.
+
+        Args:
+            text (str): Text.
+            cache (bool): Whether to look up and store the count. Pass False for
+                          text that will not recur (whole contexts, packed output,
+                          trial prefixes), so it does not evict chunk counts.
+
+        Returns:
+            int: Token count (0 for empty text).
+        """
+        if not text:
+            return 0
+        if not cache:
+            return self._encode_count(text)
+        with self._lock:
+            tokens = self._cache.get(text)
+            if tokens is not None:
+                self._cache.move_to_end(text)
+                self.stats.hits += 1
+                return tokens
+
+        tokens = self._encode_count(text)
+        with self._lock:
+            self.stats.misses += 1
+            self._cache[text] = tokens
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self.stats.evictions += 1
+        return tokens
+    # ------------------------------------------------------------------------- end count()
+
+    # ------------------------------------------------------------------------- tokenizer
+    @property
+    def tokenizer(self) -> str:
+        """Name of the tokenizer in use ("tiktoken:<encoding>" or "estimate")."""
+        encoding = self._get_encoding()
+        return f"tiktoken:{encoding.name}" if encoding is not None else "estimate"
+    # ------------------------------------------------------------------------- end tokenizer
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters, cache size and hit rate.
+
+        Returns:
+            Dict[str, Any]: Token count cache statistics.
+        """
+        with self._lock:
+            counters = asdict(self.stats)
+            entries = len(self._cache)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "model": self.model,
+            "tokenizer": self.tokenizer,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class TokenCounter
+
+# ------------------------------------------------------------------------- class PackedContext
+@dataclass
+class PackedContext:
+    """Context packed into a token budget.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        content (str): Packed text, ending with the truncation marker if anything was left out.
+        used_tokens (int): Tokens of the packed text.
+        available_tokens (int): Token budget.
+        units_total (int): Paragraphs in the input.
+        units_packed (int): Paragraphs kept whole.
+        sentences_packed (int): Leading sentences kept from paragraphs that did not fit whole.
+        truncated (bool): Whether any input text was left out.
+        tokenizer (str): Tokenizer used for the counts.
+
+    Methods:
+        get_stats(): Report without the packed text.
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    content: str
+    used_tokens: int
+    available_tokens: int
+    units_total: int
+    units_packed: int
+    sentences_packed: int
+    truncated: bool
+    tokenizer: str
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Used versus available tokens and packing counts (content omitted)."""
+        stats = asdict(self)
+        del stats["content"]
+        return stats
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class PackedContext
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_token_counter()
+def get_token_counter(model: Optional[str] = None) -> TokenCounter:
+    """Get the process-wide TokenCounter for a model (singleton per model).
+
+    Args:
+        model (Optional[str]): Model name. None uses BackendConfig.openai_model.
+
+    Returns:
+        TokenCounter: Shared counter for the model.
+
+    Examples:
+        >>> counter = get_token_counter()
+        >>> assert counter is get_token_counter()
+    """
+    model = model or getattr(get_config(), "openai_model", "gpt-4o")
+    with _token_counters_lock:
+        counter = _token_counters.get(model)
+        if counter is None:
+            counter = _token_counters[model] = TokenCounter(model)
+        return counter
+# ------------------------------------------------------------------------- end get_token_counter()
+
+# ------------------------------------------------------------------------- get_context_budget()
+def get_context_budget(model: Optional[str] = None) -> int:
+    """Get the retrieved-context token budget for a model.
+
+    BackendConfig.prompt_context_max_tokens overrides the per-model table when
+    it is positive.
+
+    Args:
+        model (Optional[str]): Model name. None uses BackendConfig.openai_model.
+
+    Returns:
+        int: Context token budget.
+    """
+    config = get_config()
+    override = getattr(config, "prompt_context_max_tokens", 0)
+    if override and override > 0:
+        return override
+    model = model or getattr(config, "openai_model", "gpt-4o")
+    for prefix in sorted(MODEL_CONTEXT_BUDGETS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_CONTEXT_BUDGETS[prefix]
+    return DEFAULT_CONTEXT_BUDGET
+# ------------------------------------------------------------------------- end get_context_budget()
+
+# ------------------------------------------------------------------------- pack_context()
+def pack_context(
+    content: str,
+    budget_tokens: int,
+    counter: Optional[TokenCounter] = None,
+    truncation_marker: str = TRUNCATION_MARKER
+) -> PackedContext:
+    """Fill a token budget with whole paragraphs, or sentences, in priority order.
+
+    Paragraph order is the priority order: fused contexts put the primary source
+    first and ranked chunks in rank order. A paragraph that fits is kept whole;
+    otherwise its longest run of leading sentences that fits is kept, under its
+    heading line if it has one, so the kept text reads as it was written. Later,
+    shorter paragraphs can still use the remaining budget. Only when not even
+    the first sentence fits is it cut, at a word boundary.
+
+    Token counts of paragraphs, headings and sentences are cached; the whole
+    content and the packed output are counted uncached.
+
+    Args:
+        content (str): Context text.
+        budget_tokens (int): Token budget, including the truncation marker.
+        counter (Optional[TokenCounter]): Token counter. None uses get_token_counter().
+        truncation_marker (str): Text appended when anything was left out.
+
+    Returns:
+        PackedContext: Packed text with the used/available token report.
+
+    Examples:
+        >>> packed = pack_context(fusion_result.fused_content, 1500)
+        >>> print(f"{packed.used_tokens}/{packed.available_tokens} tokens")
+    """
+    counter = counter or get_token_counter()
+    paragraphs = [paragraph.strip() for paragraph in _PARAGRAPH_BREAK.split(content) if paragraph.strip()]
+
+    total_tokens = counter.count(content, cache=False)
+    if total_tokens <= budget_tokens:
+        return PackedContext(content, total_tokens, budget_tokens, len(paragraphs), len(paragraphs), 0,
+                             False, counter.tokenizer)
+
+    separator_tokens = counter.count(_PARAGRAPH_SEPARATOR)
+    remaining = budget_tokens - counter.count(truncation_marker)
+    # (text, sentences kept): None marks a whole paragraph
+    parts: List[Tuple[str, Optional[int]]] = []
+
+    for paragraph in paragraphs:
+        cost = counter.count(paragraph) + (separator_tokens if parts else 0)
+        if cost <= remaining:
+            parts.append((paragraph, None))
+            remaining -= cost
+            continue
+
+        # Whole paragraph does not fit: keep its leading sentences that do
+        heading = ""
+        body = paragraph
+        if _HEADING_LINE.match(paragraph) and "\n" in paragraph:
+            heading, body = paragraph.split("\n", 1)
+        kept: List[str] = []
+        block_remaining = remaining - (separator_tokens if parts else 0) - counter.count(heading)
+        for sentence in SENTENCE_BOUNDARY.split(body.strip()):
+            if not sentence:
+                continue
+            sentence_cost = counter.count(sentence) + (1 if kept else 0)
+            if sentence_cost > block_remaining:
+                break
+            kept.append(sentence)
+            block_remaining -= sentence_cost
+        if kept:
+            parts.append((f"{heading}\n{' '.join(kept)}" if heading else " ".join(kept), len(kept)))
+            remaining = block_remaining
+
+    if not parts and paragraphs:
+        parts.append((_cut_at_word_boundary(paragraphs[0], remaining, counter), 0))
+
+    packed = _PARAGRAPH_SEPARATOR.join(text for text, _ in parts) + truncation_marker
+
+    # Token merges across joins can differ slightly from the per-part counts
+    used_tokens = counter.count(packed, cache=False)
+    while used_tokens > budget_tokens and len(parts) > 1:
+        parts.pop()
+        packed = _PARAGRAPH_SEPARATOR.join(text for text, _ in parts) + truncation_marker
+        used_tokens = counter.count(packed, cache=False)
+
+    units_packed = sum(1 for _, sentences in parts if sentences is None)
+    sentences_packed = sum(sentences or 0 for _, sentences in parts)
+    return PackedContext(packed, used_tokens, budget_tokens, len(paragraphs), units_packed, sentences_packed,
+                         True, counter.tokenizer)
+# ------------------------------------------------------------------------- end pack_context()
+
+# ------------------------------------------------------------------------- estimate_tokens()
+def estimate_tokens(text: str) -> int:
+    """Estimate the prompt tokens of a text (about four characters per token).
+
+    Args:
+        text (str): Text.
+
+    Returns:
+        int: Estimated tokens (0 for empty text).
+    """
+    return (len(text) + 3) // 4
+# ------------------------------------------------------------------------- end estimate_tokens()
+
+# ------------------------
+# --- Helper Functions ---
+# ------------------------
+
+# ------------------------------------------------------------------------- _cut_at_word_boundary()
+def _cut_at_word_boundary(text: str, budget_tokens: int, counter: TokenCounter) -> str:
+    """Longest word prefix of text within budget_tokens (binary search)."""
+    words = text.split()
+    low, high = 0, len(words)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if counter.count(" ".join(words[:middle]), cache=False) <= budget_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return " ".join(words[:low])
+# ------------------------------------------------------------------------- end _cut_at_word_boundary()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,352 @@
+# -------------------------------------------------------------------------
+# File: cypher_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/cypher_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module caches Cypher statements generated by the GraphRAG Cypher QA chain.
+# Identical or trivially different questions otherwise make GPT-4o regenerate the
+# same Cypher every time. Statements are keyed by the normalized (enhanced) graph
+# question and a fingerprint of the graph schema, held in a bounded in-memory LRU,
+# and persisted in SQLite so they survive restarts. Only statements that executed
+# successfully with results are stored; a cached statement that later errors or
+# returns no records is evicted.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: CypherCacheStats - Store/validation eviction counters dataclass
+# - Class: CypherQueryCache - Generated Cypher keys and validation over a two-tier store
+# - Function: schema_fingerprint() - Short hash of the graph schema used in cache keys
+# - Function: get_cypher_cache() - Singleton accessor configured from BackendConfig
+# - Global Variables: _cypher_cache, _cypher_cache_lock - Thread-safe singleton management
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - hashlib: Cache key and schema fingerprint hashing
+#   - logging: Cache operation logging
+#   - dataclasses: Counter data structure
+#   - threading.Lock: Thread-safe counters and singleton creation
+#   - typing: Type hints (Any, Dict, Optional)
+# - Third-Party: None
+# - Local Project Modules:
+#   - .config.get_config: Cache size, path and enablement settings
+#   - .embedding_cache.normalize_question_text: Shared question normalization
+#   - .two_tier_cache.TwoTierStore: Memory LRU and SQLite tiers shared with the embedding cache
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# tools/cypher.py consults get_cypher_cache() before asking the LLM to generate
+# Cypher: a hit executes the cached statement directly against Neo4j. Statistics
+# are reported in the Cypher tool health metrics and /parallel_hybrid/health.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Generated-Cypher Cache for MRCA GraphRAG
+
+Caches validated LLM-generated Cypher keyed by normalized question and graph
+schema fingerprint, in memory and in a SQLite tier that persists across restarts.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import hashlib
+import logging
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Dict, Optional
+
+# Third-party library imports
+# (None for this module)
+
+# Local application/library specific imports
+from .config import get_config
+from .embedding_cache import normalize_question_text
+from .two_tier_cache import TwoTierStore
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Global cache instance and thread lock for singleton pattern
+_cypher_cache: Optional['CypherQueryCache'] = None
+_cypher_cache_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class CypherCacheStats
+@dataclass
+class CypherCacheStats:
+    """Counters for generated-Cypher validation (tier counters live in TwoTierStore).
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        stores (int): Validated statements added to the cache.
+        evictions_error (int): Cached statements evicted because they raised.
+        evictions_empty (int): Cached statements evicted because they returned no records.
+
+    Methods:
+        None
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    stores: int = 0
+    evictions_error: int = 0
+    evictions_empty: int = 0
+
+# ------------------------------------------------------------------------- end class CypherCacheStats
+
+# ------------------------------------------------------------------------- class CypherQueryCache
+class CypherQueryCache:
+    """Two-tier store of validated generated Cypher: memory LRU in front of SQLite.
+
+    Keys combine the normalized graph question with a schema fingerprint, so a
+    schema change makes old statements unreachable instead of serving Cypher
+    written against a different graph. Storage and capacity eviction come from
+    TwoTierStore (table "generated_cypher"), shared with the embedding cache.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        max_entries (int): Maximum statements kept in each tier.
+        db_path (Optional[str]): SQLite database path, or None for memory only.
+        stats (CypherCacheStats): Store and validation eviction counters.
+        _store (TwoTierStore): Memory and SQLite tiers.
+        _lock (Lock): Protects the counters.
+
+    Methods:
+        make_key(): Build the cache key for a question and schema fingerprint.
+        get(): Look up a statement in memory, then on disk.
+        put(): Store a validated statement in both tiers.
+        evict(): Remove a statement that errored or returned no records.
+        clear(): Empty both tiers.
+        get_stats(): Get counters, tier sizes and hit rate.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, max_entries: int = 5000, db_path: Optional[str] = None) -> None:
+        """Initialize the cache and open the SQLite tier if a path is given.
+
+        Args:
+            max_entries (int): Size bound of each tier. Defaults to 5000.
+            db_path (Optional[str]): SQLite file path. None disables the disk tier.
+        """
+        self.max_entries = max(1, max_entries)
+        self.db_path = db_path
+        self.stats = CypherCacheStats()
+        self._store = TwoTierStore(
+            name="Cypher cache",
+            table="generated_cypher",
+            max_memory_entries=self.max_entries,
+            db_path=db_path,
+            max_disk_entries=self.max_entries,
+        )
+        self._lock = Lock()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- put()
+    def put(self, key: str, question: str, cypher: str) -> None:
+        """Store a validated statement in the memory and disk tiers.
+
+        Callers only store statements that executed successfully and returned records.
+
+        Args:
+            key (str): Cache key from make_key().
+            question (str): Graph question, stored for diagnostics.
+            cypher (str): Generated Cypher statement.
+        """
+        self._store.put(key, cypher, info=question)
+        with self._lock:
+            self.stats.stores += 1
+    # ------------------------------------------------------------------------- end put()
+
+    # ------------------------------------------------------------------------- evict()
+    def evict(self, key: str, reason: str) -> None:
+        """Remove a cached statement that errored or returned no records.
+
+        Args:
+            key (str): Cache key from make_key().
+            reason (str): "error" or "empty".
+        """
+        self._store.delete(key)
+        with self._lock:
+            if reason == "error":
+                self.stats.evictions_error += 1
+            else:
+                self.stats.evictions_empty += 1
+        logger.info(f"Evicted cached Cypher ({reason})")
+    # ------------------------------------------------------------------------- end evict()
+
+    # ------------------------------------------------------------------------- clear()
+    def clear(self) -> None:
+        """Empty both tiers without resetting the counters."""
+        self._store.clear()
+    # ------------------------------------------------------------------------- end clear()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- make_key()
+    @staticmethod
+    def make_key(question: str, schema_hash: str) -> str:
+        """Build the cache key for a graph question and schema fingerprint.
+
+        Args:
+            question (str): Graph question (the enhanced question from the parallel engine).
+            schema_hash (str): Fingerprint from schema_fingerprint().
+
+        Returns:
+            str: SHA-256 hex digest of the schema fingerprint and normalized question.
+        """
+        material = f"{schema_hash}\x00{normalize_question_text(question).rstrip(' ?.!')}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    # ------------------------------------------------------------------------- end make_key()
+
+    # ------------------------------------------------------------------------- get()
+    def get(self, key: str) -> Optional[str]:
+        """Look up a statement in memory, then on disk, counting the outcome.
+
+        Disk hits are promoted into the memory tier.
+
+        Args:
+            key (str): Cache key from make_key().
+
+        Returns:
+            Optional[str]: Cached Cypher statement, or None on a miss.
+        """
+        return self._store.get(key)
+    # ------------------------------------------------------------------------- end get()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters, tier sizes and hit rate.
+
+        Returns:
+            Dict[str, Any]: Cache statistics for health and metrics endpoints.
+
+        Examples:
+            >>> stats = get_cypher_cache().get_stats()
+            >>> print(f"Hit rate: {stats['hit_rate']:.1%}")
+        """
+        tiers = self._store.get_stats()
+        with self._lock:
+            counters = asdict(self.stats)
+
+        hits = tiers["memory_hits"] + tiers["disk_hits"]
+        lookups = hits + tiers["misses"]
+        return {
+            "hits": hits,
+            "misses": tiers["misses"],
+            **counters,
+            "capacity_evictions": tiers["memory_evictions"] + tiers["disk_evictions"],
+            "disk_errors": tiers["disk_errors"],
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": tiers["memory_entries"],
+            "max_entries": self.max_entries,
+            "disk_enabled": tiers["disk_enabled"],
+            "disk_entries": tiers["disk_entries"],
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class CypherQueryCache
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# --------------------------
+# --- Utility Functions ---
+# --------------------------
+
+# ------------------------------------------------------------------------- schema_fingerprint()
+def schema_fingerprint(schema: str) -> str:
+    """Short hash of the graph schema text used in cache keys.
+
+    Args:
+        schema (str): Schema description used for Cypher generation.
+
+    Returns:
+        str: First 16 hex digits of the schema's SHA-256 digest.
+
+    Examples:
+        >>> len(schema_fingerprint("Node properties: Chunk {text: STRING}"))
+        16
+    """
+    return hashlib.sha256((schema or "").encode("utf-8")).hexdigest()[:16]
+# ------------------------------------------------------------------------- end schema_fingerprint()
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_cypher_cache()
+def get_cypher_cache() -> Optional[CypherQueryCache]:
+    """Get the process-wide generated-Cypher cache (singleton).
+
+    Size and SQLite path come from BackendConfig. An empty cypher_cache_path
+    disables the disk tier.
+
+    Returns:
+        Optional[CypherQueryCache]: Shared cache instance, or None if
+                                    cypher_cache_enabled is False.
+
+    Examples:
+        >>> cache = get_cypher_cache()
+        >>> assert cache is get_cypher_cache()
+    """
+    global _cypher_cache
+    config = get_config()
+    if not getattr(config, "cypher_cache_enabled", True):
+        return None
+
+    with _cypher_cache_lock:
+        if _cypher_cache is None:
+            _cypher_cache = CypherQueryCache(
+                max_entries=getattr(config, "cypher_cache_max_entries", 5000),
+                db_path=getattr(config, "cypher_cache_path", ".cache/cypher_cache.sqlite3") or None,
+            )
+        return _cypher_cache
+# ------------------------------------------------------------------------- end get_cypher_cache()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -22,6 +22,7 @@
 # - Class: DatabaseMetrics - Metrics tracking dataclass for performance monitoring
 # - Class: MRCADatabaseError - Base exception class for database errors
 # - Class: DatabaseConnectionError - Exception for connection failures
+# - Class: AsyncDriverUnavailableError - Exception for asyncio driver creation failures
 # - Class: DatabaseQueryError - Exception for query execution failures
 # - Class: EnhancedNeo4jDatabase - Main database class with resilience features
 # - Function: get_database() - Factory function for global database instance
@@ -33,6 +34,7 @@
 
 # --- Dependencies / Imports ---
 # - Standard Library:
+#   - asyncio: For non-blocking backoff delays on the async query path
 #   - time: For timing operations and backoff delays
 #   - logging: For comprehensive error and operation logging
 #   - typing: For type hints (Optional, Dict, Any, List)
@@ -40,9 +42,11 @@
 #   - threading.Lock: For thread-safe singleton pattern implementation
 # - Third-Party:
 #   - neo4j.GraphDatabase, Driver, Record: Core Neo4j database connectivity
+#   - neo4j.AsyncGraphDatabase, AsyncDriver: Native asyncio driver for the async retrieval path
 #   - neo4j.exceptions: Specific Neo4j error handling (ServiceUnavailable, TransientError, DatabaseError)
 # - Local Project Modules:
 #   - .config.get_config: Configuration management for database connection parameters
+#   - .tracing.traced: neo4j.query spans for request tracing
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -70,6 +74,7 @@ Provides connection pooling, retry logic, and comprehensive health monitoring.
 # Imports
 # =========================================================================
 # Standard library imports
+import asyncio
 import time
 import logging
 from typing import Optional, Dict, Any, List, cast, LiteralString
@@ -77,11 +82,12 @@ from dataclasses import dataclass
 from threading import Lock
 
 # Third-party library imports
-from neo4j import GraphDatabase, Driver, Record
+from neo4j import GraphDatabase, AsyncGraphDatabase, Driver, AsyncDriver, Record
 from neo4j.exceptions import ServiceUnavailable, TransientError, DatabaseError
 
 # Local application/library specific imports
 from .config import get_config
+from .tracing import traced
 
 # =========================================================================
 # Global Constants / Variables
@@ -227,6 +233,26 @@ class DatabaseConnectionError(MRCADatabaseError):
     pass
 # ------------------------------------------------------------------------- end class DatabaseConnectionError
 
+# ------------------------------------------------------------------------- class AsyncDriverUnavailableError
+class AsyncDriverUnavailableError(DatabaseConnectionError):
+    """Exception for asyncio driver creation failures.
+
+    This exception is raised when the Neo4j asyncio driver cannot be
+    created. Callers with a threaded (sync driver) path use it to tell an
+    unavailable asyncio path apart from failing queries.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        Inherits from DatabaseConnectionError
+
+    Methods:
+        Inherits from DatabaseConnectionError
+    """
+    pass
+# ------------------------------------------------------------------------- end class AsyncDriverUnavailableError
+
 # ------------------------------------------------------------------------- class DatabaseQueryError
 class DatabaseQueryError(MRCADatabaseError):
     """Exception for database query failures.
@@ -263,6 +289,7 @@ class EnhancedNeo4jDatabase:
         config (DatabaseConfig): Configuration settings for database operations.
         metrics (DatabaseMetrics): Performance and operational metrics.
         _driver (Optional[Driver]): Neo4j driver instance.
+        _async_driver (Optional[AsyncDriver]): Neo4j asyncio driver instance, created on first async query.
         _lock (Lock): Thread synchronization lock.
         _is_connected (bool): Connection status flag.
 
@@ -271,6 +298,9 @@ class EnhancedNeo4jDatabase:
         connect(): Establishes database connection.
         disconnect(): Closes database connection and cleanup resources.
         execute_query(): Executes Cypher query with retry logic.
+        connect_async(): Establishes the asyncio driver.
+        execute_query_async(): Executes Cypher query on the asyncio driver with retry logic.
+        disconnect_async(): Closes the asyncio driver.
         health_check(): Performs comprehensive database health check.
         _get_metrics(): Gets current database metrics.
     """
@@ -294,6 +324,7 @@ class EnhancedNeo4jDatabase:
         self.config = config or DatabaseConfig()
         self.metrics = DatabaseMetrics()
         self._driver: Optional[Driver] = None
+        self._async_driver: Optional[AsyncDriver] = None
         self._lock = Lock()
         self._is_connected = False
         
@@ -318,17 +349,11 @@ class EnhancedNeo4jDatabase:
         Raises:
             DatabaseConnectionError: If configuration is invalid or driver creation fails.
         """
-        app_config = get_config()
-        
-        if not app_config.neo4j_uri:
-            raise DatabaseConnectionError("Neo4j URI not configured")
-        
-        if not app_config.neo4j_username or not app_config.neo4j_password:
-            raise DatabaseConnectionError("Neo4j credentials not configured")
+        uri, auth = self._get_connection_settings()
         
         driver = GraphDatabase.driver(
-            app_config.neo4j_uri,
-            auth=(app_config.neo4j_username, app_config.neo4j_password),
+            uri,
+            auth=auth,
             max_connection_lifetime=self.config.max_connection_lifetime,
             max_connection_pool_size=self.config.max_connection_pool_size,
             connection_timeout=self.config.connection_timeout,
@@ -338,6 +363,54 @@ class EnhancedNeo4jDatabase:
         return driver
     # --------------------------------------------------------------------------------- end _create_driver()
     
+    # --------------------------------------------------------------------------------- _create_async_driver()
+    def _create_async_driver(self) -> AsyncDriver:
+        """Create Neo4j asyncio driver with the same pool settings as the sync driver.
+
+        The asyncio driver is bound to the event loop that uses it, so it is only
+        created from async code running on the application's event loop.
+
+        Returns:
+            AsyncDriver: Configured Neo4j asyncio driver instance.
+
+        Raises:
+            DatabaseConnectionError: If configuration is invalid or driver creation fails.
+        """
+        uri, auth = self._get_connection_settings()
+        
+        driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=auth,
+            max_connection_lifetime=self.config.max_connection_lifetime,
+            max_connection_pool_size=self.config.max_connection_pool_size,
+            connection_timeout=self.config.connection_timeout,
+        )
+        
+        logger.info(f"Neo4j async driver created")
+        return driver
+    # --------------------------------------------------------------------------------- end _create_async_driver()
+    
+    # --------------------------------------------------------------------------------- _get_connection_settings()
+    def _get_connection_settings(self) -> tuple:
+        """Read and validate the Neo4j URI and credentials from the application config.
+
+        Returns:
+            tuple: (uri, (username, password)).
+
+        Raises:
+            DatabaseConnectionError: If the URI or credentials are not configured.
+        """
+        app_config = get_config()
+        
+        if not app_config.neo4j_uri:
+            raise DatabaseConnectionError("Neo4j URI not configured")
+        
+        if not app_config.neo4j_username or not app_config.neo4j_password:
+            raise DatabaseConnectionError("Neo4j credentials not configured")
+        
+        return app_config.neo4j_uri, (app_config.neo4j_username, app_config.neo4j_password)
+    # --------------------------------------------------------------------------------- end _get_connection_settings()
+    
     # --------------------------------------------------------------------------------- _get_metrics()
     def _get_metrics(self) -> Dict[str, Any]:
         """Get current database metrics.
@@ -360,6 +433,7 @@ class EnhancedNeo4jDatabase:
             "success_rate": success_rate,
             "average_response_time": self.metrics.average_response_time,
             "is_connected": self._is_connected,
+            "async_driver_active": self._async_driver is not None,
         }
     # --------------------------------------------------------------------------------- end _get_metrics()
 
@@ -413,9 +487,52 @@ class EnhancedNeo4jDatabase:
                 finally:
                     self._driver = None
                     self._is_connected = False
+            if self._async_driver:
+                # The asyncio driver can only be closed from its event loop (disconnect_async)
+                logger.warning("Async Neo4j driver dropped without disconnect_async()")
+                self._async_driver = None
     # --------------------------------------------------------------------------------- end disconnect()
     
+    # --------------------------------------------------------------------------------- connect_async()
+    async def connect_async(self) -> AsyncDriver:
+        """Establish the asyncio database connection.
+
+        Returns:
+            AsyncDriver: The connected Neo4j asyncio driver instance.
+
+        Raises:
+            AsyncDriverUnavailableError: If the asyncio driver cannot be created.
+        """
+        try:
+            with self._lock:
+                if self._async_driver is None:
+                    self._async_driver = self._create_async_driver()
+                    logger.info("Neo4j async database connection established")
+                return self._async_driver
+                
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j database (async): {e}")
+            raise AsyncDriverUnavailableError(f"Async connection failed: {e}")
+    # --------------------------------------------------------------------------------- end connect_async()
+    
+    # --------------------------------------------------------------------------------- disconnect_async()
+    async def disconnect_async(self) -> None:
+        """Close the asyncio database connection and cleanup resources.
+
+        Awaited by the FastAPI lifespan in main.py on shutdown, on the driver's event loop.
+        """
+        with self._lock:
+            driver, self._async_driver = self._async_driver, None
+        if driver:
+            try:
+                await driver.close()
+                logger.info("Neo4j async database connection closed")
+            except Exception as e:
+                logger.warning(f"Error closing async database connection: {e}")
+    # --------------------------------------------------------------------------------- end disconnect_async()
+    
     # --------------------------------------------------------------------------------- execute_query()
+    @traced("neo4j.query")
     def execute_query(self, query: str, parameters: Optional[Dict] = None) -> List[Record]:
         """Execute a Cypher query with retry logic.
 
@@ -480,6 +597,71 @@ class EnhancedNeo4jDatabase:
         logger.error(f"Query failed after {retry_count} attempts: {last_error}")
         raise DatabaseQueryError(f"Query failed after retries: {last_error}")
     # --------------------------------------------------------------------------------- end execute_query()
+    
+    # --------------------------------------------------------------------------------- execute_query_async()
+    @traced("neo4j.query")
+    async def execute_query_async(self, query: str, parameters: Optional[Dict] = None) -> List[Record]:
+        """Execute a Cypher query on the asyncio driver with retry logic.
+
+        Asyncio counterpart of execute_query(): the same retry policy and metrics,
+        but waiting on the network without holding a worker thread.
+
+        Args:
+            query (str): The Cypher query to execute.
+            parameters (Optional[Dict]): Query parameters. Defaults to None.
+
+        Returns:
+            List[Record]: List of Neo4j records returned by the query.
+
+        Raises:
+            DatabaseQueryError: If query execution fails after all retry attempts.
+            DatabaseConnectionError: If database connection cannot be established.
+        """
+        start_time = time.time()
+        parameters = parameters or {}
+        
+        retry_count = 0
+        last_error = None
+        
+        while retry_count < self.config.max_retry_attempts:
+            try:
+                driver = self._async_driver or await self.connect_async()
+                
+                async with driver.session() as session:
+                    result = await session.run(cast(LiteralString, query), parameters)
+                    records = [record async for record in result]
+                    
+                # Update metrics
+                response_time = time.time() - start_time
+                self.metrics.total_queries += 1
+                self.metrics.successful_queries += 1
+                self.metrics.update_response_time(response_time)
+                
+                logger.debug(f"Async query executed successfully in {response_time:.3f}s")
+                return records
+                
+            except (ServiceUnavailable, TransientError) as e:
+                last_error = e
+                retry_count += 1
+                if retry_count < self.config.max_retry_attempts:
+                    wait_time = retry_count * 2  # Simple backoff
+                    logger.warning(f"Async query failed, retrying in {wait_time}s (attempt {retry_count}): {e}")
+                    await asyncio.sleep(wait_time)
+                else:
+                    break
+            except DatabaseConnectionError:
+                self.metrics.failed_queries += 1
+                raise
+            except Exception as e:
+                self.metrics.failed_queries += 1
+                logger.error(f"Async query execution failed: {e}")
+                raise DatabaseQueryError(f"Query failed: {e}")
+        
+        # All retries exhausted
+        self.metrics.failed_queries += 1
+        logger.error(f"Async query failed after {retry_count} attempts: {last_error}")
+        raise DatabaseQueryError(f"Query failed after retries: {last_error}")
+    # --------------------------------------------------------------------------------- end execute_query_async()
 
     # ---------------------------------------------------------------------
     # --- Class Information Methods (Optional, but highly recommended) ---
@@ -0,0 +1,472 @@
+# -------------------------------------------------------------------------
+# File: embedding_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/embedding_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module provides a two-tier cache for text embeddings used by the MRCA VectorRAG
+# component. Users repeatedly ask the same regulatory questions, and every vector search
+# otherwise pays a network round trip to the Gemini embeddings API. Embeddings are keyed
+# by whitespace-normalized text, model name and task type (query and document vectors
+# differ), held in a bounded in-memory LRU, and persisted in a
+# SQLite database that is shared by all uvicorn workers on the host. Hit, miss and
+# eviction counters are exposed for health monitoring.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: EmbeddingCache - Embedding keys and vector encoding over a two-tier store
+# - Class: CachedEmbeddings - LangChain Embeddings wrapper backed by EmbeddingCache
+# - Function: normalize_embedding_text() - Whitespace normalization used for embedding cache keys
+# - Function: normalize_question_text() - Case-insensitive question normalization for request-level keys
+# - Constants: QUERY_TASK, DOCUMENT_TASK - Embedding task types included in cache keys
+# - Function: get_embedding_cache() - Singleton accessor for the process-wide cache
+# - Global Variables: _embedding_cache, _embedding_cache_lock - Thread-safe singleton management
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - array: Compact binary encoding of embedding vectors
+#   - hashlib: Cache key hashing
+#   - inspect: Detecting task_type support on the embeddings client
+#   - logging: Cache operation logging
+#   - unicodedata: Unicode normalization of question keys
+#   - threading.Lock: Thread-safe singleton creation
+#   - typing: Type hints (Any, Dict, List, Optional)
+# - Third-Party:
+#   - langchain_core.embeddings.Embeddings: Base interface for the caching wrapper
+# - Local Project Modules:
+#   - .config.get_config: Cache size, path and enablement settings
+#   - .tracing.span: embedding spans (with cache hit/miss) for request tracing
+#   - .two_tier_cache.TwoTierStore: Memory LRU and SQLite tiers shared with the Cypher cache
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# This module is used by llm.get_embeddings(), which wraps the Gemini embeddings
+# client in CachedEmbeddings. As a result tools/vector.py (get_neo4j_vector and the
+# vector health check) use the cache transparently.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Two-Tier Embedding Cache for MRCA VectorRAG
+
+Caches query and document embeddings in a bounded memory LRU and a SQLite tier
+shared across worker processes, keyed by normalized text, model name and task type.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import array
+import hashlib
+import inspect
+import logging
+import unicodedata
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+# Third-party library imports
+from langchain_core.embeddings import Embeddings
+
+# Local application/library specific imports
+from .config import get_config
+from .tracing import span
+from .two_tier_cache import TwoTierStore
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Embedding task types (Gemini names, the defaults of embed_query and embed_documents)
+QUERY_TASK = "RETRIEVAL_QUERY"
+DOCUMENT_TASK = "RETRIEVAL_DOCUMENT"
+
+# Global cache instance and thread lock for singleton pattern
+_embedding_cache: Optional['EmbeddingCache'] = None
+_embedding_cache_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class EmbeddingCache
+class EmbeddingCache:
+    """Two-tier embedding store: bounded memory LRU in front of a SQLite table.
+
+    Storage, eviction and statistics come from TwoTierStore (table "embeddings");
+    vectors are stored on disk as packed doubles. If the database cannot be opened
+    or written, the cache logs the error and keeps working with the memory tier only.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        max_memory_entries (int): Maximum number of vectors kept in memory.
+        max_disk_entries (int): Maximum number of vectors kept on disk.
+        db_path (Optional[str]): SQLite database path, or None for memory only.
+        _store (TwoTierStore): Memory and SQLite tiers.
+
+    Methods:
+        make_key(): Build the cache key for a text, model and task type.
+        get(): Look up a vector in memory, then on disk.
+        put(): Store a vector in both tiers.
+        clear(): Empty both tiers.
+        get_stats(): Get counters, tier sizes and hit rate.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, max_memory_entries: int = 1024, db_path: Optional[str] = None,
+                 max_disk_entries: int = 50000) -> None:
+        """Initialize the cache and open the SQLite tier if a path is given.
+
+        Args:
+            max_memory_entries (int): Memory LRU bound. Defaults to 1024.
+            db_path (Optional[str]): SQLite file path. None disables the disk tier.
+            max_disk_entries (int): Disk tier bound. Defaults to 50000.
+        """
+        self._store = TwoTierStore(
+            name="Embedding cache",
+            table="embeddings",
+            max_memory_entries=max_memory_entries,
+            db_path=db_path,
+            max_disk_entries=max_disk_entries,
+            encode=lambda vector: array.array("d", vector).tobytes(),
+            decode=_decode_vector,
+        )
+        self.max_memory_entries = self._store.max_memory_entries
+        self.max_disk_entries = self._store.max_disk_entries
+        self.db_path = db_path
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- put()
+    def put(self, key: str, model: str, vector: List[float]) -> None:
+        """Store a vector in the memory and disk tiers.
+
+        Args:
+            key (str): Cache key from make_key().
+            model (str): Embedding model name, stored for diagnostics.
+            vector (List[float]): Embedding vector.
+        """
+        self._store.put(key, list(vector), info=model)
+    # ------------------------------------------------------------------------- end put()
+
+    # ------------------------------------------------------------------------- clear()
+    def clear(self) -> None:
+        """Empty both tiers without resetting the counters."""
+        self._store.clear()
+    # ------------------------------------------------------------------------- end clear()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- make_key()
+    @staticmethod
+    def make_key(text: str, model: str, task: str) -> str:
+        """Build the cache key for a text, embedding model and task type.
+
+        Args:
+            text (str): Text to embed.
+            model (str): Embedding model name.
+            task (str): Embedding task type (QUERY_TASK or DOCUMENT_TASK).
+
+        Returns:
+            str: SHA-256 hex digest of the model name, task type and normalized text.
+        """
+        material = f"{model}\x00{task}\x00{normalize_embedding_text(text)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    # ------------------------------------------------------------------------- end make_key()
+
+    # ------------------------------------------------------------------------- get()
+    def get(self, key: str) -> Optional[List[float]]:
+        """Look up a vector in memory, then on disk, counting the outcome.
+
+        Disk hits are promoted into the memory tier.
+
+        Args:
+            key (str): Cache key from make_key().
+
+        Returns:
+            Optional[List[float]]: Cached vector (a copy), or None on a miss.
+        """
+        vector = self._store.get(key)
+        return list(vector) if vector is not None else None
+    # ------------------------------------------------------------------------- end get()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters, tier sizes and hit rate.
+
+        Returns:
+            Dict[str, Any]: Cache statistics for health and metrics endpoints.
+
+        Examples:
+            >>> stats = get_embedding_cache().get_stats()
+            >>> print(f"Hit rate: {stats['hit_rate']:.1%}")
+        """
+        stats = self._store.get_stats()
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_rate": (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class EmbeddingCache
+
+# ------------------------------------------------------------------------- class CachedEmbeddings
+class CachedEmbeddings(Embeddings):
+    """LangChain Embeddings wrapper that serves repeated texts from EmbeddingCache.
+
+    Drop-in replacement for the underlying embeddings client: Neo4jVector and
+    other LangChain components call embed_query/embed_documents as usual. Query
+    and document vectors are cached separately, since the task type changes the
+    vector.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        underlying (Embeddings): Embeddings client used on cache misses.
+        model_name (str): Model name included in cache keys.
+        cache (EmbeddingCache): Shared two-tier cache.
+
+    Methods:
+        embed_query(): Embed a query, using the cache when possible.
+        embed_documents(): Embed documents, batching only the cache misses.
+        embed_queries(): Embed several queries, batching only the cache misses.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, underlying: Embeddings, model_name: str, cache: EmbeddingCache) -> None:
+        """Wrap an embeddings client with a cache.
+
+        Args:
+            underlying (Embeddings): Embeddings client used on cache misses.
+            model_name (str): Model name included in cache keys.
+            cache (EmbeddingCache): Shared cache instance.
+        """
+        self.underlying = underlying
+        self.model_name = model_name
+        self.cache = cache
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- __getattr__()
+    def __getattr__(self, name):
+        """Proxy any other attribute to the underlying embeddings client."""
+        if name == "underlying":
+            raise AttributeError(name)
+        return getattr(self.underlying, name)
+    # ------------------------------------------------------------------------- end __getattr__()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- embed_query()
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query string, using the cache when possible.
+
+        Args:
+            text (str): Query text.
+
+        Returns:
+            List[float]: Embedding vector.
+        """
+        with span("embedding.query") as current:
+            key = self.cache.make_key(text, self.model_name, QUERY_TASK)
+            vector = self.cache.get(key)
+            if current is not None:
+                current.attributes["cache_hit"] = vector is not None
+            if vector is None:
+                vector = self.underlying.embed_query(text)
+                self.cache.put(key, self.model_name, vector)
+            return vector
+    # ------------------------------------------------------------------------- end embed_query()
+
+    # ------------------------------------------------------------------------- embed_documents()
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, sending only the cache misses to the API in one batch.
+
+        Args:
+            texts (List[str]): Document texts.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+        """
+        with span("embedding.documents", texts=len(texts)) as current:
+            keys = [self.cache.make_key(text, self.model_name, DOCUMENT_TASK) for text in texts]
+            vectors: List[Optional[List[float]]] = [self.cache.get(key) for key in keys]
+
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if current is not None:
+                current.attributes["cache_misses"] = len(missing)
+            if missing:
+                computed = self.underlying.embed_documents([texts[i] for i in missing])
+                for i, vector in zip(missing, computed):
+                    vectors[i] = vector
+                    self.cache.put(keys[i], self.model_name, vector)
+
+            return [list(vector) for vector in vectors]
+    # ------------------------------------------------------------------------- end embed_documents()
+
+    # ------------------------------------------------------------------------- embed_queries()
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed several queries, sending only the cache misses to the API in one batch.
+
+        The vectors are query vectors, cached under the same keys as embed_query(),
+        so a later embed_query() of one of the texts is a cache hit. Clients whose
+        embed_documents() takes no task_type embed the misses one at a time.
+
+        Args:
+            texts (List[str]): Query texts.
+
+        Returns:
+            List[List[float]]: Embedding vectors in input order.
+        """
+        with span("embedding.queries", texts=len(texts)) as current:
+            keys = [self.cache.make_key(text, self.model_name, QUERY_TASK) for text in texts]
+            vectors: List[Optional[List[float]]] = [self.cache.get(key) for key in keys]
+
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if current is not None:
+                current.attributes["cache_misses"] = len(missing)
+            if missing:
+                missing_texts = [texts[i] for i in missing]
+                if "task_type" in inspect.signature(self.underlying.embed_documents).parameters:
+                    computed = self.underlying.embed_documents(missing_texts, task_type=QUERY_TASK)
+                else:
+                    computed = [self.underlying.embed_query(text) for text in missing_texts]
+                for i, vector in zip(missing, computed):
+                    vectors[i] = vector
+                    self.cache.put(keys[i], self.model_name, vector)
+
+            return [list(vector) for vector in vectors]
+    # ------------------------------------------------------------------------- end embed_queries()
+
+# ------------------------------------------------------------------------- end class CachedEmbeddings
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# --------------------------
+# --- Utility Functions ---
+# --------------------------
+
+# ------------------------------------------------------------------------- _decode_vector()
+def _decode_vector(blob: bytes) -> List[float]:
+    """Decode a vector stored as packed doubles in the SQLite tier."""
+    vector = array.array("d")
+    vector.frombytes(blob)
+    return vector.tolist()
+# ------------------------------------------------------------------------- end _decode_vector()
+
+# ------------------------------------------------------------------------- normalize_embedding_text()
+def normalize_embedding_text(text: str) -> str:
+    """Normalize text for embedding cache keys.
+
+    Only whitespace is collapsed: case and Unicode forms can change the vector
+    ("MSHA" and "msha" embed differently), so texts differing in them keep
+    separate entries.
+
+    Args:
+        text (str): Raw text.
+
+    Returns:
+        str: Normalized text.
+
+    Examples:
+        >>> normalize_embedding_text("  What are  Methane\\nrequirements? ")
+        'What are Methane requirements?'
+    """
+    return " ".join(text.split())
+# ------------------------------------------------------------------------- end normalize_embedding_text()
+
+# ------------------------------------------------------------------------- normalize_question_text()
+def normalize_question_text(text: str) -> str:
+    """Normalize a question for request-level keys (single-flight, generated Cypher).
+
+    Applies Unicode NFKC normalization, case folding and whitespace collapsing so
+    that trivially different spellings of the same question share a key. Not used
+    for embedding keys (see normalize_embedding_text()).
+
+    Args:
+        text (str): Raw question.
+
+    Returns:
+        str: Normalized question.
+
+    Examples:
+        >>> normalize_question_text("  What are  Methane\\nrequirements? ")
+        'what are methane requirements?'
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+# ------------------------------------------------------------------------- end normalize_question_text()
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_embedding_cache()
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache (singleton).
+
+    Sizes and the SQLite path come from BackendConfig. An empty
+    embedding_cache_path disables the disk tier.
+
+    Returns:
+        EmbeddingCache: Shared cache instance.
+
+    Examples:
+        >>> cache = get_embedding_cache()
+        >>> assert cache is get_embedding_cache()
+    """
+    global _embedding_cache
+    with _embedding_cache_lock:
+        if _embedding_cache is None:
+            config = get_config()
+            _embedding_cache = EmbeddingCache(
+                max_memory_entries=config.embedding_cache_max_entries,
+                db_path=config.embedding_cache_path or None,
+                max_disk_entries=config.embedding_cache_disk_max_entries,
+            )
+        return _embedding_cache
+# ------------------------------------------------------------------------- end get_embedding_cache()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,541 @@
+# -------------------------------------------------------------------------
+# File: extractive_fusion.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/extractive_fusion.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module implements the LLM-free extractive context fusion used by
+# FusionStrategy.EXTRACTIVE. The VectorRAG and GraphRAG contexts are split into
+# sentences, near-duplicate sentences are removed by word-shingle Jaccard
+# similarity, and the remaining sentences are ranked by query overlap,
+# regulatory density and source weight. They are then packed into a token
+# budget. Every CFR citation found by EnhancedCFRParser in the inputs is
+# kept: the best sentence carrying each citation is always selected, and
+# sentence boundaries never fall inside a citation. Fusion takes
+# milliseconds on the CPU instead of a GPT-4o round trip.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: CandidateSentence - One input sentence with its ranking features
+# - Class: ExtractiveFusionOutput - Fused context and extraction statistics
+# - Function: split_sentences() - Sentence segmentation that keeps citations whole
+# - Function: extractive_fuse() - Deduplicate, rank and pack two contexts
+# - Constants: DEFAULT_BUDGET_TOKENS, DEFAULT_DUPLICATE_THRESHOLD
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - re: Sentence segmentation and tokenization
+#   - dataclasses: Candidate and output data structures
+#   - typing: Type hints (Any, Dict, FrozenSet, List, Optional, Set, Tuple)
+# - Third-Party: None
+# - Local Project Modules:
+#   - .content_analysis.scan_regulatory_content: Per-sentence regulatory density
+#   - .cfr_compliance_enhanced.get_enhanced_cfr_parser: CFR citations that must be preserved
+#   - .context_packing: SENTENCE_BOUNDARY and estimate_tokens()
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# HybridContextFusion._extractive_fusion() calls extractive_fuse() with the
+# adaptive source weights and the fusion_extractive_max_tokens budget from
+# config. Compare with ADVANCED_HYBRID using
+# python benchmarks/bench_fusion_strategies.py
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Extractive Context Fusion for MRCA
+
+Sentence-level deduplication, ranking and token-budget packing of the VectorRAG
+and GraphRAG contexts without an LLM call, preserving every CFR citation.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import re
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .content_analysis import scan_regulatory_content
+    from .cfr_compliance_enhanced import get_enhanced_cfr_parser
+    from .context_packing import SENTENCE_BOUNDARY, estimate_tokens
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from content_analysis import scan_regulatory_content
+    from cfr_compliance_enhanced import get_enhanced_cfr_parser
+    from context_packing import SENTENCE_BOUNDARY, estimate_tokens
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Default fused-context budget in (estimated) tokens
+DEFAULT_BUDGET_TOKENS = 1500
+
+# Shingle Jaccard similarity at which a sentence is a near-duplicate of a kept one
+DEFAULT_DUPLICATE_THRESHOLD = 0.6
+
+# Words per shingle
+SHINGLE_SIZE = 3
+
+# Ranking weights: query overlap, regulatory density, source weight and position
+QUERY_OVERLAP_WEIGHT = 0.5
+REGULATORY_DENSITY_WEIGHT = 0.3
+SOURCE_PRIOR_WEIGHT = 0.2
+
+# Section headings of the fused context
+SOURCE_LABELS = {
+    "vector": "Semantic Search Results",
+    "graph": "Regulatory Structure Analysis",
+}
+
+# Lines starting a new segment inside a paragraph (headings, bullets, numbered items)
+_LIST_ITEM = re.compile(r'^\s*(?:#{1,6}\s+|[-*•]\s+|\d+[.)]\s+)')
+
+# Retrieval-only chunk rendering (format_regulation_chunks): headers and entity lines
+_CHUNK_METADATA_LINE = re.compile(r'^\s*(?:\[\d+\]\s.*\(chunk\s.*\)|Entities:\s)')
+
+# Paragraph breaks
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Ranking terms: section numbers ("75.400") or words
+_TERM_PATTERN = re.compile(r'\d+(?:\.\d+)+|\w+')
+
+# Shingle words
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Cheap test for text that may hold a citation the parser recognizes
+_CITATION_HINT = re.compile(r'CFR|§|section|subpart', re.IGNORECASE)
+
+# Words ignored for query overlap
+_STOPWORDS = frozenset((
+    'the', 'and', 'for', 'are', 'what', 'which', 'that', 'this', 'with', 'from',
+    'does', 'how', 'must', 'when', 'where', 'who', 'why', 'can', 'any', 'all',
+    'about', 'into', 'there', 'their', 'these', 'those', 'have', 'has', 'was',
+    'were', 'been', 'being', 'not', 'under', 'per', 'each', 'such', 'other',
+))
+
+# Citation identity: (title, part, subpart, section, paragraph)
+CitationKey = Tuple[int, Optional[int], Optional[str], Optional[int], str]
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class CandidateSentence
+@dataclass
+class CandidateSentence:
+    """One input sentence with its ranking features.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        text (str): Sentence text.
+        source (str): "vector" or "graph".
+        block (int): Paragraph or chunk index within the source.
+        position (int): Sentence index within the source.
+        prior (float): Source weight and position prior in [0, 1].
+        tokens (int): Estimated tokens.
+        terms (FrozenSet[str]): Ranking terms (lowercase words and section numbers).
+        shingles (FrozenSet[str]): Word shingles for near-duplicate detection.
+        citations (FrozenSet[CitationKey]): CFR citations EnhancedCFRParser finds in the sentence.
+        score (float): Ranking score.
+
+    Methods:
+        None (dataclass with automatic methods)
+    """
+    text: str
+    source: str
+    block: int
+    position: int
+    prior: float
+    tokens: int
+    terms: FrozenSet[str]
+    shingles: FrozenSet[str]
+    citations: FrozenSet[CitationKey]
+    score: float = 0.0
+# ------------------------------------------------------------------------- end class CandidateSentence
+
+# ------------------------------------------------------------------------- class ExtractiveFusionOutput
+@dataclass
+class ExtractiveFusionOutput:
+    """Fused context and extraction statistics.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        content (str): Fused context.
+        input_sentences (int): Sentences in both inputs.
+        duplicates_removed (int): Near-duplicate sentences dropped.
+        selected_sentences (int): Sentences in the fused context.
+        input_tokens (int): Estimated tokens of all input sentences.
+        output_tokens (int): Estimated tokens of the fused context.
+        vector_tokens (int): Selected tokens from the vector context.
+        graph_tokens (int): Selected tokens from the graph context.
+        budget_tokens (int): Token budget.
+        citations_total (int): Distinct CFR citations in the inputs.
+        citations_kept (int): Distinct CFR citations in the fused context.
+
+    Methods:
+        get_stats(): Statistics without the content.
+    """
+    content: str
+    input_sentences: int
+    duplicates_removed: int
+    selected_sentences: int
+    input_tokens: int
+    output_tokens: int
+    vector_tokens: int
+    graph_tokens: int
+    budget_tokens: int
+    citations_total: int
+    citations_kept: int
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the extraction statistics for fusion metadata.
+
+        Returns:
+            Dict[str, Any]: Every field except content.
+        """
+        stats = asdict(self)
+        del stats["content"]
+        return stats
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class ExtractiveFusionOutput
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- split_sentences()
+def split_sentences(text: str) -> List[List[str]]:
+    """Split text into paragraphs of sentences.
+
+    Single line breaks inside a paragraph are treated as spaces (retrieved
+    chunks are often hard-wrapped) unless the next line starts a heading or a
+    list item. Markdown markers and retrieval-only chunk headers are dropped.
+
+    Args:
+        text (str): Context text.
+
+    Returns:
+        List[List[str]]: Sentences of each non-empty paragraph.
+
+    Examples:
+        >>> split_sentences("Under 30 CFR § 75.400, dust shall be cleaned up. See section 75.402.")
+        [['Under 30 CFR § 75.400, dust shall be cleaned up.', 'See section 75.402.']]
+    """
+    blocks: List[List[str]] = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        segments: List[str] = []
+        current: List[str] = []
+        for line in paragraph.splitlines():
+            if not line.strip() or _CHUNK_METADATA_LINE.match(line):
+                continue
+            if _LIST_ITEM.match(line) and current:
+                segments.append(" ".join(current))
+                current = []
+            current.append(_LIST_ITEM.sub("", line, count=1).replace("**", "").strip())
+        if current:
+            segments.append(" ".join(current))
+
+        sentences = [
+            sentence.strip()
+            for segment in segments
+            for sentence in SENTENCE_BOUNDARY.split(segment)
+            if sentence.strip()
+        ]
+        if sentences:
+            blocks.append(sentences)
+    return blocks
+# ------------------------------------------------------------------------- end split_sentences()
+
+# ------------------------------------------------------------------------- _terms()
+def _terms(lowered: str) -> FrozenSet[str]:
+    """Ranking terms of lowercased text: section numbers and content words."""
+    return frozenset(
+        term for term in _TERM_PATTERN.findall(lowered)
+        if term not in _STOPWORDS and (len(term) > 2 or term[0].isdigit())
+    )
+# ------------------------------------------------------------------------- end _terms()
+
+# ------------------------------------------------------------------------- _shingles()
+def _shingles(lowered: str) -> FrozenSet[str]:
+    """Word shingles of lowercased text (the whole text if shorter than one shingle)."""
+    words = _WORD_PATTERN.findall(lowered)
+    if len(words) <= SHINGLE_SIZE:
+        return frozenset((" ".join(words),))
+    return frozenset(" ".join(words[index:index + SHINGLE_SIZE]) for index in range(len(words) - SHINGLE_SIZE + 1))
+# ------------------------------------------------------------------------- end _shingles()
+
+# ------------------------------------------------------------------------- _citation_keys()
+def _citation_keys(sentence: str) -> FrozenSet[CitationKey]:
+    """CFR citations EnhancedCFRParser finds in a sentence."""
+    if not _CITATION_HINT.search(sentence):
+        return frozenset()
+    return frozenset(
+        (citation.title, citation.part, citation.subpart, citation.section, citation.paragraph or "")
+        for citation in get_enhanced_cfr_parser().parse_cfr_citations(sentence)
+    )
+# ------------------------------------------------------------------------- end _citation_keys()
+
+# ------------------------------------------------------------------------- _regulatory_density()
+def _regulatory_density(sentence: str, citation_count: int) -> float:
+    """Regulatory density of one sentence in [0, 1]."""
+    scan = scan_regulatory_content(sentence)
+    citations = max(scan.cfr_citations + scan.complete_citations + scan.cross_references, citation_count)
+    density = (
+        0.3 * min(2, citations) +
+        0.1 * (scan.regulatory_terms + scan.safety_terms + scan.measurements) +
+        0.15 * scan.msha_terms
+    )
+    return min(1.0, density)
+# ------------------------------------------------------------------------- end _regulatory_density()
+
+# ------------------------------------------------------------------------- _collect_candidates()
+def _collect_candidates(
+    source: str,
+    blocks: List[Tuple[List[str], float]],
+    source_weight: float,
+    query_terms: FrozenSet[str]
+) -> List[CandidateSentence]:
+    """Build ranked candidates for one source.
+
+    Args:
+        source (str): "vector" or "graph".
+        blocks (List[Tuple[List[str], float]]): Sentences of each block with the block's
+                                                 prior (chunk similarity, or 1.0).
+        source_weight (float): Source weight relative to the stronger source, in [0, 1].
+        query_terms (FrozenSet[str]): Ranking terms of the query.
+
+    Returns:
+        List[CandidateSentence]: Scored candidates in source order.
+    """
+    candidates: List[CandidateSentence] = []
+    position = 0
+    for block_index, (sentences, block_prior) in enumerate(blocks):
+        for sentence in sentences:
+            lowered = sentence.lower()
+            terms = _terms(lowered)
+            citations = _citation_keys(sentence)
+            prior = source_weight * block_prior / (1.0 + 0.05 * position)
+            overlap = len(query_terms & terms) / len(query_terms) if query_terms else 0.0
+            score = (
+                QUERY_OVERLAP_WEIGHT * overlap +
+                REGULATORY_DENSITY_WEIGHT * _regulatory_density(sentence, len(citations)) +
+                SOURCE_PRIOR_WEIGHT * prior
+            )
+            candidates.append(CandidateSentence(
+                text=sentence,
+                source=source,
+                block=block_index,
+                position=position,
+                prior=prior,
+                tokens=estimate_tokens(sentence),
+                terms=terms,
+                shingles=_shingles(lowered),
+                citations=citations,
+                score=score,
+            ))
+            position += 1
+    return candidates
+# ------------------------------------------------------------------------- end _collect_candidates()
+
+# ------------------------------------------------------------------------- _deduplicate()
+def _deduplicate(ranked: List[CandidateSentence], threshold: float) -> List[CandidateSentence]:
+    """Drop near-duplicates of better-ranked sentences.
+
+    A sentence is a near-duplicate when its shingle Jaccard similarity with a
+    kept sentence reaches the threshold and it carries no citation the kept
+    sentence lacks. Candidate pairs come from an inverted shingle index, so
+    only sentences sharing a shingle are compared.
+
+    Args:
+        ranked (List[CandidateSentence]): Candidates, best first.
+        threshold (float): Jaccard similarity threshold.
+
+    Returns:
+        List[CandidateSentence]: Kept candidates, best first.
+    """
+    kept: List[CandidateSentence] = []
+    index: Dict[str, List[int]] = {}
+    for candidate in ranked:
+        shared: Dict[int, int] = {}
+        for shingle in candidate.shingles:
+            for kept_index in index.get(shingle, ()):
+                shared[kept_index] = shared.get(kept_index, 0) + 1
+
+        duplicate = False
+        for kept_index, intersection in shared.items():
+            other = kept[kept_index]
+            union = len(candidate.shingles) + len(other.shingles) - intersection
+            if intersection / union >= threshold and candidate.citations <= other.citations:
+                duplicate = True
+                break
+        if duplicate:
+            continue
+
+        for shingle in candidate.shingles:
+            index.setdefault(shingle, []).append(len(kept))
+        kept.append(candidate)
+    return kept
+# ------------------------------------------------------------------------- end _deduplicate()
+
+# ------------------------------------------------------------------------- _pack()
+def _pack(ranked: List[CandidateSentence], budget_tokens: int) -> Tuple[List[CandidateSentence], Set[CitationKey]]:
+    """Select sentences within the budget, keeping every citation.
+
+    The best-ranked sentence carrying each citation is selected first, even if
+    the citations alone exceed the budget; the remaining budget is then filled
+    in rank order with sentences that fit.
+
+    Args:
+        ranked (List[CandidateSentence]): Deduplicated candidates, best first.
+        budget_tokens (int): Token budget.
+
+    Returns:
+        Tuple[List[CandidateSentence], Set[CitationKey]]: Selected sentences and the
+                                                          citations they carry.
+    """
+    selected: List[CandidateSentence] = []
+    chosen: Set[int] = set()
+    covered: Set[CitationKey] = set()
+    used = 0
+
+    for rank, candidate in enumerate(ranked):
+        if candidate.citations - covered:
+            selected.append(candidate)
+            chosen.add(rank)
+            covered |= candidate.citations
+            used += candidate.tokens
+
+    for rank, candidate in enumerate(ranked):
+        if rank not in chosen and used + candidate.tokens <= budget_tokens:
+            selected.append(candidate)
+            used += candidate.tokens
+
+    return selected, covered
+# ------------------------------------------------------------------------- end _pack()
+
+# ------------------------------------------------------------------------- _assemble()
+def _assemble(selected: List[CandidateSentence], source_order: Tuple[str, str]) -> str:
+    """Render selected sentences in source order under source headings.
+
+    Args:
+        selected (List[CandidateSentence]): Selected sentences.
+        source_order (Tuple[str, str]): Sources, stronger first.
+
+    Returns:
+        str: Fused context.
+    """
+    sections: List[str] = []
+    for source in source_order:
+        sentences = sorted((c for c in selected if c.source == source), key=lambda c: c.position)
+        if not sentences:
+            continue
+        paragraphs: List[List[str]] = []
+        last_block = None
+        for candidate in sentences:
+            if candidate.block != last_block:
+                paragraphs.append([])
+                last_block = candidate.block
+            paragraphs[-1].append(candidate.text)
+        body = "\n\n".join(" ".join(paragraph) for paragraph in paragraphs)
+        sections.append(f"## {SOURCE_LABELS[source]}\n{body}")
+    return "\n\n".join(sections)
+# ------------------------------------------------------------------------- end _assemble()
+
+# ------------------------------------------------------------------------- extractive_fuse()
+def extractive_fuse(
+    vector_content: str,
+    graph_content: str,
+    query: str,
+    vector_weight: float = 0.5,
+    graph_weight: float = 0.5,
+    budget_tokens: int = DEFAULT_BUDGET_TOKENS,
+    vector_chunks: Optional[List[Dict[str, Any]]] = None,
+    duplicate_threshold: float = DEFAULT_DUPLICATE_THRESHOLD
+) -> ExtractiveFusionOutput:
+    """Fuse two contexts by sentence extraction.
+
+    Args:
+        vector_content (str): VectorRAG context (answer or rendered chunks).
+        graph_content (str): GraphRAG context.
+        query (str): User question.
+        vector_weight (float): Vector source weight.
+        graph_weight (float): Graph source weight.
+        budget_tokens (int): Fused-context budget in estimated tokens.
+        vector_chunks (Optional[List[Dict[str, Any]]]): Ranked chunks (retrieval-only mode);
+            used instead of vector_content, with each chunk's similarity as its prior.
+        duplicate_threshold (float): Shingle Jaccard similarity for near-duplicates.
+
+    Returns:
+        ExtractiveFusionOutput: Fused context and statistics.
+
+    Examples:
+        >>> output = extractive_fuse(vector_text, graph_text, "methane limits", 0.6, 0.4)
+        >>> output.citations_kept == output.citations_total
+        True
+    """
+    strongest = max(vector_weight, graph_weight) or 1.0
+    query_terms = _terms(query.lower())
+
+    if vector_chunks is not None:
+        vector_blocks = [
+            (sentences, max(0.0, min(1.0, float(chunk.get("score", 1.0)))))
+            for chunk in vector_chunks
+            for sentences in split_sentences(chunk.get("text", ""))
+        ]
+    else:
+        vector_blocks = [(sentences, 1.0) for sentences in split_sentences(vector_content)]
+    graph_blocks = [(sentences, 1.0) for sentences in split_sentences(graph_content)]
+
+    candidates = (
+        _collect_candidates("vector", vector_blocks, vector_weight / strongest, query_terms) +
+        _collect_candidates("graph", graph_blocks, graph_weight / strongest, query_terms)
+    )
+    ranked = sorted(candidates, key=lambda c: c.score, reverse=True)
+    kept = _deduplicate(ranked, duplicate_threshold)
+    selected, covered = _pack(kept, budget_tokens)
+
+    all_citations: Set[CitationKey] = set()
+    for candidate in candidates:
+        all_citations |= candidate.citations
+
+    source_order = ("vector", "graph") if vector_weight >= graph_weight else ("graph", "vector")
+    content = _assemble(selected, source_order)
+
+    return ExtractiveFusionOutput(
+        content=content,
+        input_sentences=len(candidates),
+        duplicates_removed=len(candidates) - len(kept),
+        selected_sentences=len(selected),
+        input_tokens=sum(c.tokens for c in candidates),
+        output_tokens=estimate_tokens(content),
+        vector_tokens=sum(c.tokens for c in selected if c.source == "vector"),
+        graph_tokens=sum(c.tokens for c in selected if c.source == "graph"),
+        budget_tokens=budget_tokens,
+        citations_total=len(all_citations),
+        citations_kept=len(covered),
+    )
+# ------------------------------------------------------------------------- end extractive_fuse()
+
+# =========================================================================
+# End of File
+# =========================================================================
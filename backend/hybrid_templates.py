@@ -23,19 +23,24 @@
 # - Function: get_template_engine() - Factory function for template engine instances
 # - Function: create_hybrid_prompt() - Factory function for prompt creation
 # - Function: generate_hybrid_response() - Response generation using templates
+# - Function: stream_hybrid_response() - Token streaming response generation using templates
 # - Various specialized template methods for different regulatory scenarios
 # -------------------------------------------------------------------------
 
 # --- Dependencies / Imports ---
 # - Standard Library:
 #   - logging: For template operation logging and debugging
-#   - re: For regular expression pattern matching in template processing
-#   - typing: For type hints (Dict, List, Any, Optional)
+#   - time: Time to first streamed token
+#   - typing: For type hints (AsyncIterator, Dict, List, Any, Optional)
 #   - dataclasses: For template configuration data structures
 #   - enum: For template type enumeration
 # - Third-Party: None
 # - Local Project Modules:
 #   - .context_fusion: FusionResult data structure from context fusion operations
+#     (FusionResult.single_shot carries raw contexts for single-shot generation)
+#   - .tracing: Prompt construction and final LLM call spans for request tracing
+#   - .content_analysis: Shared per-request analysis of the fused content
+#   - .context_packing: Token-budget packing of the context block
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -57,8 +62,8 @@
 # =========================================================================
 # Standard library imports
 import logging
-import re
-from typing import Dict, List, Any, Optional
+import time
+from typing import AsyncIterator, Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -69,9 +74,15 @@ from enum import Enum
 try:
     # Try relative imports first (when run as module)
     from .context_fusion import FusionResult
+    from .tracing import span
+    from .content_analysis import get_content_analysis
+    from .context_packing import pack_context, get_context_budget, get_token_counter, PackedContext
 except ImportError:
     # Fall back to absolute imports (when run directly from backend directory)
     from context_fusion import FusionResult
+    from tracing import span
+    from content_analysis import get_content_analysis
+    from context_packing import pack_context, get_context_budget, get_token_counter, PackedContext
 
 # =========================================================================
 # Global Constants / Variables
@@ -81,6 +92,12 @@ logger = logging.getLogger(__name__)
 # Global template instance for singleton pattern
 _template_engine = None
 
+# Template artifact that may prefix LLM output and is stripped from responses
+EXPERT_RESPONSE_MARKER = "EXPERT RESPONSE:"
+
+# Characters buffered at the start of a stream before the marker check is settled
+STREAM_PREFIX_BUFFER_CHARS = 40
+
 # =========================================================================
 # Class Definitions
 # =========================================================================
@@ -129,7 +146,8 @@ class TemplateConfig:
         include_confidence_scores (bool): Include confidence scores in output. Defaults to True.
         include_source_attribution (bool): Include source attribution information. Defaults to True.
         include_methodology_notes (bool): Include methodology explanations. Defaults to False.
-        max_context_length (int): Maximum context length for templates. Defaults to 2000.
+        max_context_tokens (Optional[int]): Token budget for the context block. Defaults to
+                                            None (context_packing.get_context_budget()).
         regulatory_focus (bool): Enable regulatory-specific optimizations. Defaults to True.
 
     Methods:
@@ -142,7 +160,7 @@ class TemplateConfig:
     include_confidence_scores: bool = True
     include_source_attribution: bool = True
     include_methodology_notes: bool = False
-    max_context_length: int = 2000
+    max_context_tokens: Optional[int] = None
     regulatory_focus: bool = True
     
 # ------------------------------------------------------------------------- end class TemplateConfig
@@ -169,7 +187,8 @@ class HybridPromptTemplate:
         _create_regulatory_compliance_template(): Compliance-focused template implementation.
         _create_comparative_analysis_template(): Comparative analysis template implementation.
         _create_confidence_weighted_template(): Confidence-based template implementation.
-        _truncate_content(): Content truncation with sentence boundary preservation.
+        _format_context(): Context block from fused content or single-shot raw contexts.
+        _pack_content(): Token-budget packing of whole chunks or sentences.
         _add_confidence_info(): Confidence information formatting.
         _add_source_attribution(): Source attribution information formatting.
         _add_detailed_confidence_breakdown(): Detailed confidence analysis formatting.
@@ -267,7 +286,7 @@ class HybridPromptTemplate:
 USER QUESTION: {user_query}
 
 HYBRID CONTEXT INFORMATION:
-{self._truncate_content(fusion_result.fused_content)}
+{self._format_context(fusion_result)}
 
 {self._add_confidence_info(fusion_result) if self.config.include_confidence_scores else ""}
 
@@ -318,7 +337,7 @@ Information Processing: Combined Vector Search + Knowledge Graph Analysis
 Fusion Strategy: {fusion_result.fusion_strategy.replace('_', ' ').title()}
 
 HYBRID RETRIEVED CONTEXT:
-{self._truncate_content(fusion_result.fused_content)}
+{self._format_context(fusion_result)}
 
 {self._add_source_attribution(fusion_result) if self.config.include_source_attribution else ""}
 {self._add_confidence_info(fusion_result) if self.config.include_confidence_scores else ""}
@@ -352,8 +371,11 @@ EXPERT RESPONSE:"""
     def _create_regulatory_compliance_template(self, user_query: str, fusion_result: FusionResult) -> str:
         """Enhanced specialized template for regulatory compliance queries with mine-type awareness"""
         
+        # Shared per-request analysis of the fused content (lowercased text, CFR citations)
+        analysis = get_content_analysis(fusion_result.fused_content, fusion_result.content_analysis)
+        
         # CHECK FOR OUT-OF-SCOPE QUERIES FIRST
-        content_lower = fusion_result.fused_content.lower()
+        content_lower = analysis.lowered
         out_of_scope_indicators = [
             "does not directly relate", "does not pertain to", "i don't know",
             "does not include information about", "outside the mining", 
@@ -399,7 +421,6 @@ SIMPLE RESPONSE:"""
             compliance_focus = "ventilation compliance"
         
         # ENHANCEMENT: Assess compliance urgency from content
-        content_lower = fusion_result.fused_content.lower()
         urgency_assessment = ""
         if any(term in content_lower for term in ["immediate", "emergency", "danger", "fatal"]):
             urgency_assessment = "\nIMMEDIATE ACTION REQUIRED: This query involves safety-critical regulations requiring immediate compliance."
@@ -411,7 +432,7 @@ SIMPLE RESPONSE:"""
             urgency_assessment = "\nINFORMATIONAL: This involves general regulatory guidance and best practices."
         
         # ENHANCEMENT: Enhanced CFR citation analysis
-        cfr_citations = re.findall(r'\b\d+\s+CFR\s+(?:Part\s+\d+\s+)?§\s*\d+(?:\([a-zA-Z0-9]+\))*', fusion_result.fused_content)
+        cfr_citations = analysis.cfr_citations
         citation_summary = ""
         if cfr_citations:
             citation_summary = f"\nIDENTIFIED CFR CITATIONS:\n"
@@ -426,7 +447,7 @@ COMPLIANCE FOCUS AREA: {compliance_focus.title()}
 MINE TYPE CONTEXT: {mine_type_context.title()}
 
 REGULATORY CONTEXT DATABASE:
-{self._truncate_content(fusion_result.fused_content)}
+{self._format_context(fusion_result)}
 
 {citation_summary}
 {self._add_confidence_info(fusion_result) if self.config.include_confidence_scores else ""}
@@ -478,7 +499,7 @@ Provides contextually relevant documents and passages based on semantic meaning.
 Reveals regulatory relationships and structured knowledge connections.
 
 COMBINED CONTEXT:
-{self._truncate_content(fusion_result.fused_content)}
+{self._format_context(fusion_result)}
 
 FUSION METHODOLOGY:
 - Strategy: {fusion_result.fusion_strategy.replace('_', ' ').title()}
@@ -520,7 +541,7 @@ INFORMATION QUALITY ASSESSMENT:
 - Fusion Strategy: {fusion_result.fusion_strategy.replace('_', ' ').title()}
 
 RETRIEVED CONTEXT:
-{self._truncate_content(fusion_result.fused_content)}
+{self._format_context(fusion_result)}
 
 {self._add_detailed_confidence_breakdown(fusion_result)}
 
@@ -542,32 +563,96 @@ CONFIDENCE-CALIBRATED EXPERT RESPONSE:"""
         return template
     # --------------------------------------------------------------------------------- end _create_confidence_weighted_template()
     
-    # --------------------------------------------------------------------------------- _truncate_content()
-    def _truncate_content(self, content: str) -> str:
-        """Truncate content to fit within template limits.
+    # --------------------------------------------------------------------------------- _format_context()
+    def _format_context(self, fusion_result: FusionResult) -> str:
+        """Build the context block inserted into every template.
+
+        Normally this is the fused content packed into the context token budget.
+        In single-shot mode (fusion_result.single_shot is set) fusion made no LLM
+        call, so the block holds both raw retrieval contexts with their adaptive
+        weights and the merge instructions of the fusion prompt; the template's
+        generation then fuses and answers at once. The higher-weight source is
+        packed first, with at least its weight share of the budget, and the
+        other source gets the rest.
 
-        This internal method intelligently truncates content to fit within the
-        configured maximum context length while attempting to preserve sentence
-        boundaries for better readability.
+        The used/available token report is stored in a copy of
+        fusion_result.metadata under "context_packing".
 
         Args:
-            content (str): Original content text to be truncated.
+            fusion_result (FusionResult): Result from context fusion.
 
         Returns:
-            str: Truncated content with appropriate truncation indicators.
+            str: Context block for template insertion.
         """
-        if len(content) <= self.config.max_context_length:
-            return content
+        budget_tokens = self.config.max_context_tokens or get_context_budget()
+        single_shot = fusion_result.single_shot
+        
+        with span("context_packing", available_tokens=budget_tokens) as current:
+            if single_shot is None:
+                packed = self._pack_content(fusion_result.fused_content, budget_tokens)
+                packings = [packed]
+                context = packed.content
+            else:
+                total_weight = (single_shot.vector_weight + single_shot.graph_weight) or 1.0
+                vector_first = single_shot.vector_weight >= single_shot.graph_weight
+                primary, secondary = ((single_shot.vector_content, single_shot.graph_content) if vector_first
+                                      else (single_shot.graph_content, single_shot.vector_content))
+                primary_share = max(single_shot.vector_weight, single_shot.graph_weight) / total_weight
+                primary_budget = max(int(budget_tokens * primary_share),
+                                     budget_tokens - get_token_counter().count(secondary))
+                primary_packed = self._pack_content(primary, primary_budget)
+                secondary_packed = self._pack_content(secondary, budget_tokens - primary_packed.used_tokens)
+                vector_packed, graph_packed = ((primary_packed, secondary_packed) if vector_first
+                                               else (secondary_packed, primary_packed))
+                packings = [vector_packed, graph_packed]
+                
+                vector_label = ("Vector Search Passages, ranked by similarity" if single_shot.vector_is_chunks
+                                else "Vector Search Results")
+                context = f"""{vector_label} (Weight: {single_shot.vector_weight:.2f}):
+{vector_packed.content}
+
+Graph Analysis Results (Weight: {single_shot.graph_weight:.2f}):
+{graph_packed.content}
+
+The two sources above have not been merged. Combine them in your response:
+prioritize information based on the given weights, eliminate redundancy while
+preserving important details, and keep their CFR citations exactly as written."""
             
-        # Truncate but try to end at a sentence boundary
-        truncated = content[:self.config.max_context_length]
-        last_period = truncated.rfind('.')
+            report = {
+                "used_tokens": sum(packed.used_tokens for packed in packings),
+                "available_tokens": budget_tokens,
+                "truncated": any(packed.truncated for packed in packings),
+                "units_packed": sum(packed.units_packed for packed in packings),
+                "units_total": sum(packed.units_total for packed in packings),
+                "sentences_packed": sum(packed.sentences_packed for packed in packings),
+                "tokenizer": packings[0].tokenizer,
+            }
+            if current is not None:
+                current.attributes["used_tokens"] = report["used_tokens"]
+                current.attributes["truncated"] = report["truncated"]
         
-        if last_period > self.config.max_context_length * 0.8:  # If period is reasonably close to end
-            return truncated[:last_period + 1] + "\n\n[Content truncated for length]"
-        else:
-            return truncated + "...\n\n[Content truncated for length]"
-    # --------------------------------------------------------------------------------- end _truncate_content()
+        # Copy rather than update: the metadata dict can be shared with other holders of the fusion result
+        fusion_result.metadata = {**fusion_result.metadata, "context_packing": report}
+        return context
+    # --------------------------------------------------------------------------------- end _format_context()
+    
+    # --------------------------------------------------------------------------------- _pack_content()
+    def _pack_content(self, content: str, budget_tokens: int) -> PackedContext:
+        """Pack content into a token budget without cutting sentences or citations.
+
+        This internal method keeps whole paragraphs (chunks) in order while they
+        fit, then the sentences that fit, counting tokens with the response
+        model's tokenizer (see context_packing.pack_context()).
+
+        Args:
+            content (str): Original content text to be packed.
+            budget_tokens (int): Token budget for this content.
+
+        Returns:
+            PackedContext: Packed content with the used/available token report.
+        """
+        return pack_context(content, max(0, budget_tokens))
+    # --------------------------------------------------------------------------------- end _pack_content()
     
     # --------------------------------------------------------------------------------- _add_confidence_info()
     def _add_confidence_info(self, fusion_result: FusionResult) -> str:
@@ -781,7 +866,8 @@ async def generate_hybrid_response(
         config (Optional[TemplateConfig]): Optional template configuration.
 
     Returns:
-        str: Final clean response from LLM processing.
+        str: Final clean response from LLM processing, or the fallback response
+             if the LLM fails (recorded in fusion_result.metadata["generation"]).
 
     Examples:
         >>> response = await generate_hybrid_response("safety rules", fusion_result)
@@ -797,18 +883,20 @@ async def generate_hybrid_response(
     
     try:
         # Step 1: Generate the advanced prompt
-        template_engine = get_template_engine(config)
-        advanced_prompt = template_engine.create_hybrid_prompt(user_query, fusion_result, template_type)
+        with span("prompt_construction", template_type=template_type.value):
+            template_engine = get_template_engine(config)
+            advanced_prompt = template_engine.create_hybrid_prompt(user_query, fusion_result, template_type)
         
         # Step 2: Invoke LLM with the advanced prompt
         llm = get_llm()
         
         # Run LLM invocation in thread pool to avoid blocking
         loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: llm.invoke(advanced_prompt)
-        )
+        with span("llm.generate", prompt_chars=len(advanced_prompt)):
+            response = await loop.run_in_executor(
+                None,
+                lambda: llm.invoke(advanced_prompt)
+            )
         
         # Step 3: Extract clean response
         if hasattr(response, 'content'):
@@ -817,8 +905,8 @@ async def generate_hybrid_response(
             final_response = str(response)
         
         # Clean up any residual template artifacts
-        if "EXPERT RESPONSE:" in final_response:
-            final_response = final_response.split("EXPERT RESPONSE:")[-1].strip()
+        if EXPERT_RESPONSE_MARKER in final_response:
+            final_response = final_response.split(EXPERT_RESPONSE_MARKER)[-1].strip()
         
         # DEBUGGING: Show final response after template processing
         logger.info(f"\nTEMPLATE PROCESSING COMPLETE:")
@@ -838,14 +926,137 @@ async def generate_hybrid_response(
         logger.error(f"❌ Error generating hybrid response: {str(e)}")
         
         # Fallback to basic response without LLM
-        return f"""Based on MSHA regulations regarding "{user_query}":
+        _record_generation_failure(fusion_result, "fallback", e)
+        return _create_fallback_response(user_query, fusion_result)
+# --------------------------------------------------------------------------------- end generate_hybrid_response()
+
+# --------------------------------------------------------------------------------- stream_hybrid_response()
+async def stream_hybrid_response(
+    user_query: str,
+    fusion_result: FusionResult,
+    template_type: TemplateType = TemplateType.RESEARCH_BASED,
+    config: Optional[TemplateConfig] = None
+) -> AsyncIterator[str]:
+    """Stream the Advanced Parallel Hybrid response token by token.
+
+    Streaming counterpart of generate_hybrid_response(). The prompt is built the
+    same way and the LLM's streaming API (astream) yields text chunks as they are
+    produced. The first chunks are buffered until the "EXPERT RESPONSE:" template
+    artifact can be detected and stripped. If the LLM fails before producing any
+    text, the fallback response is yielded instead and recorded in
+    fusion_result.metadata["generation"]; a failure after text was yielded is
+    re-raised, so a cut-short answer is never reported as complete. Prompt
+    construction and the LLM call are traced like generate_hybrid_response(),
+    with the time to first token as an llm.generate span attribute.
+
+    Args:
+        user_query (str): Original user question.
+        fusion_result (FusionResult): Result from context fusion.
+        template_type (TemplateType): Type of template to use. Defaults to RESEARCH_BASED.
+        config (Optional[TemplateConfig]): Optional template configuration.
+
+    Yields:
+        str: Response text chunks in order.
+
+    Raises:
+        Exception: The LLM error, if the stream fails after text was yielded.
+
+    Examples:
+        >>> async for chunk in stream_hybrid_response("safety rules", fusion_result):
+        ...     print(chunk, end="")
+    """
+    try:
+        # Try relative imports first (when run as module)
+        from .llm import get_llm
+    except ImportError:
+        # Fall back to absolute imports (when run directly from backend directory)
+        from llm import get_llm
+    
+    produced_text = False
+    prefix_buffer = ""
+    prefix_resolved = False
+    
+    try:
+        # Step 1: Generate the advanced prompt
+        with span("prompt_construction", template_type=template_type.value):
+            template_engine = get_template_engine(config)
+            advanced_prompt = template_engine.create_hybrid_prompt(user_query, fusion_result, template_type)
+        
+        # Step 2: Stream LLM output
+        llm = get_llm()
+        with span("llm.generate", prompt_chars=len(advanced_prompt), streamed=True) as current:
+            started = time.perf_counter()
+            async for chunk in llm.astream(advanced_prompt):
+                text = str(chunk.content) if hasattr(chunk, 'content') else str(chunk)
+                if not text:
+                    continue
+                if current is not None and "time_to_first_token_ms" not in current.attributes:
+                    current.attributes["time_to_first_token_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                
+                # Step 3: Hold back the opening chunks until the template artifact can be stripped
+                if not prefix_resolved:
+                    prefix_buffer += text
+                    if EXPERT_RESPONSE_MARKER in prefix_buffer:
+                        prefix_buffer = prefix_buffer.split(EXPERT_RESPONSE_MARKER)[-1].lstrip()
+                    elif len(prefix_buffer) < STREAM_PREFIX_BUFFER_CHARS:
+                        continue
+                    prefix_resolved = True
+                    text, prefix_buffer = prefix_buffer, ""
+                    if not text:
+                        continue
+                
+                produced_text = True
+                yield text
+        
+        # Flush a short response that never filled the prefix buffer
+        if prefix_buffer:
+            produced_text = True
+            yield prefix_buffer.strip()
+            
+    except Exception as e:
+        logger.error(f"❌ Error streaming hybrid response: {str(e)}")
+        if produced_text:
+            # The client already holds part of the answer: fail the stream instead of ending it as complete
+            raise
+        _record_generation_failure(fusion_result, "fallback", e)
+        yield _create_fallback_response(user_query, fusion_result)
+# --------------------------------------------------------------------------------- end stream_hybrid_response()
+
+# --------------------------------------------------------------------------------- _record_generation_failure()
+def _record_generation_failure(fusion_result: FusionResult, outcome: str, error: Exception) -> None:
+    """Record in the fusion metadata that the LLM answer was replaced.
+
+    Callers read metadata["generation"] to keep such answers out of the semantic cache.
+
+    Args:
+        fusion_result (FusionResult): Result from context fusion.
+        outcome (str): "fallback" (the excerpt answer replaced the LLM's).
+        error (Exception): The LLM error.
+    """
+    # Copy rather than update: the metadata dict can be shared with other holders of the fusion result
+    fusion_result.metadata = {**fusion_result.metadata,
+                              "generation": {"outcome": outcome, "error": str(error) or type(error).__name__}}
+# --------------------------------------------------------------------------------- end _record_generation_failure()
+
+# --------------------------------------------------------------------------------- _create_fallback_response()
+def _create_fallback_response(user_query: str, fusion_result: FusionResult) -> str:
+    """Build the basic response used when LLM generation fails.
+
+    Args:
+        user_query (str): Original user question.
+        fusion_result (FusionResult): Result from context fusion.
+
+    Returns:
+        str: Fused content excerpt with a note on the fusion strategy and confidence.
+    """
+    return f"""Based on MSHA regulations regarding "{user_query}":
 
 {fusion_result.fused_content[:800]}
 
 This information combines vector search (semantic similarity) and knowledge graph analysis to provide comprehensive regulatory guidance. For specific compliance requirements, please consult the complete CFR documentation.
 
 *Note: Response generated with {fusion_result.fusion_strategy.replace('_', ' ')} fusion strategy with {fusion_result.final_confidence:.2f} confidence.*""" 
-# --------------------------------------------------------------------------------- end generate_hybrid_response()
+# --------------------------------------------------------------------------------- end _create_fallback_response()
 
 # =========================================================================
 # End of File
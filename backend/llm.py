@@ -20,7 +20,7 @@
 # - Function: validate_openai_config() - Validates OpenAI API configuration
 # - Function: get_llm() - Factory function for OpenAI ChatGPT instance
 # - Function: validate_gemini_config() - Validates Gemini API configuration
-# - Function: get_embeddings() - Factory function for Gemini embeddings instance
+# - Function: get_embeddings() - Factory function for (cached) Gemini embeddings instance
 # - Class: LazyLLM - Lazy loading wrapper for LLM instance
 # - Class: LazyEmbeddings - Lazy loading wrapper for embeddings instance
 # - Global Variable: llm - Lazy-loaded LLM instance for backwards compatibility
@@ -36,6 +36,7 @@
 #   - langchain_google_genai.GoogleGenerativeAIEmbeddings: Google Gemini embeddings
 # - Local Project Modules:
 #   - .config.init_config: Configuration management for API keys and model settings
+#   - .embedding_cache: CachedEmbeddings wrapper and shared two-tier embedding cache
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -75,6 +76,7 @@ from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
 # Local application/library specific imports
 from .config import init_config
+from .embedding_cache import CachedEmbeddings, get_embedding_cache
 
 # =========================================================================
 # Global Constants / Variables
@@ -82,6 +84,9 @@ from .config import init_config
 # Logger for this module
 logger = logging.getLogger(__name__)
 
+# Gemini embedding model, same as used in build_hybrid_store.py (768 dimensions)
+EMBEDDING_MODEL = "models/embedding-001"
+
 # =========================================================================
 # Standalone Function Definitions
 # =========================================================================
@@ -205,10 +210,12 @@ def get_embeddings():
     Creates embeddings instance only when needed for better resilience.
     Uses same model as graph building for consistency.
     This function provides consistent embeddings for semantic similarity operations
-    across the vector search components.
+    across the vector search components. Unless embedding_cache_enabled is False,
+    the client is wrapped in CachedEmbeddings so repeated texts are served from the
+    shared memory/SQLite embedding cache instead of the Gemini API.
 
     Returns:
-        GoogleGenerativeAIEmbeddings: Configured Gemini embeddings instance (768 dimensions).
+        Embeddings: Gemini embeddings instance (768 dimensions), cached by default.
 
     Raises:
         Exception: If embeddings initialization fails due to configuration or network issues.
@@ -226,9 +233,11 @@ def get_embeddings():
         import os
         os.environ["GOOGLE_API_KEY"] = api_key
         
-        return GoogleGenerativeAIEmbeddings(
-            model="models/embedding-001"  # Same as used in build_hybrid_store.py (768 dimensions)
-        )
+        gemini_embeddings = GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL)
+        
+        if not init_config().embedding_cache_enabled:
+            return gemini_embeddings
+        return CachedEmbeddings(gemini_embeddings, EMBEDDING_MODEL, get_embedding_cache())
     except Exception as e:
         logger.error(f"Gemini embeddings initialization error: {str(e)}")
         raise
@@ -18,6 +18,7 @@
 
 # --- Module Contents Overview ---
 # - Class: ParallelHybridRequest (Pydantic Model for API request)
+# - Class: ParallelHybridBatchRequest (Pydantic Model for batch API request)
 # - Class: ParallelHybridResponse (Pydantic Model for API response)
 # - Class: HealthResponse (Pydantic Model for health check response)
 # - FastAPI App: app (Main FastAPI application instance)
@@ -25,17 +26,34 @@
 # - Endpoint: /health (Basic health check)
 # - Endpoint: /parallel_hybrid/health (Detailed health check for Parallel Hybrid components)
 # - Endpoint: /generate_parallel_hybrid (Primary endpoint for generating AI responses)
+# - Endpoint: /generate_parallel_hybrid/stream (Server-sent events: stage progress and answer tokens)
+# - Endpoint: /generate_parallel_hybrid/batch (NDJSON results for a list of questions)
+# - Global Constant: ADMISSION_CONTROLLED_PATHS (Endpoints queued/shed by admission control)
 # - Global Variable: PARALLEL_HYBRID_AVAILABLE (Boolean flag indicating module availability)
 # - Global Variable: active_sessions (Dictionary to store active session data)
 # - Global Variable: startup_time (Timestamp of application startup)
+# - Function: lifespan() (Closes the sync and asyncio Neo4j drivers on shutdown)
+# - Function: _embed_for_semantic_cache() (Embeds user input for semantic cache lookups)
+# - Functions: _resolve_fusion_strategy(), _fusion_strategy_key(), _resolve_template_type(), _create_template_config(),
+#   _build_response_metadata(), _create_not_ready_response() (Shared pipeline helpers)
+# - Function: _cache_skip_reason() (Keeps fallback, cut-short and partial-retrieval answers out of the semantic cache)
+# - Function: _run_pipeline() (Retrieval, fusion and generation; the unit shared by coalesced requests)
+# - Functions: _answer_request(), _process_request() (Traced semantic cache lookup then coalesced pipeline;
+#   shared by single and batch endpoints)
+# - Functions: _group_batch_queries(), _embed_batch() (Batch deduplication and single-call embedding)
+# - Function: _format_sse() (Formats server-sent event frames)
 # -------------------------------------------------------------------------
 
 # --- Dependencies / Imports ---
 # - Standard Library:
+#   - asyncio: For running blocking embedding calls off the event loop.
+#   - json: For serializing server-sent event payloads.
 #   - logging: For application logging.
 #   - uuid: For generating unique session IDs.
-#   - typing: For type hinting (Optional, Dict, Any).
+#   - typing: For type hinting (Optional, Dict, Any, List, Callable).
 #   - time: For measuring processing time.
+#   - contextlib.aclosing, asynccontextmanager, nullcontext: For closing the token stream in the request task,
+#     the application lifespan, and batch questions when admission control is disabled.
 #   - datetime: For timestamp generation.
 # - Third-Party:
 #   - fastapi: The core web framework for building the API.
@@ -43,16 +61,27 @@
 #   - httpx: For making asynchronous HTTP requests (indirectly via FastAPI/Uvicorn).
 # - Local Project Modules:
 #   - .config.get_config: For retrieving application configurations.
+#   - .admission.AdmissionControlMiddleware, get_admission_controller: For bounded concurrency and load shedding.
+#   - .database.get_database: For closing the Neo4j drivers on shutdown.
 #   - .parallel_hybrid.get_parallel_engine, ParallelRetrievalResponse: For parallel RAG processing.
 #   - .context_fusion.get_fusion_engine, FusionStrategy: For intelligent context fusion.
-#   - .hybrid_templates.create_hybrid_prompt, generate_hybrid_response, TemplateConfig, TemplateType: For response generation using specialized templates.
+#   - .hybrid_templates.create_hybrid_prompt, generate_hybrid_response, stream_hybrid_response, TemplateConfig, TemplateType: For response generation using specialized templates.
+#   - .semantic_cache.get_semantic_cache: For serving cached responses to near-duplicate questions.
+#   - .single_flight.get_single_flight, SingleFlightTimeoutError: For coalescing concurrent identical requests into one pipeline run.
+#   - .embedding_cache.normalize_embedding_text: For deduplicating batch questions.
+#   - .tracing.start_trace, span, bind_context, get_trace_exporter: For per-request stage spans and OTLP/JSON export.
+#   - .tools.cypher.get_cypher_path_stats: For Cypher intent-template hit rate and per-path latency.
+#   - .context_packing.get_token_counter: For prompt token count cache statistics.
+#   - .llm.embeddings: For embedding user input for semantic cache lookups.
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
 # This module is the main entry point for the MRCA backend API.
 # It is typically run using a WSGI server like Uvicorn (e.g., `uvicorn main:app`).
 # The frontend service (`frontend/bot.py`) interacts with this module via HTTP requests
-# to `/generate_parallel_hybrid` for AI-powered compliance assistance.
+# to `/generate_parallel_hybrid` (or `/generate_parallel_hybrid/stream` for incremental
+# rendering) for AI-powered compliance assistance. Audit tooling submits question
+# lists to `/generate_parallel_hybrid/batch`.
 # External monitoring systems or health check services can query `/health` and
 # `/parallel_hybrid/health` to ascertain the operational status of the backend components.
 # -------------------------------------------------------------------------
@@ -77,25 +106,32 @@ for comprehensive MSHA regulation queries.
 # Imports
 # =========================================================================
 # Standard library imports
+import asyncio
+import json
 import logging
 import uuid
 import time
-from typing import Optional, Dict, Any
+from contextlib import aclosing, asynccontextmanager, nullcontext
+from typing import Optional, Dict, Any, List, Callable
 from datetime import datetime
 
 # Third-party library imports
 from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 # Local application/library specific imports
 try:
     # Try relative imports first (when run as module: python -m uvicorn backend.main:app)
     from .config import get_config
+    from .admission import AdmissionControlMiddleware, get_admission_controller
+    from .database import get_database
 except ImportError:
     # Fall back to absolute imports (when run directly from backend directory)
     from config import get_config
+    from admission import AdmissionControlMiddleware, get_admission_controller
+    from database import get_database
 
 # =========================================================================
 # Global Constants / Variables
@@ -107,6 +143,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# --- Global Constant ---
+# Generation endpoints protected by admission control. Health and docs endpoints
+# are never queued or shed so monitoring keeps working under load. The batch
+# endpoint is not listed: it admits each question it runs (one slot per question
+# in flight) so a batch counts against capacity like its concurrent pipelines.
+ADMISSION_CONTROLLED_PATHS = (
+    "/generate_parallel_hybrid",
+    "/generate_parallel_hybrid/stream",
+)
+# ---------------------------------------------------------------------------------
+
 # --- Global Variable ---
 # Flag indicating if Advanced Parallel Hybrid modules are successfully loaded.
 # This is crucial for determining service availability and fallback behavior.
@@ -132,7 +179,14 @@ try:
     # Try relative imports first (when run as module)
     from .parallel_hybrid import get_parallel_engine, ParallelRetrievalResponse
     from .context_fusion import get_fusion_engine, FusionStrategy
-    from .hybrid_templates import generate_hybrid_response, TemplateConfig, TemplateType
+    from .hybrid_templates import generate_hybrid_response, stream_hybrid_response, TemplateConfig, TemplateType
+    from .semantic_cache import get_semantic_cache
+    from .single_flight import get_single_flight, SingleFlightTimeoutError
+    from .embedding_cache import normalize_embedding_text
+    from .tracing import start_trace, span, bind_context, get_trace_exporter
+    from .tools.cypher import get_cypher_path_stats
+    from .context_packing import get_token_counter
+    from .llm import embeddings
     PARALLEL_HYBRID_AVAILABLE = True
     logger.info("✅ Advanced Parallel Hybrid modules loaded successfully")
 except ImportError:
@@ -140,7 +194,14 @@ except ImportError:
     try:
         from parallel_hybrid import get_parallel_engine, ParallelRetrievalResponse
         from context_fusion import get_fusion_engine, FusionStrategy
-        from hybrid_templates import generate_hybrid_response, TemplateConfig, TemplateType
+        from hybrid_templates import generate_hybrid_response, stream_hybrid_response, TemplateConfig, TemplateType
+        from semantic_cache import get_semantic_cache
+        from single_flight import get_single_flight, SingleFlightTimeoutError
+        from embedding_cache import normalize_embedding_text
+        from tracing import start_trace, span, bind_context, get_trace_exporter
+        from tools.cypher import get_cypher_path_stats
+        from context_packing import get_token_counter
+        from llm import embeddings
         PARALLEL_HYBRID_AVAILABLE = True
         logger.info("✅ Advanced Parallel Hybrid modules loaded successfully")
     except ImportError as e:
@@ -149,15 +210,39 @@ except ImportError:
         logger.error(f"❌ Advanced Parallel Hybrid modules could not be loaded: {e}")
         logger.error("   Backend will run in degraded mode without advanced features")
 
+# --------------------------------------------------------------------------------- lifespan()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: closes the Neo4j drivers when the server shuts down.
+
+    The asyncio driver can only be closed from the event loop it runs on, so it is
+    awaited here before the sync driver is closed.
+
+    Args:
+        app (FastAPI): The application.
+    """
+    yield
+    database = get_database()
+    await database.disconnect_async()
+    database.disconnect()
+
+# --------------------------------------------------------------------------------- end lifespan()
+
 # FastAPI app initialization
 app = FastAPI(
     title="MRCA Advanced Parallel Hybrid API",
     description="Mining Regulatory Compliance Assistant - Advanced Parallel Hybrid Service",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
+# Admission control for generation endpoints (limits from BackendConfig).
+# Added before CORS so that 503 load-shedding responses still carry CORS headers.
+if get_config().admission_control_enabled:
+    app.add_middleware(AdmissionControlMiddleware, paths=ADMISSION_CONTROLLED_PATHS)
+
 # CORS middleware for cross-origin communication
 app.add_middleware(
     CORSMiddleware,
@@ -184,7 +269,9 @@ class ParallelHybridRequest(BaseModel):
         user_input (str): The natural language question from the user.
         session_id (Optional[str]): An optional identifier for tracking conversation sessions.
         fusion_strategy (Optional[str]): The chosen strategy for combining VectorRAG and GraphRAG results.
-                                         Defaults to "advanced_hybrid".
+                                         Defaults to "advanced_hybrid". When it is left unset, a
+                                         question answered by the CFR section index skips the graph
+                                         branch and fusion; when it is set, both still run.
         template_type (Optional[str]): The type of prompt template to use for response generation.
                                        Defaults to "regulatory_compliance".
 
@@ -210,6 +297,30 @@ class ParallelHybridRequest(BaseModel):
 
 # ------------------------------------------------------------------------- end class ParallelHybridRequest
 
+# ------------------------------------------------------------------------- class ParallelHybridBatchRequest
+class ParallelHybridBatchRequest(BaseModel):
+    """Represents the request body for `/generate_parallel_hybrid/batch`.
+
+    Instance Attributes:
+        queries (List[str]): Questions to answer (duplicates are answered once).
+        session_id (Optional[str]): An optional identifier for tracking the batch.
+        fusion_strategy (Optional[str]): Fusion strategy applied to every question (explicit for
+                                         every question only when set on the batch).
+        template_type (Optional[str]): Template type applied to every question.
+        max_concurrency (Optional[int]): Questions processed at once, capped by
+                                         BackendConfig.batch_max_concurrency.
+
+    Methods:
+        No explicit methods defined beyond BaseModel's inherited methods.
+    """
+    queries: List[str]
+    session_id: Optional[str] = None
+    fusion_strategy: Optional[str] = "advanced_hybrid"
+    template_type: Optional[str] = "regulatory_compliance"
+    max_concurrency: Optional[int] = None
+
+# ------------------------------------------------------------------------- end class ParallelHybridBatchRequest
+
 # ------------------------------------------------------------------------- class ParallelHybridResponse
 class ParallelHybridResponse(BaseModel):
     """Represents the response body for the Advanced Parallel Hybrid response generation.
@@ -325,6 +436,488 @@ async def health_check() -> HealthResponse:
 
 # --------------------------------------------------------------------------------- end health_check()
 
+# --------------------------------------------------------------------------------- _embed_for_semantic_cache()
+async def _embed_for_semantic_cache(user_input: str) -> Optional[list]:
+    """Embeds the user input for semantic cache lookups without blocking the event loop.
+
+    Embedding failures are logged and reported as None so that a cache problem
+    never fails the request; the pipeline simply runs uncached.
+
+    Args:
+        user_input (str): The user's question.
+
+    Returns:
+        Optional[list]: The question embedding, or None if embedding failed.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, bind_context(embeddings.embed_query), user_input)
+    except Exception as e:
+        logger.warning(f"⚠️ Semantic cache embedding failed, continuing uncached: {e}")
+        return None
+
+# --------------------------------------------------------------------------------- end _embed_for_semantic_cache()
+
+# --------------------------------------------------------------------------------- _resolve_fusion_strategy()
+def _resolve_fusion_strategy(fusion_strategy: Optional[str]) -> "FusionStrategy":
+    """Maps the string fusion strategy from a request to the FusionStrategy Enum.
+
+    Args:
+        fusion_strategy (Optional[str]): Requested strategy name.
+
+    Returns:
+        FusionStrategy: Matching strategy, ADVANCED_HYBRID if unknown or missing.
+    """
+    strategy_map = {
+        "weighted_linear": FusionStrategy.WEIGHTED_LINEAR,
+        "max_confidence": FusionStrategy.MAX_CONFIDENCE,
+        "advanced_hybrid": FusionStrategy.ADVANCED_HYBRID,
+        "adaptive_fusion": FusionStrategy.ADAPTIVE_FUSION,
+        "extractive": FusionStrategy.EXTRACTIVE
+    }
+    return strategy_map.get(fusion_strategy or "advanced_hybrid", FusionStrategy.ADVANCED_HYBRID)
+
+# --------------------------------------------------------------------------------- end _resolve_fusion_strategy()
+
+# --------------------------------------------------------------------------------- _fusion_strategy_key()
+def _fusion_strategy_key(request: "ParallelHybridRequest") -> str:
+    """Fusion strategy name used in the semantic cache and single-flight keys.
+
+    A request that leaves fusion_strategy unset may be answered by the CFR section
+    index without fusion, so it is keyed apart from the same strategy requested
+    explicitly.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+
+    Returns:
+        str: Strategy name, suffixed with ":default" when it was not requested.
+    """
+    name = request.fusion_strategy or "advanced_hybrid"
+    return name if "fusion_strategy" in request.model_fields_set else f"{name}:default"
+
+# --------------------------------------------------------------------------------- end _fusion_strategy_key()
+
+# --------------------------------------------------------------------------------- _resolve_template_type()
+def _resolve_template_type(template_type: Optional[str]) -> "TemplateType":
+    """Maps the string template type from a request to the TemplateType Enum.
+
+    Args:
+        template_type (Optional[str]): Requested template name.
+
+    Returns:
+        TemplateType: Matching template, REGULATORY_COMPLIANCE if unknown or missing.
+    """
+    template_map = {
+        "basic_hybrid": TemplateType.BASIC_HYBRID,
+        "research_based": TemplateType.RESEARCH_BASED,
+        "regulatory_compliance": TemplateType.REGULATORY_COMPLIANCE,
+        "comparative_analysis": TemplateType.COMPARATIVE_ANALYSIS,
+        "confidence_weighted": TemplateType.CONFIDENCE_WEIGHTED
+    }
+    return template_map.get(template_type or "regulatory_compliance", TemplateType.REGULATORY_COMPLIANCE)
+
+# --------------------------------------------------------------------------------- end _resolve_template_type()
+
+# --------------------------------------------------------------------------------- _create_template_config()
+def _create_template_config() -> "TemplateConfig":
+    """Creates the template configuration used for API response generation.
+
+    Returns:
+        TemplateConfig: Configuration with confidence scores, source attribution
+                        and regulatory focus enabled, and the per-model context
+                        token budget (BackendConfig.prompt_context_max_tokens).
+    """
+    return TemplateConfig(
+        include_confidence_scores=True,
+        include_source_attribution=True,
+        regulatory_focus=True
+    )
+
+# --------------------------------------------------------------------------------- end _create_template_config()
+
+# --------------------------------------------------------------------------------- _build_response_metadata()
+def _build_response_metadata(
+    request: "ParallelHybridRequest",
+    parallel_result: "ParallelRetrievalResponse",
+    fusion_result: Any,
+    final_response: str
+) -> Dict[str, Any]:
+    """Gathers metadata from all processing stages for the response.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+        parallel_result (ParallelRetrievalResponse): Result of parallel retrieval.
+        fusion_result (FusionResult): Result of context fusion.
+        final_response (str): Generated response text.
+
+    Returns:
+        Dict[str, Any]: Metadata for the parallel_retrieval, context_fusion and
+                        hybrid_template stages.
+    """
+    return {
+        "parallel_retrieval": {
+            "total_time_ms": parallel_result.total_time_ms,
+            "fusion_ready": True,
+            "vector_confidence": parallel_result.vector_result.confidence if parallel_result.vector_result else 0.0,
+            "graph_confidence": parallel_result.graph_result.confidence if parallel_result.graph_result else 0.0,
+            "vector_timed_out": parallel_result.vector_result.timed_out if parallel_result.vector_result else False,
+            "graph_timed_out": parallel_result.graph_result.timed_out if parallel_result.graph_result else False,
+            "vector_retrieval_mode": ((parallel_result.vector_result.metadata or {}).get("retrieval_mode", "chunks")
+                                      if parallel_result.vector_result and parallel_result.vector_result.chunks is not None else "answer"),
+            "section_lookup": parallel_result.section_lookup,
+        },
+        "context_fusion": {
+            "strategy": request.fusion_strategy,
+            "applied_strategy": fusion_result.fusion_strategy,
+            "strategy_override": fusion_result.metadata.get("strategy_override"),
+            "final_confidence": fusion_result.final_confidence,
+            "vector_contribution": fusion_result.vector_contribution,
+            "graph_contribution": fusion_result.graph_contribution,
+            "quality_score": fusion_result.fusion_quality_score,
+            "content_analysis": (fusion_result.content_analysis.get_stats()
+                                 if fusion_result.content_analysis is not None else None),
+            "single_shot": fusion_result.single_shot is not None,
+        },
+        "hybrid_template": {
+            "type": request.template_type,
+            "length": len(final_response),
+            "context_packing": fusion_result.metadata.get("context_packing"),
+            "generation": fusion_result.metadata.get("generation"),
+        }
+    }
+
+# --------------------------------------------------------------------------------- end _build_response_metadata()
+
+# --------------------------------------------------------------------------------- _cache_skip_reason()
+def _cache_skip_reason(parallel_result: "ParallelRetrievalResponse", fusion_result: Any) -> Optional[str]:
+    """Explains why a pipeline answer must not be stored in the semantic cache.
+
+    A cached answer is served to every paraphrase until it expires, so answers
+    built after an LLM failure or from an incomplete retrieval are not stored.
+
+    Args:
+        parallel_result (ParallelRetrievalResponse): Result of parallel retrieval.
+        fusion_result (FusionResult): Result of context fusion; generation failures
+                                      are recorded in metadata["generation"].
+
+    Returns:
+        Optional[str]: Reason to skip the store, or None if the answer can be cached.
+    """
+    generation = fusion_result.metadata.get("generation")
+    if generation:
+        return f"generation {generation['outcome']}"
+    for branch in (parallel_result.vector_result, parallel_result.graph_result):
+        if branch is None or (branch.metadata or {}).get("skipped"):
+            continue
+        if branch.timed_out:
+            return f"{branch.method} timed out"
+        if branch.error:
+            return f"{branch.method} failed"
+    return None
+
+# --------------------------------------------------------------------------------- end _cache_skip_reason()
+
+# --------------------------------------------------------------------------------- _create_not_ready_response()
+def _create_not_ready_response(request: "ParallelHybridRequest", session_id: str,
+                               start_time: float) -> "ParallelHybridResponse":
+    """Creates the simple fallback response used when retrieval is not fusion-ready.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+        session_id (str): Current session identifier.
+        start_time (float): Request start timestamp.
+
+    Returns:
+        ParallelHybridResponse: Fallback response asking the user to rephrase.
+    """
+    response_text = f"Based on MSHA regulations regarding: {request.user_input}\n\nI found relevant information but the parallel system encountered issues. Please try rephrasing your question."
+
+    return ParallelHybridResponse(
+        response=response_text,
+        session_id=session_id,
+        processing_time=time.time() - start_time,
+        timestamp=datetime.now().isoformat(),
+        metadata={
+            "parallel_retrieval": {"fusion_ready": False},
+            "context_fusion": {"strategy": "fallback"},
+            "hybrid_template": {"type": "fallback"}
+        }
+    )
+
+# --------------------------------------------------------------------------------- end _create_not_ready_response()
+
+# --------------------------------------------------------------------------------- _run_pipeline()
+async def _run_pipeline(request: "ParallelHybridRequest",
+                        emit: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Optional[tuple]:
+    """Runs parallel retrieval, context fusion and response generation for a request.
+
+    With an emit callback (streaming requests), stage results are reported as
+    `stage` events and the answer is generated token by token as `token` events.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+        emit (Optional[Callable[[str, Dict[str, Any]], None]]): Receives (event, payload)
+                                                               progress events.
+
+    Returns:
+        Optional[tuple]: (parallel_result, fusion_result, final_response), or None
+                         if the retrieval results were not fusion-ready.
+    """
+    # Step 1: Parallel Retrieval
+    # Executes VectorRAG and GraphRAG concurrently.
+    # A section index hit replaces graph retrieval and fusion unless a strategy was requested
+    parallel_result = await get_parallel_engine().retrieve_parallel(
+        query=request.user_input,
+        skip_graph_on_section_hit="fusion_strategy" not in request.model_fields_set
+    )
+    if emit is not None:
+        emit("stage", {
+            "stage": "retrieval",
+            "fusion_ready": parallel_result.fusion_ready,
+            "vector_confidence": parallel_result.vector_result.confidence if parallel_result.vector_result else 0.0,
+            "graph_confidence": parallel_result.graph_result.confidence if parallel_result.graph_result else 0.0,
+            "vector_timed_out": parallel_result.vector_result.timed_out if parallel_result.vector_result else False,
+            "graph_timed_out": parallel_result.graph_result.timed_out if parallel_result.graph_result else False,
+            "section_lookup": parallel_result.section_lookup,
+        })
+
+    # Check if parallel retrieval results are viable for fusion.
+    if not parallel_result.fusion_ready:
+        return None
+
+    # Step 2: Context Fusion
+    # Fuses the results from parallel retrieval based on the chosen strategy.
+    fusion_result = await get_fusion_engine().fuse_contexts(
+        parallel_response=parallel_result,
+        strategy=_resolve_fusion_strategy(request.fusion_strategy)
+    )
+    if emit is not None:
+        emit("stage", {
+            "stage": "fusion",
+            "strategy": request.fusion_strategy,
+            "applied_strategy": fusion_result.fusion_strategy,
+            "final_confidence": fusion_result.final_confidence,
+            "quality_score": fusion_result.fusion_quality_score,
+        })
+
+    # Step 3: Template Application
+    # Generates the final response using the fused context and the selected template.
+    if emit is None:
+        final_response = await generate_hybrid_response(
+            user_query=request.user_input,
+            fusion_result=fusion_result,
+            template_type=_resolve_template_type(request.template_type),
+            config=_create_template_config()
+        )
+        return parallel_result, fusion_result, final_response
+
+    # aclosing: the generator's tracing span is closed in this task even if emit raises
+    chunks = []
+    async with aclosing(stream_hybrid_response(
+        user_query=request.user_input,
+        fusion_result=fusion_result,
+        template_type=_resolve_template_type(request.template_type),
+        config=_create_template_config()
+    )) as stream:
+        async for text in stream:
+            chunks.append(text)
+            emit("token", {"text": text})
+    return parallel_result, fusion_result, "".join(chunks)
+
+# --------------------------------------------------------------------------------- end _run_pipeline()
+
+# --------------------------------------------------------------------------------- _answer_request()
+async def _answer_request(request: "ParallelHybridRequest", session_id: str, start_time: float,
+                          query_embedding: Optional[list] = None,
+                          emit: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> "ParallelHybridResponse":
+    """Answers one request inside a trace and adds the span summary to the metadata.
+
+    Shared by `/generate_parallel_hybrid`, `/generate_parallel_hybrid/stream` and
+    `/generate_parallel_hybrid/batch`. Pipeline exceptions propagate to the caller.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+        session_id (str): Current session identifier.
+        start_time (float): Request start timestamp.
+        query_embedding (Optional[list]): Precomputed question embedding.
+        emit (Optional[Callable[[str, Dict[str, Any]], None]]): Progress event callback
+                                                               (streaming requests).
+
+    Returns:
+        ParallelHybridResponse: Response whose metadata["tracing"] summarizes the stage spans.
+    """
+    with start_trace("answer_request", session_id=session_id[:8],
+                     fusion_strategy=request.fusion_strategy or "advanced_hybrid",
+                     template_type=request.template_type or "regulatory_compliance") as trace:
+        response = await _process_request(request, session_id, start_time, query_embedding, emit)
+    if trace is not None:
+        response.metadata = {**response.metadata, "tracing": trace.summary()}
+    return response
+
+# --------------------------------------------------------------------------------- end _answer_request()
+
+# --------------------------------------------------------------------------------- _process_request()
+async def _process_request(request: "ParallelHybridRequest", session_id: str, start_time: float,
+                           query_embedding: Optional[list] = None,
+                           emit: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> "ParallelHybridResponse":
+    """Processes one request: semantic cache lookup, then the (coalesced) pipeline.
+
+    Args:
+        request (ParallelHybridRequest): The originating request.
+        session_id (str): Current session identifier.
+        start_time (float): Request start timestamp.
+        query_embedding (Optional[list]): Precomputed question embedding; embedded
+                                          here when None and the semantic cache is enabled.
+        emit (Optional[Callable[[str, Dict[str, Any]], None]]): Progress event callback;
+                                                               only a leader's pipeline emits
+                                                               retrieval, fusion and token events.
+
+    Returns:
+        ParallelHybridResponse: Cached, generated, or not-ready fallback response.
+    """
+    # Step 0: Semantic Response Cache
+    # Serves a stored response for a near-duplicate question with the same
+    # fusion strategy and template type, skipping the whole pipeline.
+    fusion_strategy_name = _fusion_strategy_key(request)
+    template_type_name = request.template_type or "regulatory_compliance"
+    semantic_cache = get_semantic_cache()
+    cache_hit = None
+    if semantic_cache is None:
+        query_embedding = None
+    else:
+        with span("semantic_cache.lookup"):
+            if query_embedding is None:
+                query_embedding = await _embed_for_semantic_cache(request.user_input)
+            if query_embedding is not None:
+                cache_hit = semantic_cache.lookup(request.user_input, query_embedding,
+                                                  fusion_strategy_name, template_type_name)
+        if cache_hit:
+            logger.info(f"✅ Semantic cache hit (similarity {cache_hit.similarity:.3f})")
+            if emit is not None:
+                emit("stage", {"stage": "cache", "hit": True, "similarity": round(cache_hit.similarity, 4)})
+            return ParallelHybridResponse(
+                response=cache_hit.entry.response,
+                session_id=session_id,
+                processing_time=time.time() - start_time,
+                timestamp=datetime.now().isoformat(),
+                metadata={**cache_hit.entry.metadata, "cache": cache_hit.to_metadata()}
+            )
+
+    # Steps 1-3: Retrieval, Fusion and Template Application
+    # Concurrent identical requests (same normalized query, fusion strategy
+    # and template type) share one pipeline execution.
+    single_flight = get_single_flight()
+    if single_flight is not None:
+        pipeline_result, coalesced = await single_flight.run(
+            single_flight.make_key(request.user_input, fusion_strategy_name, template_type_name),
+            lambda: _run_pipeline(request, emit)
+        )
+    else:
+        pipeline_result, coalesced = await _run_pipeline(request, emit), False
+
+    if pipeline_result is None:
+        # Simple fallback response if fusion is not possible due to retrieval issues.
+        return _create_not_ready_response(request, session_id, start_time)
+    parallel_result, fusion_result, final_response = pipeline_result
+
+    processing_time = time.time() - start_time
+
+    # Gathers metadata from all processing stages for the response.
+    response_metadata = _build_response_metadata(request, parallel_result, fusion_result, final_response)
+
+    # Stores the completed response for future near-duplicate questions
+    # (once per pipeline execution; the leader stores for coalesced followers).
+    # Fallback, cut-short and partial-retrieval answers are not stored.
+    if semantic_cache is not None and query_embedding is not None and not coalesced:
+        skip_reason = _cache_skip_reason(parallel_result, fusion_result)
+        if skip_reason is not None:
+            logger.info(f"Semantic cache store skipped: {skip_reason}")
+        else:
+            semantic_cache.store(
+                query=request.user_input,
+                embedding=query_embedding,
+                fusion_strategy=fusion_strategy_name,
+                template_type=template_type_name,
+                response=final_response,
+                metadata=response_metadata
+            )
+    response_metadata = {
+        **response_metadata,
+        "cache": {"hit": False},
+        "single_flight": {"coalesced": coalesced}
+    }
+
+    return ParallelHybridResponse(
+        response=final_response,
+        session_id=session_id,
+        processing_time=processing_time,
+        timestamp=datetime.now().isoformat(),
+        metadata=response_metadata
+    )
+
+# --------------------------------------------------------------------------------- end _process_request()
+
+# --------------------------------------------------------------------------------- _group_batch_queries()
+def _group_batch_queries(queries: List[str]) -> List[List[int]]:
+    """Groups batch positions by normalized question, in first-occurrence order.
+
+    Args:
+        queries (List[str]): Batch questions.
+
+    Returns:
+        List[List[int]]: Positions of each distinct question; the first position
+                         of each group is the one that is answered.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, query in enumerate(queries):
+        groups.setdefault(normalize_embedding_text(query), []).append(index)
+    return list(groups.values())
+
+# --------------------------------------------------------------------------------- end _group_batch_queries()
+
+# --------------------------------------------------------------------------------- _embed_batch()
+async def _embed_batch(queries: List[str]) -> List[Optional[list]]:
+    """Embeds all batch questions as query vectors with one batched call.
+
+    The vectors feed semantic cache lookups and land in the shared embedding
+    cache under the same keys as embed_query(), so the vector retrieval branch
+    does not embed the questions again. Without the cache wrapper (embedding
+    cache disabled) the questions are embedded one at a time. On failure every
+    question falls back to individual embedding.
+
+    Args:
+        queries (List[str]): Distinct batch questions.
+
+    Returns:
+        List[Optional[list]]: One embedding (or None) per question.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+        embed_queries = getattr(embeddings, "embed_queries", None) or \
+            (lambda texts: [embeddings.embed_query(text) for text in texts])
+        return await loop.run_in_executor(None, bind_context(embed_queries), queries)
+    except Exception as e:
+        logger.warning(f"⚠️ Batch embedding failed, embedding questions individually: {e}")
+        return [None] * len(queries)
+
+# --------------------------------------------------------------------------------- end _embed_batch()
+
+# --------------------------------------------------------------------------------- _format_sse()
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Formats one server-sent event.
+
+    Args:
+        event (str): Event name (stage, token, done, error).
+        data (Dict[str, Any]): JSON-serializable event payload.
+
+    Returns:
+        str: SSE frame terminated by a blank line.
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# --------------------------------------------------------------------------------- end _format_sse()
+
 # ---------------------------------------------
 # --- Callable Functions from other modules ---
 # ---------------------------------------------
@@ -343,6 +936,14 @@ async def generate_parallel_hybrid_response(
     2. Context Fusion (combining results based on a selected strategy).
     3. Hybrid Template Application (formatting the final response).
 
+    Before running the pipeline, the semantic response cache is consulted. A
+    near-duplicate question answered with the same fusion strategy and template
+    type returns the stored response, flagged with `metadata["cache"]["hit"]`.
+    Identical requests arriving while the same pipeline is already running are
+    coalesced onto that execution (single-flight), flagged with
+    `metadata["single_flight"]["coalesced"]`. `metadata["tracing"]` summarizes
+    the time spent in each pipeline stage.
+
     Args:
         request (ParallelHybridRequest): The incoming request containing the
                                          user's query and optional parameters
@@ -360,7 +961,9 @@ async def generate_parallel_hybrid_response(
     Raises:
         HTTPException:
             - 503 Service Unavailable: If the core Advanced Parallel Hybrid modules
-                                       failed to load at application startup.
+                                       failed to load at application startup, or an
+                                       identical request this one was coalesced onto
+                                       did not finish within the follower timeout.
             - Other exceptions might be raised internally and caught, resulting
               in an error response within the ParallelHybridResponse metadata.
     """
@@ -373,120 +976,241 @@ async def generate_parallel_hybrid_response(
     try:
         logger.info(f"Processing parallel hybrid request for session {current_session_id[:8]}")
 
-        # Get components
-        # Retrieves the singleton instance of the ParallelRetrievalEngine.
-        parallel_engine = get_parallel_engine()
-        # Retrieves the singleton instance of the HybridContextFusion engine.
-        fusion_engine = get_fusion_engine()
+        return await _answer_request(request, current_session_id, start_time)
 
-        # Step 1: Parallel Retrieval
-        # Executes VectorRAG and GraphRAG concurrently.
-        parallel_result = await parallel_engine.retrieve_parallel(
-            query=request.user_input
+    except SingleFlightTimeoutError as e:
+        # An identical request is still running: shed this one rather than start a second run
+        retry_after = getattr(get_config(), "admission_retry_after_seconds", 5)
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(retry_after)})
+    except Exception as e:
+        logger.error(f"❌ Error in parallel hybrid processing: {e}")
+        return ParallelHybridResponse(
+            response=f"Error processing your question: {str(e)}",
+            session_id=current_session_id,
+            processing_time=time.time() - start_time,
+            timestamp=datetime.now().isoformat(),
+            metadata={"error": True, "error_message": str(e)}
         )
 
-        # Check if parallel retrieval results are viable for fusion.
-        if not parallel_result.fusion_ready:
-            # Simple fallback response if fusion is not possible due to retrieval issues.
-            response_text = f"Based on MSHA regulations regarding: {request.user_input}\n\nI found relevant information but the parallel system encountered issues. Please try rephrasing your question."
+# --------------------------------------------------------------------------------- end generate_parallel_hybrid_response()
 
-            return ParallelHybridResponse(
-                response=response_text,
-                session_id=current_session_id,
-                processing_time=time.time() - start_time,
-                timestamp=datetime.now().isoformat(),
-                metadata={
-                    "parallel_retrieval": {"fusion_ready": False},
-                    "context_fusion": {"strategy": "fallback"},
-                    "hybrid_template": {"type": "fallback"}
-                }
-            )
+# --------------------------------------------------------------------------------- stream_parallel_hybrid_response()
+@app.post("/generate_parallel_hybrid/stream")
+async def stream_parallel_hybrid_response(
+    request: ParallelHybridRequest,
+    session_id: Optional[str] = Header(None, alias="X-Session-ID")
+) -> StreamingResponse:
+    """Processes a user query and streams progress and answer tokens as server-sent events.
+
+    Runs the same path as `/generate_parallel_hybrid` (semantic cache, single-flight
+    coalescing, tracing) but reports progress as it happens instead of returning a
+    single JSON body. Event types:
+    - `stage`: `{"stage": "cache" | "retrieval" | "fusion", ...}` with stage results
+      (cache similarity, retrieval confidences, fusion confidence) and `elapsed_ms`.
+    - `token`: `{"text": "..."}` for each chunk of the final answer (one token with the
+      whole answer for cache hits and requests coalesced onto another request).
+    - `done`: the complete ParallelHybridResponse as JSON, whose metadata includes
+      `streaming.time_to_first_token_ms`.
+    - `error`: `{"message": "..."}` if processing failed.
 
-        # Step 2: Context Fusion
-        # Maps the string fusion strategy from the request to the FusionStrategy Enum.
-        strategy_map = {
-            "weighted_linear": FusionStrategy.WEIGHTED_LINEAR,
-            "max_confidence": FusionStrategy.MAX_CONFIDENCE,
-            "advanced_hybrid": FusionStrategy.ADVANCED_HYBRID,
-            "adaptive_fusion": FusionStrategy.ADAPTIVE_FUSION
-        }
+    Args:
+        request (ParallelHybridRequest): The incoming request, as for `/generate_parallel_hybrid`.
+        session_id (Optional[str]): Optional session ID from the `X-Session-ID` header.
 
-        fusion_strategy = strategy_map.get(request.fusion_strategy or "advanced_hybrid", FusionStrategy.ADVANCED_HYBRID)
-        # Fuses the results from parallel retrieval based on the chosen strategy.
-        fusion_result = await fusion_engine.fuse_contexts(
-            parallel_response=parallel_result,
-            strategy=fusion_strategy
-        )
+    Returns:
+        StreamingResponse: A `text/event-stream` response.
 
-        # Step 3: Template Application
-        # Maps the string template type from the request to the TemplateType Enum.
-        template_map = {
-            "basic_hybrid": TemplateType.BASIC_HYBRID,
-            "research_based": TemplateType.RESEARCH_BASED,
-            "regulatory_compliance": TemplateType.REGULATORY_COMPLIANCE,
-            "comparative_analysis": TemplateType.COMPARATIVE_ANALYSIS,
-            "confidence_weighted": TemplateType.CONFIDENCE_WEIGHTED
-        }
+    Raises:
+        HTTPException: 503 if the Advanced Parallel Hybrid modules are not available.
+    """
+    if not PARALLEL_HYBRID_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Advanced Parallel Hybrid system not available")
 
-        template_type = template_map.get(request.template_type or "regulatory_compliance", TemplateType.REGULATORY_COMPLIANCE)
-        # Configures the template generation process with desired options.
-        template_config = TemplateConfig(
-            include_confidence_scores=True,
-            include_source_attribution=True,
-            max_context_length=2000,
-            regulatory_focus=True
-        )
+    start_time = time.time()
+    current_session_id = session_id or request.session_id or str(uuid.uuid4())
 
-        # Generates the final response using the fused context and the selected template.
-        final_response = await generate_hybrid_response(
-            user_query=request.user_input,
-            fusion_result=fusion_result,
-            template_type=template_type,
-            config=template_config
+    # -----------------------
+    # -- Embedded Function --
+    # -----------------------
+
+    # --------------------------------------------------------------------------------- event_stream()
+    async def event_stream():
+        elapsed_ms = lambda: int((time.time() - start_time) * 1000)
+        events: asyncio.Queue = asyncio.Queue()
+        streamed = {"chunks": 0, "time_to_first_token_ms": None}
+
+        def emit(event: str, data: Dict[str, Any]) -> None:
+            if event == "token":
+                if streamed["time_to_first_token_ms"] is None:
+                    streamed["time_to_first_token_ms"] = elapsed_ms()
+                    logger.info(f"⏱️ Time to first token: {streamed['time_to_first_token_ms']}ms")
+                streamed["chunks"] += 1
+            else:
+                data = {**data, "elapsed_ms": elapsed_ms()}
+            events.put_nowait((event, data))
+
+        logger.info(f"Streaming parallel hybrid request for session {current_session_id[:8]}")
+
+        # Same path as /generate_parallel_hybrid (tracing, semantic cache, single-flight);
+        # progress events are relayed while it runs, then a None marks completion.
+        task = asyncio.ensure_future(
+            _answer_request(request, current_session_id, start_time, emit=emit)
         )
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (item := await events.get()) is not None:
+                yield _format_sse(*item)
+            response = await task
+
+            # Cache hits, coalesced followers and not-ready fallbacks produce no
+            # tokens of their own: the whole answer is sent as one token.
+            if streamed["chunks"] == 0:
+                emit("token", {"text": response.response})
+                yield _format_sse(*events.get_nowait())
+            response.metadata = {
+                **response.metadata,
+                "streaming": {"time_to_first_token_ms": streamed["time_to_first_token_ms"],
+                              "chunks": streamed["chunks"]}
+            }
+            yield _format_sse("done", response.model_dump())
+
+        except Exception as e:
+            logger.error(f"❌ Error in streaming parallel hybrid processing: {e}")
+            yield _format_sse("error", {"message": str(e), "elapsed_ms": elapsed_ms()})
+        finally:
+            # Client disconnected mid-stream: stop the pipeline (followers of this
+            # leader run it themselves)
+            task.cancel()
+    # --------------------------------------------------------------------------------- end event_stream()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# --------------------------------------------------------------------------------- end stream_parallel_hybrid_response()
+
+# --------------------------------------------------------------------------------- batch_parallel_hybrid_response()
+@app.post("/generate_parallel_hybrid/batch")
+async def batch_parallel_hybrid_response(
+    request: ParallelHybridBatchRequest,
+    session_id: Optional[str] = Header(None, alias="X-Session-ID")
+) -> StreamingResponse:
+    """Answers a list of questions and streams the results as NDJSON as they complete.
+
+    Duplicate questions (after whitespace normalization) are answered once, all
+    distinct questions are embedded with a single batched embedding call,
+    and at most max_concurrency questions run through the pipeline at a time. Each
+    running question holds its own admission control slot; a question shed by
+    admission control is reported as a failed item.
+    Each input position gets one line:
+    `{"type": "result", "index", "query", "status": "ok" | "error", "deduplicated", ...}`
+    with the ParallelHybridResponse fields on success or `error` on failure; a
+    final `{"type": "summary", ...}` line reports counts and total time. Each
+    question's processing_time is measured from batch receipt. A failed question
+    never fails the batch.
 
-        processing_time = time.time() - start_time
+    Args:
+        request (ParallelHybridBatchRequest): Questions and shared options.
+        session_id (Optional[str]): Optional session ID from the `X-Session-ID` header.
 
-        # Gathers metadata from all processing stages for the response.
-        response_metadata = {
-            "parallel_retrieval": {
-                "total_time_ms": int(processing_time * 1000),
-                "fusion_ready": True,
-                "vector_confidence": parallel_result.vector_result.confidence if parallel_result.vector_result else 0.0,
-                "graph_confidence": parallel_result.graph_result.confidence if parallel_result.graph_result else 0.0,
-            },
-            "context_fusion": {
-                "strategy": request.fusion_strategy,
-                "final_confidence": fusion_result.final_confidence,
-                "vector_contribution": fusion_result.vector_contribution,
-                "graph_contribution": fusion_result.graph_contribution,
-                "quality_score": fusion_result.fusion_quality_score,
-            },
-            "hybrid_template": {
-                "type": request.template_type,
-                "length": len(final_response)
-            }
-        }
+    Returns:
+        StreamingResponse: An `application/x-ndjson` response.
 
-        return ParallelHybridResponse(
-            response=final_response,
-            session_id=current_session_id,
-            processing_time=processing_time,
-            timestamp=datetime.now().isoformat(),
-            metadata=response_metadata
-        )
+    Raises:
+        HTTPException: 503 if the Advanced Parallel Hybrid modules are not available,
+                       400 for an empty batch, 413 for more than batch_max_queries questions.
+    """
+    if not PARALLEL_HYBRID_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Advanced Parallel Hybrid system not available")
 
-    except Exception as e:
-        logger.error(f"❌ Error in parallel hybrid processing: {e}")
-        return ParallelHybridResponse(
-            response=f"Error processing your question: {str(e)}",
+    config = get_config()
+    max_queries = getattr(config, "batch_max_queries", 500)
+    if not request.queries:
+        raise HTTPException(status_code=400, detail="queries must contain at least one question")
+    if len(request.queries) > max_queries:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_queries} questions")
+
+    max_concurrency = getattr(config, "batch_max_concurrency", 4)
+    concurrency = max(1, min(request.max_concurrency or max_concurrency, max_concurrency))
+    start_time = time.time()
+    current_session_id = session_id or request.session_id or str(uuid.uuid4())
+    groups = _group_batch_queries(request.queries)
+    admission_controller = get_admission_controller()
+
+    # -----------------------
+    # -- Embedded Function --
+    # -----------------------
+
+    # --------------------------------------------------------------------------------- answer_group()
+    async def answer_group(indices: List[int], query_embedding: Optional[list],
+                           semaphore: asyncio.Semaphore) -> tuple:
+        # Only options set on the batch count as explicitly requested for each question
+        options = {name: getattr(request, name) for name in ("fusion_strategy", "template_type")
+                   if name in request.model_fields_set}
+        item = ParallelHybridRequest(
+            user_input=request.queries[indices[0]],
             session_id=current_session_id,
-            processing_time=time.time() - start_time,
-            timestamp=datetime.now().isoformat(),
-            metadata={"error": True, "error_message": str(e)}
+            **options
         )
-
-# --------------------------------------------------------------------------------- end generate_parallel_hybrid_response()
+        async with semaphore:
+            try:
+                # One admission slot per question in flight; a shed question is a failed item
+                admission = admission_controller.admit() if admission_controller is not None else nullcontext()
+                async with admission:
+                    # processing_time counts from batch receipt, including the wait for a slot
+                    response = await _answer_request(item, current_session_id, start_time, query_embedding)
+                return indices, response.model_dump(), None
+            except Exception as e:
+                logger.error(f"❌ Batch question failed: {e}")
+                return indices, None, str(e)
+    # --------------------------------------------------------------------------------- end answer_group()
+
+    # --------------------------------------------------------------------------------- event_stream()
+    async def event_stream():
+        logger.info(f"Processing batch of {len(request.queries)} questions "
+                    f"({len(groups)} distinct, concurrency {concurrency}) for session {current_session_id[:8]}")
+        query_embeddings = await _embed_batch([request.queries[indices[0]] for indices in groups])
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [
+            asyncio.ensure_future(answer_group(indices, query_embedding, semaphore))
+            for indices, query_embedding in zip(groups, query_embeddings)
+        ]
+        failed = 0
+        try:
+            for completed in asyncio.as_completed(tasks):
+                indices, response, error = await completed
+                failed += len(indices) if error else 0
+                for index in indices:
+                    line = {
+                        "type": "result",
+                        "index": index,
+                        "query": request.queries[index],
+                        "status": "error" if error else "ok",
+                        "deduplicated": index != indices[0],
+                    }
+                    line.update({"error": error} if error else response)
+                    yield json.dumps(line) + "\n"
+
+            yield json.dumps({
+                "type": "summary",
+                "session_id": current_session_id,
+                "total": len(request.queries),
+                "distinct": len(groups),
+                "succeeded": len(request.queries) - failed,
+                "failed": failed,
+                "processing_time": time.time() - start_time
+            }) + "\n"
+        finally:
+            # Client disconnected mid-batch: stop the remaining questions
+            for task in tasks:
+                task.cancel()
+    # --------------------------------------------------------------------------------- end event_stream()
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+# --------------------------------------------------------------------------------- end batch_parallel_hybrid_response()
 
 # --------------------------------------------------------------------------------- parallel_hybrid_health()
 @app.get("/parallel_hybrid/health")
@@ -518,6 +1242,10 @@ async def parallel_hybrid_health() -> JSONResponse:
 
         # Determine overall health based on engine availability.
         health_status = "healthy" if (parallel_engine and fusion_engine) else "degraded"
+        semantic_cache = get_semantic_cache()
+        admission_controller = get_admission_controller()
+        single_flight = get_single_flight()
+        trace_exporter = get_trace_exporter()
 
         return JSONResponse(
             content={
@@ -526,7 +1254,25 @@ async def parallel_hybrid_health() -> JSONResponse:
                 "components": {
                     "parallel_engine": {"status": "healthy", "available": True},
                     "fusion_engine": {"status": "healthy", "available": True},
-                    "templates": {"status": "healthy", "available": True}
+                    "templates": {"status": "healthy", "available": True},
+                    "semantic_cache": (
+                        {"status": "healthy", **semantic_cache.get_stats()}
+                        if semantic_cache is not None else {"status": "disabled"}
+                    ),
+                    "cypher_paths": {"status": "healthy", **get_cypher_path_stats()},
+                    "admission": (
+                        {"status": "healthy", **admission_controller.get_stats()}
+                        if admission_controller is not None else {"status": "disabled"}
+                    ),
+                    "single_flight": (
+                        {"status": "healthy", **single_flight.get_stats()}
+                        if single_flight is not None else {"status": "disabled"}
+                    ),
+                    "trace_export": (
+                        {"status": "healthy", **trace_exporter.get_stats()}
+                        if trace_exporter is not None else {"status": "disabled"}
+                    ),
+                    "prompt_tokens": {"status": "healthy", **get_token_counter().get_stats()}
                 }
             },
             status_code=200
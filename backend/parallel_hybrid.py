@@ -32,14 +32,20 @@
 #   - logging: For comprehensive debugging and operation tracking
 #   - typing: For type hints (Dict, List, Any, Optional, Tuple, cast)
 #   - dataclasses: For data container definitions (RetrievalResult, ParallelRetrievalResponse)
-#   - concurrent.futures: For thread pool execution and parallel processing
+#   - concurrent.futures: For thread pool execution (threaded fallback path)
 # - Third-Party: None
 # - Local Project Modules:
 #   - .tools.vector: VectorRAG implementation with semantic similarity search
 #   - .tools.cypher: GraphRAG implementation with Cypher query generation
+#   - .tools.section_index: Indexed chunk lookup for questions citing CFR sections
 #   - .tools.general: General tool safety mechanisms and fallbacks
+#   - .tools.registry: Warm component registry status for health reporting
+#   - .database.AsyncDriverUnavailableError: Detects an unavailable asyncio driver path
 #   - .llm: LLM access for processing and enhancement
 #   - .utils: Session management and utility functions
+#   - .config: Engine settings (async retrieval, vector retrieval mode, GraphRAG fallback concurrency,
+#     branch grace period, section lookup)
+#   - .tracing: Spans for retrieval, each branch and each GraphRAG fallback strategy
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -74,18 +80,36 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # Local application/library specific imports
 try:
     # Try relative imports first (when run as module)
-    from .tools.vector import search_regulations_semantic, check_vector_tool_health
-    from .tools.cypher import query_regulations, check_cypher_tool_health
+    from .tools.vector import (
+        search_regulations_semantic, asearch_regulations_semantic, retrieve_regulation_chunks,
+        aretrieve_regulation_chunks, retrieve_hybrid_chunks, aretrieve_hybrid_chunks,
+        format_regulation_chunks, check_vector_tool_health
+    )
+    from .tools.cypher import query_regulations, aquery_regulations, check_cypher_tool_health
+    from .tools.section_index import extract_question_sections, lookup_section_chunks, alookup_section_chunks
+    from .tools.registry import get_component_registry
     from .tools.general import get_general_tool_safe
+    from .database import AsyncDriverUnavailableError
     from .llm import get_llm
     from .utils import get_session_id
+    from .config import get_config
+    from .tracing import traced, span, bind_context
 except ImportError:
     # Fall back to absolute imports (when run directly from backend directory)
-    from tools.vector import search_regulations_semantic, check_vector_tool_health
-    from tools.cypher import query_regulations, check_cypher_tool_health
+    from tools.vector import (
+        search_regulations_semantic, asearch_regulations_semantic, retrieve_regulation_chunks,
+        aretrieve_regulation_chunks, retrieve_hybrid_chunks, aretrieve_hybrid_chunks,
+        format_regulation_chunks, check_vector_tool_health
+    )
+    from tools.cypher import query_regulations, aquery_regulations, check_cypher_tool_health
+    from tools.section_index import extract_question_sections, lookup_section_chunks, alookup_section_chunks
+    from tools.registry import get_component_registry
     from tools.general import get_general_tool_safe
+    from database import AsyncDriverUnavailableError
     from llm import get_llm
     from utils import get_session_id
+    from config import get_config
+    from tracing import traced, span, bind_context
 
 # =========================================================================
 # Global Constants / Variables
@@ -93,6 +117,16 @@ except ImportError:
 # Logger for this module
 logger = logging.getLogger(__name__)
 
+# Vector branch modes: "answer" runs the retrieval + answer LLM chain, "chunks" returns
+# the ranked chunks for context fusion to consume directly (one LLM call fewer), and
+# "hybrid" returns chunks from keyword and vector search merged by reciprocal rank fusion
+VECTOR_RETRIEVAL_MODES = ("answer", "chunks", "hybrid")
+
+# Errors meaning the asyncio path itself is unavailable (a component without an async
+# implementation, or an asyncio driver that cannot be created). Only these retry the
+# call on the thread pool; query, LLM and timeout errors propagate.
+ASYNC_PATH_UNAVAILABLE_ERRORS = (NotImplementedError, AsyncDriverUnavailableError)
+
 # Global parallel engine instance for singleton pattern
 _parallel_engine = None
 
@@ -120,6 +154,9 @@ class RetrievalResult:
         response_time_ms (int): Response time in milliseconds for performance tracking.
         error (Optional[str]): Error message if retrieval failed. Defaults to None.
         metadata (Optional[Dict[str, Any]]): Additional metadata about the retrieval. Defaults to None.
+        timed_out (bool): True if the branch missed its deadline and was abandoned. Defaults to False.
+        chunks (Optional[List[Dict[str, Any]]]): Ranked chunks (text, score, document, chunk_id,
+                                                 entities) in retrieval-only vector mode. Defaults to None.
 
     Methods:
         None (dataclass with automatic methods)
@@ -130,6 +167,8 @@ class RetrievalResult:
     response_time_ms: int
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    timed_out: bool = False
+    chunks: Optional[List[Dict[str, Any]]] = None
 # -------------------------------------------------------------------------
 
 # -------------------------------------------------------------------------
@@ -152,6 +191,10 @@ class ParallelRetrievalResponse:
         total_time_ms (int): Total time for parallel retrieval operation in milliseconds.
         success (bool): Overall success status (true if at least one retrieval succeeded).
         fusion_ready (bool): Whether results are suitable for context fusion processing.
+        section_lookup (Optional[List[str]]): Cited section numbers when the section index answered
+                                              the question (vector_result holds the chunks). The
+                                              graph result is marked skipped unless the graph branch
+                                              also ran. Defaults to None.
 
     Methods:
         None (dataclass with automatic methods)
@@ -162,6 +205,7 @@ class ParallelRetrievalResponse:
     total_time_ms: int
     success: bool
     fusion_ready: bool
+    section_lookup: Optional[List[str]] = None
 # ------------------------------------------------------------------------- end class ParallelRetrievalResponse
 
 # ------------------------------------------------------------------------- class ParallelRetrievalEngine
@@ -178,18 +222,36 @@ class ParallelRetrievalEngine:
         None
 
     Instance Attributes:
-        timeout_seconds (int): Maximum time to wait for retrieval operations.
-        executor (ThreadPoolExecutor): Thread pool for parallel retrieval execution.
+        timeout_seconds (int): Maximum time to wait for retrieval operations (per-branch deadline).
+        branch_grace_seconds (float): Grace period for the slower branch once the other is viable.
+        max_concurrent_fallbacks (int): Maximum GraphRAG fallback strategies in flight at once.
+        async_retrieval (bool): Whether retrieval uses the native asyncio path first.
+        vector_retrieval_mode (str): "answer" (retrieval + answer LLM), "chunks" (retrieval only)
+                                     or "hybrid" (keyword + vector retrieval only).
+        section_lookup (bool): Whether questions citing CFR sections are answered from the section index.
+        async_fallback_count (int): Number of asyncio retrievals that fell back to the thread pool
+                                    because the asyncio path was unavailable.
+        executor (ThreadPoolExecutor): Thread pool for the threaded retrieval path.
 
     Methods:
         retrieve_parallel(): Main method for parallel VectorRAG and GraphRAG execution.
+        retrieve_sections(): Section index lookup that replaces both branches for cited sections.
         health_check(): Comprehensive health check for retrieval components.
         _async_vector_retrieve(): Asynchronous VectorRAG execution.
         _async_graph_retrieve(): Asynchronous GraphRAG execution.
+        _run_vector_search() / _run_graph_query(): Asyncio tool calls with threaded fallback when asyncio is unavailable.
+        _run_vector_chunk_search(): Retrieval-only vector search with threaded fallback when asyncio is unavailable.
+        _run_section_lookup(): Section index lookup with threaded fallback when asyncio is unavailable.
         _calculate_vector_confidence(): Confidence scoring for vector results.
+        _calculate_chunk_confidence(): Confidence scoring for retrieval-only vector results.
         _calculate_graph_confidence(): Confidence scoring for graph results.
         _enhance_query_for_graph(): Query enhancement for GraphRAG optimization.
-        _try_alternative_graph_queries(): Fallback strategies for failed graph queries.
+        _try_alternative_graph_queries(): Concurrent fallback strategies for failed graph queries.
+        _build_graph_fallback_strategies(): Fallback strategy construction in preference order.
+        _await_branches(): Per-branch deadlines with a grace period for the slower branch.
+        _completed_branch(): Branch coroutine for section index chunks used as the vector result.
+        _is_vector_viable() / _is_graph_viable(): Fusion viability checks per branch.
+        _create_timed_out_result(): Result creation for a branch that missed its deadline.
         _create_timeout_response(): Response creation for timeout scenarios.
         _create_error_response(): Response creation for error scenarios.
     """
@@ -199,7 +261,9 @@ class ParallelRetrievalEngine:
     # -------------------
     
     # --------------------------------------------------------------------------------- function __init__
-    def __init__(self, timeout_seconds: int = 30) -> None:
+    def __init__(self, timeout_seconds: int = 30, max_concurrent_fallbacks: int = 3,
+                 branch_grace_seconds: float = 5.0, async_retrieval: bool = True,
+                 vector_retrieval_mode: str = "answer", section_lookup: bool = False) -> None:
         """Initialize the parallel retrieval engine.
 
         Creates a parallel retrieval engine with configurable timeout and thread pool
@@ -208,8 +272,28 @@ class ParallelRetrievalEngine:
 
         Args:
             timeout_seconds (int): Maximum time to wait for retrieval operations. Defaults to 30.
+            max_concurrent_fallbacks (int): Maximum GraphRAG fallback strategies in flight at once. Defaults to 3.
+            branch_grace_seconds (float): Extra time the slower branch gets once the other branch
+                                          returned a viable result. Defaults to 5.0.
+            async_retrieval (bool): Use the native asyncio retrieval path, falling back to the
+                                    thread pool if it is unavailable. Defaults to True.
+            vector_retrieval_mode (str): "answer" to have the vector branch write an answer with the
+                                         LLM, "chunks" to return ranked chunks for fusion to consume
+                                         directly, "hybrid" to return chunks from keyword and vector
+                                         search merged by reciprocal rank fusion. Defaults to "answer".
+            section_lookup (bool): Answer questions citing CFR sections with one section index
+                                   lookup before the branches. Defaults to False.
         """
         self.timeout_seconds = timeout_seconds
+        self.max_concurrent_fallbacks = max(1, max_concurrent_fallbacks)
+        self.branch_grace_seconds = max(0.0, branch_grace_seconds)
+        self.async_retrieval = async_retrieval
+        if vector_retrieval_mode not in VECTOR_RETRIEVAL_MODES:
+            logger.warning(f"⚠️ Unknown vector retrieval mode '{vector_retrieval_mode}', using 'answer'")
+            vector_retrieval_mode = "answer"
+        self.vector_retrieval_mode = vector_retrieval_mode
+        self.section_lookup = section_lookup
+        self.async_fallback_count = 0
         self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ParallelRAG")
     # ---------------------------------------------------------------------------------
 
@@ -218,7 +302,8 @@ class ParallelRetrievalEngine:
     # ---------------------------
     
     # --------------------------------------------------------------------------------- function retrieve_parallel
-    async def retrieve_parallel(self, query: str) -> ParallelRetrievalResponse:
+    @traced("retrieve_parallel")
+    async def retrieve_parallel(self, query: str, skip_graph_on_section_hit: bool = True) -> ParallelRetrievalResponse:
         """Execute VectorRAG and GraphRAG simultaneously using advanced parallel approach.
 
         This is the core method of the Advanced Parallel Hybrid system that executes
@@ -227,6 +312,11 @@ class ParallelRetrievalEngine:
 
         Args:
             query (str): User's natural language question about MSHA regulations.
+            skip_graph_on_section_hit (bool): On a section index hit, return the section chunks
+                                              without running the graph branch. False keeps the
+                                              graph branch, with the section chunks as the vector
+                                              result, so a requested fusion strategy has both
+                                              contexts to fuse. Defaults to True.
 
         Returns:
             ParallelRetrievalResponse: Complete response with results from both retrieval methods,
@@ -240,16 +330,29 @@ class ParallelRetrievalEngine:
         start_time = time.time()
         logger.info(f"Starting parallel retrieval for query: {query[:50]}...")
         
+        # Questions citing CFR sections resolve straight to the chunks that reference them
+        section_response = None
+        if self.section_lookup:
+            section_response = await self.retrieve_sections(query)
+            if section_response is not None and skip_graph_on_section_hit:
+                return section_response
+        
         try:
-            # Create async tasks for parallel execution
-            vector_task = asyncio.create_task(self._async_vector_retrieve(query))
+            # Create async tasks for parallel execution; section chunks stand in for the vector branch
+            vector_task = asyncio.create_task(
+                self._async_vector_retrieve(query) if section_response is None
+                else self._completed_branch(section_response.vector_result)
+            )
             graph_task = asyncio.create_task(self._async_graph_retrieve(query))
             
-            # Wait for both tasks with timeout
-            vector_result, graph_result = await asyncio.wait_for(
-                asyncio.gather(vector_task, graph_task, return_exceptions=True),
-                timeout=self.timeout_seconds
-            )
+            # Wait with independent per-branch deadlines; a late branch is abandoned
+            # instead of discarding the branch that already finished
+            vector_result, graph_result = await self._await_branches(vector_task, graph_task, start_time)
+            
+            if all(isinstance(result, RetrievalResult) and result.timed_out
+                   for result in (vector_result, graph_result)):
+                logger.error(f"❌ Parallel retrieval timeout after {self.timeout_seconds}s")
+                return self._create_timeout_response(query, start_time)
             
             # Handle potential exceptions and ensure proper typing
             final_vector_result: RetrievalResult
@@ -281,14 +384,8 @@ class ParallelRetrievalEngine:
             
             # Determine if we have sufficient content for fusion
             # Advanced Parallel Hybrid should use available results even if one component fails
-            vector_viable = (final_vector_result.error is None and 
-                           len(final_vector_result.content) > 100 and 
-                           final_vector_result.confidence > 0.3)
-            
-            graph_viable = (final_graph_result.error is None and 
-                          len(final_graph_result.content) > 50 and 
-                          final_graph_result.confidence > 0.2 and
-                          "I don't know" not in final_graph_result.content.lower())
+            vector_viable = self._is_vector_viable(final_vector_result)
+            graph_viable = self._is_graph_viable(final_graph_result)
             
             # Fusion ready if we have at least one strong result OR good vector with any graph attempt
             fusion_ready = vector_viable or graph_viable or (
@@ -302,6 +399,9 @@ class ParallelRetrievalEngine:
             logger.info(f"   Vector viable: {vector_viable} ({len(final_vector_result.content)} chars)")
             logger.info(f"   Graph viable: {graph_viable} ({len(final_graph_result.content)} chars)")
             logger.info(f"   Fusion ready: {fusion_ready}")
+            if final_vector_result.timed_out or final_graph_result.timed_out:
+                late_branch = "vector" if final_vector_result.timed_out else "graph"
+                logger.warning(f"⚠️ {late_branch} branch missed its deadline, proceeding with partial results")
             
             # 🔍 DEBUGGING: Show actual search results
             logger.info(f"\n" + "="*80)
@@ -330,28 +430,280 @@ class ParallelRetrievalEngine:
                 query=query,
                 total_time_ms=total_time,
                 success=success,
-                fusion_ready=fusion_ready
+                fusion_ready=fusion_ready,
+                section_lookup=section_response.section_lookup if section_response is not None else None
             )
             
-        except asyncio.TimeoutError:
-            logger.error(f"❌ Parallel retrieval timeout after {self.timeout_seconds}s")
-            return self._create_timeout_response(query, start_time)
         except Exception as e:
             logger.error(f"❌ Parallel retrieval failed: {str(e)}")
             return self._create_error_response(query, start_time, str(e))
     # ---------------------------------------------------------------------------------
 
+    # --------------------------------------------------------------------------------- function retrieve_sections
+    @traced("section_lookup")
+    async def retrieve_sections(self, query: str) -> Optional[ParallelRetrievalResponse]:
+        """Answer a question citing CFR sections from the section index.
+
+        The cited section numbers are resolved with one indexed lookup to the chunks
+        that reference them. On a hit, the chunks become the vector result and the
+        graph branch is skipped, so no embedding, Cypher generation or branch LLM
+        call is made.
+
+        Args:
+            query (str): User's natural language question about MSHA regulations.
+
+        Returns:
+            Optional[ParallelRetrievalResponse]: Response with section_lookup set, or None if the
+                                                 question cites no section, no chunk references the
+                                                 cited sections, or the lookup failed or missed the
+                                                 timeout_seconds deadline.
+
+        Examples:
+            >>> result = await engine.retrieve_sections("What does 30 CFR § 75.400 say?")
+            >>> print(result.section_lookup if result else "use the parallel branches")
+        """
+        sections = extract_question_sections(query)
+        if not sections:
+            return None
+        
+        start_time = time.time()
+        try:
+            chunks = await asyncio.wait_for(self._run_section_lookup(sections), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ Section index lookup exceeded {self.timeout_seconds}s, using parallel retrieval")
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Section index lookup failed, using parallel retrieval: {e}")
+            return None
+        if not chunks:
+            return None
+        
+        total_time = int((time.time() - start_time) * 1000)
+        content = format_regulation_chunks(chunks)
+        logger.info(f"✅ Section index lookup for {', '.join(sections)}: {len(chunks)} chunks in {total_time}ms")
+        
+        return ParallelRetrievalResponse(
+            vector_result=RetrievalResult(
+                content=content,
+                method="section_lookup",
+                confidence=self._calculate_chunk_confidence(chunks, content),
+                response_time_ms=total_time,
+                metadata={"sections": sections, "num_chunks": len(chunks)},
+                chunks=chunks
+            ),
+            graph_result=RetrievalResult(
+                content="",
+                method="graph_rag",
+                confidence=0.0,
+                response_time_ms=0,
+                error="Skipped: answered by the CFR section index",
+                metadata={"skipped": True}
+            ),
+            query=query,
+            total_time_ms=total_time,
+            success=True,
+            fusion_ready=True,
+            section_lookup=sections
+        )
+    # ---------------------------------------------------------------------------------
+
     # ---------------------------------------------
     # --- Internal/Private Methods ---
     # ---------------------------------------------
     
     # ---------------------------------------------------------------------------------
+    async def _await_branches(self, vector_task: asyncio.Task, graph_task: asyncio.Task,
+                              start_time: float) -> Tuple[RetrievalResult, RetrievalResult]:
+        """Wait for both retrieval branches with independent deadlines.
+
+        Each branch may run until timeout_seconds after start_time. Once one branch
+        returns a viable result, the other gets at most branch_grace_seconds more;
+        if the finished branch is not viable, the other keeps its full deadline.
+        A branch still running afterwards is cancelled and reported as timed out.
+        Cancelling does not interrupt a retrieval already running in the thread
+        pool; it finishes in the background and its result is discarded.
+
+        Args:
+            vector_task (asyncio.Task): Task running _async_vector_retrieve().
+            graph_task (asyncio.Task): Task running _async_graph_retrieve().
+            start_time (float): Retrieval start timestamp the deadlines are measured from.
+
+        Returns:
+            Tuple[RetrievalResult, RetrievalResult]: Vector and graph results; a branch
+                                                     that missed its deadline has timed_out=True.
+        """
+        branches = {vector_task: "vector_rag", graph_task: "graph_rag"}
+        deadline = start_time + self.timeout_seconds
+        pending = set(branches)
+        grace_started = False
+        
+        while pending:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            
+            # Shorten the other branch's deadline once a viable result is in hand
+            if pending and not grace_started and any(self._is_task_result_viable(task) for task in done):
+                grace_started = True
+                deadline = min(deadline, time.time() + self.branch_grace_seconds)
+        
+        results: Dict[str, Any] = {}
+        for task, method in branches.items():
+            if task in pending:
+                task.cancel()
+                results[method] = self._create_timed_out_result(method, start_time)
+            else:
+                exception = task.exception()
+                results[method] = exception if exception is not None else task.result()
+        
+        return results["vector_rag"], results["graph_rag"]
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    def _is_task_result_viable(self, task: asyncio.Task) -> bool:
+        """Check whether a finished branch task produced a fusion-viable result."""
+        if task.exception() is not None:
+            return False
+        result = task.result()
+        if result.method == "graph_rag":
+            return self._is_graph_viable(result)
+        return self._is_vector_viable(result)
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    @staticmethod
+    async def _completed_branch(result: RetrievalResult) -> RetrievalResult:
+        """Branch coroutine for a result already in hand (section index chunks)."""
+        return result
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    def _is_vector_viable(self, result: RetrievalResult) -> bool:
+        """Check whether a vector result has sufficient content for fusion."""
+        return (result.error is None and 
+                len(result.content) > 100 and 
+                result.confidence > 0.3)
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    def _is_graph_viable(self, result: RetrievalResult) -> bool:
+        """Check whether a graph result has sufficient content for fusion."""
+        return (result.error is None and 
+                len(result.content) > 50 and 
+                result.confidence > 0.2 and
+                "I don't know" not in result.content.lower())
+    # ---------------------------------------------------------------------------------
+
+    # ---------------------------------------------------------------------------------
+    async def _run_vector_search(self, query: str) -> str:
+        """Run the vector search tool, natively async when enabled, else on the thread pool.
+
+        The asyncio path does not hold a pool worker while waiting on the LLM, so
+        concurrency is bounded by the event loop instead of the 4-thread pool. If the
+        asyncio path is unavailable (ASYNC_PATH_UNAVAILABLE_ERRORS), the query is
+        retried once on the threaded path; other errors propagate.
+
+        Args:
+            query (str): Question for semantic search.
+
+        Returns:
+            str: Vector search answer.
+        """
+        if self.async_retrieval:
+            try:
+                return await asearch_regulations_semantic(query)
+            except ASYNC_PATH_UNAVAILABLE_ERRORS as e:
+                self.async_fallback_count += 1
+                logger.warning(f"⚠️ Async vector search failed, using threaded path: {e}")
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, bind_context(search_regulations_semantic), query)
+    # ---------------------------------------------------------------------------------
+
+    # ---------------------------------------------------------------------------------
+    async def _run_vector_chunk_search(self, query: str) -> List[Dict[str, Any]]:
+        """Run retrieval-only vector search, natively async when enabled, else on the thread pool.
+
+        In "hybrid" mode the chunks come from keyword and vector search merged by
+        reciprocal rank fusion.
+
+        Args:
+            query (str): Question for semantic search.
+
+        Returns:
+            List[Dict[str, Any]]: Ranked chunks (text, score, document, chunk_id, entities).
+        """
+        hybrid = self.vector_retrieval_mode == "hybrid"
+        if self.async_retrieval:
+            try:
+                return await (aretrieve_hybrid_chunks(query) if hybrid else aretrieve_regulation_chunks(query))
+            except ASYNC_PATH_UNAVAILABLE_ERRORS as e:
+                self.async_fallback_count += 1
+                logger.warning(f"⚠️ Async chunk retrieval failed, using threaded path: {e}")
+        
+        loop = asyncio.get_event_loop()
+        search = retrieve_hybrid_chunks if hybrid else retrieve_regulation_chunks
+        return await loop.run_in_executor(self.executor, bind_context(search), query)
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    async def _run_section_lookup(self, sections: List[str]) -> List[Dict[str, Any]]:
+        """Run the section index lookup, natively async when enabled, else on the thread pool.
+
+        Args:
+            sections (List[str]): Cited section numbers.
+
+        Returns:
+            List[Dict[str, Any]]: Chunks referencing the sections.
+        """
+        if self.async_retrieval:
+            try:
+                return await alookup_section_chunks(sections)
+            except ASYNC_PATH_UNAVAILABLE_ERRORS as e:
+                self.async_fallback_count += 1
+                logger.warning(f"⚠️ Async section lookup failed, using threaded path: {e}")
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, bind_context(lookup_section_chunks), sections)
+    # ---------------------------------------------------------------------------------
+    
+    # ---------------------------------------------------------------------------------
+    async def _run_graph_query(self, query: str) -> str:
+        """Run the Cypher QA tool, natively async when enabled, else on the thread pool.
+
+        The asyncio path awaits the LLM and the async Neo4j driver directly. If it is
+        unavailable (ASYNC_PATH_UNAVAILABLE_ERRORS), the query is retried once on the
+        threaded path; other errors propagate.
+
+        Args:
+            query (str): Question for Cypher generation.
+
+        Returns:
+            str: Cypher QA answer.
+        """
+        if self.async_retrieval:
+            try:
+                return await aquery_regulations(query)
+            except ASYNC_PATH_UNAVAILABLE_ERRORS as e:
+                self.async_fallback_count += 1
+                logger.warning(f"⚠️ Async graph query failed, using threaded path: {e}")
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, bind_context(query_regulations), query)
+    # ---------------------------------------------------------------------------------
+
+    # ---------------------------------------------------------------------------------
+    @traced("vector_branch")
     async def _async_vector_retrieve(self, query: str) -> RetrievalResult:
         """Execute vector retrieval asynchronously.
 
         This internal method performs VectorRAG retrieval using semantic similarity
-        search in a thread pool to avoid blocking the async event loop. It includes
-        confidence calculation and comprehensive error handling.
+        search on the asyncio path (or the thread pool) to avoid blocking the event loop. It includes
+        confidence calculation and comprehensive error handling. In "chunks" and "hybrid" modes
+        the ranked chunks are returned as structured content instead of an LLM-written answer.
 
         Args:
             query (str): User's natural language question for semantic search.
@@ -362,13 +714,26 @@ class ParallelRetrievalEngine:
         start_time = time.time()
         
         try:
-            # Run vector search in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor, 
-                search_regulations_semantic, 
-                query
-            )
+            if self.vector_retrieval_mode != "answer":
+                # Retrieval only: fusion consumes the ranked chunks directly
+                chunks = await self._run_vector_chunk_search(query)
+                content = format_regulation_chunks(chunks) or "No relevant regulations found."
+                return RetrievalResult(
+                    content=content,
+                    method="vector_rag",
+                    confidence=self._calculate_chunk_confidence(chunks, content),
+                    response_time_ms=int((time.time() - start_time) * 1000),
+                    metadata={
+                        "retrieval_type": "semantic_similarity" if self.vector_retrieval_mode == "chunks" else "hybrid_rrf",
+                        "retrieval_mode": self.vector_retrieval_mode,
+                        "chunk_count": len(chunks),
+                        "top_score": chunks[0]["score"] if chunks else 0.0
+                    },
+                    chunks=chunks
+                )
+            
+            # Run vector search without blocking the event loop
+            result = await self._run_vector_search(query)
             
             response_time = int((time.time() - start_time) * 1000)
             
@@ -380,7 +745,7 @@ class ParallelRetrievalEngine:
                 method="vector_rag",
                 confidence=confidence,
                 response_time_ms=response_time,
-                metadata={"retrieval_type": "semantic_similarity"}
+                metadata={"retrieval_type": "semantic_similarity", "retrieval_mode": "answer"}
             )
             
         except Exception as e:
@@ -396,11 +761,12 @@ class ParallelRetrievalEngine:
     # ---------------------------------------------------------------------------------
     
     # ---------------------------------------------------------------------------------
+    @traced("graph_branch")
     async def _async_graph_retrieve(self, query: str) -> RetrievalResult:
         """Execute graph retrieval asynchronously.
 
         This internal method performs GraphRAG retrieval using knowledge graph traversal
-        in a thread pool to avoid blocking the async event loop. It includes query
+        on the asyncio path (or the thread pool) to avoid blocking the event loop. It includes query
         enhancement, alternative query strategies, and confidence calculation.
 
         Args:
@@ -415,20 +781,17 @@ class ParallelRetrievalEngine:
             # Enhance the query with MSHA regulatory context like the ReAct agent does
             enhanced_query = self._enhance_query_for_graph(query)
             
-            # Run graph query in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor,
-                query_regulations,
-                enhanced_query
-            )
+            # Run graph query without blocking the event loop
+            result = await self._run_graph_query(enhanced_query)
             
             response_time = int((time.time() - start_time) * 1000)
+            metadata: Dict[str, Any] = {"retrieval_type": "graph_traversal", "enhanced_query": enhanced_query}
             
             # If we get "I don't know", try alternative query strategies
             if "I don't know" in result or len(result) < 50:
                 logger.info(f"Graph retrieval got minimal result, trying alternative approaches...")
-                alternative_result = await self._try_alternative_graph_queries(query)
+                alternative_result, fallback_metadata = await self._try_alternative_graph_queries(query)
+                metadata.update(fallback_metadata)
                 if alternative_result and len(alternative_result) > len(result):
                     result = alternative_result
             
@@ -440,7 +803,7 @@ class ParallelRetrievalEngine:
                 method="graph_rag",
                 confidence=confidence,
                 response_time_ms=response_time,
-                metadata={"retrieval_type": "graph_traversal", "enhanced_query": enhanced_query}
+                metadata=metadata
             )
             
         except Exception as e:
@@ -491,6 +854,28 @@ class ParallelRetrievalEngine:
         return min(1.0, confidence)
     # ---------------------------------------------------------------------------------
     
+    # ---------------------------------------------------------------------------------
+    def _calculate_chunk_confidence(self, chunks: List[Dict[str, Any]], content: str) -> float:
+        """Calculate confidence score for retrieval-only vector results.
+
+        Blends the content heuristics used for vector answers with the mean
+        similarity of the top three chunks.
+
+        Args:
+            chunks (List[Dict[str, Any]]): Ranked chunks from retrieval-only search.
+            content (str): Formatted chunk context.
+
+        Returns:
+            float: Confidence score between 0.0 and 1.0 indicating result quality.
+        """
+        if not chunks:
+            return 0.0
+        
+        top_scores = [chunk["score"] for chunk in chunks[:3]]
+        similarity = sum(top_scores) / len(top_scores)
+        return min(1.0, 0.5 * self._calculate_vector_confidence(content) + 0.5 * similarity)
+    # ---------------------------------------------------------------------------------
+    
     # ---------------------------------------------------------------------------------
     def _calculate_graph_confidence(self, result: str) -> float:
         """Calculate confidence score for graph retrieval result.
@@ -552,81 +937,178 @@ Query: {query}
 """
         return enhanced_query.strip()
     
-    async def _try_alternative_graph_queries(self, original_query: str) -> str:
+    def _build_graph_fallback_strategies(self, original_query: str) -> List[Tuple[str, str, str]]:
+        """
+        Build the alternative GraphRAG strategies tried when the primary query fails.
+        Returns (strategy name, query, result prefix) tuples in preference order.
+        """
+        # Strategy 1: Broader entity search
+        strategies = [(
+            "broad_entity_search",
+            f"Find any entities or information related to: {original_query}",
+            "Related regulatory information: "
+        )]
+        
+        # Strategy 2: Keyword-based search
+        # Extract key terms from the query
+        key_terms = []
+        mining_terms = ["mine", "mining", "underground", "surface", "coal", "metal", "safety", 
+                      "equipment", "ventilation", "methane", "rescue", "emergency", "compliance"]
+        
+        for term in mining_terms:
+            if term.lower() in original_query.lower():
+                key_terms.append(term)
+        
+        if key_terms:
+            strategies.append((
+                "keyword_search",
+                f"Find information about mining safety regulations related to: {', '.join(key_terms)}",
+                f"Mining safety regulations related to {', '.join(key_terms)}: "
+            ))
+        
+        # Strategy 3: General MSHA guidance
+        strategies.append((
+            "general_guidance",
+            f"Provide general MSHA guidance about: {original_query}",
+            "General MSHA guidance: "
+        ))
+        return strategies
+    
+    async def _run_graph_fallback_strategy(self, strategy_query: str, semaphore: asyncio.Semaphore,
+                                           strategy_name: str = "",
+                                           run_times: Optional[Dict[str, List[float]]] = None,
+                                           won: Optional[asyncio.Event] = None) -> str:
+        """Run one GraphRAG fallback query once a concurrency slot is free.
+
+        run_times, if given, receives [start, end] perf_counter times of the query
+        under strategy_name, from acquiring the slot (end is missing while it runs).
+        won, if given, is set before the slot is released when the answer is viable,
+        so a strategy still queued behind it returns "" without querying.
+        """
+        async with semaphore:
+            if won is not None and won.is_set():
+                return ""
+            times = [time.perf_counter()]
+            if run_times is not None:
+                run_times[strategy_name] = times
+            try:
+                with span("graph_fallback_strategy", strategy=strategy_name):
+                    result = await self._run_graph_query(strategy_query)
+            finally:
+                times.append(time.perf_counter())
+            if won is not None and self._is_viable_graph_result(result):
+                won.set()
+            return result
+    
+    @traced("graph_fallback")
+    async def _try_alternative_graph_queries(self, original_query: str) -> Tuple[str, Dict[str, Any]]:
         """
         Try alternative query strategies when the primary GraphRAG query fails.
         This provides fallback approaches similar to what a ReAct agent might try.
+
+        The strategies run concurrently (at most max_concurrent_fallbacks in flight)
+        and the first viable answer wins; the remaining tasks are cancelled. Queued
+        strategies never start, while a Cypher round trip already running in the
+        thread pool finishes in the background and its result is discarded.
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: Fallback content and metadata with the winning
+                strategy, the strategies that started, and time_saved_ms, an estimate
+                (lower bound) of the time saved versus running them one after another.
+                Each strategy counts from acquiring its slot, so time spent queued
+                behind max_concurrent_fallbacks is not counted as saved.
         """
+        start_time = time.time()
+        strategies = self._build_graph_fallback_strategies(original_query)
+        semaphore = asyncio.Semaphore(self.max_concurrent_fallbacks)
+        
+        run_times: Dict[str, List[float]] = {}
+        won = asyncio.Event()
+        tasks: Dict[asyncio.Task, int] = {}
+        for index, (name, strategy_query, _) in enumerate(strategies):
+            task = asyncio.create_task(self._run_graph_fallback_strategy(strategy_query, semaphore, name,
+                                                                         run_times, won))
+            tasks[task] = index
+        
+        winner: Optional[int] = None
+        winning_result = ""
+        pending = set(tasks)
+        
         try:
-            # Strategy 1: Broader entity search
-            broad_query = f"Find any entities or information related to: {original_query}"
-            
-            loop = asyncio.get_event_loop()
-            result1 = await loop.run_in_executor(
-                self.executor,
-                query_regulations,
-                broad_query
-            )
-            
-            if result1 and "I don't know" not in result1 and len(result1) > 50:
-                return f"Related regulatory information: {result1}"
-            
-            # Strategy 2: Keyword-based search
-            # Extract key terms from the query
-            key_terms = []
-            mining_terms = ["mine", "mining", "underground", "surface", "coal", "metal", "safety", 
-                          "equipment", "ventilation", "methane", "rescue", "emergency", "compliance"]
-            
-            for term in mining_terms:
-                if term.lower() in original_query.lower():
-                    key_terms.append(term)
-            
-            if key_terms:
-                keyword_query = f"Find information about mining safety regulations related to: {', '.join(key_terms)}"
-                
-                result2 = await loop.run_in_executor(
-                    self.executor,
-                    query_regulations,
-                    keyword_query
-                )
-                
-                if result2 and "I don't know" not in result2 and len(result2) > 50:
-                    return f"Mining safety regulations related to {', '.join(key_terms)}: {result2}"
-            
-            # Strategy 3: General MSHA guidance
-            general_query = f"Provide general MSHA guidance about: {original_query}"
-            
-            result3 = await loop.run_in_executor(
-                self.executor,
-                query_regulations, 
-                general_query
-            )
-            
-            if result3 and "I don't know" not in result3 and len(result3) > 50:
-                return f"General MSHA guidance: {result3}"
-                
-            # If all strategies fail, return a helpful message
-            return f"While I couldn't find specific graph data for '{original_query}', this appears to be related to mining safety regulations under MSHA's jurisdiction. Consider checking the vector search results or consulting Title 30 CFR directly."
-            
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = tasks[task]
+                    if task.exception() is not None:
+                        logger.warning(f"⚠️ Graph fallback '{strategies[index][0]}' failed: {task.exception()}")
+                        continue
+                    result = task.result()
+                    # Prefer the earlier strategy if several finish in the same wake-up
+                    if self._is_viable_graph_result(result) and (winner is None or index < winner):
+                        winner = index
+                        winning_result = result
         except Exception as e:
             logger.error(f"Alternative graph query strategies failed: {str(e)}")
-            return f"Alternative search strategies encountered an error for '{original_query}'. Please try rephrasing your question."
-    
-    def _create_timeout_response(self, query: str, start_time: float) -> ParallelRetrievalResponse:
-        """Create response for timeout scenarios"""
-        total_time = int((time.time() - start_time) * 1000)
+            return (
+                f"Alternative search strategies encountered an error for '{original_query}'. Please try rephrasing your question.",
+                {"fallback_error": str(e)}
+            )
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        wall_time_ms = int((time.time() - start_time) * 1000)
+        
+        # Query time of each strategy that started; one cancelled mid-query counts up to now
+        now = time.perf_counter()
+        run_ms = {name: int(((times[1] if len(times) > 1 else now) - times[0]) * 1000)
+                  for name, times in list(run_times.items())}
+        
+        # Sequential execution would have run every strategy up to the winner (or all of them)
+        last_index = winner if winner is not None else len(strategies) - 1
+        sequential_estimate_ms = sum(run_ms.get(name, 0) for name, _, _ in strategies[:last_index + 1])
+        fallback_metadata = {
+            "fallback_strategy": strategies[winner][0] if winner is not None else None,
+            "fallback_strategies_tried": [name for name, _, _ in strategies if name in run_ms],
+            # Cancelled mid-query, or skipped in the queue once another strategy won
+            "fallback_cancelled": sum(1 for name, _, _ in strategies if len(run_times.get(name, ())) < 2),
+            "fallback_time_ms": wall_time_ms,
+            "fallback_time_saved_ms": max(0, sequential_estimate_ms - wall_time_ms)
+        }
         
-        timeout_result = RetrievalResult(
+        if winner is not None:
+            logger.info(f"✅ Graph fallback '{strategies[winner][0]}' won in {wall_time_ms}ms")
+            return f"{strategies[winner][2]}{winning_result}", fallback_metadata
+            
+        # If all strategies fail, return a helpful message
+        return (
+            f"While I couldn't find specific graph data for '{original_query}', this appears to be related to mining safety regulations under MSHA's jurisdiction. Consider checking the vector search results or consulting Title 30 CFR directly.",
+            fallback_metadata
+        )
+    
+    @staticmethod
+    def _is_viable_graph_result(result: Optional[str]) -> bool:
+        """Check whether a GraphRAG answer contains usable information."""
+        return bool(result) and "I don't know" not in result and len(result) > 50
+    
+    def _create_timed_out_result(self, method: str, start_time: float) -> RetrievalResult:
+        """Create the result for a branch that missed its deadline"""
+        return RetrievalResult(
             content="Retrieval operation timed out",
-            method="timeout",
+            method=method,
             confidence=0.0,
-            response_time_ms=total_time,
-            error="Timeout"
+            response_time_ms=int((time.time() - start_time) * 1000),
+            error="Timeout",
+            timed_out=True
         )
+    
+    def _create_timeout_response(self, query: str, start_time: float) -> ParallelRetrievalResponse:
+        """Create response for timeout scenarios"""
+        total_time = int((time.time() - start_time) * 1000)
         
         return ParallelRetrievalResponse(
-            vector_result=timeout_result,
-            graph_result=timeout_result,
+            vector_result=self._create_timed_out_result("vector_rag", start_time),
+            graph_result=self._create_timed_out_result("graph_rag", start_time),
             query=query,
             total_time_ms=total_time,
             success=False,
@@ -692,7 +1174,13 @@ Query: {query}
             "graph_tool": graph_health,
             "parallel_capable": engine_healthy,
             "timeout_seconds": self.timeout_seconds,
-            "thread_pool_size": self.executor._max_workers
+            "thread_pool_size": self.executor._max_workers,
+            "max_concurrent_fallbacks": self.max_concurrent_fallbacks,
+            "branch_grace_seconds": self.branch_grace_seconds,
+            "async_retrieval": self.async_retrieval,
+            "vector_retrieval_mode": self.vector_retrieval_mode,
+            "async_fallback_count": self.async_fallback_count,
+            "component_registry": get_component_registry().get_status()
         }
     # ---------------------------------------------------------------------------------
 
@@ -740,7 +1228,14 @@ def get_parallel_engine() -> ParallelRetrievalEngine:
     """
     global _parallel_engine
     if _parallel_engine is None:
-        _parallel_engine = ParallelRetrievalEngine()
+        config = get_config()
+        _parallel_engine = ParallelRetrievalEngine(
+            max_concurrent_fallbacks=getattr(config, "graph_fallback_max_concurrency", 3),
+            branch_grace_seconds=getattr(config, "retrieval_branch_grace_seconds", 5.0),
+            async_retrieval=getattr(config, "async_retrieval_enabled", True),
+            vector_retrieval_mode=getattr(config, "vector_retrieval_mode", "answer"),
+            section_lookup=getattr(config, "section_lookup_enabled", True)
+        )
     return _parallel_engine
 # ---------------------------------------------------------------------------------
 
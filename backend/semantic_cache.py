@@ -0,0 +1,511 @@
+# -------------------------------------------------------------------------
+# File: semantic_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/semantic_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module implements a semantic response cache for the /generate_parallel_hybrid
+# endpoint. Most MRCA traffic consists of paraphrases of a few hundred compliance
+# questions, and every request otherwise runs parallel retrieval, context fusion and
+# template generation (four to six LLM calls). The cache stores completed responses
+# together with the embedding of the question, and serves a stored response when a
+# new question is similar enough, for the same fusion strategy, template type and
+# cited CFR sections ("§ 75.400" and "§ 75.401" questions embed almost identically
+# but must never share an answer). Each partition keeps its unit embeddings in one
+# NumPy matrix, so a lookup is a single matrix-vector product. Entries expire after
+# a TTL and the cache is bounded in size with LRU eviction. main.py does not store
+# fallback answers from a failed LLM call or answers built after a retrieval branch
+# failed or timed out.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: SemanticCacheEntry - Stored response with its question embedding
+# - Class: SemanticCacheHit - Lookup result carrying the entry and its similarity
+# - Class: SemanticResponseCache - Thread-safe similarity cache with TTL and size bound
+# - Function: get_semantic_cache() - Singleton accessor configured from BackendConfig
+# - Global Variables: _semantic_cache, _semantic_cache_lock - Thread-safe singleton management
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - logging: Cache operation logging
+#   - math: Vector normalization (without numpy)
+#   - operator: Dot products (without numpy)
+#   - time: TTL and age tracking
+#   - collections.OrderedDict: LRU ordering of entries
+#   - dataclasses: Entry and hit data structures
+#   - threading.Lock: Thread-safe access
+#   - typing: Type hints (Any, Dict, List, Optional, Tuple)
+# - Third-Party:
+#   - numpy (optional, installed with langchain): Per-partition embedding matrices;
+#     without it lookups scan the partition in pure Python
+# - Local Project Modules:
+#   - .config.get_config: Threshold, TTL and size settings
+#   - .cfr_compliance_enhanced.get_enhanced_cfr_parser: Section numbers cited by a question
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# This module is used by main.py: generate_parallel_hybrid_response() embeds the
+# incoming user_input, returns a cached ParallelHybridResponse on a hit (flagged with
+# metadata["cache"]["hit"] = True), and stores successful responses on a miss.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Semantic Response Cache for MRCA Advanced Parallel Hybrid Responses
+
+Serves stored responses for near-duplicate questions, keyed by fusion strategy,
+template type and cited CFR sections, with similarity threshold, TTL and size bounds.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import logging
+import math
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-party library imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local application/library specific imports
+try:
+    from .config import get_config
+    from .cfr_compliance_enhanced import get_enhanced_cfr_parser
+except ImportError:
+    from config import get_config
+    from cfr_compliance_enhanced import get_enhanced_cfr_parser
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Cache partition: (fusion_strategy, template_type, sorted cited section numbers)
+Partition = Tuple[str, str, Tuple[str, ...]]
+
+# Global cache instance and thread lock for singleton pattern
+_semantic_cache: Optional['SemanticResponseCache'] = None
+_semantic_cache_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class SemanticCacheEntry
+@dataclass
+class SemanticCacheEntry:
+    """Stored response together with the embedding of the question that produced it.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        query (str): Original user question.
+        partition (Partition): (fusion_strategy, template_type, cited sections) of the response.
+        embedding (List[float]): Unit-length question embedding (float32 array with numpy).
+        response (str): Generated response text.
+        metadata (Dict[str, Any]): Pipeline metadata of the original response.
+        created_at (float): Timestamp when the entry was stored.
+        hits (int): Number of times the entry was served.
+
+    Methods:
+        None
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    query: str
+    partition: Partition
+    embedding: List[float]
+    response: str
+    metadata: Dict[str, Any]
+    created_at: float = field(default_factory=time.time)
+    hits: int = 0
+
+# ------------------------------------------------------------------------- end class SemanticCacheEntry
+
+# ------------------------------------------------------------------------- class SemanticCacheHit
+@dataclass
+class SemanticCacheHit:
+    """Result of a successful cache lookup.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        entry (SemanticCacheEntry): Matched cache entry.
+        similarity (float): Cosine similarity between the new and the cached question.
+
+    Methods:
+        to_metadata(): Build the metadata["cache"] block returned to the frontend.
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    entry: SemanticCacheEntry
+    similarity: float
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- to_metadata()
+    def to_metadata(self) -> Dict[str, Any]:
+        """Build the metadata["cache"] block returned to the frontend.
+
+        Returns:
+            Dict[str, Any]: Hit flag, similarity, matched question and entry age.
+        """
+        return {
+            "hit": True,
+            "similarity": round(self.similarity, 4),
+            "cached_query": self.entry.query,
+            "age_seconds": round(time.time() - self.entry.created_at, 1),
+        }
+    # ------------------------------------------------------------------------- end to_metadata()
+
+# ------------------------------------------------------------------------- end class SemanticCacheHit
+
+# ------------------------------------------------------------------------- class SemanticResponseCache
+class SemanticResponseCache:
+    """Thread-safe semantic cache of generated responses.
+
+    Lookups compare the unit-normalized question embedding against every live entry
+    in the same (fusion_strategy, template_type, cited sections) partition and return
+    the best match at or above the similarity threshold; a question citing other CFR
+    sections than the cached one is never served its answer. With numpy, the
+    partition's embeddings are kept as one matrix (rebuilt after the partition
+    changes) and compared with one product. Storing a question that matches an
+    existing entry replaces it, so paraphrases do not fill the cache with duplicates.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        similarity_threshold (float): Minimum cosine similarity for a hit.
+        ttl_seconds (float): Entry lifetime in seconds.
+        max_entries (int): Maximum number of entries across all partitions.
+        _entries (OrderedDict): Entry id -> entry, least recently used first.
+        _matrices (Dict): (partition, dimensions) -> (entry ids, unit embedding matrix,
+                          creation times), dropped when the partition changes.
+        _next_id (int): Next entry id.
+        _lock (Lock): Protects entries and counters.
+        _stats (Dict[str, int]): hits/misses/stores/evictions/expirations counters.
+
+    Methods:
+        lookup(): Find a cached response for a question embedding.
+        store(): Store a generated response.
+        clear(): Remove every entry.
+        get_stats(): Get counters and size information.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, similarity_threshold: float = 0.95, ttl_seconds: float = 3600.0,
+                 max_entries: int = 1000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            similarity_threshold (float): Minimum cosine similarity for a hit. Defaults to 0.95.
+            ttl_seconds (float): Entry lifetime in seconds. Defaults to 3600.
+            max_entries (int): Maximum number of entries. Defaults to 1000.
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[int, SemanticCacheEntry]" = OrderedDict()
+        self._matrices: Dict[Tuple[Partition, int], Tuple[List[int], Any, Any]] = {}
+        self._next_id = 0
+        self._lock = Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expirations": 0}
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+
+    # ------------------------------------------------------------------------- _normalize()
+    @staticmethod
+    def _normalize(embedding: List[float]) -> List[float]:
+        """Scale an embedding to unit length so dot products are cosine similarities.
+
+        With numpy the result is a float32 array, so partition matrices are stacked
+        without converting Python floats.
+        """
+        if np is not None:
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            return vector / norm if norm else vector
+        norm = math.sqrt(sum(map(operator.mul, embedding, embedding)))
+        if norm == 0:
+            return list(embedding)
+        return [value / norm for value in embedding]
+    # ------------------------------------------------------------------------- end _normalize()
+
+    # ------------------------------------------------------------------------- _partition()
+    @staticmethod
+    def _partition(query: str, fusion_strategy: str, template_type: str) -> Partition:
+        """Build the partition of a question: strategy, template and sorted cited sections."""
+        sections = tuple(sorted(get_enhanced_cfr_parser().extract_section_numbers(query)))
+        return fusion_strategy, template_type, sections
+    # ------------------------------------------------------------------------- end _partition()
+
+    # ------------------------------------------------------------------------- _remove()
+    def _remove(self, entry_id: int) -> None:
+        """Delete an entry and drop its partition matrix; caller holds the lock."""
+        entry = self._entries.pop(entry_id)
+        self._matrices.pop((entry.partition, len(entry.embedding)), None)
+    # ------------------------------------------------------------------------- end _remove()
+
+    # ------------------------------------------------------------------------- _best_match()
+    def _best_match(self, unit_embedding: List[float], partition: Partition,
+                    now: float) -> Tuple[Optional[int], float]:
+        """Return (entry id, similarity) of the closest live entry; caller holds the lock.
+
+        Expired entries of the partition are removed on the way.
+        """
+        if np is None:
+            return self._best_match_python(unit_embedding, partition, now)
+
+        key = (partition, len(unit_embedding))
+        if key not in self._matrices:
+            ids = [entry_id for entry_id, entry in self._entries.items()
+                   if entry.partition == partition and len(entry.embedding) == len(unit_embedding)]
+            if not ids:
+                return None, -1.0
+            self._matrices[key] = (
+                ids,
+                np.stack([self._entries[entry_id].embedding for entry_id in ids]),
+                np.asarray([self._entries[entry_id].created_at for entry_id in ids]),
+            )
+        ids, matrix, created = self._matrices[key]
+
+        expired = np.flatnonzero(now - created > self.ttl_seconds)
+        if len(expired):
+            for index in expired:
+                self._remove(ids[index])
+            self._stats["expirations"] += len(expired)
+            return self._best_match(unit_embedding, partition, now)
+
+        similarities = matrix @ unit_embedding
+        best = int(np.argmax(similarities))
+        return ids[best], float(similarities[best])
+    # ------------------------------------------------------------------------- end _best_match()
+
+    # ------------------------------------------------------------------------- _best_match_python()
+    def _best_match_python(self, unit_embedding: List[float], partition: Partition,
+                           now: float) -> Tuple[Optional[int], float]:
+        """Pure-Python _best_match() used when numpy is not installed."""
+        best_id, best_similarity = None, -1.0
+        expired = []
+
+        for entry_id, entry in self._entries.items():
+            if entry.partition != partition or len(entry.embedding) != len(unit_embedding):
+                continue
+            if now - entry.created_at > self.ttl_seconds:
+                expired.append(entry_id)
+                continue
+            similarity = sum(map(operator.mul, unit_embedding, entry.embedding))
+            if similarity > best_similarity:
+                best_id, best_similarity = entry_id, similarity
+
+        for entry_id in expired:
+            self._remove(entry_id)
+        self._stats["expirations"] += len(expired)
+
+        return best_id, best_similarity
+    # ------------------------------------------------------------------------- end _best_match_python()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- store()
+    def store(self, query: str, embedding: List[float], fusion_strategy: str, template_type: str,
+              response: str, metadata: Dict[str, Any]) -> None:
+        """Store a generated response.
+
+        Args:
+            query (str): Original user question.
+            embedding (List[float]): Question embedding.
+            fusion_strategy (str): Fusion strategy used to build the response.
+            template_type (str): Template type used to build the response.
+            response (str): Generated response text.
+            metadata (Dict[str, Any]): Pipeline metadata of the response.
+        """
+        partition = self._partition(query, fusion_strategy, template_type)
+        unit_embedding = self._normalize(embedding)
+
+        with self._lock:
+            # Replace a near-duplicate instead of adding another entry
+            duplicate_id, similarity = self._best_match(unit_embedding, partition, time.time())
+            if duplicate_id is not None and similarity >= self.similarity_threshold:
+                self._remove(duplicate_id)
+
+            self._entries[self._next_id] = SemanticCacheEntry(
+                query=query,
+                partition=partition,
+                embedding=unit_embedding,
+                response=response,
+                metadata=metadata,
+            )
+            self._matrices.pop((partition, len(unit_embedding)), None)
+            self._next_id += 1
+            self._stats["stores"] += 1
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+    # ------------------------------------------------------------------------- end store()
+
+    # ------------------------------------------------------------------------- clear()
+    def clear(self) -> None:
+        """Remove every entry without resetting the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+    # ------------------------------------------------------------------------- end clear()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- lookup()
+    def lookup(self, query: str, embedding: List[float], fusion_strategy: str,
+               template_type: str) -> Optional[SemanticCacheHit]:
+        """Find a cached response for a question embedding.
+
+        Only entries citing the same CFR sections as the question are candidates.
+
+        Args:
+            query (str): Incoming question (its cited sections select the partition).
+            embedding (List[float]): Embedding of the incoming question.
+            fusion_strategy (str): Requested fusion strategy.
+            template_type (str): Requested template type.
+
+        Returns:
+            Optional[SemanticCacheHit]: Best match above the threshold, or None.
+
+        Examples:
+            >>> hit = cache.lookup(question, query_embedding, "advanced_hybrid", "regulatory_compliance")
+            >>> if hit:
+            ...     print(hit.entry.response, hit.similarity)
+        """
+        partition = self._partition(query, fusion_strategy, template_type)
+        unit_embedding = self._normalize(embedding)
+
+        with self._lock:
+            entry_id, similarity = self._best_match(unit_embedding, partition, time.time())
+            if entry_id is None or similarity < self.similarity_threshold:
+                self._stats["misses"] += 1
+                return None
+
+            entry = self._entries[entry_id]
+            self._entries.move_to_end(entry_id)
+            entry.hits += 1
+            self._stats["hits"] += 1
+            return SemanticCacheHit(entry=entry, similarity=similarity)
+    # ------------------------------------------------------------------------- end lookup()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and size information.
+
+        Returns:
+            Dict[str, Any]: Counters, hit rate, entry count and configured bounds.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            entries = len(self._entries)
+
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.similarity_threshold,
+            "ttl_seconds": self.ttl_seconds,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class SemanticResponseCache
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_semantic_cache()
+def get_semantic_cache() -> Optional[SemanticResponseCache]:
+    """Get the process-wide semantic response cache (singleton).
+
+    Returns:
+        Optional[SemanticResponseCache]: Shared cache, or None when
+            semantic_cache_enabled is False in BackendConfig.
+
+    Examples:
+        >>> cache = get_semantic_cache()
+        >>> if cache:
+        ...     print(cache.get_stats()["entries"])
+    """
+    global _semantic_cache
+    config = get_config()
+    if not config.semantic_cache_enabled:
+        return None
+
+    with _semantic_cache_lock:
+        if _semantic_cache is None:
+            _semantic_cache = SemanticResponseCache(
+                similarity_threshold=config.semantic_cache_similarity_threshold,
+                ttl_seconds=config.semantic_cache_ttl_seconds,
+                max_entries=config.semantic_cache_max_entries,
+            )
+            logger.info(
+                f"✅ Semantic response cache initialized "
+                f"(threshold={config.semantic_cache_similarity_threshold}, "
+                f"ttl={config.semantic_cache_ttl_seconds}s, max={config.semantic_cache_max_entries})"
+            )
+        return _semantic_cache
+# ------------------------------------------------------------------------- end get_semantic_cache()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
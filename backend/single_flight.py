@@ -0,0 +1,395 @@
+# -------------------------------------------------------------------------
+# File: single_flight.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/single_flight.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module implements single-flight request coalescing for the MRCA
+# response pipeline. When many users ask the same question at the same time
+# (for example right after a safety bulletin goes out), only the first request
+# (the leader) runs retrieval, fusion and response generation; identical
+# requests arriving while it runs (followers) await the leader's result instead
+# of repeating the LLM and database work. Followers wait for a bounded time (at
+# least the request timeout) so a stuck leader cannot hang every duplicate request;
+# a follower that gives up fails instead of starting another pipeline run.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: SingleFlightStats - Leader, coalesced follower and timeout counters
+# - Class: SingleFlightTimeoutError - Raised when a follower gives up waiting for its leader
+# - Class: SingleFlight - Per-key in-flight futures shared by concurrent duplicates
+# - Function: get_single_flight() - Singleton accessor configured from BackendConfig
+# - Global Variables: _single_flight, _single_flight_lock - Thread-safe singleton
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - asyncio: In-flight futures and bounded follower waits
+#   - logging: Coalescing and timeout logging
+#   - dataclasses: Statistics data structure
+#   - threading.Lock: Thread-safe singleton creation
+#   - typing: Type hints (Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar)
+# - Local Project Modules:
+#   - .config.get_config: Coalescing settings from BackendConfig
+#   - .embedding_cache.normalize_question_text: Query normalization shared with the caches
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# main.py runs the /generate_parallel_hybrid pipeline through
+# get_single_flight().run(key, operation) with a key built by make_key() from
+# the query, fusion strategy and template type, answers SingleFlightTimeoutError
+# with 503, and reports get_stats() from /parallel_hybrid/health. Flights are asyncio futures, so all coalesced
+# requests must share one event loop (one Uvicorn worker process).
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Single-Flight Request Coalescing for the MRCA Response Pipeline
+
+Concurrent identical requests share one pipeline execution; followers wait a
+bounded time for the leader and fail with SingleFlightTimeoutError after it.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .config import get_config
+    from .embedding_cache import normalize_question_text
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from config import get_config
+    from embedding_cache import normalize_question_text
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Result type of a coalesced operation
+T = TypeVar("T")
+
+# Sentinel for a follower that did not receive the leader's result
+_NO_RESULT = object()
+
+# Global single-flight instance and thread lock for singleton pattern
+_single_flight: Optional['SingleFlight'] = None
+_single_flight_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class SingleFlightStats
+@dataclass
+class SingleFlightStats:
+    """Counters for single-flight coalescing.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        leaders (int): Pipeline executions started by a leader request.
+        coalesced (int): Follower requests served with a leader's result.
+        follower_timeouts (int): Followers that stopped waiting and failed with SingleFlightTimeoutError.
+        leader_errors (int): Leader executions that raised (propagated to followers).
+        leader_abandoned (int): Leaders cancelled before finishing (followers ran the pipeline themselves).
+        peak_followers (int): Largest number of followers waiting on one flight.
+
+    Methods:
+        None (dataclass with automatic methods)
+    """
+    leaders: int = 0
+    coalesced: int = 0
+    follower_timeouts: int = 0
+    leader_errors: int = 0
+    leader_abandoned: int = 0
+    peak_followers: int = 0
+# ------------------------------------------------------------------------- end class SingleFlightStats
+
+# ------------------------------------------------------------------------- class SingleFlightTimeoutError
+class SingleFlightTimeoutError(Exception):
+    """Exception raised when a follower stops waiting for its leader.
+
+    The follower does not start a second pipeline run: a leader that is this
+    slow means the downstream services are overloaded, so the request fails
+    (503) instead of adding load.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        timeout_seconds (float): How long the follower waited.
+
+    Methods:
+        Inherits from Exception
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, timeout_seconds: float) -> None:
+        """Initialize SingleFlightTimeoutError with the follower wait.
+
+        Args:
+            timeout_seconds (float): How long the follower waited.
+        """
+        self.timeout_seconds = timeout_seconds
+        super().__init__(f"Identical request still processing after {timeout_seconds:.0f}s")
+    # ------------------------------------------------------------------------- end __init__()
+
+# ------------------------------------------------------------------------- end class SingleFlightTimeoutError
+
+# ------------------------------------------------------------------------- class _LeaderAbandonedError
+class _LeaderAbandonedError(Exception):
+    """Set on a flight whose leader was cancelled, so followers run the operation themselves."""
+# ------------------------------------------------------------------------- end class _LeaderAbandonedError
+
+# ------------------------------------------------------------------------- class SingleFlight
+class SingleFlight:
+    """Coalesces concurrent executions of the same keyed operation.
+
+    The first caller for a key becomes the leader and runs the operation; later
+    callers for the same key await the leader's future for at most
+    follower_timeout_seconds. Leader exceptions are propagated to followers. A
+    follower whose wait times out raises SingleFlightTimeoutError; one whose
+    leader was cancelled runs the operation itself without registering a new flight.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        follower_timeout_seconds (float): Maximum time a follower waits for its leader.
+        stats (SingleFlightStats): Coalescing counters.
+        _flights (Dict[Any, asyncio.Future]): In-flight leader futures by key.
+        _followers (Dict[Any, int]): Followers currently waiting per key.
+
+    Methods:
+        run(): Execute or join the flight for a key.
+        make_key(): Build the coalescing key for a pipeline request.
+        get_stats(): Counters and current in-flight state.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, follower_timeout_seconds: float = 120.0) -> None:
+        """Initialize an empty flight table.
+
+        Args:
+            follower_timeout_seconds (float): Maximum time a follower waits for its leader.
+        """
+        self.follower_timeout_seconds = follower_timeout_seconds
+        self.stats = SingleFlightStats()
+        self._flights: Dict[Any, asyncio.Future] = {}
+        self._followers: Dict[Any, int] = {}
+    # ------------------------------------------------------------------------- end __init__()
+
+    # -----------------------------------------------------------------------------------------------------------------------------
+    # --- Public Methods ---
+    # -----------------------------------------------------------------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- run()
+    async def run(self, key: Any, operation: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run the operation for a key, or join the execution already in flight.
+
+        Args:
+            key (Any): Hashable coalescing key (see make_key()).
+            operation (Callable[[], Awaitable[T]]): Coroutine factory producing the result.
+
+        Returns:
+            Tuple[T, bool]: The result and whether it was coalesced from a leader.
+
+        Raises:
+            SingleFlightTimeoutError: If the leader did not finish within follower_timeout_seconds.
+            Exception: Whatever the operation (or the leader's operation) raised.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            result = await self._follow(key, flight)
+            if result is not _NO_RESULT:
+                return result, True
+            return await operation(), False
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        self.stats.leaders += 1
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            self.stats.leader_abandoned += 1
+            flight.set_exception(_LeaderAbandonedError())
+            raise
+        except Exception as e:
+            self.stats.leader_errors += 1
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if not flight.done():
+                flight.set_exception(_LeaderAbandonedError())
+            # Mark the exception retrieved so asyncio does not log it when nobody followed
+            flight.exception()
+    # ------------------------------------------------------------------------- end run()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- make_key()
+    @staticmethod
+    def make_key(query: str, fusion_strategy: str, template_type: str) -> Tuple[str, str, str]:
+        """Build the coalescing key for a pipeline request.
+
+        Args:
+            query (str): User question (normalized for case and whitespace).
+            fusion_strategy (str): Context fusion strategy name.
+            template_type (str): Response template type name.
+
+        Returns:
+            Tuple[str, str, str]: Hashable key.
+        """
+        return normalize_question_text(query), fusion_strategy, template_type
+    # ------------------------------------------------------------------------- end make_key()
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing counters and current in-flight state.
+
+        Returns:
+            Dict[str, Any]: Counters, coalesce rate, flights in progress and waiting followers.
+
+        Examples:
+            >>> stats = get_single_flight().get_stats()
+            >>> print(f"Coalesced: {stats['coalesced']}")
+        """
+        counters = asdict(self.stats)
+        requests = counters["leaders"] + counters["coalesced"] + counters["follower_timeouts"]
+        return {
+            **counters,
+            "coalesce_rate": round(counters["coalesced"] / requests, 3) if requests else 0.0,
+            "in_flight": len(self._flights),
+            "waiting_followers": sum(self._followers.values()),
+            "follower_timeout_seconds": self.follower_timeout_seconds,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+    # -----------------------------------------------------------------------------------------------------------------------------
+    # --- Private Methods ---
+    # -----------------------------------------------------------------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- _follow()
+    async def _follow(self, key: Any, flight: asyncio.Future) -> Any:
+        """Wait a bounded time for the leader's result.
+
+        Args:
+            key (Any): Coalescing key.
+            flight (asyncio.Future): Leader future for the key.
+
+        Returns:
+            Any: Leader result, or _NO_RESULT if the leader was abandoned.
+
+        Raises:
+            SingleFlightTimeoutError: If the wait timed out.
+        """
+        waiting = self._followers.get(key, 0) + 1
+        self._followers[key] = waiting
+        self.stats.peak_followers = max(self.stats.peak_followers, waiting)
+        try:
+            # shield(): a follower timing out must not cancel the leader's flight
+            result = await asyncio.wait_for(asyncio.shield(flight), self.follower_timeout_seconds)
+            self.stats.coalesced += 1
+            return result
+        except asyncio.TimeoutError:
+            self.stats.follower_timeouts += 1
+            logger.warning(f"⚠️ Coalesced request waited {self.follower_timeout_seconds}s for its leader, failing")
+            raise SingleFlightTimeoutError(self.follower_timeout_seconds)
+        except _LeaderAbandonedError:
+            return _NO_RESULT
+        finally:
+            remaining = self._followers[key] - 1
+            if remaining:
+                self._followers[key] = remaining
+            else:
+                del self._followers[key]
+    # ------------------------------------------------------------------------- end _follow()
+
+# ------------------------------------------------------------------------- end class SingleFlight
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_single_flight()
+def get_single_flight() -> Optional[SingleFlight]:
+    """Get the process-wide single-flight coalescer (singleton).
+
+    The follower wait is never shorter than BackendConfig.request_timeout, so a
+    follower does not give up on a leader that is still within its own budget.
+
+    Returns:
+        Optional[SingleFlight]: The coalescer, or None if coalescing is
+                                disabled in BackendConfig.
+
+    Examples:
+        >>> single_flight = get_single_flight()
+        >>> if single_flight:
+        ...     print(single_flight.get_stats()["in_flight"])
+    """
+    global _single_flight
+
+    config = get_config()
+    if not getattr(config, "single_flight_enabled", True):
+        return None
+
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight(
+                    follower_timeout_seconds=max(
+                        getattr(config, "single_flight_follower_timeout_seconds", 120.0),
+                        getattr(config, "request_timeout", 120),
+                    )
+                )
+    return _single_flight
+# ------------------------------------------------------------------------- end get_single_flight()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -20,6 +20,7 @@
 # - Module: cypher.py - Cypher query generation and GraphRAG functionality
 # - Module: vector.py - Vector similarity search and VectorRAG functionality
 # - Module: general.py - General query processing and fallback functionality
+# - Module: registry.py - Warm, process-wide registry for shared retrieval chains
 # -------------------------------------------------------------------------
 
 # --- Dependencies / Imports ---
@@ -22,7 +22,15 @@
 # - Global Template: CYPHER_GENERATION_TEMPLATE - MSHA-specific Cypher generation prompt
 # - Global Variable: cypher_prompt - Configured prompt template for regulatory queries
 # - Function: get_cypher_qa() - Create Cypher QA chain with lazy loading
-# - Function: query_regulations() - Query MSHA regulations using Cypher generation
+# - Function: get_warm_cypher_qa() - Return the shared Cypher QA chain from the component registry
+# - Class: CypherIntent - Recognized question shape mapped to a parameterized Cypher template
+# - Global Constant: CYPHER_INTENTS - Pre-validated templates (section lookup, CFR structure, related entities, mentions)
+# - Function: query_regulations() - Query MSHA regulations (intent template first, else Cypher generation)
+# - Function: aquery_regulations() - Asyncio Cypher QA using ainvoke and the async Neo4j driver
+# - Function: match_cypher_intent() - Map a question to an intent template and parameters
+# - Function: get_cypher_path_stats() - Template hit rate and latency per query path
+# - Function: _extract_cypher() - Strip code fences from generated Cypher
+# - Functions: _run_cached_cypher(), _arun_cached_cypher(), _store_generated_cypher() - Generated-Cypher cache use
 # - Function: query_regulations_detailed() - Query with detailed response and metadata
 # - Function: get_cypher_tool() - Get cypher tool for agent integration
 # - Function: check_cypher_tool_health() - Comprehensive health check for cypher tool
@@ -31,6 +39,10 @@
 # -------------------------------------------------------------------------
 
 # --- Dependencies / Imports ---
+# - Standard Library:
+#   - re: Extracting Cypher statements from fenced LLM output, intent matching
+#   - threading.Lock: Thread-safe query path statistics
+#   - dataclasses, typing: Intent template definition and type hints
 # - Third-Party:
 #   - langchain_neo4j.GraphCypherQAChain: Neo4j graph chain for Cypher QA operations
 #   - langchain.prompts.prompt.PromptTemplate: Template engine for prompt formatting
@@ -38,6 +50,10 @@
 # - Local Project Modules:
 #   - ..llm.get_llm: Lazy loading function for LLM initialization
 #   - ..graph.get_graph: Lazy loading function for Neo4j graph connection
+#   - ..database.get_database: Neo4j driver for intent templates, cached Cypher and the asyncio query path
+#   - ..cypher_cache: get_cypher_cache, schema_fingerprint for reusing validated generated Cypher
+#   - ..tracing: span, set_span_attribute for Cypher generation and QA spans
+#   - .registry.get_component_registry: Shared, warm Cypher QA chain across requests
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -72,7 +88,11 @@ structured graph traversal as part of the Advanced Parallel Hybrid system's Grap
 # =========================================================================
 # Standard library imports
 import logging
+import re
 import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third-party library imports
 from langchain_neo4j import GraphCypherQAChain
@@ -81,6 +101,10 @@ from langchain.prompts.prompt import PromptTemplate
 # Local application/library specific imports
 from ..llm import get_llm
 from ..graph import get_graph
+from ..database import get_database
+from ..cypher_cache import get_cypher_cache, schema_fingerprint
+from ..tracing import span, set_span_attribute
+from .registry import get_component_registry
 
 # =========================================================================
 # Global Constants / Variables
@@ -148,6 +172,16 @@ ORDER BY e.id
 LIMIT 15
 ```
 
+5. To find requirements within a part, subpart or section range (start from the
+CFR structure: Part.number, Subpart.id like '75.D', Section.part and Section.number are indexed):
+```
+MATCH (sp:Subpart)-[:CONTAINS]->(s:Section)-[:CONTAINS]->(c:Chunk)
+WHERE sp.id = '75.D' AND toLower(c.text) CONTAINS 'ventilation'
+RETURN s.id, s.title, c.text
+ORDER BY s.number
+LIMIT 10
+```
+
 Always use case insensitive matching with =~ '(?i)pattern' for text searches.
 Focus on safety-related entities and provide regulatory context in results.
 
@@ -163,6 +197,167 @@ Cypher Query:
 # Create the configured prompt template for regulatory Cypher generation
 cypher_prompt = PromptTemplate.from_template(CYPHER_GENERATION_TEMPLATE)
 
+# Component registry key for the shared Cypher QA chain
+CYPHER_QA_COMPONENT = "cypher_qa"
+
+# Query path labels for questions answered with LLM-generated or cached generated Cypher
+LLM_CYPHER_PATH = "llm_generated"
+CACHED_CYPHER_PATH = "cached_cypher"
+
+# Clauses that must never appear in an intent template (templates are read-only)
+_WRITE_CLAUSE_PATTERN = re.compile(r"\b(CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP|LOAD\s+CSV|CALL)\b", re.IGNORECASE)
+
+# Per-path query statistics: path -> {"count", "total_ms"}; template misses counted separately
+_cypher_path_stats: Dict[str, Dict[str, float]] = {}
+_cypher_template_misses = 0
+_cypher_stats_lock = Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class CypherIntent
+@dataclass(frozen=True)
+class CypherIntent:
+    """A recognized question shape mapped to a parameterized, read-only Cypher template.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        name (str): Intent identifier reported in query path statistics.
+        pattern (re.Pattern): Question pattern; its named groups become query parameters
+                              (an optional group absent from the question becomes '').
+        cypher (str): Parameterized Cypher template (read-only, no string interpolation).
+        limit (int): Maximum records returned as QA context.
+        unique (Optional[re.Pattern]): If set, the question must contain exactly one distinct
+                                       match of this pattern (e.g. one CFR section number).
+
+    Methods:
+        match(): Return query parameters if the question has this intent's shape.
+    """
+    name: str
+    pattern: re.Pattern
+    cypher: str
+    limit: int = 5
+    unique: Optional[re.Pattern] = None
+
+    # ------------------------------------------------------------------------- match()
+    def match(self, question: str) -> Optional[Dict[str, Any]]:
+        """Return query parameters if the question has this intent's shape.
+
+        Args:
+            question (str): Natural language question.
+
+        Returns:
+            Optional[Dict[str, Any]]: Cypher parameters, or None if the question does not match.
+        """
+        found = self.pattern.search(question)
+        if not found:
+            return None
+        if self.unique is not None and len(set(self.unique.findall(question))) != 1:
+            return None
+        
+        parameters: Dict[str, Any] = {"limit": self.limit}
+        for key, value in found.groupdict().items():
+            if value is None:
+                parameters[key] = ""
+                continue
+            value = value.strip(" ?.!,;:'\"").lower()
+            if key == "term":
+                if len(value) < 2:
+                    return None
+                value = _singular(value)
+            parameters[key] = value
+        return parameters
+    # ------------------------------------------------------------------------- end match()
+
+# ------------------------------------------------------------------------- end class CypherIntent
+
+# Intent templates in match order. Each is parameterized and validated as read-only at import.
+CYPHER_INTENTS: List[CypherIntent] = [
+    # "What does 30 CFR 75.400 require?", "Show me § 57.15030"
+    # The CFR structure templates start from a seek on the Section, Part or Subpart
+    # indexes built by build_hybrid_store.py and only traverse CONTAINS edges below it.
+    CypherIntent(
+        name="section_lookup",
+        pattern=re.compile(r"(?:§+\s*|\bsection\s+|\bsec\.\s*|\bCFR\s+(?:part\s+)?)(?P<section>\d{1,3}\.\d{1,5})\b", re.IGNORECASE),
+        cypher="""
+MATCH (s:Section {id: $section})-[:CONTAINS]->(c:Chunk)-[:PART_OF]->(d:Document)
+RETURN d.id AS document, s.title AS title, c.id AS chunk_id, c.text AS text
+LIMIT $limit
+""",
+        # Comparisons across several sections need generated Cypher
+        unique=re.compile(r"\b\d{1,3}\.\d{1,5}\b"),
+    ),
+    # "Summarize sections 75.300 through 75.399", "§§ 57.4100-57.4104"
+    CypherIntent(
+        name="section_range",
+        pattern=re.compile(r"(?:§§?\s*|\bsections?\s+)(?P<part>\d{1,3})\.(?P<first>\d{1,5})\s*(?:-|–|—|to|through|thru)\s*(?:§\s*)?(?P=part)\.(?P<last>\d{1,5})\b", re.IGNORECASE),
+        cypher="""
+MATCH (s:Section)
+WHERE s.part = toInteger($part) AND s.number >= toInteger($first) AND s.number <= toInteger($last)
+MATCH (s)-[:CONTAINS]->(c:Chunk)
+WITH s, collect(c.text)[0] AS text
+RETURN s.id AS section, s.title AS title, text
+ORDER BY s.number
+LIMIT $limit
+""",
+        limit=15,
+    ),
+    # "Everything in Part 75 Subpart D about ventilation", "Show Part 77, Subpart Q"
+    CypherIntent(
+        name="subpart_sections",
+        pattern=re.compile(r"\bpart\s+(?P<part>\d{1,3}),?\s+subpart\s+(?P<subpart>(?-i:[A-Z]{1,3}))\b(?:.*?\b(?:about|on|regarding|concerning|covering)\s+(?:an?\s+|the\s+)?(?P<term>[\w][\w\s\-/]{1,60}?)\s*[?.!]*$)?", re.IGNORECASE),
+        cypher="""
+MATCH (sp:Subpart {id: $part + '.' + toUpper($subpart)})-[:CONTAINS]->(s:Section)-[:CONTAINS]->(c:Chunk)
+WHERE $term = '' OR toLower(c.text) CONTAINS $term
+RETURN s.id AS section, s.title AS title, c.id AS chunk_id, c.text AS text
+ORDER BY s.number
+LIMIT $limit
+""",
+        limit=10,
+    ),
+    # "What subparts are in Part 75?", "List the subparts of 30 CFR Part 57"
+    CypherIntent(
+        name="part_subparts",
+        pattern=re.compile(r"\bsubparts\b.*?\bpart\s+(?P<part>\d{1,3})\b", re.IGNORECASE),
+        cypher="""
+MATCH (p:Part {number: toInteger($part)})-[:CONTAINS]->(sp:Subpart)
+RETURN p.title AS part, sp.id AS subpart, sp.title AS title
+ORDER BY sp.letter
+LIMIT $limit
+""",
+        limit=30,
+    ),
+    # "Which entities are related to methane?", "List concepts connected with roof bolting"
+    CypherIntent(
+        name="related_entities",
+        pattern=re.compile(r"\b(?:entities|concepts|topics|terms)\b.*?\b(?:related|connected|linked)\s+(?:to|with)\s+(?:an?\s+|the\s+)?(?P<term>[\w][\w\s\-/]{1,60}?)\s*[?.!]*$", re.IGNORECASE),
+        cypher="""
+MATCH (e:Entity)<-[:HAS_ENTITY]-(c:Chunk)-[:HAS_ENTITY]->(related:Entity)
+WHERE toLower(e.name) CONTAINS $term AND related <> e
+RETURN related.name AS entity, related.type AS type, count(DISTINCT c) AS shared_chunks
+ORDER BY shared_chunks DESC
+LIMIT $limit
+""",
+        limit=15,
+    ),
+    # "Find chunks mentioning self-rescuers", "Which regulations reference continuous miners?"
+    CypherIntent(
+        name="entity_mentions",
+        pattern=re.compile(r"\b(?:chunks|passages|sections|regulations|provisions|text)\s+(?:that\s+)?(?:mention|mentions|mentioning|reference|references|referencing)\s+(?:an?\s+|the\s+)?(?P<term>[\w][\w\s\-/]{1,60}?)\s*[?.!]*$", re.IGNORECASE),
+        cypher="""
+MATCH (c:Chunk)-[:HAS_ENTITY]->(e:Entity)
+WHERE toLower(e.name) CONTAINS $term
+MATCH (c)-[:PART_OF]->(d:Document)
+RETURN d.id AS document, c.id AS chunk_id, e.name AS entity, e.type AS type, c.text AS text
+ORDER BY CASE WHEN e.type = 'Equipment' THEN 0 ELSE 1 END
+LIMIT $limit
+""",
+    ),
+]
+
 # =========================================================================
 # Standalone Function Definitions
 # =========================================================================
@@ -202,6 +397,24 @@ def get_cypher_qa():
     )
 # --------------------------------------------------------------------------------- end get_cypher_qa()
 
+# --------------------------------------------------------------------------------- get_warm_cypher_qa()
+def get_warm_cypher_qa():
+    """Return the shared Cypher QA chain, building it on first use.
+
+    The chain (and the schema introspection done by its Neo4j graph) is built
+    once per process by the component registry and reused by every request and
+    worker thread until the configuration or the knowledge store changes.
+
+    Returns:
+        GraphCypherQAChain: Shared chain for MSHA regulatory Cypher generation
+
+    Examples:
+        >>> cypher_qa = get_warm_cypher_qa()
+        >>> assert cypher_qa is get_warm_cypher_qa()
+    """
+    return get_component_registry().get(CYPHER_QA_COMPONENT)
+# --------------------------------------------------------------------------------- end get_warm_cypher_qa()
+
 # --------------------------------------------------------------------------------- query_regulations()
 def query_regulations(question: str) -> str:
     """Query MSHA regulations using Cypher generation for agent integration.
@@ -209,7 +422,10 @@ def query_regulations(question: str) -> str:
     Translates natural language questions about mining safety regulations into
     Cypher queries and executes them against the Neo4j knowledge graph. Designed
     for use as a tool in agent workflows, providing clean string responses
-    suitable for further processing or direct user presentation.
+    suitable for further processing or direct user presentation. Questions that
+    match a CYPHER_INTENTS shape run the intent's template directly. Other
+    questions reuse previously generated Cypher from the generated-Cypher cache
+    when possible; only cache misses use the LLM to generate Cypher.
 
     Args:
         question (str): Natural language question about MSHA regulations
@@ -227,18 +443,186 @@ def query_regulations(question: str) -> str:
         "Safety equipment regulations specify..."
     """
     try:
-        # Get the chain and invoke with the question
-        cypher_qa = get_cypher_qa()
-        result = cypher_qa.invoke({"query": question})
+        start_time = time.time()
+        
+        # Recognized question shapes skip LLM Cypher generation
+        intent_match = match_cypher_intent(question)
+        if intent_match is not None:
+            intent, parameters = intent_match
+            records = get_database().execute_query(intent.cypher, parameters)
+            if records:
+                context = [record.data() for record in records]
+                with span("cypher.qa"):
+                    answer = get_component_registry().run(
+                        CYPHER_QA_COMPONENT,
+                        lambda cypher_qa: cypher_qa.qa_chain.invoke({"question": question, "context": context})
+                    )
+                _record_cypher_path(intent.name, start_time)
+                return _qa_text(answer)
+            _record_template_miss(intent.name)
+        
+        # --------------------------------------------------------------------------------- invoke_cypher_qa()
+        def invoke_cypher_qa(cypher_qa) -> Tuple[str, str]:
+            cached_answer = _run_cached_cypher(cypher_qa, question)
+            if cached_answer is not None:
+                return cached_answer, CACHED_CYPHER_PATH
+            
+            # Generation, execution and QA in one chain call
+            with span("cypher.generate_and_answer"):
+                result = cypher_qa.invoke({"query": question})
+            steps = result.get("intermediate_steps") or []
+            if len(steps) >= 2 and steps[1].get("context"):
+                _store_generated_cypher(cypher_qa, question, steps[0].get("query", ""))
+            return result.get("result", "No answer found."), LLM_CYPHER_PATH
+        # --------------------------------------------------------------------------------- end invoke_cypher_qa()
+        
+        # Invoke the shared, warm chain with the question
+        answer, path = get_component_registry().run(CYPHER_QA_COMPONENT, invoke_cypher_qa)
+        _record_cypher_path(path, start_time)
         
         # Return the result string for the agent
-        return result.get("result", "No answer found.")
+        return answer
         
     except Exception as e:
         # Return error message for the agent
         return f"Error processing query: {str(e)}"
 # --------------------------------------------------------------------------------- end query_regulations()
 
+# --------------------------------------------------------------------------------- aquery_regulations()
+async def aquery_regulations(question: str) -> str:
+    """Query MSHA regulations using Cypher generation on the asyncio path.
+
+    Asyncio counterpart of query_regulations() used by the parallel retrieval
+    engine. It runs the same steps as the shared GraphCypherQAChain (Cypher
+    generation, query correction, top_k context, QA answer) but awaits the LLM
+    through `ainvoke` and runs the generated Cypher on the async Neo4j driver,
+    so no worker thread is held while waiting. Intent templates and then the
+    generated-Cypher cache are tried first, as in query_regulations().
+
+    Unlike query_regulations(), errors are raised rather than returned as text,
+    so the caller can fall back to the threaded path.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+
+    Returns:
+        str: Formatted response with regulatory information
+
+    Raises:
+        Exception: Any error raised by Cypher generation, the database, or the QA step.
+
+    Examples:
+        >>> response = await aquery_regulations("What are the methane detection requirements?")
+    """
+    # --------------------------------------------------------------------------------- ainvoke_cypher_qa()
+    async def ainvoke_cypher_qa(cypher_qa) -> Tuple[str, str]:
+        cached_answer = await _arun_cached_cypher(cypher_qa, question)
+        if cached_answer is not None:
+            return cached_answer, CACHED_CYPHER_PATH
+        
+        with span("cypher.generate"):
+            generated = await cypher_qa.cypher_generation_chain.ainvoke(
+                {"question": question, "schema": cypher_qa.graph_schema}
+            )
+        if isinstance(generated, dict):
+            generated = generated.get("text", "")
+        generated_cypher = _extract_cypher(generated)
+        
+        # Validate and correct relationship directions like the synchronous chain
+        if getattr(cypher_qa, "cypher_query_corrector", None):
+            generated_cypher = cypher_qa.cypher_query_corrector(generated_cypher)
+        
+        context = []
+        if generated_cypher:
+            records = await get_database().execute_query_async(generated_cypher)
+            context = [record.data() for record in records][: cypher_qa.top_k]
+            if context:
+                _store_generated_cypher(cypher_qa, question, generated_cypher)
+        
+        with span("cypher.qa"):
+            answer = await cypher_qa.qa_chain.ainvoke({"question": question, "context": context})
+        return _qa_text(answer), LLM_CYPHER_PATH
+    # --------------------------------------------------------------------------------- end ainvoke_cypher_qa()
+
+    start_time = time.time()
+    
+    # Recognized question shapes skip LLM Cypher generation
+    intent_match = match_cypher_intent(question)
+    if intent_match is not None:
+        intent, parameters = intent_match
+        records = await get_database().execute_query_async(intent.cypher, parameters)
+        if records:
+            context = [record.data() for record in records]
+            with span("cypher.qa"):
+                answer = await get_component_registry().arun(
+                    CYPHER_QA_COMPONENT,
+                    lambda cypher_qa: cypher_qa.qa_chain.ainvoke({"question": question, "context": context})
+                )
+            _record_cypher_path(intent.name, start_time)
+            return _qa_text(answer)
+        _record_template_miss(intent.name)
+
+    answer, path = await get_component_registry().arun(CYPHER_QA_COMPONENT, ainvoke_cypher_qa)
+    _record_cypher_path(path, start_time)
+    return answer
+# --------------------------------------------------------------------------------- end aquery_regulations()
+
+# --------------------------------------------------------------------------------- match_cypher_intent()
+def match_cypher_intent(question: str) -> Optional[Tuple[CypherIntent, Dict[str, Any]]]:
+    """Map a question to the first matching intent template.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+
+    Returns:
+        Optional[Tuple[CypherIntent, Dict[str, Any]]]: The intent and its Cypher
+            parameters, or None if the question needs LLM Cypher generation.
+
+    Examples:
+        >>> intent, parameters = match_cypher_intent("What does 30 CFR 75.400 require?")
+        >>> intent.name, parameters["section"]
+        ('section_lookup', '75.400')
+    """
+    for intent in CYPHER_INTENTS:
+        parameters = intent.match(question)
+        if parameters is not None:
+            return intent, parameters
+    return None
+# --------------------------------------------------------------------------------- end match_cypher_intent()
+
+# --------------------------------------------------------------------------------- get_cypher_path_stats()
+def get_cypher_path_stats() -> Dict[str, Any]:
+    """Report how graph questions were answered: intent templates vs LLM-generated Cypher.
+
+    Returns:
+        Dict[str, Any]: Total queries, template hit rate, template misses (matched
+                        but no records, so LLM fallback), count and average
+                        latency per path, and generated-Cypher cache statistics.
+
+    Examples:
+        >>> stats = get_cypher_path_stats()
+        >>> print(f"Template hit rate: {stats['template_hit_rate']:.0%}")
+    """
+    with _cypher_stats_lock:
+        paths = {
+            path: {"count": int(stats["count"]), "avg_ms": round(stats["total_ms"] / stats["count"], 1)}
+            for path, stats in _cypher_path_stats.items()
+        }
+        misses = _cypher_template_misses
+    
+    total = sum(path["count"] for path in paths.values())
+    template_hits = sum(paths.get(intent.name, {}).get("count", 0) for intent in CYPHER_INTENTS)
+    cypher_cache = get_cypher_cache()
+    return {
+        "total_queries": total,
+        "template_hits": template_hits,
+        "template_hit_rate": round(template_hits / total, 3) if total else 0.0,
+        "template_misses": misses,
+        "paths": paths,
+        "cypher_cache": cypher_cache.get_stats() if cypher_cache is not None else {"enabled": False}
+    }
+# --------------------------------------------------------------------------------- end get_cypher_path_stats()
+
 # --------------------------------------------------------------------------------- query_regulations_detailed()
 def query_regulations_detailed(question: str) -> dict:
     """Query MSHA regulations with detailed response including metadata and debugging info.
@@ -266,9 +650,11 @@ def query_regulations_detailed(question: str) -> dict:
         "MATCH (c:Chunk)-[:HAS_ENTITY]->(e)..."
     """
     try:
-        # Get the chain and invoke with the question
-        cypher_qa = get_cypher_qa()
-        result = cypher_qa.invoke({"query": question})
+        # Invoke the shared, warm chain with the question
+        result = get_component_registry().run(
+            CYPHER_QA_COMPONENT,
+            lambda cypher_qa: cypher_qa.invoke({"query": question})
+        )
         
         # Extract Cypher query from intermediate steps if available
         cypher_query = None
@@ -391,7 +777,8 @@ def check_cypher_tool_health() -> dict:
             "last_check": None,
             "response_time_ms": 0,
             "node_count": 0,
-            "relationship_count": 0
+            "relationship_count": 0,
+            "cypher_paths": get_cypher_path_stats()
         },
         "errors": []
     }
@@ -518,6 +905,176 @@ def _cypher_fallback(question: str) -> str:
     )
 # --------------------------------------------------------------------------------- end _cypher_fallback()
 
+# ------------------------
+# --- Helper Functions ---
+# ------------------------
+
+# --------------------------------------------------------------------------------- _extract_cypher()
+def _extract_cypher(text: str) -> str:
+    """Extract the Cypher statement from LLM output that may wrap it in code fences.
+
+    Args:
+        text (str): Raw Cypher generation output
+
+    Returns:
+        str: The Cypher statement without surrounding fences
+
+    Examples:
+        >>> _extract_cypher("```cypher\nMATCH (n) RETURN n\n```")
+        'MATCH (n) RETURN n'
+    """
+    matches = re.findall(r"```(?:cypher)?(.*?)```", text, re.DOTALL | re.IGNORECASE)
+    return (matches[0] if matches else text).strip()
+# --------------------------------------------------------------------------------- end _extract_cypher()
+
+# --------------------------------------------------------------------------------- _cached_cypher_key()
+def _cached_cypher_key(cypher_qa, question: str) -> Optional[str]:
+    """Return the generated-Cypher cache key for a question, or None if the cache is disabled."""
+    cache = get_cypher_cache()
+    if cache is None:
+        return None
+    return cache.make_key(question, schema_fingerprint(getattr(cypher_qa, "graph_schema", "")))
+# --------------------------------------------------------------------------------- end _cached_cypher_key()
+
+# --------------------------------------------------------------------------------- _run_cached_cypher()
+def _run_cached_cypher(cypher_qa, question: str) -> Optional[str]:
+    """Answer from cached generated Cypher, skipping the generation LLM call.
+
+    A cached statement that raises or returns no records is evicted.
+
+    Args:
+        cypher_qa: Shared Cypher QA chain (schema and QA step).
+        question (str): Graph question.
+
+    Returns:
+        Optional[str]: Answer text, or None on a miss or eviction.
+    """
+    key = _cached_cypher_key(cypher_qa, question)
+    cached_cypher = get_cypher_cache().get(key) if key else None
+    if cached_cypher is None:
+        return None
+    
+    try:
+        records = get_database().execute_query(cached_cypher)
+    except Exception as e:
+        logger.warning(f"⚠️ Cached Cypher failed, regenerating: {e}")
+        get_cypher_cache().evict(key, "error")
+        return None
+    if not records:
+        get_cypher_cache().evict(key, "empty")
+        return None
+    
+    context = [record.data() for record in records][: cypher_qa.top_k]
+    with span("cypher.qa"):
+        return _qa_text(cypher_qa.qa_chain.invoke({"question": question, "context": context}))
+# --------------------------------------------------------------------------------- end _run_cached_cypher()
+
+# --------------------------------------------------------------------------------- _arun_cached_cypher()
+async def _arun_cached_cypher(cypher_qa, question: str) -> Optional[str]:
+    """Asyncio counterpart of _run_cached_cypher() using the async Neo4j driver."""
+    key = _cached_cypher_key(cypher_qa, question)
+    cached_cypher = get_cypher_cache().get(key) if key else None
+    if cached_cypher is None:
+        return None
+    
+    try:
+        records = await get_database().execute_query_async(cached_cypher)
+    except Exception as e:
+        logger.warning(f"⚠️ Cached Cypher failed, regenerating: {e}")
+        get_cypher_cache().evict(key, "error")
+        return None
+    if not records:
+        get_cypher_cache().evict(key, "empty")
+        return None
+    
+    context = [record.data() for record in records][: cypher_qa.top_k]
+    with span("cypher.qa"):
+        return _qa_text(await cypher_qa.qa_chain.ainvoke({"question": question, "context": context}))
+# --------------------------------------------------------------------------------- end _arun_cached_cypher()
+
+# --------------------------------------------------------------------------------- _store_generated_cypher()
+def _store_generated_cypher(cypher_qa, question: str, generated_cypher: str) -> None:
+    """Cache generated Cypher that executed successfully and returned records.
+
+    Statements containing write clauses are never cached.
+    """
+    key = _cached_cypher_key(cypher_qa, question)
+    if key is None or not generated_cypher or _WRITE_CLAUSE_PATTERN.search(generated_cypher):
+        return
+    get_cypher_cache().put(key, question, generated_cypher)
+# --------------------------------------------------------------------------------- end _store_generated_cypher()
+
+# --------------------------------------------------------------------------------- _qa_text()
+def _qa_text(answer) -> str:
+    """Normalize QA chain output (string or LLMChain dict) to answer text."""
+    if isinstance(answer, dict):
+        answer = answer.get("text", "")
+    return answer or "No answer found."
+# --------------------------------------------------------------------------------- end _qa_text()
+
+# --------------------------------------------------------------------------------- _singular()
+def _singular(term: str) -> str:
+    """Singularize the last word of an entity term so plural questions match singular entity names.
+
+    Examples:
+        >>> _singular("self-rescuers"), _singular("batteries"), _singular("methane gas")
+        ('self-rescuer', 'battery', 'methane gas')
+    """
+    if term.endswith("ies") and len(term) > 4:
+        return term[:-3] + "y"
+    if term.endswith("s") and not term.endswith(("ss", "us", "as", "is")) and len(term) > 3:
+        return term[:-1]
+    return term
+# --------------------------------------------------------------------------------- end _singular()
+
+# --------------------------------------------------------------------------------- _record_cypher_path()
+def _record_cypher_path(path: str, start_time: float) -> None:
+    """Record one answered graph question and its latency under its query path."""
+    elapsed_ms = (time.time() - start_time) * 1000
+    with _cypher_stats_lock:
+        stats = _cypher_path_stats.setdefault(path, {"count": 0, "total_ms": 0.0})
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+    set_span_attribute("cypher_path", path)
+# --------------------------------------------------------------------------------- end _record_cypher_path()
+
+# --------------------------------------------------------------------------------- _record_template_miss()
+def _record_template_miss(intent_name: str) -> None:
+    """Record an intent match whose template returned no records (LLM fallback follows)."""
+    global _cypher_template_misses
+    with _cypher_stats_lock:
+        _cypher_template_misses += 1
+    logger.info(f"Cypher intent '{intent_name}' returned no records, falling back to LLM generation")
+# --------------------------------------------------------------------------------- end _record_template_miss()
+
+# --------------------------------------------------------------------------------- _validate_cypher_intents()
+def _validate_cypher_intents() -> None:
+    """Validate intent templates at import: read-only and every named group used as a parameter.
+
+    Raises:
+        ValueError: If a template writes to the graph or references an unknown parameter.
+    """
+    for intent in CYPHER_INTENTS:
+        if _WRITE_CLAUSE_PATTERN.search(intent.cypher):
+            raise ValueError(f"Cypher intent '{intent.name}' must be read-only")
+        template_parameters = set(re.findall(r"\$(\w+)", intent.cypher))
+        pattern_parameters = set(intent.pattern.groupindex) | {"limit"}
+        if template_parameters != pattern_parameters:
+            raise ValueError(
+                f"Cypher intent '{intent.name}' parameters {sorted(template_parameters)} "
+                f"do not match pattern groups {sorted(pattern_parameters)}"
+            )
+# --------------------------------------------------------------------------------- end _validate_cypher_intents()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# Register the Cypher QA chain factory; the chain itself is built lazily on first use.
+get_component_registry().register(CYPHER_QA_COMPONENT, get_cypher_qa)
+
+# Intent templates are static; reject unsafe or inconsistent templates at import.
+_validate_cypher_intents()
+
 # =========================================================================
 # End of File
 # ========================================================================= 
\ No newline at end of file
@@ -0,0 +1,566 @@
+# -------------------------------------------------------------------------
+# File: local_vector_index.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/tools/local_vector_index.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module keeps an in-process mirror of the Chunk.textEmbedding vectors of the
+# hybrid store, so retrieval-only vector search does not need a round trip to the
+# Neo4j vector index and its retrieval query. The embeddings are exported once
+# into a memory-mapped NumPy matrix (float32, rows scaled to unit length) with a
+# JSON table of chunk ids. Top-k is one matrix-vector product; the shipped volumes
+# hold about 1,300 768-d chunks and a scan of 5,000 takes under a millisecond on
+# one core, so no approximate (HNSW/IVF) structure is needed. Only the
+# winning chunks' text and metadata are then fetched from Neo4j, by id.
+# A mirror is stale when the store's build marker, a (:StoreBuild) node that
+# build_data/build_hybrid_store.py stamps with a new build id when a build starts
+# and when it completes, no longer matches the one read at export; searches then
+# fall back to the remote index until the mirror is rebuilt. Reading the marker
+# is one node lookup, so the check adds no scan to the request it runs on. Exports are an explicit
+# build step; the serving process only exports on its own when
+# local_vector_index_auto_export is set.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: LocalVectorIndex - Memory-mapped embedding mirror with exact top-k search
+# - Function: build_local_vector_index() - Explicit export step, run after building the store
+# - Function: get_local_vector_index() - Singleton accessor configured from BackendConfig
+# - Constants: LOCAL_INDEX_MATRIX_FILE, LOCAL_INDEX_TABLE_FILE, LOCAL_INDEX_EXPORT_BATCH, Cypher statements
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - json, os: Mirror files
+#   - logging, threading, time: Background export, freshness checks, statistics
+#   - datetime: Export timestamps
+#   - typing: Type hints
+# - Third-Party:
+#   - numpy (optional): Memory-mapped matrix and top-k; without it the mirror is disabled
+# - Local Project Modules:
+#   - ..config: get_config for the local_vector_index_* settings
+#   - ..database: get_database for export, freshness checks and chunk fetches
+#   - ..tracing: traced for local search spans
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# vector.py's retrieve_regulation_chunks() and aretrieve_regulation_chunks() try
+# the mirror first when local_vector_index_enabled is set, and use the Neo4j
+# vector index when the mirror is missing, stale, being exported, or fails.
+# Export the mirror after build_data/build_hybrid_store.py, and again after the
+# store changes:
+#   python -m backend.tools.local_vector_index
+# With local_vector_index_auto_export set, a fallback starts the export on a
+# background thread of the serving process instead.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Local Vector Index for MRCA Retrieval-Only Vector Search
+
+Memory-mapped mirror of the chunk embeddings answering top-k similarity search
+in process, with the remote Neo4j vector index as the fallback.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-party library imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Local application/library specific imports
+from ..config import get_config
+from ..database import get_database
+from ..tracing import traced
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Mirror files: float32 matrix (one unit-length row per chunk) and the chunk id table
+LOCAL_INDEX_MATRIX_FILE = "embeddings.f32"
+LOCAL_INDEX_TABLE_FILE = "chunk_ids.json"
+
+# Chunks read per export query
+LOCAL_INDEX_EXPORT_BATCH = 1000
+
+# Chunk count bounding the export matrix: answered from the count store, without reading chunks
+CHUNK_COUNT_CYPHER = "MATCH (c:Chunk) RETURN count(c) AS count"
+
+# Store build marker stamped by build_data/build_hybrid_store.py (null for stores built without it)
+STORE_BUILD_CYPHER = """
+OPTIONAL MATCH (b:StoreBuild {id: 'hybrid_store'})
+RETURN b.build_id AS build_id
+"""
+
+# Export page: keyset pagination on the Chunk.id uniqueness constraint
+EXPORT_EMBEDDINGS_CYPHER = """
+MATCH (c:Chunk)
+WHERE c.id > $after AND c.textEmbedding IS NOT NULL
+RETURN c.id AS chunk_id, c.textEmbedding AS embedding
+ORDER BY c.id
+LIMIT $limit
+"""
+
+# Winning chunks by id, in the retrieval-only chunk format of vector.py
+FETCH_CHUNKS_CYPHER = """
+UNWIND $hits AS hit
+MATCH (c:Chunk {id: hit.chunk_id})-[:PART_OF]->(d:Document)
+RETURN c.text AS text, hit.score AS score, d.id AS document, c.id AS chunk_id,
+       [(c)-[:HAS_ENTITY]->(e:Entity) | e.name] AS entities
+ORDER BY score DESC
+"""
+
+# Singleton instance and its guard
+_local_vector_index: Optional["LocalVectorIndex"] = None
+_local_vector_index_lock = threading.Lock()
+# Whether the missing-numpy warning was logged
+_numpy_missing_logged = False
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class LocalVectorIndex
+class LocalVectorIndex:
+    """Memory-mapped mirror of the chunk embeddings with exact top-k search.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        path (str): Directory holding the matrix and chunk id table.
+        check_interval_seconds (float): Minimum time between store freshness checks.
+        auto_export (bool): Whether a fallback starts a background export.
+        local_searches (int): Searches answered by the mirror.
+        fallbacks (int): Searches handed back to the remote index.
+        exports (int): Completed exports.
+
+    Methods:
+        is_ready(): Whether a mirror is loaded.
+        export(): Export the store's embeddings and load the new mirror.
+        search(): Top-k chunk ids and scores for an embedding.
+        retrieve() / aretrieve(): Top-k chunks, or None to use the remote index.
+        get_stats(): Mirror and search statistics.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, path: str, check_interval_seconds: float = 300.0, auto_export: bool = False) -> None:
+        """Open the mirror in path, if one was exported.
+
+        Args:
+            path (str): Mirror directory.
+            check_interval_seconds (float): Minimum time between store freshness checks.
+                                            Defaults to 300.0.
+            auto_export (bool): Start a background export when a search falls back.
+                                Defaults to False.
+
+        Raises:
+            RuntimeError: If numpy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("numpy is required for the local vector index")
+        self.path = path
+        self.check_interval_seconds = check_interval_seconds
+        self.auto_export = auto_export
+        self.local_searches = 0
+        self.fallbacks = 0
+        self.exports = 0
+        self._lock = threading.Lock()
+        # (chunk ids, matrix, store build id at export, export time), swapped as a whole
+        self._mirror: Optional[Tuple[List[str], Any, Optional[str], str]] = None
+        self._stale = False
+        self._last_check = 0.0
+        self._export_thread: Optional[threading.Thread] = None
+        self._load()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------
+    # --- Public Methods ---
+    # ------------------------
+
+    # ------------------------------------------------------------------------- is_ready()
+    def is_ready(self) -> bool:
+        """Whether a mirror is loaded and not known to be stale."""
+        return self._mirror is not None and not self._stale
+    # ------------------------------------------------------------------------- end is_ready()
+
+    # ------------------------------------------------------------------------- export()
+    def export(self) -> int:
+        """Export the store's chunk embeddings into the mirror files and load them.
+
+        The matrix is written to temporary files that replace the mirror once
+        complete, so a running search keeps its snapshot.
+
+        Returns:
+            int: Number of exported chunks.
+
+        Raises:
+            Exception: Any error raised by the database or while writing the files.
+        """
+        database = get_database()
+        # Read before the pages: a build completing during the export makes the next check report stale
+        build_id = database.execute_query(STORE_BUILD_CYPHER)[0]["build_id"]
+        chunk_count = database.execute_query(CHUNK_COUNT_CYPHER)[0]["count"]
+        os.makedirs(self.path, exist_ok=True)
+        matrix_path = os.path.join(self.path, LOCAL_INDEX_MATRIX_FILE)
+        table_path = os.path.join(self.path, LOCAL_INDEX_TABLE_FILE)
+
+        chunk_ids: List[str] = []
+        matrix = None
+        after = ""
+        while len(chunk_ids) < chunk_count:
+            records = database.execute_query(EXPORT_EMBEDDINGS_CYPHER,
+                                             {"after": after, "limit": LOCAL_INDEX_EXPORT_BATCH})
+            if not records:
+                break
+            rows = np.asarray([record["embedding"] for record in records], dtype=np.float32)
+            if matrix is None:
+                matrix = np.memmap(matrix_path + ".tmp", dtype=np.float32, mode="w+",
+                                   shape=(chunk_count, rows.shape[1]))
+            rows = rows[:chunk_count - len(chunk_ids)]
+            norms = np.linalg.norm(rows, axis=1, keepdims=True)
+            matrix[len(chunk_ids):len(chunk_ids) + len(rows)] = rows / np.maximum(norms, 1e-12)
+            chunk_ids.extend(record["chunk_id"] for record in records[:len(rows)])
+            after = chunk_ids[-1]
+
+        if matrix is None:
+            logger.warning("Local vector index: the store has no chunk embeddings to export")
+            return 0
+        dimensions = matrix.shape[1]
+        matrix.flush()
+        del matrix
+        # Fewer chunks with embeddings than chunks: drop the unused rows
+        os.truncate(matrix_path + ".tmp", len(chunk_ids) * dimensions * 4)
+
+        exported_at = datetime.now(timezone.utc).isoformat()
+        with open(table_path + ".tmp", "w", encoding="utf-8") as table_file:
+            json.dump({"chunk_ids": chunk_ids, "dimensions": dimensions, "build_id": build_id,
+                       "exported_at": exported_at}, table_file)
+        with self._lock:
+            os.replace(matrix_path + ".tmp", matrix_path)
+            os.replace(table_path + ".tmp", table_path)
+            self._load()
+            self._stale = False
+            self.exports += 1
+        logger.info(f"✅ Local vector index exported: {len(chunk_ids):,} chunks x {dimensions} dimensions")
+        return len(chunk_ids)
+    # ------------------------------------------------------------------------- end export()
+
+    # ------------------------------------------------------------------------- search()
+    def search(self, embedding: List[float], k: int) -> List[Tuple[str, float]]:
+        """Return the k chunks most similar to an embedding.
+
+        Scores use the Neo4j cosine convention, (1 + cosine) / 2, so they compare
+        with scores from the remote index.
+
+        Args:
+            embedding (List[float]): Query embedding.
+            k (int): Number of chunks.
+
+        Returns:
+            List[Tuple[str, float]]: (chunk id, score) pairs, best first; empty
+                                     when no mirror is loaded.
+        """
+        mirror = self._mirror
+        if mirror is None or k <= 0:
+            return []
+        chunk_ids, matrix = mirror[0], mirror[1]
+
+        query = np.asarray(embedding, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        similarities = matrix @ query
+        if k < len(similarities):
+            top = np.argpartition(-similarities, k - 1)[:k]
+        else:
+            top = np.arange(len(similarities))
+        top = top[np.argsort(-similarities[top])]
+        return [(chunk_ids[i], float((1.0 + similarities[i]) / 2.0)) for i in top]
+    # ------------------------------------------------------------------------- end search()
+
+    # ------------------------------------------------------------------------- retrieve()
+    @traced("vector.local_search")
+    def retrieve(self, embedding: List[float], k: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the top-k chunks from the mirror, or None to use the remote index.
+
+        Args:
+            embedding (List[float]): Query embedding.
+            k (int): Number of chunks.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Chunks (text, score, document, chunk_id,
+                                            entities) best first, or None when the
+                                            mirror is missing, stale or failed.
+        """
+        try:
+            if self._check_due():
+                self._record_check(get_database().execute_query(STORE_BUILD_CYPHER)[0]["build_id"])
+            if not self.is_ready():
+                return self._fall_back()
+            hits = self.search(embedding, k)
+            records = get_database().execute_query(FETCH_CHUNKS_CYPHER, {"hits": self._hit_rows(hits)})
+            return self._to_chunks(records, hits)
+        except Exception as e:
+            logger.warning(f"Local vector search failed, using the remote index: {e}")
+            return self._fall_back()
+    # ------------------------------------------------------------------------- end retrieve()
+
+    # ------------------------------------------------------------------------- aretrieve()
+    @traced("vector.local_search")
+    async def aretrieve(self, embedding: List[float], k: int) -> Optional[List[Dict[str, Any]]]:
+        """Asyncio counterpart of retrieve() on the async Neo4j driver.
+
+        Args:
+            embedding (List[float]): Query embedding.
+            k (int): Number of chunks.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Chunks best first, or None to use the remote index.
+        """
+        try:
+            if self._check_due():
+                records = await get_database().execute_query_async(STORE_BUILD_CYPHER)
+                self._record_check(records[0]["build_id"])
+            if not self.is_ready():
+                return self._fall_back()
+            hits = self.search(embedding, k)
+            records = await get_database().execute_query_async(FETCH_CHUNKS_CYPHER, {"hits": self._hit_rows(hits)})
+            return self._to_chunks(records, hits)
+        except Exception as e:
+            logger.warning(f"Local vector search failed, using the remote index: {e}")
+            return self._fall_back()
+    # ------------------------------------------------------------------------- end aretrieve()
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Return mirror and search statistics.
+
+        Returns:
+            Dict[str, Any]: ready, stale, exporting, chunks, dimensions, build_id,
+                            exported_at, local_searches, fallbacks and exports.
+        """
+        mirror = self._mirror
+        return {
+            "ready": self.is_ready(),
+            "stale": self._stale,
+            "exporting": self._export_thread is not None and self._export_thread.is_alive(),
+            "chunks": len(mirror[0]) if mirror else 0,
+            "dimensions": int(mirror[1].shape[1]) if mirror else 0,
+            "build_id": mirror[2] if mirror else None,
+            "exported_at": mirror[3] if mirror else None,
+            "local_searches": self.local_searches,
+            "fallbacks": self.fallbacks,
+            "exports": self.exports,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+    # ------------------------
+    # --- Helper Methods ---
+    # ------------------------
+
+    # ------------------------------------------------------------------------- _load()
+    def _load(self) -> None:
+        """Open the mirror files, if present and consistent (matrix size matches the id table)."""
+        matrix_path = os.path.join(self.path, LOCAL_INDEX_MATRIX_FILE)
+        table_path = os.path.join(self.path, LOCAL_INDEX_TABLE_FILE)
+        try:
+            with open(table_path, encoding="utf-8") as table_file:
+                table = json.load(table_file)
+            chunk_ids, dimensions = table["chunk_ids"], table["dimensions"]
+            if not chunk_ids or os.path.getsize(matrix_path) != len(chunk_ids) * dimensions * 4:
+                raise ValueError("matrix size does not match the chunk id table")
+            matrix = np.memmap(matrix_path, dtype=np.float32, mode="r", shape=(len(chunk_ids), dimensions))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"Local vector index at {self.path} is unreadable and is ignored until re-exported: {e}")
+            return
+        self._mirror = (chunk_ids, matrix, table.get("build_id"), table.get("exported_at"))
+        # Mirrors exported before build ids were recorded are checked on the first search
+        self._last_check = time.monotonic() if "build_id" in table else 0.0
+    # ------------------------------------------------------------------------- end _load()
+
+    # ------------------------------------------------------------------------- _check_due()
+    def _check_due(self) -> bool:
+        """Whether the store build marker should be compared with the mirror now.
+
+        A missing or stale mirror is first reopened from disk, so files written
+        by the build step are picked up without a restart.
+        """
+        if time.monotonic() - self._last_check < self.check_interval_seconds:
+            return False
+        self._last_check = time.monotonic()
+        if self._mirror is None or self._stale:
+            with self._lock:
+                exported = self._mirror[2] if self._mirror else None
+                self._load()
+                if self._mirror is not None and self._mirror[2] != exported:
+                    self._stale = False
+        return self._mirror is not None
+    # ------------------------------------------------------------------------- end _check_due()
+
+    # ------------------------------------------------------------------------- _record_check()
+    def _record_check(self, build_id: Optional[str]) -> None:
+        """Mark the mirror stale if the store was rebuilt since the export."""
+        self._last_check = time.monotonic()
+        mirror = self._mirror
+        if mirror is not None and build_id != mirror[2]:
+            logger.info(f"Local vector index is stale (store build {build_id}, exported from build {mirror[2]})")
+            self._stale = True
+    # ------------------------------------------------------------------------- end _record_check()
+
+    # ------------------------------------------------------------------------- _fall_back()
+    def _fall_back(self) -> None:
+        """Count a fallback to the remote index; with auto_export, start a background export if none is running."""
+        self.fallbacks += 1
+        if not self.auto_export:
+            return None
+        with self._lock:
+            if self._export_thread is None or not self._export_thread.is_alive():
+                self._export_thread = threading.Thread(target=self._export_in_background,
+                                                       name="local-vector-export", daemon=True)
+                self._export_thread.start()
+        return None
+    # ------------------------------------------------------------------------- end _fall_back()
+
+    # ------------------------------------------------------------------------- _export_in_background()
+    def _export_in_background(self) -> None:
+        """Export the mirror on the background thread, logging failures."""
+        try:
+            self.export()
+        except Exception as e:
+            logger.warning(f"Local vector index export failed: {e}")
+    # ------------------------------------------------------------------------- end _export_in_background()
+
+    # ------------------------------------------------------------------------- _hit_rows()
+    @staticmethod
+    def _hit_rows(hits: List[Tuple[str, float]]) -> List[Dict[str, Any]]:
+        """Cypher parameter rows for the winning chunks."""
+        return [{"chunk_id": chunk_id, "score": score} for chunk_id, score in hits]
+    # ------------------------------------------------------------------------- end _hit_rows()
+
+    # ------------------------------------------------------------------------- _to_chunks()
+    def _to_chunks(self, records: List[Any], hits: List[Tuple[str, float]]) -> Optional[List[Dict[str, Any]]]:
+        """Convert fetched records into chunks; a missing winner means the mirror is stale.
+
+        Args:
+            records (List[Any]): neo4j Records returned by FETCH_CHUNKS_CYPHER.
+            hits (List[Tuple[str, float]]): Winning (chunk id, score) pairs.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Chunks best first, or None to use the remote index.
+        """
+        if len(records) < len(hits):
+            self._stale = True
+            return self._fall_back()
+        self.local_searches += 1
+        return [{
+            "text": record["text"] or "",
+            "score": float(record["score"]),
+            "document": record["document"] or "Unknown",
+            "chunk_id": record["chunk_id"],
+            "entities": [name for name in record["entities"] or [] if name],
+        } for record in records]
+    # ------------------------------------------------------------------------- end _to_chunks()
+
+# ------------------------------------------------------------------------- end class LocalVectorIndex
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- build_local_vector_index()
+def build_local_vector_index() -> int:
+    """Export the mirror into local_vector_index_path, whether or not it is enabled.
+
+    This is the build step run after build_data/build_hybrid_store.py and after
+    the store changes; serving processes pick the new files up on restart.
+
+    Returns:
+        int: Number of exported chunks.
+
+    Raises:
+        RuntimeError: If numpy is not installed.
+    """
+    config = get_config()
+    index = LocalVectorIndex(path=getattr(config, "local_vector_index_path", ".cache/local_vector_index"))
+    return index.export()
+# ------------------------------------------------------------------------- end build_local_vector_index()
+
+# ------------------------------------------------------------------------- get_local_vector_index()
+def get_local_vector_index() -> Optional[LocalVectorIndex]:
+    """Get the process-wide local vector index (singleton).
+
+    Returns:
+        Optional[LocalVectorIndex]: Shared index, or None when local_vector_index_enabled
+            is False in BackendConfig or numpy is not installed. The config is
+            not changed; without numpy the warning is logged once.
+
+    Examples:
+        >>> index = get_local_vector_index()
+        >>> if index:
+        ...     print(index.get_stats()["chunks"])
+    """
+    global _local_vector_index, _numpy_missing_logged
+    config = get_config()
+    if not getattr(config, "local_vector_index_enabled", False):
+        return None
+
+    with _local_vector_index_lock:
+        if _local_vector_index is None:
+            if np is None:
+                if not _numpy_missing_logged:
+                    logger.warning("⚠️ local_vector_index_enabled is set but numpy is not installed; "
+                                   "using the remote vector index")
+                    _numpy_missing_logged = True
+                return None
+            _local_vector_index = LocalVectorIndex(
+                path=getattr(config, "local_vector_index_path", ".cache/local_vector_index"),
+                check_interval_seconds=getattr(config, "local_vector_index_check_seconds", 300.0),
+                auto_export=getattr(config, "local_vector_index_auto_export", False),
+            )
+            logger.info(f"✅ Local vector index initialized ({_local_vector_index.get_stats()['chunks']:,} chunks)")
+        return _local_vector_index
+# ------------------------------------------------------------------------- end get_local_vector_index()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# Running the module exports the mirror: python -m backend.tools.local_vector_index
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"Exported {build_local_vector_index():,} chunk embeddings")
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,629 @@
+# -------------------------------------------------------------------------
+# File: registry.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/tools/registry.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module provides a process-wide registry of warm retrieval components for the
+# MRCA tools package. Building the VectorRAG retrieval chain and the GraphRAG Cypher
+# QA chain requires opening Neo4j connections, introspecting the graph schema, and
+# creating LLM/embedding clients. The registry builds each component once, shares the
+# instance safely across the ParallelRetrievalEngine thread pool, rebuilds it when the
+# relevant configuration or the knowledge store changes, and records build counts and
+# cold/warm call latencies for health monitoring.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: ComponentMetrics - Build and latency metrics dataclass for a registered component
+# - Class: ComponentRegistry - Thread-safe registry of lazily built, fingerprinted components
+# - Function: get_component_registry() - Singleton accessor for the process-wide registry
+# - Function: compute_config_fingerprint() - Fingerprint of the settings used to build components
+# - Function: is_connection_error() - Whether a failed call should drop the component
+# - Global Variables: _component_registry, _registry_lock - Thread-safe singleton management
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - asyncio: Running cold builds off the event loop for arun()
+#   - hashlib: Configuration fingerprint hashing
+#   - logging: Registry operation logging
+#   - time: Build timing, latency measurement, and component age tracking
+#   - threading.Lock: Thread-safe registry and per-component build synchronization
+#   - dataclasses: Metrics data structure
+#   - typing: Type hints (Any, Awaitable, Callable, Dict, Optional, TypeVar)
+# - Third-Party:
+#   - neo4j.exceptions (optional): Driver and connection errors that invalidate a component
+# - Local Project Modules:
+#   - ..config.get_config: Settings that determine how components are built
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# This module is used by the MRCA tools package:
+# - vector.py: Registers and reuses the VectorRAG retrieval chain
+# - cypher.py: Registers and reuses the GraphRAG Cypher QA chain
+# - parallel_hybrid.py: Reports registry status through the engine health check
+# Build scripts or admin tooling call mark_store_changed() after reloading the
+# knowledge graph so that every component is rebuilt against the new store.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Warm Component Registry for MRCA Retrieval Chains
+
+Builds retrieval chains once per process, shares them across worker threads, and
+rebuilds them when configuration or the knowledge store changes.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+# Third-party library imports
+try:
+    from neo4j.exceptions import AuthError, DriverError, ServiceUnavailable, SessionExpired
+except ImportError:
+    AuthError = DriverError = ServiceUnavailable = SessionExpired = None
+
+# Local application/library specific imports
+from ..config import get_config
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Settings that change how retrieval components are built
+FINGERPRINT_FIELDS = (
+    "neo4j_uri",
+    "neo4j_username",
+    "neo4j_password",
+    "openai_api_key",
+    "openai_model",
+    "gemini_api_key",
+    "gemini_model",
+    "embedding_cache_enabled",
+)
+
+# Errors meaning the component's connection is broken; anything else (LLM errors,
+# invalid generated Cypher) leaves the warm component in place
+CONNECTION_ERRORS = tuple(error for error in (ServiceUnavailable, SessionExpired, AuthError, DriverError,
+                                              ConnectionError) if error is not None)
+
+# Global registry instance and thread lock for singleton pattern
+_component_registry: Optional['ComponentRegistry'] = None
+_registry_lock = Lock()
+
+T = TypeVar("T")
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class ComponentMetrics
+@dataclass
+class ComponentMetrics:
+    """Build and latency metrics for a registered component.
+
+    Cold calls are calls that had to build (or rebuild) the component before
+    running; warm calls reused an already built instance.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        builds (int): Number of times the component has been built.
+        build_failures (int): Number of failed build attempts.
+        invalidations (int): Number of explicit invalidations.
+        cold_calls (int): Calls that included a component build.
+        warm_calls (int): Calls served by an existing instance.
+        total_cold_ms (float): Accumulated latency of cold calls.
+        total_warm_ms (float): Accumulated latency of warm calls.
+        last_build_ms (float): Duration of the most recent build.
+        last_built_at (Optional[float]): Timestamp of the most recent build.
+        last_rebuild_reason (Optional[str]): Why the component was last (re)built.
+
+    Methods:
+        record_call(): Record the latency of a cold or warm call.
+        to_dict(): Summarize the metrics for status reporting.
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    builds: int = 0
+    build_failures: int = 0
+    invalidations: int = 0
+    cold_calls: int = 0
+    warm_calls: int = 0
+    total_cold_ms: float = 0.0
+    total_warm_ms: float = 0.0
+    last_build_ms: float = 0.0
+    last_built_at: Optional[float] = None
+    last_rebuild_reason: Optional[str] = None
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- record_call()
+    def record_call(self, elapsed_ms: float, cold: bool) -> None:
+        """Record the latency of a component call.
+
+        Args:
+            elapsed_ms (float): Call latency in milliseconds, including any build.
+            cold (bool): True if the call had to build the component first.
+        """
+        if cold:
+            self.cold_calls += 1
+            self.total_cold_ms += elapsed_ms
+        else:
+            self.warm_calls += 1
+            self.total_warm_ms += elapsed_ms
+    # ------------------------------------------------------------------------- end record_call()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- to_dict()
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the metrics for status reporting.
+
+        Returns:
+            Dict[str, Any]: Build counts and average cold/warm latencies.
+        """
+        return {
+            "builds": self.builds,
+            "build_failures": self.build_failures,
+            "invalidations": self.invalidations,
+            "cold_calls": self.cold_calls,
+            "warm_calls": self.warm_calls,
+            "avg_cold_ms": round(self.total_cold_ms / max(1, self.cold_calls), 2),
+            "avg_warm_ms": round(self.total_warm_ms / max(1, self.warm_calls), 2),
+            "last_build_ms": round(self.last_build_ms, 2),
+            "last_built_at": self.last_built_at,
+            "last_rebuild_reason": self.last_rebuild_reason,
+        }
+    # ------------------------------------------------------------------------- end to_dict()
+
+# ------------------------------------------------------------------------- end class ComponentMetrics
+
+# ------------------------------------------------------------------------- class _RegisteredComponent
+class _RegisteredComponent:
+    """Internal holder for one registered component and its build state.
+
+    Instance Attributes:
+        name (str): Registry key of the component.
+        factory (Callable[[], Any]): Zero-argument builder for the component.
+        instance (Any): Current built instance, or None when cold.
+        fingerprint (Optional[str]): Fingerprint the instance was built with.
+        lock (Lock): Serializes builds so concurrent cold callers build once.
+        metrics (ComponentMetrics): Build and latency metrics, guarded by the registry lock.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, name: str, factory: Callable[[], Any]) -> None:
+        self.name = name
+        self.factory = factory
+        self.instance: Any = None
+        self.fingerprint: Optional[str] = None
+        self.lock = Lock()
+        self.metrics = ComponentMetrics()
+    # ------------------------------------------------------------------------- end __init__()
+
+# ------------------------------------------------------------------------- end class _RegisteredComponent
+
+# ------------------------------------------------------------------------- class ComponentRegistry
+class ComponentRegistry:
+    """Thread-safe registry of lazily built, fingerprinted components.
+
+    Each component is built on first use and reused by every subsequent caller,
+    including concurrent callers in the ParallelRetrievalEngine thread pool. A
+    component is rebuilt when the configuration fingerprint changes, when the
+    store generation is bumped through mark_store_changed(), when it exceeds the
+    configured maximum age, or after it has been invalidated following an error.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        max_age_seconds (float): Maximum component age before a rebuild, 0 disables.
+        _components (Dict[str, _RegisteredComponent]): Registered components by name.
+        _lock (Lock): Protects the component table, store generation and metrics.
+        _store_generation (int): Incremented whenever the knowledge store changes.
+
+    Methods:
+        register(): Register a component factory under a name.
+        get(): Return a warm component, building it if required.
+        run(): Run an operation against a component and record its latency.
+        arun(): Async counterpart of run() for coroutine operations.
+        invalidate(): Drop one or all built components.
+        mark_store_changed(): Force a rebuild of every component.
+        get_status(): Get build counts and cold/warm latencies.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, max_age_seconds: float = 0.0) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_age_seconds (float): Maximum age of a built component before it is
+                rebuilt. Defaults to 0.0 (no age limit).
+        """
+        self.max_age_seconds = max_age_seconds
+        self._components: Dict[str, _RegisteredComponent] = {}
+        self._lock = Lock()
+        self._store_generation = 0
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+
+    # ------------------------------------------------------------------------- _entry()
+    def _entry(self, name: str) -> _RegisteredComponent:
+        """Look up a registered component.
+
+        Raises:
+            KeyError: If no factory is registered under the name.
+        """
+        with self._lock:
+            if name not in self._components:
+                raise KeyError(f"No component registered under '{name}'")
+            return self._components[name]
+    # ------------------------------------------------------------------------- end _entry()
+
+    # ------------------------------------------------------------------------- _current_fingerprint()
+    def _current_fingerprint(self) -> str:
+        """Combine the configuration fingerprint with the store generation."""
+        with self._lock:
+            generation = self._store_generation
+        return f"{compute_config_fingerprint()}:{generation}"
+    # ------------------------------------------------------------------------- end _current_fingerprint()
+
+    # ------------------------------------------------------------------------- _stale_reason()
+    def _stale_reason(self, entry: _RegisteredComponent, fingerprint: str) -> Optional[str]:
+        """Return why the entry needs a (re)build, or None if it is warm."""
+        if entry.instance is None:
+            return "cold" if entry.metrics.builds == 0 else "invalidated"
+        if entry.fingerprint != fingerprint:
+            return "config_or_store_changed"
+        if (
+            self.max_age_seconds > 0
+            and entry.metrics.last_built_at is not None
+            and time.time() - entry.metrics.last_built_at > self.max_age_seconds
+        ):
+            return "max_age_exceeded"
+        return None
+    # ------------------------------------------------------------------------- end _stale_reason()
+
+    # ------------------------------------------------------------------------- _acquire()
+    def _acquire(self, name: str) -> tuple:
+        """Return (instance, built) for a component, building it if stale."""
+        entry = self._entry(name)
+        fingerprint = self._current_fingerprint()
+
+        # Fast path: warm instance with a matching fingerprint
+        instance = entry.instance
+        if instance is not None and self._stale_reason(entry, fingerprint) is None:
+            return instance, False
+
+        with entry.lock:
+            # Another thread may have rebuilt while we waited for the lock
+            reason = self._stale_reason(entry, fingerprint)
+            if reason is None:
+                return entry.instance, False
+
+            build_start = time.time()
+            try:
+                instance = entry.factory()
+            except Exception:
+                with self._lock:
+                    entry.metrics.build_failures += 1
+                raise
+
+            with self._lock:
+                entry.metrics.last_build_ms = (time.time() - build_start) * 1000
+                entry.metrics.builds += 1
+                entry.metrics.last_built_at = time.time()
+                entry.metrics.last_rebuild_reason = reason
+            entry.instance = instance
+            entry.fingerprint = fingerprint
+
+            logger.info(
+                f"✅ Built component '{name}' in {entry.metrics.last_build_ms:.1f}ms "
+                f"(reason: {reason}, build #{entry.metrics.builds})"
+            )
+            return instance, True
+    # ------------------------------------------------------------------------- end _acquire()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- register()
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a component factory under a name.
+
+        Registering an already known name keeps its metrics and built instance,
+        so modules can register their factories at import time safely.
+
+        Args:
+            name (str): Registry key for the component.
+            factory (Callable[[], Any]): Zero-argument function that builds the component.
+
+        Examples:
+            >>> registry = ComponentRegistry()
+            >>> registry.register("vector_chain", create_vector_chain)
+        """
+        with self._lock:
+            if name in self._components:
+                self._components[name].factory = factory
+            else:
+                self._components[name] = _RegisteredComponent(name, factory)
+    # ------------------------------------------------------------------------- end register()
+
+    # ------------------------------------------------------------------------- invalidate()
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one or all built components so they are rebuilt on next use.
+
+        Typically called after a call fails with a connection error, so that the
+        next request does not keep reusing a broken client.
+
+        Args:
+            name (Optional[str]): Component to invalidate. If None, invalidates all.
+        """
+        with self._lock:
+            entries = [self._components[name]] if name in self._components else []
+            if name is None:
+                entries = list(self._components.values())
+
+        for entry in entries:
+            with entry.lock:
+                if entry.instance is not None:
+                    entry.instance = None
+                    entry.fingerprint = None
+                    with self._lock:
+                        entry.metrics.invalidations += 1
+                    logger.warning(f"⚠️ Component '{entry.name}' invalidated")
+    # ------------------------------------------------------------------------- end invalidate()
+
+    # ------------------------------------------------------------------------- mark_store_changed()
+    def mark_store_changed(self) -> None:
+        """Record that the knowledge store changed and force a rebuild of every component.
+
+        Examples:
+            >>> get_component_registry().mark_store_changed()
+            >>> # Next call to each component rebuilds it against the new store
+        """
+        with self._lock:
+            self._store_generation += 1
+            generation = self._store_generation
+        logger.info(f"Knowledge store generation advanced to {generation}")
+    # ------------------------------------------------------------------------- end mark_store_changed()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- get()
+    def get(self, name: str) -> Any:
+        """Return a warm component, building it first if required.
+
+        Args:
+            name (str): Registry key of the component.
+
+        Returns:
+            Any: The shared component instance.
+
+        Raises:
+            KeyError: If no factory is registered under the name.
+            Exception: Any error raised by the component factory.
+        """
+        instance, _ = self._acquire(name)
+        return instance
+    # ------------------------------------------------------------------------- end get()
+
+    # ------------------------------------------------------------------------- run()
+    def run(self, name: str, operation: Callable[[Any], T], invalidate_on_error: bool = True) -> T:
+        """Run an operation against a component and record cold/warm latency.
+
+        Args:
+            name (str): Registry key of the component.
+            operation (Callable[[Any], T]): Function receiving the component instance.
+            invalidate_on_error (bool): Drop the component if the operation fails with a
+                driver or connection error, so a broken connection is not reused. Other
+                errors are re-raised with the component kept warm. Defaults to True.
+
+        Returns:
+            T: The operation result.
+
+        Examples:
+            >>> registry = get_component_registry()
+            >>> result = registry.run("vector_chain", lambda chain: chain.invoke({"input": q}))
+        """
+        start_time = time.time()
+        instance, built = self._acquire(name)
+        try:
+            return operation(instance)
+        except Exception as e:
+            if invalidate_on_error and is_connection_error(e):
+                self.invalidate(name)
+            raise
+        finally:
+            entry = self._entry(name)
+            elapsed_ms = (time.time() - start_time) * 1000
+            with self._lock:
+                entry.metrics.record_call(elapsed_ms, cold=built)
+    # ------------------------------------------------------------------------- end run()
+
+    # ------------------------------------------------------------------------- arun()
+    async def arun(self, name: str, operation: Callable[[Any], Awaitable[T]],
+                   invalidate_on_error: bool = True) -> T:
+        """Await a coroutine operation against a component and record cold/warm latency.
+
+        A warm component is used directly on the event loop; a cold or stale one is
+        built in the loop's default executor so that slow builds (schema
+        introspection, driver setup) do not block other requests.
+
+        Args:
+            name (str): Registry key of the component.
+            operation (Callable[[Any], Awaitable[T]]): Coroutine function receiving the component instance.
+            invalidate_on_error (bool): Drop the component if the operation fails with a
+                driver or connection error. Defaults to True.
+
+        Returns:
+            T: The operation result.
+
+        Examples:
+            >>> registry = get_component_registry()
+            >>> result = await registry.arun("vector_chain", lambda chain: chain.ainvoke({"input": q}))
+        """
+        start_time = time.time()
+        entry = self._entry(name)
+        instance = entry.instance
+        built = False
+        if instance is None or self._stale_reason(entry, self._current_fingerprint()) is not None:
+            loop = asyncio.get_running_loop()
+            instance, built = await loop.run_in_executor(None, self._acquire, name)
+        try:
+            return await operation(instance)
+        except Exception as e:
+            if invalidate_on_error and is_connection_error(e):
+                self.invalidate(name)
+            raise
+        finally:
+            elapsed_ms = (time.time() - start_time) * 1000
+            with self._lock:
+                entry.metrics.record_call(elapsed_ms, cold=built)
+    # ------------------------------------------------------------------------- end arun()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_status()
+    def get_status(self) -> Dict[str, Any]:
+        """Get build counts and cold/warm latencies for every registered component.
+
+        Returns:
+            Dict[str, Any]: Store generation, age limit and per-component metrics.
+
+        Examples:
+            >>> status = get_component_registry().get_status()
+            >>> print(status["components"]["vector_chain"]["builds"])
+        """
+        with self._lock:
+            generation = self._store_generation
+            components = {
+                entry.name: {"warm": entry.instance is not None, **entry.metrics.to_dict()}
+                for entry in self._components.values()
+            }
+
+        return {
+            "store_generation": generation,
+            "max_age_seconds": self.max_age_seconds,
+            "components": components,
+        }
+    # ------------------------------------------------------------------------- end get_status()
+
+# ------------------------------------------------------------------------- end class ComponentRegistry
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# --------------------------
+# --- Utility Functions ---
+# --------------------------
+
+# ------------------------------------------------------------------------- compute_config_fingerprint()
+def compute_config_fingerprint() -> str:
+    """Fingerprint the settings that determine how retrieval components are built.
+
+    Secrets are hashed together with the other fields, so the fingerprint can be
+    logged or reported without exposing credentials.
+
+    Returns:
+        str: Short SHA-256 hex digest of the relevant configuration values.
+    """
+    config = get_config()
+    material = "|".join(f"{field}={getattr(config, field, None)}" for field in FINGERPRINT_FIELDS)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+# ------------------------------------------------------------------------- end compute_config_fingerprint()
+
+# ------------------------------------------------------------------------- is_connection_error()
+def is_connection_error(error: BaseException) -> bool:
+    """Whether an error, or an error it was raised from, is a driver or connection failure.
+
+    LangChain wraps some driver errors, so the __cause__/__context__ chain is followed.
+
+    Args:
+        error (BaseException): Error raised by a component operation.
+
+    Returns:
+        bool: True for CONNECTION_ERRORS anywhere in the chain.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, CONNECTION_ERRORS):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+# ------------------------------------------------------------------------- end is_connection_error()
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- get_component_registry()
+def get_component_registry() -> ComponentRegistry:
+    """Get the process-wide component registry (singleton).
+
+    Returns:
+        ComponentRegistry: Shared registry instance.
+
+    Examples:
+        >>> registry1 = get_component_registry()
+        >>> registry2 = get_component_registry()  # Same instance
+        >>> assert registry1 is registry2
+    """
+    global _component_registry
+    with _registry_lock:
+        if _component_registry is None:
+            max_age = getattr(get_config(), "component_max_age_seconds", 0)
+            _component_registry = ComponentRegistry(max_age_seconds=max_age)
+        return _component_registry
+# ------------------------------------------------------------------------- end get_component_registry()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,219 @@
+# -------------------------------------------------------------------------
+# File: section_index.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/tools/section_index.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module answers exact-citation questions ("what does 30 CFR § 75.400 say")
+# from the CFR section index built at ingest by build_data/build_hybrid_store.py:
+# one (:Section {id: "75.400"}) node per section number, unique-constrained on id,
+# linked to every chunk that references it by [:MENTIONS_SECTION {count}]. The
+# section numbers in the question are extracted with EnhancedCFRParser, and one
+# indexed Cypher lookup returns the chunks that reference them most, in the chunk
+# format of retrieval-only vector search. The parallel retrieval engine runs it
+# before the VectorRAG and GraphRAG branches, which a hit replaces.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Function: extract_question_sections() - Section numbers cited in a question
+# - Function: lookup_section_chunks() - Indexed chunk lookup for section numbers
+# - Function: alookup_section_chunks() - Asyncio counterpart of lookup_section_chunks()
+# - Function: _to_section_chunks() - Converts lookup records into chunk dictionaries
+# - Constants: SECTION_LOOKUP_CYPHER, SECTION_LOOKUP_MAX_CHUNKS, SECTION_LOOKUP_CHUNKS_PER_SECTION,
+#   SECTION_MATCH_BASE_SCORE
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - typing: Type hints (Any, Dict, List)
+# - Third-Party: None
+# - Local Project Modules:
+#   - ..cfr_compliance_enhanced: get_enhanced_cfr_parser for section number extraction
+#   - ..database: get_database for the synchronous and asyncio Neo4j drivers
+#   - ..tracing: traced for section lookup spans
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# parallel_hybrid.py calls extract_question_sections() and alookup_section_chunks()
+# at the start of retrieve_parallel() when section_lookup_enabled is set. The
+# index must first be built with build_data/build_hybrid_store.py; without it the
+# lookup returns no chunks and the parallel branches run as usual.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+CFR Section Index Lookup for MRCA Exact-Citation Questions
+
+Resolves questions citing specific Title 30 CFR sections straight to the chunks
+that reference those sections, with one lookup on the ingest-time section index.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+from typing import Any, Dict, List
+
+# Local application/library specific imports
+from ..cfr_compliance_enhanced import get_enhanced_cfr_parser
+from ..database import get_database
+from ..tracing import traced
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Chunks returned for a question (matches retrieval-only vector search)
+SECTION_LOOKUP_MAX_CHUNKS = 5
+
+# Chunks kept per cited section, so one popular section cannot crowd out the others
+SECTION_LOOKUP_CHUNKS_PER_SECTION = 3
+
+# Score of a chunk citing a section once; each further reference closes part of the
+# gap to 1.0 (1 reference: 0.75, 3 references: 0.875), independent of other chunks
+SECTION_MATCH_BASE_SCORE = 0.5
+
+# Indexed lookup: a seek on the Section.id uniqueness constraint, then the chunks
+# referencing each section, most references first
+SECTION_LOOKUP_CYPHER = """
+MATCH (s:Section) WHERE s.id IN $sections
+MATCH (s)<-[m:MENTIONS_SECTION]-(c:Chunk)
+WITH s, c, m ORDER BY m.count DESC, c.id
+WITH s, collect({chunk: c, mentions: m.count})[..$per_section] AS ranked
+UNWIND ranked AS hit
+WITH s, hit.chunk AS c, hit.mentions AS mentions
+MATCH (c)-[:PART_OF]->(d:Document)
+RETURN s.id AS section, d.id AS document, c.id AS chunk_id, c.text AS text, mentions,
+       [(c)-[:HAS_ENTITY]->(e:Entity) | e.name] AS entities
+"""
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# --------------------------------------------------------------------------------- extract_question_sections()
+def extract_question_sections(question: str) -> List[str]:
+    """Return the CFR section numbers cited in a question.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+
+    Returns:
+        List[str]: Part-qualified section numbers ("75.400") in order of first
+                   reference; empty when the question cites no section.
+
+    Examples:
+        >>> extract_question_sections("What does 30 CFR § 75.400 say?")
+        ['75.400']
+    """
+    return list(get_enhanced_cfr_parser().extract_section_numbers(question))
+# --------------------------------------------------------------------------------- end extract_question_sections()
+
+# --------------------------------------------------------------------------------- lookup_section_chunks()
+@traced("section_index.lookup")
+def lookup_section_chunks(sections: List[str], limit: int = SECTION_LOOKUP_MAX_CHUNKS) -> List[Dict[str, Any]]:
+    """Retrieve the chunks referencing the given sections with one indexed query.
+
+    Args:
+        sections (List[str]): Section numbers from extract_question_sections().
+        limit (int): Maximum chunks returned. Defaults to SECTION_LOOKUP_MAX_CHUNKS.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks (text, score, document, chunk_id, entities,
+                              section, mentions) in cited-section order.
+
+    Raises:
+        Exception: Any error raised by the database.
+
+    Examples:
+        >>> chunks = lookup_section_chunks(["75.400"])
+        >>> print(chunks[0]["chunk_id"], chunks[0]["mentions"])
+    """
+    if not sections:
+        return []
+    records = get_database().execute_query(
+        SECTION_LOOKUP_CYPHER, {"sections": sections, "per_section": SECTION_LOOKUP_CHUNKS_PER_SECTION}
+    )
+    return _to_section_chunks(records, sections, limit)
+# --------------------------------------------------------------------------------- end lookup_section_chunks()
+
+# --------------------------------------------------------------------------------- alookup_section_chunks()
+@traced("section_index.lookup")
+async def alookup_section_chunks(sections: List[str], limit: int = SECTION_LOOKUP_MAX_CHUNKS) -> List[Dict[str, Any]]:
+    """Retrieve the chunks referencing the given sections on the asyncio driver.
+
+    Asyncio counterpart of lookup_section_chunks() used by the parallel retrieval engine.
+
+    Args:
+        sections (List[str]): Section numbers from extract_question_sections().
+        limit (int): Maximum chunks returned. Defaults to SECTION_LOOKUP_MAX_CHUNKS.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks in cited-section order.
+
+    Raises:
+        Exception: Any error raised by the database.
+    """
+    if not sections:
+        return []
+    records = await get_database().execute_query_async(
+        SECTION_LOOKUP_CYPHER, {"sections": sections, "per_section": SECTION_LOOKUP_CHUNKS_PER_SECTION}
+    )
+    return _to_section_chunks(records, sections, limit)
+# --------------------------------------------------------------------------------- end alookup_section_chunks()
+
+# -------------------------
+# --- Helper Functions ---
+# -------------------------
+
+# --------------------------------------------------------------------------------- _to_section_chunks()
+def _to_section_chunks(records: List[Any], sections: List[str], limit: int) -> List[Dict[str, Any]]:
+    """Convert lookup records into chunk dictionaries, one per chunk.
+
+    Chunks are ordered by the position of their section in the question, then by
+    references; a chunk referencing several cited sections appears once. The score
+    grows with the chunk's own reference count and stays below 1.0, so a section
+    cited once in a single chunk does not look like a perfect match.
+
+    Args:
+        records (List[Any]): neo4j Records returned by SECTION_LOOKUP_CYPHER.
+        sections (List[str]): Cited section numbers in question order.
+        limit (int): Maximum chunks returned.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks with text, score, document, chunk_id, entities,
+                              section and mentions.
+    """
+    rows = [record.data() for record in records]
+    order = {section: position for position, section in enumerate(sections)}
+    rows.sort(key=lambda row: (order.get(row["section"], len(order)), -row["mentions"]))
+
+    chunks: List[Dict[str, Any]] = []
+    seen = set()
+    for row in rows:
+        if row["chunk_id"] in seen:
+            continue
+        seen.add(row["chunk_id"])
+        mentions = max(1, row["mentions"] or 0)
+        chunks.append({
+            "text": row["text"] or "",
+            "score": SECTION_MATCH_BASE_SCORE + (1.0 - SECTION_MATCH_BASE_SCORE) * mentions / (mentions + 1),
+            "document": row["document"],
+            "chunk_id": row["chunk_id"],
+            "entities": [name for name in row.get("entities") or [] if name],
+            "section": row["section"],
+            "mentions": row["mentions"],
+        })
+    return chunks[:limit]
+# --------------------------------------------------------------------------------- end _to_section_chunks()
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -20,20 +20,34 @@
 # - Function: get_neo4j_vector() - Creates Neo4jVector instance with Gemini embeddings
 # - Function: get_vector_retriever() - Creates configured retriever for semantic search
 # - Function: create_vector_chain() - Creates complete vector search chain with LLM processing
+# - Function: get_warm_vector_chain() - Returns the shared vector chain from the component registry
 # - Function: search_regulations_semantic() - Main semantic search function for agent use
+# - Function: asearch_regulations_semantic() - Asyncio semantic search for the parallel engine
 # - Function: search_regulations_detailed() - Detailed search with full metadata and sources
+# - Function: retrieve_regulation_chunks() - Ranked chunks without an answer LLM call (retrieval-only mode)
+# - Function: aretrieve_regulation_chunks() - Asyncio ranked chunk retrieval for the parallel engine
+# - Functions: keyword_search_chunks(), akeyword_search_chunks() - Full-text (Lucene) chunk search
+# - Functions: retrieve_hybrid_chunks(), aretrieve_hybrid_chunks() - Keyword + vector search merged by RRF
+# - Function: reciprocal_rank_fusion() - Merges ranked chunk lists by reciprocal rank
+# - Function: format_regulation_chunks() - Renders ranked chunks as numbered context for fusion
 # - Function: get_vector_tool() - Creates LangChain tool for semantic vector search
 # - Function: test_vector_search() - Test function for development and debugging
 # - Function: check_vector_tool_health() - Health check function for vector search system
 # - Function: get_vector_tool_safe() - Safe vector tool getter with fallback handling
 # - Function: _vector_fallback() - Fallback function when vector search unavailable
+# - Function: _to_chunk() - Converts a scored vector store document into a chunk dictionary
+# - Function: _lucene_query() - Escapes a question for the full-text index query parser
 # - Constant: VECTOR_SEARCH_INSTRUCTIONS - MSHA-specific retrieval instructions template
 # -------------------------------------------------------------------------
 
 # --- Dependencies / Imports ---
 # - Standard Library:
+#   - asyncio: Concurrent keyword and vector search on the asyncio path
 #   - logging: For vector search operation logging and debugging
+#   - re: Escaping questions for the full-text query parser
 #   - time: Performance monitoring and timing operations
+#   - concurrent.futures.ThreadPoolExecutor: Shared pool for concurrent keyword search on the threaded path
+#   - typing: Type hints for structured chunk results (Any, Dict, List)
 # - Third-party:
 #   - langchain_neo4j.Neo4jVector: Neo4j vector database integration
 #   - langchain.chains.combine_documents.create_stuff_documents_chain: Document processing
@@ -43,6 +57,11 @@
 # - Local Project Modules:
 #   - ..llm: get_llm, get_embeddings functions for LLM and embedding access
 #   - ..graph: get_graph function for Neo4j database connection
+#   - ..database: get_database for full-text index queries
+#   - ..embedding_cache: get_embedding_cache for embedding cache statistics
+#   - ..tracing: traced, bind_context for vector search spans
+#   - .registry: get_component_registry for the shared, warm vector chain
+#   - .local_vector_index: get_local_vector_index for in-process top-k chunk search
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
@@ -73,8 +92,12 @@ Parallel Hybrid system's VectorRAG component.
 # Imports
 # =========================================================================
 # Standard library imports
+import asyncio
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 # Third-party library imports
 from langchain_neo4j import Neo4jVector
@@ -85,6 +108,11 @@ from langchain_core.prompts import ChatPromptTemplate
 # Local application/library specific imports
 from ..llm import get_llm, get_embeddings
 from ..graph import get_graph
+from ..database import get_database
+from ..embedding_cache import get_embedding_cache
+from ..tracing import traced, bind_context
+from .registry import get_component_registry
+from .local_vector_index import get_local_vector_index
 
 # =========================================================================
 # Global Constants / Variables
@@ -107,6 +135,40 @@ Context from CFR Title 30 documents:
 {context}
 """
 
+# Component registry key for the shared vector search chain
+VECTOR_CHAIN_COMPONENT = "vector_chain"
+
+# Component registry key for the shared Neo4jVector store (retrieval-only mode)
+VECTOR_STORE_COMPONENT = "vector_store"
+
+# Number of ranked chunks returned by retrieval-only search (matches the chain's retriever)
+VECTOR_CHUNK_K = 5
+
+# Full-text (Lucene) index on Chunk.text created by build_hybrid_store.py
+CHUNK_FULLTEXT_INDEX = "chunkText"
+
+# Candidates taken from each of the keyword and vector rankings before fusion
+HYBRID_CANDIDATE_K = 10
+
+# Reciprocal rank fusion constant: a chunk at rank r of a ranking contributes 1 / (RRF_K + r)
+RRF_K = 60
+
+# Shared pool running threaded-path keyword searches next to the vector search
+# (one search per hybrid request, sized like the parallel engine's pool)
+_keyword_search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="keyword-search")
+
+# Keyword search: BM25-ranked chunks from the full-text index, in the retrieval-only chunk format
+KEYWORD_SEARCH_CYPHER = """
+CALL db.index.fulltext.queryNodes($index, $query, {limit: $k}) YIELD node, score
+MATCH (node)-[:PART_OF]->(d:Document)
+RETURN node.text AS text, score, d.id AS document, node.id AS chunk_id,
+       [(node)-[:HAS_ENTITY]->(e:Entity) | e.name] AS entities
+"""
+
+# Lucene query syntax: special characters and uppercase boolean operators
+_LUCENE_SPECIAL_PATTERN = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+_LUCENE_OPERATOR_PATTERN = re.compile(r"\b(AND|OR|NOT|TO)\b")
+
 # =========================================================================
 # Standalone Function Definitions
 # =========================================================================
@@ -123,6 +185,7 @@ def get_neo4j_vector():
     using consistent 768-dimensional Gemini embeddings for both storage and query
     operations. It connects to the existing vector index in Neo4j created by the
     hybrid store builder and provides semantic similarity search capabilities.
+    Query embeddings go through the shared embedding cache from get_embeddings().
 
     Returns:
         Neo4jVector: Configured Neo4j vector instance for similarity search operations
@@ -232,11 +295,30 @@ def create_vector_chain():
     return vector_search_chain
 # --------------------------------------------------------------------------------- end create_vector_chain()
 
+# --------------------------------------------------------------------------------- get_warm_vector_chain()
+def get_warm_vector_chain():
+    """Return the shared vector search chain, building it on first use.
+
+    The chain is built once per process by the component registry and reused by
+    every request and worker thread until the configuration or the knowledge
+    store changes.
+
+    Returns:
+        BaseChain: Shared vector search chain
+
+    Examples:
+        >>> chain = get_warm_vector_chain()
+        >>> assert chain is get_warm_vector_chain()
+    """
+    return get_component_registry().get(VECTOR_CHAIN_COMPONENT)
+# --------------------------------------------------------------------------------- end get_warm_vector_chain()
+
 # --------------------------------------
 # --- Main Search Interface Functions ---
 # --------------------------------------
 
 # --------------------------------------------------------------------------------- search_regulations_semantic()
+@traced("vector.search_answer")
 def search_regulations_semantic(question: str) -> str:
     """Perform semantic vector search on MSHA regulations using Gemini embeddings.
 
@@ -260,9 +342,11 @@ def search_regulations_semantic(question: str) -> str:
         "Ventilation standards require..."
     """
     try:
-        # Get the vector search chain and invoke
-        vector_chain = create_vector_chain()
-        result = vector_chain.invoke({"input": question})
+        # Invoke the shared, warm vector search chain
+        result = get_component_registry().run(
+            VECTOR_CHAIN_COMPONENT,
+            lambda chain: chain.invoke({"input": question})
+        )
         
         # Return the answer from the chain
         return result.get("answer", "No relevant regulations found.")
@@ -272,6 +356,40 @@ def search_regulations_semantic(question: str) -> str:
         return f"Error during semantic search: {str(e)}"
 # --------------------------------------------------------------------------------- end search_regulations_semantic()
 
+# --------------------------------------------------------------------------------- asearch_regulations_semantic()
+@traced("vector.search_answer")
+async def asearch_regulations_semantic(question: str) -> str:
+    """Perform semantic vector search on MSHA regulations without a worker thread.
+
+    Asyncio counterpart of search_regulations_semantic() used by the parallel
+    retrieval engine. The shared chain is awaited through `ainvoke`, so the LLM
+    call runs on the event loop. Neo4jVector has no native async search, so
+    LangChain runs the similarity search itself in the loop's default executor.
+
+    Unlike search_regulations_semantic(), errors are raised rather than returned
+    as text, so the caller can fall back to the threaded path.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+
+    Returns:
+        str: Comprehensive response including regulatory context
+
+    Raises:
+        Exception: Any error raised while building or invoking the vector chain.
+
+    Examples:
+        >>> result = await asearch_regulations_semantic("What are hard hat requirements?")
+    """
+    result = await get_component_registry().arun(
+        VECTOR_CHAIN_COMPONENT,
+        lambda chain: chain.ainvoke({"input": question})
+    )
+    
+    # Return the answer from the chain
+    return result.get("answer", "No relevant regulations found.")
+# --------------------------------------------------------------------------------- end asearch_regulations_semantic()
+
 # --------------------------------------------------------------------------------- search_regulations_detailed()
 def search_regulations_detailed(question: str) -> dict:
     """Perform detailed semantic vector search with full metadata and source documents.
@@ -300,9 +418,11 @@ def search_regulations_detailed(question: str) -> dict:
         >>> print(f"Answer: {result['answer']}")
     """
     try:
-        # Get the vector chain and invoke it for detailed results
-        vector_chain = create_vector_chain()
-        result = vector_chain.invoke({"input": question})
+        # Invoke the shared, warm vector chain for detailed results
+        result = get_component_registry().run(
+            VECTOR_CHAIN_COMPONENT,
+            lambda chain: chain.invoke({"input": question})
+        )
         
         # Extract answer
         answer = result.get("answer", "No relevant regulations found.")
@@ -352,6 +472,288 @@ def search_regulations_detailed(question: str) -> dict:
         }
 # --------------------------------------------------------------------------------- end search_regulations_detailed()
 
+# --------------------------------------------------------------------------------- retrieve_regulation_chunks()
+@traced("vector.similarity_search")
+def retrieve_regulation_chunks(question: str, k: int = VECTOR_CHUNK_K) -> List[Dict[str, Any]]:
+    """Retrieve ranked regulation chunks without generating an answer.
+
+    Retrieval-only counterpart of search_regulations_semantic(). It runs the same
+    similarity search as the vector chain's retriever but skips the
+    stuff-documents LLM call, so the parallel engine can hand the raw chunks to
+    context fusion and save a full LLM round trip per request. With
+    local_vector_index_enabled, the top k is found in the in-process mirror of
+    the chunk embeddings and only those chunks are read from Neo4j; the Neo4j
+    vector index answers while the mirror is missing or stale.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to VECTOR_CHUNK_K.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks ordered by descending similarity, each with
+                              text, score, document, chunk_id and entities.
+
+    Raises:
+        Exception: Any error raised while building the store or searching.
+
+    Examples:
+        >>> chunks = retrieve_regulation_chunks("What are hard hat requirements?")
+        >>> print(chunks[0]["document"], chunks[0]["score"])
+    """
+    local_index = get_local_vector_index()
+    if local_index is not None:
+        embedding = get_component_registry().run(
+            VECTOR_STORE_COMPONENT,
+            lambda store: store.embedding.embed_query(question)
+        )
+        chunks = local_index.retrieve(embedding, k)
+        if chunks is not None:
+            return chunks
+
+    results = get_component_registry().run(
+        VECTOR_STORE_COMPONENT,
+        lambda store: store.similarity_search_with_score(question, k=k)
+    )
+    return [_to_chunk(doc, score) for doc, score in results]
+# --------------------------------------------------------------------------------- end retrieve_regulation_chunks()
+
+# --------------------------------------------------------------------------------- aretrieve_regulation_chunks()
+@traced("vector.similarity_search")
+async def aretrieve_regulation_chunks(question: str, k: int = VECTOR_CHUNK_K) -> List[Dict[str, Any]]:
+    """Retrieve ranked regulation chunks on the asyncio path.
+
+    Asyncio counterpart of retrieve_regulation_chunks() used by the parallel
+    retrieval engine. Errors are raised so the caller can fall back to the
+    threaded path.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to VECTOR_CHUNK_K.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks ordered by descending similarity.
+
+    Raises:
+        Exception: Any error raised while building the store or searching.
+
+    Examples:
+        >>> chunks = await aretrieve_regulation_chunks("What are hard hat requirements?")
+    """
+    local_index = get_local_vector_index()
+    if local_index is not None:
+        embedding = await get_component_registry().arun(
+            VECTOR_STORE_COMPONENT,
+            lambda store: store.embedding.aembed_query(question)
+        )
+        chunks = await local_index.aretrieve(embedding, k)
+        if chunks is not None:
+            return chunks
+
+    results = await get_component_registry().arun(
+        VECTOR_STORE_COMPONENT,
+        lambda store: store.asimilarity_search_with_score(question, k=k)
+    )
+    return [_to_chunk(doc, score) for doc, score in results]
+# --------------------------------------------------------------------------------- end aretrieve_regulation_chunks()
+
+# --------------------------------------------------------------------------------- keyword_search_chunks()
+@traced("vector.keyword_search")
+def keyword_search_chunks(question: str, k: int = HYBRID_CANDIDATE_K) -> List[Dict[str, Any]]:
+    """Retrieve chunks by keyword from the full-text index on Chunk.text.
+
+    Lucene BM25 ranking finds the exact terms that embeddings blur: section
+    numbers ("75.1714"), acronyms ("SCSR") and units ("cfm").
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to HYBRID_CANDIDATE_K.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks ordered by descending BM25 score, each with
+                              text, score, document, chunk_id and entities.
+
+    Raises:
+        Exception: Any error raised by the database (e.g. the index does not exist).
+
+    Examples:
+        >>> chunks = keyword_search_chunks("SCSR storage")
+        >>> print(chunks[0]["chunk_id"], chunks[0]["score"])
+    """
+    query = _lucene_query(question)
+    if not query:
+        return []
+    records = get_database().execute_query(KEYWORD_SEARCH_CYPHER, {"index": CHUNK_FULLTEXT_INDEX, "query": query, "k": k})
+    return [_to_keyword_chunk(record.data()) for record in records]
+# --------------------------------------------------------------------------------- end keyword_search_chunks()
+
+# --------------------------------------------------------------------------------- akeyword_search_chunks()
+@traced("vector.keyword_search")
+async def akeyword_search_chunks(question: str, k: int = HYBRID_CANDIDATE_K) -> List[Dict[str, Any]]:
+    """Retrieve chunks by keyword from the full-text index on the asyncio driver.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to HYBRID_CANDIDATE_K.
+
+    Returns:
+        List[Dict[str, Any]]: Chunks ordered by descending BM25 score.
+
+    Raises:
+        Exception: Any error raised by the database (e.g. the index does not exist).
+    """
+    query = _lucene_query(question)
+    if not query:
+        return []
+    records = await get_database().execute_query_async(
+        KEYWORD_SEARCH_CYPHER, {"index": CHUNK_FULLTEXT_INDEX, "query": query, "k": k}
+    )
+    return [_to_keyword_chunk(record.data()) for record in records]
+# --------------------------------------------------------------------------------- end akeyword_search_chunks()
+
+# --------------------------------------------------------------------------------- retrieve_hybrid_chunks()
+@traced("vector.hybrid_search")
+def retrieve_hybrid_chunks(question: str, k: int = VECTOR_CHUNK_K) -> List[Dict[str, Any]]:
+    """Retrieve chunks with keyword and vector search merged by reciprocal rank fusion.
+
+    The keyword search runs on the module's shared keyword search pool while the
+    vector search runs on the calling thread. Each contributes HYBRID_CANDIDATE_K candidates, and the fused
+    top k is returned. If the keyword search fails (e.g. a store built without the
+    full-text index), the vector ranking is used alone.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to VECTOR_CHUNK_K.
+
+    Returns:
+        List[Dict[str, Any]]: Fused chunks, best first (see reciprocal_rank_fusion()).
+
+    Raises:
+        Exception: Any error raised by the vector search.
+
+    Examples:
+        >>> chunks = retrieve_hybrid_chunks("How far from the working face are SCSRs stored?")
+        >>> print(chunks[0]["chunk_id"], chunks[0]["retrievers"])
+    """
+    keyword_future = _keyword_search_executor.submit(bind_context(keyword_search_chunks), question,
+                                                     HYBRID_CANDIDATE_K)
+    vector_chunks = retrieve_regulation_chunks(question, k=HYBRID_CANDIDATE_K)
+    try:
+        keyword_chunks = keyword_future.result()
+    except Exception as e:
+        logger.warning(f"Keyword search failed, using vector search only: {e}")
+        keyword_chunks = []
+    return reciprocal_rank_fusion({"vector": vector_chunks, "keyword": keyword_chunks}, limit=k)
+# --------------------------------------------------------------------------------- end retrieve_hybrid_chunks()
+
+# --------------------------------------------------------------------------------- aretrieve_hybrid_chunks()
+@traced("vector.hybrid_search")
+async def aretrieve_hybrid_chunks(question: str, k: int = VECTOR_CHUNK_K) -> List[Dict[str, Any]]:
+    """Retrieve chunks with concurrent keyword and vector search on the asyncio path.
+
+    Asyncio counterpart of retrieve_hybrid_chunks() used by the parallel retrieval
+    engine. Vector search errors are raised so the caller can fall back to the
+    threaded path; keyword search errors fall back to the vector ranking alone.
+
+    Args:
+        question (str): Natural language question about MSHA regulations
+        k (int): Number of chunks to return. Defaults to VECTOR_CHUNK_K.
+
+    Returns:
+        List[Dict[str, Any]]: Fused chunks, best first.
+
+    Raises:
+        Exception: Any error raised by the vector search.
+    """
+    vector_chunks, keyword_chunks = await asyncio.gather(
+        aretrieve_regulation_chunks(question, k=HYBRID_CANDIDATE_K),
+        akeyword_search_chunks(question, HYBRID_CANDIDATE_K),
+        return_exceptions=True
+    )
+    if isinstance(vector_chunks, BaseException):
+        raise vector_chunks
+    if isinstance(keyword_chunks, BaseException):
+        logger.warning(f"Keyword search failed, using vector search only: {keyword_chunks}")
+        keyword_chunks = []
+    return reciprocal_rank_fusion({"vector": vector_chunks, "keyword": keyword_chunks}, limit=k)
+# --------------------------------------------------------------------------------- end aretrieve_hybrid_chunks()
+
+# --------------------------------------------------------------------------------- reciprocal_rank_fusion()
+def reciprocal_rank_fusion(rankings: Dict[str, List[Dict[str, Any]]], limit: int = VECTOR_CHUNK_K,
+                           rrf_k: int = RRF_K, score_ranking: str = "vector") -> List[Dict[str, Any]]:
+    """Merge ranked chunk lists by reciprocal rank fusion.
+
+    Each chunk scores the sum of 1 / (rrf_k + rank) over the rankings that contain
+    it, so chunks found by both keyword and vector search rise to the top without
+    comparing BM25 and cosine scores. Chunks are identified by chunk_id.
+
+    The fused value only orders the chunks. "score" stays the similarity from the
+    score_ranking retriever, because confidence, viability, adaptive weights and the
+    rendered "similarity" all read it as one. A chunk that only other retrievers
+    found gets the lowest similarity in that ranking. It ranked below all of those
+    candidates, so its similarity can be no higher.
+
+    Args:
+        rankings (Dict[str, List[Dict[str, Any]]]): Retriever name -> chunks, best first.
+        limit (int): Maximum chunks returned. Defaults to VECTOR_CHUNK_K.
+        rrf_k (int): Rank constant. Defaults to RRF_K.
+        score_ranking (str): Retriever whose "score" is a similarity. Defaults to "vector".
+
+    Returns:
+        List[Dict[str, Any]]: Chunks by descending fused score. "score" is the similarity
+                              described above, "rrf_score" the fused score and
+                              "retrievers" the rankings that contained the chunk.
+
+    Examples:
+        >>> fused = reciprocal_rank_fusion({"vector": [a, b], "keyword": [b, c]}, limit=2)
+        >>> [chunk["chunk_id"] for chunk in fused]
+        ['b', 'a']
+    """
+    reference = rankings.get(score_ranking) or []
+    similarities = {chunk["chunk_id"]: chunk["score"] for chunk in reference}
+    floor_similarity = min(similarities.values(), default=0.0)
+
+    fused: Dict[str, Dict[str, Any]] = {}
+    for retriever, chunks in rankings.items():
+        for rank, chunk in enumerate(chunks, start=1):
+            entry = fused.setdefault(chunk["chunk_id"], {
+                **chunk,
+                "score": similarities.get(chunk["chunk_id"], floor_similarity),
+                "rrf_score": 0.0,
+                "retrievers": []
+            })
+            entry["rrf_score"] += 1.0 / (rrf_k + rank)
+            entry["retrievers"].append(retriever)
+
+    return sorted(fused.values(), key=lambda chunk: chunk["rrf_score"], reverse=True)[:limit]
+# --------------------------------------------------------------------------------- end reciprocal_rank_fusion()
+
+# --------------------------------------------------------------------------------- format_regulation_chunks()
+def format_regulation_chunks(chunks: List[Dict[str, Any]]) -> str:
+    """Render ranked chunks as numbered, source-labelled context.
+
+    The rendering keeps each chunk's document, chunk id and similarity score next
+    to its text so fusion and response templates can cite the source directly.
+
+    Args:
+        chunks (List[Dict[str, Any]]): Chunks from retrieve_regulation_chunks().
+
+    Returns:
+        str: Numbered passages, or an empty string when there are no chunks.
+
+    Examples:
+        >>> print(format_regulation_chunks(retrieve_regulation_chunks("roof bolting")))
+        [1] 30 CFR Part 75 (chunk 75-12, similarity 0.91)
+        ...
+    """
+    passages = []
+    for rank, chunk in enumerate(chunks, start=1):
+        header = f"[{rank}] {chunk['document']} (chunk {chunk['chunk_id']}, similarity {chunk['score']:.2f})"
+        if chunk["entities"]:
+            header += f"\nEntities: {', '.join(chunk['entities'][:8])}"
+        passages.append(f"{header}\n{chunk['text'].strip()}")
+    return "\n\n".join(passages)
+# --------------------------------------------------------------------------------- end format_regulation_chunks()
+
 # -------------------------------
 # --- Agent Integration Tools ---
 # -------------------------------
@@ -486,7 +888,8 @@ def check_vector_tool_health() -> dict:
         "metrics": {
             "last_check": None,
             "response_time_ms": 0,
-            "index_node_count": 0
+            "index_node_count": 0,
+            "embedding_cache": {}
         },
         "errors": []
     }
@@ -538,6 +941,12 @@ def check_vector_tool_health() -> dict:
             health_status["components"]["retrieval"] = "error"
             health_status["errors"].append(f"Retrieval: {str(e)}")
             
+        # Report embedding cache effectiveness
+        try:
+            health_status["metrics"]["embedding_cache"] = get_embedding_cache().get_stats()
+        except Exception as e:
+            health_status["errors"].append(f"Embedding cache: {str(e)}")
+            
         # Calculate response time
         health_status["metrics"]["response_time_ms"] = int((time.time() - start_time) * 1000)
         health_status["metrics"]["last_check"] = time.time()
@@ -621,9 +1030,76 @@ def _vector_fallback(question: str) -> str:
     )
 # --------------------------------------------------------------------------------- end _vector_fallback()
 
+# -------------------------
+# --- Helper Functions ---
+# -------------------------
+
+# --------------------------------------------------------------------------------- _to_chunk()
+def _to_chunk(doc, score: float) -> Dict[str, Any]:
+    """Convert a scored Neo4jVector document into a structured chunk dictionary.
+
+    Args:
+        doc: LangChain Document returned by the vector store.
+        score (float): Similarity score from the vector index.
+
+    Returns:
+        Dict[str, Any]: Chunk with text, score, document, chunk_id and entity names.
+    """
+    metadata = doc.metadata if hasattr(doc, 'metadata') else {}
+    entities = metadata.get("entities", []) or []
+    return {
+        "text": doc.page_content if hasattr(doc, 'page_content') else str(doc),
+        "score": float(score),
+        "document": metadata.get("document", "Unknown"),
+        "chunk_id": metadata.get("chunk_id", "Unknown"),
+        "entities": [entity.get("name", "") if isinstance(entity, dict) else str(entity) for entity in entities],
+    }
+# --------------------------------------------------------------------------------- end _to_chunk()
+
+# --------------------------------------------------------------------------------- _to_keyword_chunk()
+def _to_keyword_chunk(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a keyword search record into a structured chunk dictionary.
+
+    Args:
+        row (Dict[str, Any]): Record data returned by KEYWORD_SEARCH_CYPHER.
+
+    Returns:
+        Dict[str, Any]: Chunk with text, score (BM25), document, chunk_id and entity names.
+    """
+    return {
+        "text": row["text"] or "",
+        "score": float(row["score"]),
+        "document": row["document"] or "Unknown",
+        "chunk_id": row["chunk_id"] or "Unknown",
+        "entities": [name for name in row.get("entities") or [] if name],
+    }
+# --------------------------------------------------------------------------------- end _to_keyword_chunk()
+
+# --------------------------------------------------------------------------------- _lucene_query()
+def _lucene_query(question: str) -> str:
+    """Escape a question for the full-text index query parser.
+
+    Special characters are escaped and boolean operators lowercased, so the question
+    is searched as plain terms (any term may match; BM25 ranks chunks with more and
+    rarer terms first). The index analyzer removes stop words.
+
+    Args:
+        question (str): Natural language question.
+
+    Returns:
+        str: Lucene query string, or an empty string if the question has no terms.
+    """
+    query = _LUCENE_OPERATOR_PATTERN.sub(lambda match: match.group().lower(), question)
+    return _LUCENE_SPECIAL_PATTERN.sub(r"\\\1", query).strip()
+# --------------------------------------------------------------------------------- end _lucene_query()
+
 # =========================================================================
 # Module Initialization / Main Execution Guard
 # =========================================================================
+# Register the vector chain and vector store factories; both are built lazily on first use.
+get_component_registry().register(VECTOR_CHAIN_COMPONENT, create_vector_chain)
+get_component_registry().register(VECTOR_STORE_COMPONENT, get_neo4j_vector)
+
 # This block runs only when the file is executed directly, not when imported.
 # It serves as a testing entry point for the VectorRAG functionality, allowing
 # the module to be used both as an importable component and as a standalone
@@ -0,0 +1,599 @@
+# -------------------------------------------------------------------------
+# File: tracing.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/tracing.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module provides lightweight span-based tracing for the MRCA request
+# pipeline. A trace is started per answered question; nested spans record
+# where the time goes (parallel retrieval, each branch, GraphRAG fallback
+# strategies, embedding calls, Neo4j queries, Cypher generation, context
+# fusion, prompt construction and the final LLM call). Finished traces are
+# summarized in the response metadata and can be exported in OTLP/JSON format
+# to a local file (one ExportTraceServiceRequest per line) or an OTLP/HTTP
+# collector, without adding an OpenTelemetry dependency.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: Span - One timed operation with attributes and status
+# - Class: Trace - Spans of one request, with summary() and OTLP/JSON conversion
+# - Class: TraceExporterStats - Export counters
+# - Class: OTLPJsonExporter - Background exporter to a JSON-lines file and/or OTLP/HTTP endpoint
+# - Function: start_trace() - Context manager starting a request trace
+# - Function: span() - Context manager recording a child span of the current span
+# - Function: traced() - Decorator recording a span around a sync or async function
+# - Function: bind_context() - Carries the current trace into thread pool work
+# - Function: set_span_attribute() - Annotates the current span
+# - Function: get_trace_exporter() - Singleton exporter configured from BackendConfig
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - contextvars: Current trace and span across asyncio tasks
+#   - functools: Decorator and context binding helpers
+#   - inspect: Detecting coroutine functions in traced()
+#   - json, urllib.request: OTLP/JSON serialization and HTTP export
+#   - logging: Export error logging
+#   - os, queue, threading: Background export worker and thread-safe state
+#   - time: Span timestamps
+#   - contextlib, dataclasses, typing: Context managers, data structures, type hints
+# - Local Project Modules:
+#   - .config.get_config: Tracing settings from BackendConfig
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# main.py wraps each answered question in start_trace() and adds
+# trace.summary() to metadata["tracing"]. Pipeline modules mark stages with
+# @traced("name") or `with span("name"):`; both are no-ops outside a trace.
+# Work sent to a thread pool must be wrapped with bind_context() so its spans
+# join the request's trace. Set tracing_export_path and/or
+# tracing_otlp_endpoint (e.g. http://localhost:4318/v1/traces) to export.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Span-Based Request Tracing for the MRCA Pipeline
+
+Records nested stage timings per request, summarizes them for the response
+metadata, and exports them in OTLP/JSON format.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Local application/library specific imports
+try:
+    # Try relative imports first (when run as module)
+    from .config import get_config
+except ImportError:
+    # Fall back to absolute imports (when run directly from backend directory)
+    from config import get_config
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# OTLP instrumentation scope name and span kind (SPAN_KIND_INTERNAL)
+INSTRUMENTATION_SCOPE = "mrca.tracing"
+OTLP_SPAN_KIND_INTERNAL = 1
+
+# OTLP status codes
+OTLP_STATUS_OK = 1
+OTLP_STATUS_ERROR = 2
+
+# Traces waiting for export; beyond this they are dropped rather than slowing requests
+EXPORT_QUEUE_SIZE = 1000
+
+# Current trace and span of the running task or thread
+_current_trace: contextvars.ContextVar[Optional['Trace']] = contextvars.ContextVar("mrca_trace", default=None)
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar("mrca_span", default=None)
+
+# Global exporter instance and thread lock for singleton pattern
+_trace_exporter: Optional['OTLPJsonExporter'] = None
+_trace_exporter_lock = threading.Lock()
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class Span
+@dataclass
+class Span:
+    """One timed operation in a trace.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        name (str): Stage name, e.g. "retrieve_parallel" or "neo4j.query".
+        span_id (str): 16 hex digit span identifier.
+        parent_id (Optional[str]): Parent span identifier (None for the root span).
+        start_ns (int): Start time in Unix nanoseconds.
+        end_ns (int): End time in Unix nanoseconds (0 while running).
+        attributes (Dict[str, Any]): Scalar annotations.
+        error (Optional[str]): Exception message if the operation raised.
+
+    Methods:
+        duration_ms(): Elapsed time in milliseconds.
+    """
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    # ------------------------------------------------------------------------- duration_ms()
+    def duration_ms(self) -> float:
+        """Elapsed time in milliseconds (up to now for a running span)."""
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1_000_000
+    # ------------------------------------------------------------------------- end duration_ms()
+# ------------------------------------------------------------------------- end class Span
+
+# ------------------------------------------------------------------------- class Trace
+class Trace:
+    """Spans recorded for one request.
+
+    Spans may finish on worker threads, so recording is lock protected.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        trace_id (str): 32 hex digit trace identifier.
+        root (Span): Root span created by start_trace().
+        spans (List[Span]): Finished spans in completion order.
+
+    Methods:
+        record(): Add a finished span.
+        summary(): Per-stage counts and durations for response metadata.
+        to_otlp(): OTLP/JSON ResourceSpans for export.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        """Start a trace with its root span.
+
+        Args:
+            name (str): Root span name.
+            attributes (Optional[Dict[str, Any]]): Root span attributes.
+        """
+        self.trace_id = os.urandom(16).hex()
+        self.root = Span(name, _new_span_id(), None, time.time_ns(), attributes=dict(attributes or {}))
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- record()
+    def record(self, finished: Span) -> None:
+        """Add a finished span."""
+        with self._lock:
+            self.spans.append(finished)
+    # ------------------------------------------------------------------------- end record()
+
+    # ------------------------------------------------------------------------- summary()
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the trace for response metadata.
+
+        Stages are listed in order of first start. total_ms is the sum of all
+        spans of that name, which can exceed the request time for stages that
+        run concurrently (e.g. GraphRAG fallback strategies).
+
+        Returns:
+            Dict[str, Any]: trace_id, total_ms and {name: {count, total_ms, max_ms, errors}}.
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda recorded: recorded.start_ns)
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for recorded in spans:
+            duration = recorded.duration_ms()
+            stage = stages.setdefault(recorded.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "errors": 0})
+            stage["count"] += 1
+            stage["total_ms"] += duration
+            stage["max_ms"] = max(stage["max_ms"], duration)
+            stage["errors"] += 1 if recorded.error else 0
+
+        for stage in stages.values():
+            stage["total_ms"] = round(stage["total_ms"], 1)
+            stage["max_ms"] = round(stage["max_ms"], 1)
+
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": round(self.root.duration_ms(), 1),
+            "stages": stages
+        }
+    # ------------------------------------------------------------------------- end summary()
+
+    # ------------------------------------------------------------------------- to_otlp()
+    def to_otlp(self, service_name: str) -> Dict[str, Any]:
+        """Convert the trace to an OTLP/JSON ExportTraceServiceRequest.
+
+        Args:
+            service_name (str): Value of the service.name resource attribute.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable OTLP payload.
+        """
+        with self._lock:
+            spans = [self.root] + list(self.spans)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": service_name})},
+                "scopeSpans": [{
+                    "scope": {"name": INSTRUMENTATION_SCOPE},
+                    "spans": [self._otlp_span(recorded) for recorded in spans]
+                }]
+            }]
+        }
+    # ------------------------------------------------------------------------- end to_otlp()
+
+    # ------------------------------------------------------------------------- _otlp_span()
+    def _otlp_span(self, recorded: Span) -> Dict[str, Any]:
+        """Convert one span to OTLP/JSON (ids as hex, times as decimal strings)."""
+        otlp_span = {
+            "traceId": self.trace_id,
+            "spanId": recorded.span_id,
+            "name": recorded.name,
+            "kind": OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(recorded.start_ns),
+            "endTimeUnixNano": str(recorded.end_ns or time.time_ns()),
+            "attributes": _otlp_attributes(recorded.attributes),
+            "status": (
+                {"code": OTLP_STATUS_ERROR, "message": recorded.error}
+                if recorded.error else {"code": OTLP_STATUS_OK}
+            )
+        }
+        if recorded.parent_id:
+            otlp_span["parentSpanId"] = recorded.parent_id
+        return otlp_span
+    # ------------------------------------------------------------------------- end _otlp_span()
+# ------------------------------------------------------------------------- end class Trace
+
+# ------------------------------------------------------------------------- class TraceExporterStats
+@dataclass
+class TraceExporterStats:
+    """Counters for trace export.
+
+    Instance Attributes:
+        exported (int): Traces written or sent successfully.
+        dropped (int): Traces dropped because the export queue was full.
+        export_errors (int): Failed file writes or collector requests.
+    """
+    exported: int = 0
+    dropped: int = 0
+    export_errors: int = 0
+# ------------------------------------------------------------------------- end class TraceExporterStats
+
+# ------------------------------------------------------------------------- class OTLPJsonExporter
+class OTLPJsonExporter:
+    """Exports finished traces in OTLP/JSON from a background thread.
+
+    Each trace becomes one ExportTraceServiceRequest, appended as a line to the
+    export file and/or POSTed to an OTLP/HTTP collector (Content-Type
+    application/json). Requests never wait for export; when the queue is full
+    traces are dropped and counted.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        file_path (Optional[str]): JSON-lines export file.
+        endpoint (Optional[str]): OTLP/HTTP traces endpoint, e.g. http://localhost:4318/v1/traces.
+        service_name (str): service.name resource attribute.
+        stats (TraceExporterStats): Export counters.
+
+    Methods:
+        export(): Queue a finished trace for export.
+        flush(): Wait until queued traces are exported.
+        get_stats(): Export counters and queue depth.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, file_path: Optional[str] = None, endpoint: Optional[str] = None,
+                 service_name: str = "mrca-backend", timeout_seconds: float = 5.0) -> None:
+        """Start the export worker.
+
+        Args:
+            file_path (Optional[str]): JSON-lines export file (parent directories are created).
+            endpoint (Optional[str]): OTLP/HTTP traces endpoint.
+            service_name (str): service.name resource attribute.
+            timeout_seconds (float): Collector request timeout.
+        """
+        self.file_path = file_path
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout_seconds = timeout_seconds
+        self.stats = TraceExporterStats()
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+
+        if file_path and os.path.dirname(file_path):
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        self._worker = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._worker.start()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- export()
+    def export(self, trace: Trace) -> None:
+        """Queue a finished trace for export (never blocks)."""
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.stats.dropped += 1
+    # ------------------------------------------------------------------------- end export()
+
+    # ------------------------------------------------------------------------- flush()
+    def flush(self) -> None:
+        """Block until every queued trace has been exported."""
+        self._queue.join()
+    # ------------------------------------------------------------------------- end flush()
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get export counters and destinations.
+
+        Returns:
+            Dict[str, Any]: Counters, queue depth, file path and endpoint.
+        """
+        return {
+            **asdict(self.stats),
+            "queued": self._queue.qsize(),
+            "file_path": self.file_path,
+            "endpoint": self.endpoint
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+    # ------------------------------------------------------------------------- _run()
+    def _run(self) -> None:
+        """Worker loop writing and sending queued traces."""
+        while True:
+            trace = self._queue.get()
+            try:
+                payload = json.dumps(trace.to_otlp(self.service_name), default=str)
+                if self.file_path:
+                    with open(self.file_path, "a", encoding="utf-8") as export_file:
+                        export_file.write(payload + "\n")
+                if self.endpoint:
+                    request = urllib.request.Request(
+                        self.endpoint, data=payload.encode("utf-8"),
+                        headers={"Content-Type": "application/json"}, method="POST"
+                    )
+                    with urllib.request.urlopen(request, timeout=self.timeout_seconds):
+                        pass
+                self.stats.exported += 1
+            except Exception as e:
+                self.stats.export_errors += 1
+                logger.warning(f"⚠️ Trace export failed: {e}")
+            finally:
+                self._queue.task_done()
+    # ------------------------------------------------------------------------- end _run()
+# ------------------------------------------------------------------------- end class OTLPJsonExporter
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# --------------------------
+# --- Utility Functions ---
+# --------------------------
+
+# ------------------------------------------------------------------------- _new_span_id()
+def _new_span_id() -> str:
+    """Random 16 hex digit span identifier."""
+    return os.urandom(8).hex()
+# ------------------------------------------------------------------------- end _new_span_id()
+
+# ------------------------------------------------------------------------- _otlp_attributes()
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert scalar attributes to OTLP/JSON KeyValue entries."""
+    converted = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+        converted.append({"key": key, "value": otlp_value})
+    return converted
+# ------------------------------------------------------------------------- end _otlp_attributes()
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- start_trace()
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Optional[Trace]]:
+    """Start a request trace whose root span covers the with-block.
+
+    The finished trace is queued for export when an exporter is configured.
+
+    Args:
+        name (str): Root span name.
+        **attributes: Root span attributes.
+
+    Yields:
+        Optional[Trace]: The trace, or None if tracing is disabled.
+
+    Examples:
+        >>> with start_trace("answer_request") as trace:
+        ...     await pipeline()
+        >>> metadata["tracing"] = trace.summary()
+    """
+    if not getattr(get_config(), "tracing_enabled", True):
+        yield None
+        return
+
+    trace = Trace(name, attributes)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.root.error = str(e) or type(e).__name__
+        raise
+    finally:
+        trace.root.end_ns = time.time_ns()
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        exporter = get_trace_exporter()
+        if exporter is not None:
+            exporter.export(trace)
+# ------------------------------------------------------------------------- end start_trace()
+
+# ------------------------------------------------------------------------- span()
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Record a child span of the current span around the with-block.
+
+    A no-op (yielding None) outside a trace.
+
+    Args:
+        name (str): Stage name.
+        **attributes: Span attributes.
+
+    Yields:
+        Optional[Span]: The running span, or None outside a trace.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(name, _new_span_id(), parent.span_id if parent else None, time.time_ns(),
+                   attributes=dict(attributes))
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = str(e) or type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        trace.record(current)
+# ------------------------------------------------------------------------- end span()
+
+# ------------------------------------------------------------------------- traced()
+def traced(name: str) -> Callable:
+    """Decorator recording a span around each call of a sync or async function.
+
+    Args:
+        name (str): Stage name.
+
+    Returns:
+        Callable: Decorator.
+
+    Examples:
+        >>> @traced("fuse_contexts")
+        ... async def fuse_contexts(...): ...
+    """
+    def decorator(function: Callable) -> Callable:
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+# ------------------------------------------------------------------------- end traced()
+
+# ------------------------------------------------------------------------- bind_context()
+def bind_context(function: Callable) -> Callable:
+    """Bind a callable to the current context so thread pool work joins the trace.
+
+    loop.run_in_executor() does not copy context variables; wrap the submitted
+    callable with this function instead.
+
+    Args:
+        function (Callable): Callable to run on another thread.
+
+    Returns:
+        Callable: Callable running in a copy of the current context.
+    """
+    return functools.partial(contextvars.copy_context().run, function)
+# ------------------------------------------------------------------------- end bind_context()
+
+# ------------------------------------------------------------------------- set_span_attribute()
+def set_span_attribute(key: str, value: Any) -> None:
+    """Annotate the current span (no-op outside a trace)."""
+    current = _current_span.get()
+    if current is not None and _current_trace.get() is not None:
+        current.attributes[key] = value
+# ------------------------------------------------------------------------- end set_span_attribute()
+
+# ------------------------------------------------------------------------- get_trace_exporter()
+def get_trace_exporter() -> Optional[OTLPJsonExporter]:
+    """Get the process-wide OTLP/JSON trace exporter (singleton).
+
+    Returns:
+        Optional[OTLPJsonExporter]: The exporter, or None if neither
+                                    tracing_export_path nor tracing_otlp_endpoint is set.
+    """
+    global _trace_exporter
+
+    config = get_config()
+    file_path = getattr(config, "tracing_export_path", "") or None
+    endpoint = getattr(config, "tracing_otlp_endpoint", "") or None
+    if not (file_path or endpoint):
+        return None
+
+    if _trace_exporter is None:
+        with _trace_exporter_lock:
+            if _trace_exporter is None:
+                _trace_exporter = OTLPJsonExporter(
+                    file_path=file_path,
+                    endpoint=endpoint,
+                    service_name=getattr(config, "tracing_service_name", "mrca-backend")
+                )
+                logger.info(f"✅ Trace export enabled: {file_path or ''} {endpoint or ''}".rstrip())
+    return _trace_exporter
+# ------------------------------------------------------------------------- end get_trace_exporter()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,423 @@
+# -------------------------------------------------------------------------
+# File: two_tier_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: backend/two_tier_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# This module provides the storage shared by the MRCA embedding and generated-Cypher
+# caches: a bounded in-memory LRU in front of a SQLite table. The SQLite tier runs in
+# WAL mode so all uvicorn workers on the host share it, evicts least recently used
+# rows in batches when it exceeds its bound, and buffers last-used updates from disk
+# hits so reads do not commit. SQLite failures are counted and logged, and the store
+# keeps working with the memory tier only.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: TwoTierStoreStats - Hit/miss/eviction/error counters dataclass
+# - Class: TwoTierStore - Memory LRU tier plus optional SQLite tier
+# - Constants: DISK_EVICTION_FRACTION, LAST_USED_FLUSH_BATCH - Disk tier tuning
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - logging: Disk tier logging
+#   - os: Cache directory creation
+#   - sqlite3: Persistent, multi-process tier
+#   - time: Last-used timestamps for disk eviction
+#   - collections.OrderedDict: In-memory LRU tier
+#   - dataclasses: Counter data structure
+#   - threading.Lock: Thread-safe tier access
+#   - typing: Type hints (Any, Callable, Dict, Optional)
+# - Third-Party: None
+# - Local Project Modules: None
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# embedding_cache.EmbeddingCache and cypher_cache.CypherQueryCache each own one
+# TwoTierStore (tables "embeddings" and "generated_cypher") and add their own
+# keys, value encoding and statistics on top.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Two-Tier (Memory LRU + SQLite) Store for MRCA Caches
+
+Key/value storage with a bounded memory LRU and a bounded SQLite table shared
+across worker processes, used by the embedding and generated-Cypher caches.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Logger for this module
+logger = logging.getLogger(__name__)
+
+# Fraction of the disk tier removed when it exceeds its size bound
+DISK_EVICTION_FRACTION = 0.1
+
+# Disk hits whose last-used time is buffered before one batched UPDATE
+LAST_USED_FLUSH_BATCH = 256
+
+# Columns of every disk tier table (an older layout is dropped and recreated)
+TABLE_COLUMNS = ("key", "value", "info", "last_used")
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class TwoTierStoreStats
+@dataclass
+class TwoTierStoreStats:
+    """Counters for two-tier store activity.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        memory_hits (int): Lookups served by the in-memory LRU.
+        disk_hits (int): Lookups served by the SQLite tier.
+        misses (int): Lookups found in neither tier.
+        memory_evictions (int): Entries evicted from the in-memory LRU.
+        disk_evictions (int): Entries evicted from the SQLite tier.
+        disk_errors (int): SQLite read/write failures (the store degrades to memory only).
+
+    Methods:
+        None
+    """
+
+    # ----------------------
+    # --- Class Variable ---
+    # ----------------------
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+    disk_errors: int = 0
+
+# ------------------------------------------------------------------------- end class TwoTierStoreStats
+
+# ------------------------------------------------------------------------- class TwoTierStore
+class TwoTierStore:
+    """Bounded memory LRU in front of a bounded SQLite table.
+
+    Values are kept decoded in memory and encoded on disk (encode/decode default
+    to storing the value as is). Disk hits are promoted into memory; their
+    last-used time is buffered and written with the next disk write, or once
+    LAST_USED_FLUSH_BATCH hits accumulate.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        name (str): Cache name used in log messages.
+        table (str): SQLite table name.
+        max_memory_entries (int): Maximum entries kept in memory.
+        max_disk_entries (int): Maximum entries kept on disk.
+        db_path (Optional[str]): SQLite database path, or None for memory only.
+        stats (TwoTierStoreStats): Hit/miss/eviction counters.
+        _encode (Callable[[Any], Any]): Value to SQLite value.
+        _decode (Callable[[Any], Any]): SQLite value to value.
+        _memory (OrderedDict): LRU of key -> value.
+        _lock (Lock): Protects the memory tier and counters.
+        _disk_lock (Lock): Serializes use of the shared SQLite connection.
+        _conn (Optional[sqlite3.Connection]): SQLite connection, None if disabled.
+        _pending_last_used (Dict[str, float]): Disk hits not yet written back for eviction order.
+
+    Methods:
+        get(): Look up a value in memory, then on disk.
+        put(): Store a value in both tiers.
+        delete(): Remove a key from both tiers.
+        clear(): Empty both tiers.
+        get_stats(): Get counters and tier sizes.
+    """
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, name: str, table: str, max_memory_entries: int, db_path: Optional[str] = None,
+                 max_disk_entries: int = 50000, encode: Optional[Callable[[Any], Any]] = None,
+                 decode: Optional[Callable[[Any], Any]] = None) -> None:
+        """Initialize the store and open the SQLite tier if a path is given.
+
+        Args:
+            name (str): Cache name used in log messages.
+            table (str): SQLite table name.
+            max_memory_entries (int): Memory LRU bound.
+            db_path (Optional[str]): SQLite file path. None disables the disk tier.
+            max_disk_entries (int): Disk tier bound. Defaults to 50000.
+            encode (Optional[Callable[[Any], Any]]): Converts values for SQLite. Defaults to identity.
+            decode (Optional[Callable[[Any], Any]]): Converts SQLite values back. Defaults to identity.
+        """
+        self.name = name
+        self.table = table
+        self.max_memory_entries = max(1, max_memory_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self.db_path = db_path
+        self.stats = TwoTierStoreStats()
+        self._encode = encode or (lambda value: value)
+        self._decode = decode or (lambda value: value)
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._disk_lock = Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_last_used: Dict[str, float] = {}
+
+        if db_path:
+            self._open_disk_tier(db_path)
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ---------------------------------------------
+    # --- Internal/Private Methods ---
+    # ---------------------------------------------
+
+    # ------------------------------------------------------------------------- _open_disk_tier()
+    def _open_disk_tier(self, db_path: str) -> None:
+        """Open (and create if needed) the SQLite table."""
+        try:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            columns = tuple(row[1] for row in conn.execute(f"PRAGMA table_info({self.table})"))
+            if columns and columns != TABLE_COLUMNS:
+                # Cache contents are disposable: replace a table with an older layout
+                conn.execute(f"DROP TABLE {self.table}")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " info TEXT NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.table}_last_used ON {self.table}(last_used)")
+            conn.commit()
+            self._conn = conn
+            logger.info(f"✅ {self.name} disk tier ready at {db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ {self.name} disk tier unavailable ({db_path}): {e}")
+            self._conn = None
+    # ------------------------------------------------------------------------- end _open_disk_tier()
+
+    # ------------------------------------------------------------------------- _remember()
+    def _remember(self, key: str, value: Any) -> None:
+        """Insert into the memory LRU, evicting the least recently used entries."""
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                self.stats.memory_evictions += 1
+    # ------------------------------------------------------------------------- end _remember()
+
+    # ------------------------------------------------------------------------- _disk_execute()
+    def _disk_execute(self, operation: Callable[[sqlite3.Connection], Any], commit: bool = True) -> Any:
+        """Run an operation on the SQLite connection, counting and logging failures."""
+        if self._conn is None:
+            return None
+        try:
+            with self._disk_lock:
+                result = operation(self._conn)
+                if commit:
+                    self._conn.commit()
+            return result
+        except sqlite3.Error as e:
+            with self._lock:
+                self.stats.disk_errors += 1
+            logger.warning(f"⚠️ {self.name} disk operation failed: {e}")
+            return None
+    # ------------------------------------------------------------------------- end _disk_execute()
+
+    # ------------------------------------------------------------------------- _flush_last_used()
+    def _flush_last_used(self, conn: sqlite3.Connection) -> None:
+        """Write buffered last-used times in one statement (caller holds _disk_lock and commits)."""
+        if self._pending_last_used:
+            pending = [(last_used, key) for key, last_used in self._pending_last_used.items()]
+            self._pending_last_used.clear()
+            conn.executemany(f"UPDATE {self.table} SET last_used = ? WHERE key = ?", pending)
+    # ------------------------------------------------------------------------- end _flush_last_used()
+
+    # ------------------------------------------------------------------------- _disk_get()
+    def _disk_get(self, key: str) -> Any:
+        """Read an encoded value from the SQLite tier, buffering its last-used time."""
+        def read(conn):
+            row = conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._pending_last_used[key] = time.time()
+            if len(self._pending_last_used) >= LAST_USED_FLUSH_BATCH:
+                self._flush_last_used(conn)
+                conn.commit()
+            return row[0]
+
+        return self._disk_execute(read, commit=False)
+    # ------------------------------------------------------------------------- end _disk_get()
+
+    # ---------------------------
+    # --- Setters / Mutators ---
+    # ---------------------------
+
+    # ------------------------------------------------------------------------- put()
+    def put(self, key: str, value: Any, info: str = "") -> None:
+        """Store a value in the memory and disk tiers, enforcing both size bounds.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to store.
+            info (str): Diagnostic text stored next to the value on disk. Defaults to "".
+        """
+        self._remember(key, value)
+
+        def write(conn):
+            self._flush_last_used(conn)
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, info, last_used) VALUES (?, ?, ?, ?)",
+                (key, self._encode(value), info, time.time())
+            )
+            count = conn.execute(f"SELECT count(*) FROM {self.table}").fetchone()[0]
+            if count <= self.max_disk_entries:
+                return 0
+            batch = count - self.max_disk_entries + int(self.max_disk_entries * DISK_EVICTION_FRACTION)
+            return conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY last_used ASC LIMIT ?)",
+                (batch,)
+            ).rowcount
+
+        evicted = self._disk_execute(write)
+        if evicted:
+            with self._lock:
+                self.stats.disk_evictions += evicted
+    # ------------------------------------------------------------------------- end put()
+
+    # ------------------------------------------------------------------------- delete()
+    def delete(self, key: str) -> None:
+        """Remove a key from both tiers.
+
+        Args:
+            key (str): Cache key.
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+
+        def remove(conn):
+            self._pending_last_used.pop(key, None)
+            conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+        self._disk_execute(remove)
+    # ------------------------------------------------------------------------- end delete()
+
+    # ------------------------------------------------------------------------- clear()
+    def clear(self) -> None:
+        """Empty both tiers without resetting the counters."""
+        with self._lock:
+            self._memory.clear()
+
+        def remove_all(conn):
+            self._pending_last_used.clear()
+            conn.execute(f"DELETE FROM {self.table}")
+
+        self._disk_execute(remove_all)
+    # ------------------------------------------------------------------------- end clear()
+
+    # -------------------------------------------
+    # --- Getters / Accessors ---
+    # -------------------------------------------
+
+    # ------------------------------------------------------------------------- get()
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a value in memory, then on disk, counting the outcome.
+
+        Disk hits are promoted into the memory tier.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[Any]: Stored value, or None on a miss.
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return value
+
+        stored = self._disk_get(key)
+        if stored is not None:
+            value = self._decode(stored)
+            self._remember(key, value)
+            with self._lock:
+                self.stats.disk_hits += 1
+            return value
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+    # ------------------------------------------------------------------------- end get()
+
+    # ---------------------------------------------------------------------
+    # --- Class Information Methods (Optional, but highly recommended) ---
+    # ---------------------------------------------------------------------
+
+    # ------------------------------------------------------------------------- get_stats()
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and tier sizes.
+
+        Returns:
+            Dict[str, Any]: Counters, memory and disk entry counts and bounds.
+        """
+        disk_entries = self._disk_execute(
+            lambda conn: conn.execute(f"SELECT count(*) FROM {self.table}").fetchone()[0], commit=False
+        )
+
+        with self._lock:
+            counters = asdict(self.stats)
+            memory_entries = len(self._memory)
+
+        return {
+            **counters,
+            "memory_entries": memory_entries,
+            "max_memory_entries": self.max_memory_entries,
+            "disk_enabled": self._conn is not None,
+            "disk_entries": disk_entries,
+            "max_disk_entries": self.max_disk_entries,
+        }
+    # ------------------------------------------------------------------------- end get_stats()
+
+# ------------------------------------------------------------------------- end class TwoTierStore
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,27 @@
+# -------------------------------------------------------------------------
+# File: __init__.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: benchmarks/__init__.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Package initialization for the offline MRCA performance benchmarks.
+# The benchmarks run the real pipeline code against deterministic local stubs
+# of the LLM, embedding and Neo4j services, so results are reproducible and
+# runs can be compared without network access or API costs.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+MRCA Offline Benchmarks
+
+- stubs.py: Deterministic LLM, embedding, graph and database stubs with latency models
+- run_pipeline_benchmark.py: Retrieval -> fusion -> generation load benchmark
+"""
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+# File: bench_fusion_strategies.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: benchmarks/bench_fusion_strategies.py
+# -------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Offline comparison of context fusion strategies, by default the LLM-based
+# ADVANCED_HYBRID against the LLM-free EXTRACTIVE strategy. Each benchmark query
+# gets deterministic VectorRAG and GraphRAG contexts from the stub corpus in
+# benchmarks/stubs.py, and the fusion LLM is the latency-modelled stub chat model.
+# Reports fusion latency, fusion LLM calls and tokens, fused-context and final
+# prompt tokens, and how many input CFR citations reach the fused context.
+# --single-shot adds an "<strategy>_single_shot" run of ADVANCED_HYBRID (and
+# ADAPTIVE_FUSION) with the fusion LLM call merged into the final prompt.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: FusionSample - Measurements for one fusion
+# - Class: RecordingLLM - Counts fusion LLM calls and tokens
+# - Function: build_retrieval_response() - Deterministic parallel retrieval result for a query
+# - Function: citation_keys() - CFR citations EnhancedCFRParser finds in a text
+# - Function: measure_fusion() - One fusion with its prompt and token counts
+# - Function: summarize() - Per-strategy aggregates
+# - Function: run_benchmark(), main() - Benchmark runner and command-line entry point
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library: argparse, asyncio, json, logging, statistics, sys, time, dataclasses, pathlib, typing
+# - Local Project Modules:
+#   - benchmarks.stubs, benchmarks.run_pipeline_benchmark: Stub services, queries and percentile()
+#   - backend.context_fusion, backend.hybrid_templates: Fusion and prompt construction
+#   - backend.context_packing: Token estimate
+#   - backend.cfr_compliance_enhanced: Citation parsing
+#   - backend.tools.vector, backend.parallel_hybrid, backend.config: Chunk rendering, result types, budget
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# python benchmarks/bench_fusion_strategies.py --profile realistic --vector-mode chunks \
+#     --output results/fusion_strategies.json
+# python benchmarks/bench_fusion_strategies.py --strategies advanced_hybrid extractive weighted_linear --budget 800
+# python benchmarks/bench_fusion_strategies.py --strategies advanced_hybrid --single-shot
+# Token counts use the four-characters-per-token estimate of context_packing.estimate_tokens().
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+MRCA Fusion Strategy Benchmark
+
+Latency and token cost of the fusion strategies on stubbed retrieval contexts.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Local application/library specific imports
+from benchmarks.stubs import LATENCY_PROFILES, StubServices, build_latency_profile, install_stubs
+from benchmarks.run_pipeline_benchmark import BENCHMARK_QUERIES, percentile
+from backend.config import get_config
+from backend.context_fusion import HybridContextFusion, FusionStrategy
+from backend.context_packing import estimate_tokens
+from backend.cfr_compliance_enhanced import get_enhanced_cfr_parser
+from backend.hybrid_templates import create_hybrid_prompt, TemplateType
+from backend.parallel_hybrid import RetrievalResult, ParallelRetrievalResponse
+from backend.tools.vector import format_regulation_chunks
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class FusionSample
+@dataclass
+class FusionSample:
+    """Measurements for one fusion."""
+    fusion_ms: float
+    llm_calls: int
+    llm_tokens: int
+    fused_tokens: int
+    prompt_tokens: int
+    citations_input: int
+    citations_kept: int
+# ------------------------------------------------------------------------- end class FusionSample
+
+# ------------------------------------------------------------------------- class RecordingLLM
+class RecordingLLM:
+    """Wraps the fusion LLM to count calls and estimated prompt plus completion tokens.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        llm (Any): Wrapped chat model.
+        calls (int): invoke() calls.
+        tokens (int): Estimated prompt and completion tokens.
+
+    Methods:
+        invoke(): Call the wrapped model and count the tokens.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, llm: Any) -> None:
+        """Wrap a chat model.
+
+        Args:
+            llm (Any): Chat model used by HybridContextFusion.
+        """
+        self.llm = llm
+        self.calls = 0
+        self.tokens = 0
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- invoke()
+    def invoke(self, prompt: Any) -> Any:
+        """Invoke the wrapped model.
+
+        Args:
+            prompt (Any): Prompt text.
+
+        Returns:
+            Any: The model response.
+        """
+        response = self.llm.invoke(prompt)
+        self.calls += 1
+        self.tokens += estimate_tokens(str(prompt)) + estimate_tokens(str(getattr(response, "content", response)))
+        return response
+    # ------------------------------------------------------------------------- end invoke()
+
+# ------------------------------------------------------------------------- end class RecordingLLM
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- build_retrieval_response()
+def build_retrieval_response(services: StubServices, query: str, vector_mode: str,
+                             vector_k: int, graph_k: int) -> ParallelRetrievalResponse:
+    """Build a deterministic parallel retrieval result for a query.
+
+    The vector context is the top vector_k corpus chunks, either as ranked chunks
+    ("chunks" mode) or as one passage-style answer ("answer" mode). The graph
+    context restates graph_k chunks with their entities, so the two contexts
+    overlap the way real VectorRAG and GraphRAG answers do.
+
+    Args:
+        services (StubServices): Installed stubs (for the corpus).
+        query (str): Benchmark query.
+        vector_mode (str): "chunks" or "answer".
+        vector_k (int): Vector chunks.
+        graph_k (int): Graph chunks.
+
+    Returns:
+        ParallelRetrievalResponse: Fusion-ready retrieval result.
+    """
+    chunks = [
+        {"text": chunk["text"], "score": score, "document": chunk["document"],
+         "chunk_id": chunk["chunk_id"], "entities": chunk["entities"]}
+        for chunk, score in services.corpus.select(query, vector_k)
+    ]
+    if vector_mode == "chunks":
+        vector_content = format_regulation_chunks(chunks)
+        vector_chunks = chunks
+    else:
+        vector_content = "\n\n".join(f"Under 30 CFR {chunk['text']}" for chunk in chunks)
+        vector_chunks = None
+
+    graph_content = "\n\n".join(
+        f"30 CFR {chunk['text']} Related entities: {', '.join(chunk['entities'])}."
+        for chunk, _ in services.corpus.select(f"graph::{query}", graph_k)
+    )
+
+    return ParallelRetrievalResponse(
+        vector_result=RetrievalResult(content=vector_content, method="vector_rag", confidence=0.82,
+                                      response_time_ms=0.0, chunks=vector_chunks),
+        graph_result=RetrievalResult(content=graph_content, method="graph_rag", confidence=0.74,
+                                     response_time_ms=0.0),
+        query=query,
+        total_time_ms=0.0,
+        success=True,
+        fusion_ready=True
+    )
+# ------------------------------------------------------------------------- end build_retrieval_response()
+
+# ------------------------------------------------------------------------- citation_keys()
+def citation_keys(text: str) -> Set[Tuple[Any, ...]]:
+    """CFR citations EnhancedCFRParser finds in a text.
+
+    Args:
+        text (str): Text.
+
+    Returns:
+        Set[Tuple[Any, ...]]: (title, part, section) of each citation.
+    """
+    return {(c.title, c.part, c.section) for c in get_enhanced_cfr_parser().parse_cfr_citations(text)}
+# ------------------------------------------------------------------------- end citation_keys()
+
+# ------------------------------------------------------------------------- measure_fusion()
+async def measure_fusion(fusion: HybridContextFusion, recorder: RecordingLLM, response: ParallelRetrievalResponse,
+                         strategy: FusionStrategy, template_type: TemplateType,
+                         single_shot: bool = False) -> FusionSample:
+    """Run one fusion and measure it.
+
+    Args:
+        fusion (HybridContextFusion): Fusion engine using the recorder as its LLM.
+        recorder (RecordingLLM): Fusion LLM recorder.
+        response (ParallelRetrievalResponse): Retrieval result to fuse.
+        strategy (FusionStrategy): Strategy.
+        template_type (TemplateType): Template for the final prompt.
+        single_shot (bool): Defer the advanced hybrid fusion LLM call to the final prompt.
+
+    Returns:
+        FusionSample: Measurements.
+    """
+    calls, tokens = recorder.calls, recorder.tokens
+    start = time.perf_counter()
+    result = await fusion.fuse_contexts(response, strategy, single_shot=single_shot)
+    fusion_ms = (time.perf_counter() - start) * 1000
+
+    prompt = create_hybrid_prompt(response.query, result, template_type)
+    input_citations = citation_keys(response.vector_result.content) | citation_keys(response.graph_result.content)
+    return FusionSample(
+        fusion_ms=fusion_ms,
+        llm_calls=recorder.calls - calls,
+        llm_tokens=recorder.tokens - tokens,
+        fused_tokens=estimate_tokens(result.fused_content),
+        prompt_tokens=estimate_tokens(prompt),
+        citations_input=len(input_citations),
+        citations_kept=len(input_citations & citation_keys(result.fused_content)),
+    )
+# ------------------------------------------------------------------------- end measure_fusion()
+
+# ------------------------------------------------------------------------- summarize()
+def summarize(samples: List[FusionSample]) -> Dict[str, Any]:
+    """Aggregate the samples of one strategy.
+
+    Args:
+        samples (List[FusionSample]): Samples.
+
+    Returns:
+        Dict[str, Any]: Latency percentiles and mean token counts.
+    """
+    latencies = [sample.fusion_ms for sample in samples]
+    citations_input = sum(sample.citations_input for sample in samples)
+
+    def mean(name: str) -> float:
+        return round(statistics.fmean(getattr(sample, name) for sample in samples), 1)
+
+    return {
+        "fusions": len(samples),
+        "fusion_ms": {
+            "mean": round(statistics.fmean(latencies), 2),
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "max": round(max(latencies), 2),
+        },
+        "llm_calls_per_fusion": mean("llm_calls"),
+        "fusion_llm_tokens": mean("llm_tokens"),
+        "fused_context_tokens": mean("fused_tokens"),
+        "final_prompt_tokens": mean("prompt_tokens"),
+        "total_llm_input_tokens": round(mean("llm_tokens") + mean("prompt_tokens"), 1),
+        "citation_retention": round(sum(s.citations_kept for s in samples) / citations_input, 3) if citations_input else 1.0,
+    }
+# ------------------------------------------------------------------------- end summarize()
+
+# ------------------------------------------------------------------------- run_benchmark()
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Install the stubs and measure every strategy on every query.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+
+    Returns:
+        Dict[str, Any]: Results document.
+    """
+    latency = build_latency_profile(args.profile, {"llm": args.llm_latency}, seed=args.seed)
+    services = install_stubs(latency)
+    get_config().fusion_extractive_max_tokens = args.budget
+
+    recorder = RecordingLLM(services.llm)
+    fusion = HybridContextFusion()
+    fusion.llm = recorder
+    template_type = TemplateType(args.template)
+    responses = [
+        build_retrieval_response(services, query, args.vector_mode, args.vector_k, args.graph_k)
+        for query in BENCHMARK_QUERIES
+    ]
+
+    runs = []
+    for name in args.strategies:
+        strategy = FusionStrategy(name)
+        runs.append((name, strategy, False))
+        if args.single_shot and strategy in (FusionStrategy.ADVANCED_HYBRID, FusionStrategy.ADAPTIVE_FUSION):
+            runs.append((f"{name}_single_shot", strategy, True))
+
+    results: Dict[str, Any] = {}
+    for label, strategy, single_shot in runs:
+        # Warm-up: regex compilation, lazy parser and LLM initialization
+        await measure_fusion(fusion, recorder, responses[0], strategy, template_type, single_shot)
+        samples = [
+            await measure_fusion(fusion, recorder, response, strategy, template_type, single_shot)
+            for _ in range(args.repeats)
+            for response in responses
+        ]
+        results[label] = summarize(samples)
+
+    return {
+        "benchmark": "fusion_strategies",
+        "settings": {
+            "profile": args.profile,
+            "llm_latency": latency["llm"].describe(),
+            "vector_mode": args.vector_mode,
+            "vector_k": args.vector_k,
+            "graph_k": args.graph_k,
+            "extractive_budget_tokens": args.budget,
+            "single_shot": args.single_shot,
+            "template": args.template,
+            "queries": len(responses),
+            "repeats": args.repeats,
+        },
+        "results": results,
+    }
+# ------------------------------------------------------------------------- end run_benchmark()
+
+# ------------------------------------------------------------------------- main()
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare fusion strategies on latency and tokens")
+    parser.add_argument("--strategies", nargs="+", default=[FusionStrategy.ADVANCED_HYBRID.value, FusionStrategy.EXTRACTIVE.value],
+                        choices=[strategy.value for strategy in FusionStrategy])
+    parser.add_argument("--profile", default="realistic", choices=sorted(LATENCY_PROFILES),
+                        help="Stub latency preset (the fusion LLM latency is what matters here)")
+    parser.add_argument("--llm-latency", help="Override the stub LLM latency, e.g. lognormal:2500:0.3")
+    parser.add_argument("--vector-mode", default="chunks", choices=["chunks", "answer"])
+    parser.add_argument("--vector-k", type=int, default=8, help="Vector chunks per query")
+    parser.add_argument("--graph-k", type=int, default=5, help="Graph chunks per query")
+    parser.add_argument("--budget", type=int, default=1500, help="Extractive fusion budget in tokens")
+    parser.add_argument("--single-shot", action="store_true",
+                        help="Also measure advanced_hybrid/adaptive_fusion with fusion merged into the final prompt")
+    parser.add_argument("--template", default=TemplateType.REGULATORY_COMPLIANCE.value,
+                        choices=[template.value for template in TemplateType])
+    parser.add_argument("--repeats", type=int, default=3, help="Passes over the benchmark queries")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    document = asyncio.run(run_benchmark(args))
+
+    print("🚀 MRCA Fusion Strategy Benchmark")
+    print(f"LLM latency: {document['settings']['llm_latency']}, vector mode: {args.vector_mode}\n")
+    print("Strategy         |  p50 ms |  p95 ms | LLM calls | fusion LLM tok | fused tok | prompt tok | citations")
+    print("-----------------|---------|---------|-----------|----------------|-----------|------------|----------")
+    for name, summary in document["results"].items():
+        print(f"{name:16} | {summary['fusion_ms']['p50']:7.1f} | {summary['fusion_ms']['p95']:7.1f} | "
+              f"{summary['llm_calls_per_fusion']:9.1f} | {summary['fusion_llm_tokens']:14.0f} | "
+              f"{summary['fused_context_tokens']:9.0f} | {summary['final_prompt_tokens']:10.0f} | "
+              f"{summary['citation_retention']:8.0%}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"\n✅ Results written to {args.output}")
+    return 0
+# ------------------------------------------------------------------------- end main()
+
+# =========================================================================
+# Entry Point
+# =========================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# =========================================================================
+# End of File
+# =========================================================================
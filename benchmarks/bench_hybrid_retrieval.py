@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+# File: bench_hybrid_retrieval.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: benchmarks/bench_hybrid_retrieval.py
+# -------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Retrieval quality and latency benchmark of the vector branch's chunk retrievers
+# on the live hybrid store: vector-only search (chunkVector), keyword search
+# (chunkText full-text index) and hybrid search (both, merged by reciprocal rank
+# fusion) from backend/tools/vector.py. Each labeled question names the CFR
+# sections that answer it; its relevant chunks are the chunks those Section nodes
+# CONTAIN in the CFR structure built by build_data/build_hybrid_store.py.
+# Reports hit@k, recall@k and MRR per retriever, and p50/p95 search latency.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Constant: EVAL_QUESTIONS - Labeled questions (question, answering sections) for the shipped volumes
+# - Function: load_questions() - Built-in or JSON question set
+# - Function: relevant_chunks() - Chunk ids of the answering sections
+# - Function: score_ranking() - hit@k, recall@k and reciprocal rank of one ranking
+# - Function: percentile() - Nearest-rank percentile
+# - Function: main() - Command-line entry point
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library: argparse, json, math, statistics, sys, time, pathlib, typing
+# - Third-Party: None directly (backend requirements for the retrievers)
+# - Local Project Modules:
+#   - backend.tools.vector: retrieve_regulation_chunks, keyword_search_chunks, retrieve_hybrid_chunks
+#   - backend.database: get_database for relevance labels
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# python benchmarks/bench_hybrid_retrieval.py [--k 1 3 5] [--repeats 3]
+#     [--questions questions.json] [--output results/hybrid_retrieval.json]
+# Requires the backend secrets and a store built by build_data/build_hybrid_store.py
+# (vector, full-text and CFR structure indexes). A questions file is a JSON list of
+# {"question": "...", "sections": ["250.820"]} objects.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+MRCA Hybrid Retrieval Benchmark
+
+Vector-only, keyword and reciprocal-rank-fused chunk retrieval on labeled CFR questions.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Local application/library specific imports
+from backend.database import get_database
+from backend.tools.vector import keyword_search_chunks, retrieve_hybrid_chunks, retrieve_regulation_chunks
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Labeled questions for the volumes in data/cfr_pdf (Title 30 vol2: parts 200-699, vol3: parts 700-end).
+# Exact-term questions (acronyms, section numbers) and paraphrased questions are mixed.
+EVAL_QUESTIONS: List[Tuple[str, List[str]]] = [
+    ("When are SSVs required on a producing well?", ["250.820"]),
+    ("What elements must a SEMS program include?", ["250.1902"]),
+    ("What security measures protect production facilities from theft of oil and gas?", ["250.1634"]),
+    ("Requirements for pressure vessels, heat exchangers and fired vessels on a platform", ["250.851"]),
+    ("What does 30 CFR 250.875 require for subsea pump systems?", ["250.875"]),
+    ("Can non-metallic piping be used on a production platform?", ["250.868"]),
+    ("Why does BSEE inspect OCS facilities?", ["250.130"]),
+    ("How are pipeline rights-of-way granted on the OCS?", ["250.1016"]),
+    ("What source control and containment equipment is needed for Arctic OCS drilling?", ["250.471"]),
+    ("How does a lessee apply for end-of-life royalty relief?", ["203.51"]),
+    ("Does royalty relief carry over when a lease is assigned to someone else?", ["203.56"]),
+    ("What instructions must the crew of a sulphur operation receive?", ["250.1621"]),
+    ("How must surface coal mining protect the hydrologic balance and water quality?", ["715.17"]),
+    ("What are the performance standards for steep slope mining?", ["785.15"]),
+    ("How is the prohibition on mining within 300 feet of an occupied dwelling waived?", ["761.15"]),
+    ("When can OSMRE waive the civil penalty formula?", ["723.16"]),
+    ("May state employees accept gifts or gratuities from coal companies?", ["705.18"]),
+    ("What general requirements apply to maps and plans in a permit application?", ["777.14"]),
+    ("Can coal processing waste be returned to abandoned underground workings?", ["784.25"]),
+    ("Which cross sections, maps and plans must a surface mining permit application contain?", ["783.25"]),
+    ("How are petitions to designate lands unsuitable for mining processed and recorded?", ["764.15"]),
+]
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- load_questions()
+def load_questions(path: Optional[Path] = None) -> List[Tuple[str, List[str]]]:
+    """Load the labeled questions.
+
+    Args:
+        path (Optional[Path]): JSON list of {"question", "sections"} objects (None uses EVAL_QUESTIONS).
+
+    Returns:
+        List[Tuple[str, List[str]]]: (question, answering section numbers) pairs.
+    """
+    if path is None:
+        return EVAL_QUESTIONS
+    return [(item["question"], list(item["sections"])) for item in json.loads(path.read_text(encoding="utf-8"))]
+# ------------------------------------------------------------------------- end load_questions()
+
+# ------------------------------------------------------------------------- relevant_chunks()
+def relevant_chunks(sections: List[str]) -> Set[str]:
+    """Chunk ids contained by the answering sections in the CFR structure.
+
+    Args:
+        sections (List[str]): Section numbers ("250.820").
+
+    Returns:
+        Set[str]: Relevant chunk ids (empty if the sections are not in the store).
+    """
+    records = get_database().execute_query(
+        "MATCH (s:Section)-[:CONTAINS]->(c:Chunk) WHERE s.id IN $sections RETURN c.id AS chunk_id",
+        {"sections": sections}
+    )
+    return {record.data()["chunk_id"] for record in records}
+# ------------------------------------------------------------------------- end relevant_chunks()
+
+# ------------------------------------------------------------------------- score_ranking()
+def score_ranking(ranking: List[str], relevant: Set[str], k: int) -> Tuple[float, float, float]:
+    """Score the top k of a ranking against the relevant chunks.
+
+    Args:
+        ranking (List[str]): Retrieved chunk ids, best first.
+        relevant (Set[str]): Relevant chunk ids (non-empty).
+        k (int): Cutoff.
+
+    Returns:
+        Tuple[float, float, float]: hit@k (1.0 if any relevant chunk is in the top k),
+                                    recall@k (relevant chunks found over min(|relevant|, k))
+                                    and reciprocal rank of the first relevant chunk.
+
+    Examples:
+        >>> score_ranking(["a", "b", "c"], {"b", "d"}, 2)
+        (1.0, 0.5, 0.5)
+    """
+    found = [chunk_id for chunk_id in ranking[:k] if chunk_id in relevant]
+    rank = next((position for position, chunk_id in enumerate(ranking, start=1) if chunk_id in relevant), None)
+    return (1.0 if found else 0.0, len(found) / min(len(relevant), k), 1.0 / rank if rank else 0.0)
+# ------------------------------------------------------------------------- end score_ranking()
+
+# ------------------------------------------------------------------------- percentile()
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile.
+
+    Args:
+        values (List[float]): Samples (any order).
+        pct (float): Percentile in [0, 100].
+
+    Returns:
+        float: The percentile, or 0.0 for no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+# ------------------------------------------------------------------------- end percentile()
+
+# ------------------------------------------------------------------------- main()
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark vector-only, keyword and hybrid (RRF) chunk retrieval")
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 3, 5], help="Cutoffs for hit@k and recall@k")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed searches per question and retriever")
+    parser.add_argument("--questions", type=Path, help="JSON question set instead of EVAL_QUESTIONS")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    args = parser.parse_args()
+
+    max_k = max(args.k)
+    retrievers: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+        "vector": lambda question: retrieve_regulation_chunks(question, k=max_k),
+        "keyword": lambda question: keyword_search_chunks(question, k=max_k),
+        "hybrid": lambda question: retrieve_hybrid_chunks(question, k=max_k),
+    }
+
+    print("🚀 MRCA Hybrid Retrieval Benchmark")
+    questions = []
+    for question, sections in load_questions(args.questions):
+        relevant = relevant_chunks(sections)
+        if relevant:
+            questions.append((question, relevant))
+        else:
+            print(f"⚠️ Skipped (sections {', '.join(sections)} not in the store): {question}")
+    if not questions:
+        print("❌ No labeled question has relevant chunks; build the store with build_hybrid_store.py")
+        return 1
+    print(f"Questions: {len(questions)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, retrieve in retrievers.items():
+        scores = {k: [] for k in args.k}
+        reciprocal_ranks, latencies_ms = [], []
+        for question, relevant in questions:
+            # Untimed first search warms the query embedding cache and the connection pool
+            ranking = [chunk["chunk_id"] for chunk in retrieve(question)]
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                retrieve(question)
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+            for k in args.k:
+                scores[k].append(score_ranking(ranking, relevant, k))
+            reciprocal_ranks.append(score_ranking(ranking, relevant, max_k)[2])
+
+        results[name] = {
+            **{f"hit@{k}": round(statistics.mean(s[0] for s in scores[k]), 3) for k in args.k},
+            **{f"recall@{k}": round(statistics.mean(s[1] for s in scores[k]), 3) for k in args.k},
+            "mrr": round(statistics.mean(reciprocal_ranks), 3),
+            "p50_ms": round(percentile(latencies_ms, 50), 1),
+            "p95_ms": round(percentile(latencies_ms, 95), 1),
+        }
+
+    columns = [f"hit@{k}" for k in args.k] + [f"recall@{k}" for k in args.k] + ["mrr", "p50_ms", "p95_ms"]
+    print("\nRetriever | " + " | ".join(f"{column:>9}" for column in columns))
+    print("----------|" + "|".join("-" * 11 for _ in columns))
+    for name, metrics in results.items():
+        print(f"{name:9} | " + " | ".join(f"{metrics[column]:9}" for column in columns))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"benchmark": "hybrid_retrieval", "questions": len(questions),
+                                           "k": args.k, "results": results}, indent=2), encoding="utf-8")
+        print(f"\n✅ Results written to {args.output}")
+    return 0
+# ------------------------------------------------------------------------- end main()
+
+# =========================================================================
+# Entry Point
+# =========================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# =========================================================================
+# End of File
+# =========================================================================
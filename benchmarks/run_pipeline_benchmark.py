@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+# File: run_pipeline_benchmark.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: benchmarks/run_pipeline_benchmark.py
+# -------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Offline load benchmark of the Advanced Parallel Hybrid pipeline
+# (ParallelRetrievalEngine.retrieve_parallel -> HybridContextFusion.fuse_contexts
+# -> generate_hybrid_response) at several concurrency levels. The LLM, embedding
+# and Neo4j services are replaced by the deterministic stubs in benchmarks/stubs.py
+# with configurable latency distributions, so the numbers reflect the pipeline's
+# own scheduling, thread-pool and CPU overhead under a known service latency.
+# Reports throughput, p50/p95/p99 latency, per-stage time, thread-pool
+# saturation and memory, and writes everything to JSON for run-to-run comparison.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: RequestSample - Measurements for one benchmark request
+# - Class: ResourceMonitor - Samples thread-pool queues and process memory during a level
+# - Function: percentile() - Nearest-rank percentile
+# - Function: run_request() - One request through the full pipeline
+# - Function: run_level() - All requests of one concurrency level
+# - Function: run_benchmark() - Every level, results document
+# - Function: print_summary(), print_comparison() - Console reports
+# - Function: main() - Command-line entry point
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - argparse, json, platform, os, datetime: CLI and result files
+#   - asyncio, concurrent.futures: Pipeline execution and thread pools
+#   - gc, time, tracemalloc, statistics: Measurement
+#   - logging, sys, pathlib: Console noise control and project root on sys.path
+#   - dataclasses, typing: Result containers and type hints
+# - Third-Party:
+#   - psutil: Process resident memory
+# - Local Project Modules:
+#   - benchmarks.stubs: Deterministic service stubs
+#   - backend.parallel_hybrid, backend.context_fusion, backend.hybrid_templates: The pipeline
+#   - backend.config, backend.tracing: Benchmark settings and per-stage timing
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# python benchmarks/run_pipeline_benchmark.py --concurrency 1 4 16 --requests 64 \
+#     --profile realistic --output results/pipeline.json
+# python benchmarks/run_pipeline_benchmark.py --llm-latency lognormal:400:0.5 \
+#     --compare results/pipeline.json
+# No secrets, network or database are needed.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+MRCA Offline Pipeline Load Benchmark
+
+Throughput, tail latency, thread-pool saturation and memory of the Advanced
+Parallel Hybrid pipeline against stubbed services at varying concurrency.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Third-party library imports
+import psutil
+
+# Local application/library specific imports
+from benchmarks.stubs import LATENCY_PROFILES, StubServices, build_latency_profile, install_stubs
+from backend.config import get_config
+from backend.context_fusion import HybridContextFusion, FusionStrategy
+from backend.hybrid_templates import generate_hybrid_response, TemplateType
+from backend.parallel_hybrid import ParallelRetrievalEngine, VECTOR_RETRIEVAL_MODES
+from backend.tracing import start_trace
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Mix of semantic questions and questions matching the Cypher intent templates
+BENCHMARK_QUERIES = [
+    "What are the methane monitoring requirements in underground coal mines?",
+    "What does 30 CFR 75.400 require?",
+    "What personal protective equipment is required for surface metal mines?",
+    "Which entities are related to self-rescuers?",
+    "How often must roof bolts be examined in underground coal mines?",
+    "What are the requirements for escapeways in underground mines?",
+    "What training must new miners receive before starting work?",
+    "Show me § 57.15030",
+]
+
+# Result file format version (bump when fields change meaning)
+RESULT_SCHEMA_VERSION = 1
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class RequestSample
+@dataclass
+class RequestSample:
+    """Measurements for one benchmark request."""
+    latency_ms: float
+    ok: bool
+    error: Optional[str] = None
+    stages: Dict[str, float] = field(default_factory=dict)
+    branch_errors: Dict[str, str] = field(default_factory=dict)
+# ------------------------------------------------------------------------- end class RequestSample
+
+# ------------------------------------------------------------------------- class ResourceMonitor
+class ResourceMonitor:
+    """Samples thread-pool occupancy and process memory while a level runs.
+
+    Pool occupancy is read from ThreadPoolExecutor internals (_work_queue,
+    _threads, _idle_semaphore), which CPython has kept stable since 3.8. A pool
+    is saturated when every worker is busy; queued work then waits for a thread.
+
+    Instance Attributes:
+        pools (Dict[str, ThreadPoolExecutor]): Pools to sample by name.
+        interval_seconds (float): Sampling interval.
+        _samples (Dict[str, List[Dict[str, int]]]): Pool samples by name.
+        _rss (List[int]): Resident memory samples in bytes.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, pools: Dict[str, ThreadPoolExecutor], interval_seconds: float = 0.005) -> None:
+        """Initialize an idle monitor.
+
+        Args:
+            pools (Dict[str, ThreadPoolExecutor]): Pools to sample by name.
+            interval_seconds (float): Sampling interval.
+        """
+        self.pools = pools
+        self.interval_seconds = interval_seconds
+        self._process = psutil.Process(os.getpid())
+        self._samples: Dict[str, List[Dict[str, int]]] = {name: [] for name in pools}
+        self._rss: List[int] = []
+        self._task: Optional[asyncio.Task] = None
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- start()
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        self._rss_start = self._process.memory_info().rss
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    # ------------------------------------------------------------------------- end start()
+
+    # ------------------------------------------------------------------------- stop()
+    async def stop(self) -> None:
+        """Stop sampling and take a final sample."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._sample()
+    # ------------------------------------------------------------------------- end stop()
+
+    # ------------------------------------------------------------------------- summary()
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the samples.
+
+        Returns:
+            Dict[str, Any]: thread_pools {name: {max_workers, peak_threads, peak_busy,
+                            saturated_fraction, max_queue_depth, mean_queue_depth}}
+                            and memory {rss_start_mb, rss_peak_mb, rss_growth_mb}.
+        """
+        pools = {}
+        for name, samples in self._samples.items():
+            max_workers = self.pools[name]._max_workers
+            pools[name] = {
+                "max_workers": max_workers,
+                "samples": len(samples),
+                "peak_threads": max((s["threads"] for s in samples), default=0),
+                "peak_busy": max((s["busy"] for s in samples), default=0),
+                "saturated_fraction": round(
+                    sum(1 for s in samples if s["busy"] >= max_workers) / len(samples), 3
+                ) if samples else 0.0,
+                "max_queue_depth": max((s["queued"] for s in samples), default=0),
+                "mean_queue_depth": round(statistics.mean(s["queued"] for s in samples), 2) if samples else 0.0,
+            }
+        mb = 1024 * 1024
+        rss_peak = max(self._rss, default=self._rss_start)
+        return {
+            "thread_pools": pools,
+            "memory": {
+                "rss_start_mb": round(self._rss_start / mb, 1),
+                "rss_peak_mb": round(rss_peak / mb, 1),
+                "rss_growth_mb": round((rss_peak - self._rss_start) / mb, 1),
+            },
+        }
+    # ------------------------------------------------------------------------- end summary()
+
+    # ------------------------------------------------------------------------- _run()
+    async def _run(self) -> None:
+        """Sample until cancelled."""
+        while True:
+            self._sample()
+            await asyncio.sleep(self.interval_seconds)
+    # ------------------------------------------------------------------------- end _run()
+
+    # ------------------------------------------------------------------------- _sample()
+    def _sample(self) -> None:
+        """Record one sample of every pool and of process memory."""
+        for name, pool in self.pools.items():
+            threads = len(pool._threads)
+            idle = pool._idle_semaphore._value if hasattr(pool, "_idle_semaphore") else 0
+            self._samples[name].append({
+                "threads": threads,
+                "busy": max(0, threads - idle),
+                "queued": pool._work_queue.qsize(),
+            })
+        self._rss.append(self._process.memory_info().rss)
+    # ------------------------------------------------------------------------- end _sample()
+
+# ------------------------------------------------------------------------- end class ResourceMonitor
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- percentile()
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile.
+
+    Args:
+        values (List[float]): Samples (any order).
+        pct (float): Percentile in [0, 100].
+
+    Returns:
+        float: The percentile, or 0.0 for no samples.
+
+    Examples:
+        >>> percentile([1, 2, 3, 4], 50)
+        2
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(min(rank, len(ordered))) - 1]
+# ------------------------------------------------------------------------- end percentile()
+
+# ------------------------------------------------------------------------- run_request()
+async def run_request(engine: ParallelRetrievalEngine, fusion: HybridContextFusion, query: str,
+                      fusion_strategy: FusionStrategy, template_type: TemplateType) -> RequestSample:
+    """Run one query through retrieval, fusion and response generation.
+
+    Args:
+        engine (ParallelRetrievalEngine): Retrieval engine.
+        fusion (HybridContextFusion): Fusion engine.
+        query (str): User question.
+        fusion_strategy (FusionStrategy): Fusion strategy.
+        template_type (TemplateType): Response template.
+
+    Returns:
+        RequestSample: End-to-end latency, outcome, per-stage milliseconds and branch errors.
+    """
+    start = time.perf_counter()
+    trace = None
+    try:
+        with start_trace("benchmark_request", query=query) as trace:
+            retrieval = await engine.retrieve_parallel(query)
+            fusion_result = await fusion.fuse_contexts(retrieval, fusion_strategy)
+            await generate_hybrid_response(query, fusion_result, template_type)
+        # A failed branch still yields an answer from the other one, so count it separately
+        branch_errors = {name: result.error for name, result in
+                         (("vector", retrieval.vector_result), ("graph", retrieval.graph_result))
+                         if result.error and not result.timed_out}
+        sample = RequestSample(latency_ms=(time.perf_counter() - start) * 1000, ok=True,
+                               branch_errors=branch_errors)
+    except Exception as e:
+        sample = RequestSample(latency_ms=(time.perf_counter() - start) * 1000, ok=False,
+                               error=f"{type(e).__name__}: {e}")
+    if trace is not None:
+        sample.stages = {name: stage["total_ms"] for name, stage in trace.summary()["stages"].items()}
+    return sample
+# ------------------------------------------------------------------------- end run_request()
+
+# ------------------------------------------------------------------------- run_level()
+async def run_level(services: StubServices, args: argparse.Namespace, concurrency: int) -> Dict[str, Any]:
+    """Run all requests of one concurrency level on fresh thread pools.
+
+    A warm-up pass builds the shared chains first so the measured requests
+    exclude one-time initialization.
+
+    Args:
+        services (StubServices): Installed stubs (call counts are reported per request).
+        args (argparse.Namespace): Parsed command-line options.
+        concurrency (int): Requests in flight at once.
+
+    Returns:
+        Dict[str, Any]: Level results (throughput, latency, stages, pools, memory, stub calls).
+    """
+    loop = asyncio.get_running_loop()
+    default_pool = ThreadPoolExecutor(max_workers=args.default_pool_workers, thread_name_prefix="asyncio-default")
+    loop.set_default_executor(default_pool)
+    engine = ParallelRetrievalEngine(async_retrieval=not args.threaded, vector_retrieval_mode=args.vector_mode)
+    fusion = HybridContextFusion()
+    fusion_strategy = FusionStrategy(args.fusion_strategy)
+    template_type = TemplateType(args.template)
+
+    try:
+        for query in BENCHMARK_QUERIES[:max(0, args.warmup)]:
+            await run_request(engine, fusion, query, fusion_strategy, template_type)
+
+        services.counter.reset()
+        gc.collect()
+        if args.tracemalloc:
+            tracemalloc.start()
+        monitor = ResourceMonitor({"engine": engine.executor, "default": default_pool},
+                                  interval_seconds=args.sample_interval_ms / 1000.0)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # ---------------------------------------------------------------------- bounded()
+        async def bounded(index: int) -> RequestSample:
+            async with semaphore:
+                query = BENCHMARK_QUERIES[index % len(BENCHMARK_QUERIES)]
+                return await run_request(engine, fusion, query, fusion_strategy, template_type)
+        # ---------------------------------------------------------------------- end bounded()
+
+        monitor.start()
+        started = time.perf_counter()
+        samples = await asyncio.gather(*(bounded(index) for index in range(args.requests)))
+        wall_seconds = time.perf_counter() - started
+        await monitor.stop()
+
+        tracemalloc_peak_mb = None
+        if args.tracemalloc:
+            tracemalloc_peak_mb = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+            tracemalloc.stop()
+    finally:
+        engine.executor.shutdown(wait=True)
+        default_pool.shutdown(wait=True)
+
+    ok = [sample for sample in samples if sample.ok]
+    latencies = [sample.latency_ms for sample in ok]
+    stage_names = sorted({name for sample in ok for name in sample.stages})
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if not sample.ok:
+            errors[sample.error] = errors.get(sample.error, 0) + 1
+    branch_errors: Dict[str, int] = {}
+    for sample in ok:
+        for branch, error in sample.branch_errors.items():
+            key = f"{branch}: {error}"
+            branch_errors[key] = branch_errors.get(key, 0) + 1
+
+    resources = monitor.summary()
+    if tracemalloc_peak_mb is not None:
+        resources["memory"]["tracemalloc_peak_mb"] = tracemalloc_peak_mb
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "succeeded": len(ok),
+        "errors": errors,
+        "branch_errors": branch_errors,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(ok) / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.mean(latencies), 1) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "max": round(max(latencies, default=0.0), 1),
+        },
+        "stage_mean_ms": {
+            name: round(sum(sample.stages.get(name, 0.0) for sample in ok) / len(ok), 1)
+            for name in stage_names
+        },
+        **resources,
+        "stub_calls_per_request": {
+            service: round(count / len(samples), 2)
+            for service, count in sorted(services.counter.snapshot().items())
+        } if samples else {},
+    }
+# ------------------------------------------------------------------------- end run_level()
+
+# ------------------------------------------------------------------------- run_benchmark()
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Install the stubs and run every concurrency level.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+
+    Returns:
+        Dict[str, Any]: Results document (settings, environment, levels).
+    """
+    latency = build_latency_profile(args.profile, {
+        "llm": args.llm_latency,
+        "embeddings": args.embedding_latency,
+        "graph": args.graph_latency,
+    }, seed=args.seed)
+    services = install_stubs(latency, response_sentences=args.response_sentences)
+
+    # Repeated benchmark questions would otherwise be answered from cached Cypher
+    config = get_config()
+    config.cypher_cache_enabled = args.cypher_cache
+
+    levels = []
+    for concurrency in args.concurrency:
+        print(f"  ▶ concurrency {concurrency}: {args.requests} requests")
+        levels.append(await run_level(services, args, concurrency))
+
+    return {
+        "benchmark": "parallel_hybrid_pipeline",
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {
+            "profile": args.profile,
+            "latency": {service: model.describe() for service, model in latency.items()},
+            "requests_per_level": args.requests,
+            "warmup": args.warmup,
+            "vector_mode": args.vector_mode,
+            "async_retrieval": not args.threaded,
+            "fusion_strategy": args.fusion_strategy,
+            "template": args.template,
+            "default_pool_workers": args.default_pool_workers,
+            "cypher_cache": args.cypher_cache,
+            "seed": args.seed,
+        },
+        "levels": levels,
+    }
+# ------------------------------------------------------------------------- end run_benchmark()
+
+# ------------------------------------------------------------------------- print_summary()
+def print_summary(results: Dict[str, Any]) -> None:
+    """Print one row per concurrency level.
+
+    Args:
+        results (Dict[str, Any]): Results document from run_benchmark().
+    """
+    print("\nConc | req/s  |  p50 ms |  p95 ms |  p99 ms | errors | engine pool sat | default pool sat | peak RSS")
+    print("-----|--------|---------|---------|---------|--------|-----------------|------------------|---------")
+    for level in results["levels"]:
+        latency = level["latency_ms"]
+        pools = level["thread_pools"]
+        print(f"{level['concurrency']:4} | {level['throughput_rps']:6.1f} | {latency['p50']:7.0f} | "
+              f"{latency['p95']:7.0f} | {latency['p99']:7.0f} | {level['requests'] - level['succeeded']:6} | "
+              f"{pools['engine']['saturated_fraction']:6.0%} (q≤{pools['engine']['max_queue_depth']:3}) | "
+              f"{pools['default']['saturated_fraction']:6.0%} (q≤{pools['default']['max_queue_depth']:4}) | "
+              f"{level['memory']['rss_peak_mb']:5.0f} MB")
+    for level in results["levels"]:
+        for error, count in level.get("branch_errors", {}).items():
+            print(f"  conc {level['concurrency']}: {count} requests answered with a failed branch ({error})")
+# ------------------------------------------------------------------------- end print_summary()
+
+# ------------------------------------------------------------------------- print_comparison()
+def print_comparison(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print throughput and tail-latency changes against a previous result file.
+
+    Args:
+        results (Dict[str, Any]): Current results document.
+        baseline (Dict[str, Any]): Previous results document.
+    """
+    baseline_levels = {level["concurrency"]: level for level in baseline.get("levels", [])}
+
+    # ---------------------------------------------------------------------- change()
+    def change(current: float, previous: float) -> str:
+        return f"{(current - previous) / previous:+7.1%}" if previous else "    n/a"
+    # ---------------------------------------------------------------------- end change()
+
+    print(f"\nComparison with baseline from {baseline.get('created_at', 'unknown')}")
+    print("Conc | req/s change | p50 change | p95 change | p99 change")
+    print("-----|--------------|------------|------------|-----------")
+    for level in results["levels"]:
+        previous = baseline_levels.get(level["concurrency"])
+        if previous is None:
+            continue
+        print(f"{level['concurrency']:4} | {change(level['throughput_rps'], previous['throughput_rps']):>12} | "
+              + " | ".join(f"{change(level['latency_ms'][p], previous['latency_ms'][p]):>10}"
+                           for p in ("p50", "p95", "p99")))
+# ------------------------------------------------------------------------- end print_comparison()
+
+# ------------------------------------------------------------------------- main()
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Offline load benchmark of the parallel hybrid pipeline")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Concurrency levels (requests in flight at once)")
+    parser.add_argument("--requests", type=int, default=64, help="Measured requests per level")
+    parser.add_argument("--warmup", type=int, default=2, help="Warm-up requests per level (not measured)")
+    parser.add_argument("--profile", default="fast", choices=sorted(LATENCY_PROFILES),
+                        help="Latency preset for the stubbed services")
+    parser.add_argument("--llm-latency", help="Override LLM latency, e.g. lognormal:900:0.35")
+    parser.add_argument("--embedding-latency", help="Override embedding latency, e.g. uniform:60:20")
+    parser.add_argument("--graph-latency", help="Override Neo4j/vector index latency, e.g. constant:25")
+    parser.add_argument("--response-sentences", type=int, default=6, help="Sentences per stub LLM answer")
+    parser.add_argument("--vector-mode", default="answer", choices=VECTOR_RETRIEVAL_MODES,
+                        help="Vector branch mode")
+    parser.add_argument("--threaded", action="store_true", help="Use the thread-pool retrieval path")
+    parser.add_argument("--fusion-strategy", default=FusionStrategy.ADVANCED_HYBRID.value,
+                        choices=[strategy.value for strategy in FusionStrategy])
+    parser.add_argument("--template", default=TemplateType.REGULATORY_COMPLIANCE.value,
+                        choices=[template.value for template in TemplateType])
+    parser.add_argument("--default-pool-workers", type=int, default=None,
+                        help="Workers of the event loop's default executor (Python default if omitted)")
+    parser.add_argument("--cypher-cache", action="store_true", help="Keep the generated-Cypher cache enabled")
+    parser.add_argument("--sample-interval-ms", type=float, default=5.0, help="Thread-pool/memory sampling interval")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also report the Python allocation peak (slows the run)")
+    parser.add_argument("--seed", type=int, default=0, help="Latency sampling seed")
+    parser.add_argument("--output", type=Path, help="Write results JSON to this file")
+    parser.add_argument("--compare", type=Path, help="Previous results JSON to compare against")
+    parser.add_argument("--log-level", default="WARNING", help="Backend log level during the run")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level)
+    logging.getLogger().setLevel(args.log_level)
+
+    print("🚀 MRCA Offline Pipeline Benchmark")
+    results = asyncio.run(run_benchmark(args))
+    print_summary(results)
+
+    if args.compare:
+        print_comparison(results, json.loads(args.compare.read_text(encoding="utf-8")))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n✅ Results written to {args.output}")
+    return 0
+# ------------------------------------------------------------------------- end main()
+
+# =========================================================================
+# Entry Point
+# =========================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# =========================================================================
+# End of File
+# =========================================================================
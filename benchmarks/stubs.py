@@ -0,0 +1,970 @@
+# -------------------------------------------------------------------------
+# File: stubs.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: benchmarks/stubs.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Deterministic local stand-ins for the external services of the MRCA pipeline
+# (OpenAI chat model, Gemini embeddings, Neo4j graph, vector index and driver).
+# Each stub produces repeatable, regulation-shaped output and sleeps according
+# to a seeded latency distribution, so the real retrieval, fusion and response
+# generation code can be load-tested offline with controlled service latency.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: LatencyModel - Seeded constant/uniform/normal/lognormal latency distribution
+# - Class: StubCallCounter - Thread-safe per-service call counter
+# - Class: StubCorpus - Synthetic CFR Title 30 chunks shared by the retrieval stubs
+# - Class: StubChatModel - BaseChatModel returning Cypher or cited regulatory text
+# - Class: StubEmbeddings - Hash-based deterministic embeddings
+# - Class: StubVectorStore - VectorStore ranking corpus chunks per query
+# - Class: StubGraph - GraphStore with the MRCA schema for GraphCypherQAChain
+# - Class: StubRecord, StubDatabase - Neo4jDatabase stand-in for templates and async Cypher
+# - Class: StubServices - The installed stub instances
+# - Function: build_latency_profile() - Named presets with per-service overrides
+# - Function: install_stubs() - Points the pipeline's service factories at the stubs
+# - Constant: LATENCY_PROFILES - Named latency presets
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - asyncio, time: Simulated service latency
+#   - hashlib, math, random: Deterministic outputs and latency sampling
+#   - threading.Lock: Thread-safe sampling and counting
+#   - dataclasses, typing: Containers and type hints
+# - Third-Party:
+#   - langchain_core: Chat model, embeddings, vector store and document base classes
+#   - langchain_neo4j.graphs.graph_store.GraphStore: Graph interface used by GraphCypherQAChain
+# - Local Project Modules (imported by install_stubs() only):
+#   - backend.llm, backend.graph, backend.database: Service factories
+#   - backend.context_fusion, backend.parallel_hybrid, backend.tools.*: Modules importing the factories
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# benchmarks/run_pipeline_benchmark.py calls install_stubs() before building the
+# pipeline. install_stubs() must run before any chain is built, because chains
+# capture their LLM and graph when the component registry first builds them.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Deterministic Service Stubs for Offline MRCA Benchmarks
+
+Local LLM, embedding, graph and database stand-ins with configurable, seeded
+latency distributions.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import asyncio
+import hashlib
+import math
+import random
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# Third-party library imports
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.vectorstores import VectorStore
+from langchain_neo4j.graphs.graph_store import GraphStore
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Services whose latency can be configured
+STUB_SERVICES = ("llm", "embeddings", "graph")
+
+# Named latency presets: service -> "distribution:scale_ms[:spread]"
+# (graph latency also applies to the vector index and the Neo4j driver stubs)
+LATENCY_PROFILES: Dict[str, Dict[str, str]] = {
+    "zero": {"llm": "constant:0", "embeddings": "constant:0", "graph": "constant:0"},
+    "fast": {"llm": "lognormal:50:0.3", "embeddings": "uniform:5:2", "graph": "lognormal:5:0.3"},
+    "realistic": {"llm": "lognormal:900:0.35", "embeddings": "lognormal:80:0.3", "graph": "lognormal:40:0.5"},
+}
+
+# Marker ending the Cypher generation prompt in backend/tools/cypher.py
+CYPHER_PROMPT_MARKER = "Cypher Query:"
+
+# Cypher returned for generation prompts (read-only, valid for the stub schema)
+STUB_GENERATED_CYPHER = (
+    "MATCH (c:Chunk)-[:HAS_ENTITY]->(e:Entity) "
+    "WHERE toLower(e.name) CONTAINS 'methane' "
+    "RETURN c.id AS chunk_id, c.text AS text LIMIT 5"
+)
+
+# Sections of the synthetic corpus: (section, heading, entities)
+STUB_SECTIONS: List[Tuple[str, str, List[str]]] = [
+    ("75.400", "Accumulation of combustible materials", ["coal dust", "loose coal"]),
+    ("75.323", "Actions for excessive methane", ["methane", "ventilation"]),
+    ("75.380", "Escapeways; bituminous and lignite mines", ["escapeway", "lifeline"]),
+    ("75.210", "Manual installation of roof bolts", ["roof bolt", "roof control plan"]),
+    ("75.1714", "Availability of approved self-rescue devices", ["self-rescuer", "SCSR"]),
+    ("57.15030", "Provision and maintenance of protective equipment", ["protective equipment", "hard hat"]),
+    ("56.15001", "First aid materials", ["first aid", "stretcher"]),
+    ("48.5", "Training of new miners; minimum courses of instruction", ["new miner", "training"]),
+]
+
+# Filler sentences appended to corpus chunks and generated answers
+STUB_SENTENCES = [
+    "The operator shall examine the affected area before each shift and record the results.",
+    "A certified person shall make the examination and report hazardous conditions immediately.",
+    "Records shall be kept on the surface and made available to authorized representatives of the Secretary.",
+    "Where the condition cannot be corrected at once, miners shall be withdrawn from the affected area.",
+    "The requirements apply to underground coal mines and to surface work areas of underground mines.",
+    "Equipment shall be maintained in a safe operating condition and removed from service when defective.",
+]
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class LatencyModel
+class LatencyModel:
+    """Seeded latency distribution for one stubbed service.
+
+    Specs have the form "distribution:scale_ms[:spread]":
+    - constant:<ms>
+    - uniform:<mean_ms>:<half_width_ms>
+    - normal:<mean_ms>:<stddev_ms> (clamped at zero)
+    - lognormal:<median_ms>:<sigma> (heavy right tail, typical of LLM APIs)
+
+    Class Attributes:
+        DISTRIBUTIONS (Tuple[str, ...]): Supported distribution names.
+
+    Instance Attributes:
+        distribution (str): Distribution name.
+        scale_ms (float): Constant, mean or median latency in milliseconds.
+        spread (float): Half-width, standard deviation (ms) or log-space sigma.
+        _rng (random.Random): Seeded generator.
+        _lock (Lock): Serializes sampling across worker threads.
+
+    Methods:
+        parse(): Build a model from a spec string.
+        sample_seconds(): Draw one latency.
+        sleep(): Block for one sampled latency.
+        asleep(): Await one sampled latency.
+        describe(): JSON-serializable description.
+    """
+
+    DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+    # -------------------
+    # --- Constructor ---
+    # -------------------
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, distribution: str = "constant", scale_ms: float = 0.0,
+                 spread: float = 0.0, seed: int = 0) -> None:
+        """Initialize the distribution.
+
+        Args:
+            distribution (str): One of DISTRIBUTIONS.
+            scale_ms (float): Constant, mean or median latency in milliseconds.
+            spread (float): Half-width, standard deviation (ms) or log-space sigma.
+            seed (int): Random seed.
+
+        Raises:
+            ValueError: If the distribution is unknown or the scale is negative.
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{distribution}', expected one of {self.DISTRIBUTIONS}")
+        if scale_ms < 0 or spread < 0:
+            raise ValueError("Latency scale and spread must be non-negative")
+        self.distribution = distribution
+        self.scale_ms = scale_ms
+        self.spread = spread
+        self._rng = random.Random(seed)
+        self._lock = Lock()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- parse()
+    @classmethod
+    def parse(cls, spec: str, seed: int = 0) -> 'LatencyModel':
+        """Build a latency model from a "distribution:scale_ms[:spread]" spec.
+
+        Args:
+            spec (str): Latency spec, e.g. "lognormal:900:0.35".
+            seed (int): Random seed.
+
+        Returns:
+            LatencyModel: The parsed model.
+
+        Raises:
+            ValueError: If the spec is malformed.
+
+        Examples:
+            >>> LatencyModel.parse("uniform:20:5").describe()
+            {'distribution': 'uniform', 'scale_ms': 20.0, 'spread': 5.0}
+        """
+        parts = spec.split(":")
+        if not 2 <= len(parts) <= 3:
+            raise ValueError(f"Invalid latency spec '{spec}', expected distribution:scale_ms[:spread]")
+        try:
+            scale_ms = float(parts[1])
+            spread = float(parts[2]) if len(parts) == 3 else 0.0
+        except ValueError:
+            raise ValueError(f"Invalid latency spec '{spec}', scale and spread must be numbers") from None
+        return cls(parts[0], scale_ms, spread, seed)
+    # ------------------------------------------------------------------------- end parse()
+
+    # ------------------------------------------------------------------------- sample_seconds()
+    def sample_seconds(self) -> float:
+        """Draw one latency.
+
+        Returns:
+            float: Latency in seconds (never negative).
+        """
+        if self.distribution == "constant" or self.scale_ms == 0:
+            return self.scale_ms / 1000.0
+        with self._lock:
+            if self.distribution == "uniform":
+                value = self._rng.uniform(self.scale_ms - self.spread, self.scale_ms + self.spread)
+            elif self.distribution == "normal":
+                value = self._rng.gauss(self.scale_ms, self.spread)
+            else:
+                value = self._rng.lognormvariate(math.log(self.scale_ms), self.spread)
+        return max(0.0, value) / 1000.0
+    # ------------------------------------------------------------------------- end sample_seconds()
+
+    # ------------------------------------------------------------------------- sleep()
+    def sleep(self) -> None:
+        """Block the calling thread for one sampled latency."""
+        delay = self.sample_seconds()
+        if delay:
+            time.sleep(delay)
+    # ------------------------------------------------------------------------- end sleep()
+
+    # ------------------------------------------------------------------------- asleep()
+    async def asleep(self) -> None:
+        """Suspend the calling coroutine for one sampled latency."""
+        await asyncio.sleep(self.sample_seconds())
+    # ------------------------------------------------------------------------- end asleep()
+
+    # ------------------------------------------------------------------------- describe()
+    def describe(self) -> Dict[str, Any]:
+        """Describe the model for benchmark result files.
+
+        Returns:
+            Dict[str, Any]: distribution, scale_ms and spread.
+        """
+        return {"distribution": self.distribution, "scale_ms": self.scale_ms, "spread": self.spread}
+    # ------------------------------------------------------------------------- end describe()
+
+# ------------------------------------------------------------------------- end class LatencyModel
+
+# ------------------------------------------------------------------------- class StubCallCounter
+class StubCallCounter:
+    """Thread-safe count of calls made to each stubbed service.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        _counts (Dict[str, int]): Calls per service name.
+        _lock (Lock): Guards the counts.
+
+    Methods:
+        increment(): Count one call.
+        snapshot(): Copy of the counts.
+        reset(): Clear the counts.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self) -> None:
+        """Initialize empty counts."""
+        self._counts: Dict[str, int] = {}
+        self._lock = Lock()
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- increment()
+    def increment(self, service: str) -> None:
+        """Count one call to a service.
+
+        Args:
+            service (str): Service name.
+        """
+        with self._lock:
+            self._counts[service] = self._counts.get(service, 0) + 1
+    # ------------------------------------------------------------------------- end increment()
+
+    # ------------------------------------------------------------------------- snapshot()
+    def snapshot(self) -> Dict[str, int]:
+        """Return a copy of the counts.
+
+        Returns:
+            Dict[str, int]: Calls per service name.
+        """
+        with self._lock:
+            return dict(self._counts)
+    # ------------------------------------------------------------------------- end snapshot()
+
+    # ------------------------------------------------------------------------- reset()
+    def reset(self) -> None:
+        """Clear the counts."""
+        with self._lock:
+            self._counts.clear()
+    # ------------------------------------------------------------------------- end reset()
+
+# ------------------------------------------------------------------------- end class StubCallCounter
+
+# ------------------------------------------------------------------------- class StubCorpus
+class StubCorpus:
+    """Synthetic CFR Title 30 chunks shared by the vector, graph and database stubs.
+
+    Results are chosen by hashing the query text, so the same query always
+    retrieves the same chunks with the same scores.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        chunks (List[Dict[str, Any]]): Chunk rows (chunk_id, document, section, text, entities).
+
+    Methods:
+        select(): Deterministically ranked chunks for a query.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, chunks_per_section: int = 4) -> None:
+        """Build the corpus.
+
+        Args:
+            chunks_per_section (int): Chunks generated for each section in STUB_SECTIONS.
+        """
+        self.chunks: List[Dict[str, Any]] = []
+        for section, heading, entities in STUB_SECTIONS:
+            part = section.split(".")[0]
+            volume = "vol1" if int(part) < 50 else "vol2" if int(part) < 75 else "vol3"
+            for index in range(chunks_per_section):
+                sentences = [STUB_SENTENCES[(index + offset) % len(STUB_SENTENCES)] for offset in range(3)]
+                self.chunks.append({
+                    "chunk_id": f"CFR-2024-title30-{volume}-§{section}-{index}",
+                    "document": f"CFR-2024-title30-{volume}",
+                    "section": section,
+                    "text": f"§ {section} {heading}. " + " ".join(sentences),
+                    "entities": entities,
+                })
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- select()
+    def select(self, query: str, k: int) -> List[Tuple[Dict[str, Any], float]]:
+        """Return k chunks with descending scores, chosen deterministically from the query.
+
+        Args:
+            query (str): Query text (or Cypher plus parameters).
+            k (int): Number of chunks.
+
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: (chunk, score) pairs, best first.
+        """
+        rng = random.Random(_stable_hash(query))
+        chosen = rng.sample(self.chunks, min(k, len(self.chunks)))
+        scores = sorted((rng.uniform(0.72, 0.96) for _ in chosen), reverse=True)
+        return list(zip(chosen, scores))
+    # ------------------------------------------------------------------------- end select()
+
+# ------------------------------------------------------------------------- end class StubCorpus
+
+# ------------------------------------------------------------------------- class StubChatModel
+class StubChatModel(BaseChatModel):
+    """Chat model returning deterministic Cypher or cited regulatory text after a sampled delay.
+
+    Prompts ending with the Cypher generation marker get a read-only Cypher
+    statement; every other prompt gets an answer citing two sections chosen
+    from the prompt hash. Token usage is estimated at four characters per token.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        latency (LatencyModel): Response latency.
+        counter (StubCallCounter): Call counter ("llm").
+        response_sentences (int): Sentences per generated answer.
+
+    Methods:
+        _generate(): Blocking generation.
+        _agenerate(): Asyncio generation.
+    """
+    latency: Any
+    counter: Any
+    response_sentences: int = 6
+
+    # ------------------------------------------------------------------------- _llm_type()
+    @property
+    def _llm_type(self) -> str:
+        """Identify the model type for LangChain."""
+        return "mrca-benchmark-stub"
+    # ------------------------------------------------------------------------- end _llm_type()
+
+    # ------------------------------------------------------------------------- _generate()
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        """Sleep for one sampled latency and return the stub response."""
+        self.counter.increment("llm")
+        self.latency.sleep()
+        return self._respond(messages)
+    # ------------------------------------------------------------------------- end _generate()
+
+    # ------------------------------------------------------------------------- _agenerate()
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        """Await one sampled latency and return the stub response."""
+        self.counter.increment("llm")
+        await self.latency.asleep()
+        return self._respond(messages)
+    # ------------------------------------------------------------------------- end _agenerate()
+
+    # ------------------------------------------------------------------------- _respond()
+    def _respond(self, messages: List[BaseMessage]) -> ChatResult:
+        """Build the deterministic response for a prompt.
+
+        Args:
+            messages (List[BaseMessage]): Prompt messages.
+
+        Returns:
+            ChatResult: One generation with estimated token usage.
+        """
+        prompt = "\n".join(str(message.content) for message in messages)
+        if prompt.rstrip().endswith(CYPHER_PROMPT_MARKER):
+            text = STUB_GENERATED_CYPHER
+        else:
+            rng = random.Random(_stable_hash(prompt))
+            cited = rng.sample(STUB_SECTIONS, 2)
+            sentences = [
+                f"Under 30 CFR § {section} ({heading}), {STUB_SENTENCES[rng.randrange(len(STUB_SENTENCES))].lower()}"
+                for section, heading, _ in cited
+            ]
+            sentences += [rng.choice(STUB_SENTENCES) for _ in range(max(0, self.response_sentences - 2))]
+            text = " ".join(sentences)
+
+        usage = {
+            "prompt_tokens": len(prompt) // 4,
+            "completion_tokens": len(text) // 4,
+            "total_tokens": (len(prompt) + len(text)) // 4,
+        }
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=text))],
+            llm_output={"token_usage": usage, "model_name": self._llm_type},
+        )
+    # ------------------------------------------------------------------------- end _respond()
+
+# ------------------------------------------------------------------------- end class StubChatModel
+
+# ------------------------------------------------------------------------- class StubEmbeddings
+class StubEmbeddings(Embeddings):
+    """Deterministic hash-based embeddings with a sampled delay per call.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        latency (LatencyModel): Delay per embedding call (one per batch).
+        counter (StubCallCounter): Call counter ("embeddings").
+        dimensions (int): Vector size.
+
+    Methods:
+        embed_documents(), embed_query(): Blocking embedding.
+        aembed_documents(), aembed_query(): Asyncio embedding.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, latency: LatencyModel, counter: StubCallCounter, dimensions: int = 768) -> None:
+        """Initialize the stub.
+
+        Args:
+            latency (LatencyModel): Delay per embedding call.
+            counter (StubCallCounter): Call counter.
+            dimensions (int): Vector size (768 matches the Gemini model).
+        """
+        self.latency = latency
+        self.counter = counter
+        self.dimensions = dimensions
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- embed_documents()
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch after one sampled delay."""
+        self.counter.increment("embeddings")
+        self.latency.sleep()
+        return [self._vector(text) for text in texts]
+    # ------------------------------------------------------------------------- end embed_documents()
+
+    # ------------------------------------------------------------------------- embed_query()
+    def embed_query(self, text: str) -> List[float]:
+        """Embed one query after one sampled delay."""
+        return self.embed_documents([text])[0]
+    # ------------------------------------------------------------------------- end embed_query()
+
+    # ------------------------------------------------------------------------- aembed_documents()
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch after one awaited delay."""
+        self.counter.increment("embeddings")
+        await self.latency.asleep()
+        return [self._vector(text) for text in texts]
+    # ------------------------------------------------------------------------- end aembed_documents()
+
+    # ------------------------------------------------------------------------- aembed_query()
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed one query after one awaited delay."""
+        return (await self.aembed_documents([text]))[0]
+    # ------------------------------------------------------------------------- end aembed_query()
+
+    # ------------------------------------------------------------------------- _vector()
+    def _vector(self, text: str) -> List[float]:
+        """Return the unit vector seeded by the text hash."""
+        rng = random.Random(_stable_hash(text))
+        vector = [rng.gauss(0.0, 1.0) for _ in range(self.dimensions)]
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+    # ------------------------------------------------------------------------- end _vector()
+
+# ------------------------------------------------------------------------- end class StubEmbeddings
+
+# ------------------------------------------------------------------------- class StubVectorStore
+class StubVectorStore(VectorStore):
+    """Vector store embedding the query and ranking corpus chunks deterministically.
+
+    Each search embeds the query through the embedding stub, then waits one
+    graph latency for the (simulated) Neo4j vector index.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        corpus (StubCorpus): Chunks to rank.
+        latency (LatencyModel): Vector index latency.
+        counter (StubCallCounter): Call counter ("vector_index").
+        _embedding (StubEmbeddings): Query embedder.
+
+    Methods:
+        similarity_search(), similarity_search_with_score(): Blocking search.
+        asimilarity_search(), asimilarity_search_with_score(): Asyncio search.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, embedding: StubEmbeddings, corpus: StubCorpus,
+                 latency: LatencyModel, counter: StubCallCounter) -> None:
+        """Initialize the stub store.
+
+        Args:
+            embedding (StubEmbeddings): Query embedder.
+            corpus (StubCorpus): Chunks to rank.
+            latency (LatencyModel): Vector index latency.
+            counter (StubCallCounter): Call counter.
+        """
+        self._embedding = embedding
+        self.corpus = corpus
+        self.latency = latency
+        self.counter = counter
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- embeddings()
+    @property
+    def embeddings(self) -> Embeddings:
+        """Query embedder."""
+        return self._embedding
+    # ------------------------------------------------------------------------- end embeddings()
+
+    # ------------------------------------------------------------------------- similarity_search_with_score()
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> List[Tuple[Document, float]]:
+        """Embed the query, wait for the index and return ranked chunks."""
+        self._embedding.embed_query(query)
+        self.counter.increment("vector_index")
+        self.latency.sleep()
+        return self._ranked(query, k, kwargs.get("score_threshold"))
+    # ------------------------------------------------------------------------- end similarity_search_with_score()
+
+    # ------------------------------------------------------------------------- similarity_search()
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        """Ranked chunks without scores."""
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+    # ------------------------------------------------------------------------- end similarity_search()
+
+    # ------------------------------------------------------------------------- asimilarity_search_with_score()
+    async def asimilarity_search_with_score(self, query: str, k: int = 4,
+                                            **kwargs: Any) -> List[Tuple[Document, float]]:
+        """Asyncio counterpart of similarity_search_with_score()."""
+        await self._embedding.aembed_query(query)
+        self.counter.increment("vector_index")
+        await self.latency.asleep()
+        return self._ranked(query, k, kwargs.get("score_threshold"))
+    # ------------------------------------------------------------------------- end asimilarity_search_with_score()
+
+    # ------------------------------------------------------------------------- asimilarity_search()
+    async def asimilarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        """Asyncio counterpart of similarity_search()."""
+        return [doc for doc, _ in await self.asimilarity_search_with_score(query, k, **kwargs)]
+    # ------------------------------------------------------------------------- end asimilarity_search()
+
+    # ------------------------------------------------------------------------- add_texts()
+    def add_texts(self, texts: Any, metadatas: Optional[List[dict]] = None, **kwargs: Any) -> List[str]:
+        """Not supported: the stub corpus is fixed."""
+        raise NotImplementedError("StubVectorStore is read-only")
+    # ------------------------------------------------------------------------- end add_texts()
+
+    # ------------------------------------------------------------------------- from_texts()
+    @classmethod
+    def from_texts(cls, texts: List[str], embedding: Embeddings,
+                   metadatas: Optional[List[dict]] = None, **kwargs: Any) -> 'StubVectorStore':
+        """Not supported: build the stub with install_stubs()."""
+        raise NotImplementedError("Use install_stubs() to create the stub vector store")
+    # ------------------------------------------------------------------------- end from_texts()
+
+    # ------------------------------------------------------------------------- _ranked()
+    def _ranked(self, query: str, k: int, score_threshold: Optional[float]) -> List[Tuple[Document, float]]:
+        """Ranked corpus chunks as Neo4jVector-shaped documents."""
+        results = []
+        for chunk, score in self.corpus.select(query, k):
+            if score_threshold is not None and score < score_threshold:
+                continue
+            metadata = {
+                "document": chunk["document"],
+                "chunk_id": chunk["chunk_id"],
+                "entities": [{"name": name, "type": "Concept", "id": name} for name in chunk["entities"]],
+                "source": "CFR Title 30 - Mining Safety and Health",
+                "document_type": "Federal Regulation",
+            }
+            results.append((Document(page_content=chunk["text"], metadata=metadata), score))
+        return results
+    # ------------------------------------------------------------------------- end _ranked()
+
+# ------------------------------------------------------------------------- end class StubVectorStore
+
+# ------------------------------------------------------------------------- class StubGraph
+class StubGraph(GraphStore):
+    """GraphStore exposing the MRCA hybrid store schema and returning corpus rows.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        corpus (StubCorpus): Rows returned by queries.
+        latency (LatencyModel): Query latency.
+        counter (StubCallCounter): Call counter ("graph").
+
+    Methods:
+        query(): Run a (simulated) Cypher query.
+        get_schema, get_structured_schema, structured_schema: Schema for GraphCypherQAChain.
+        refresh_schema(), add_graph_documents(): Interface no-ops.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, corpus: StubCorpus, latency: LatencyModel, counter: StubCallCounter) -> None:
+        """Initialize the stub graph.
+
+        Args:
+            corpus (StubCorpus): Rows returned by queries.
+            latency (LatencyModel): Query latency.
+            counter (StubCallCounter): Call counter.
+        """
+        self.corpus = corpus
+        self.latency = latency
+        self.counter = counter
+        self._structured_schema = {
+            "node_props": {
+                "Chunk": [{"property": "id", "type": "STRING"}, {"property": "text", "type": "STRING"},
+                          {"property": "textEmbedding", "type": "LIST"}],
+                "Document": [{"property": "id", "type": "STRING"}],
+                "Entity": [{"property": "id", "type": "STRING"}, {"property": "name", "type": "STRING"},
+                           {"property": "type", "type": "STRING"}],
+            },
+            "rel_props": {},
+            "relationships": [
+                {"start": "Chunk", "type": "PART_OF", "end": "Document"},
+                {"start": "Chunk", "type": "HAS_ENTITY", "end": "Entity"},
+            ],
+            "metadata": {"constraint": [], "index": []},
+        }
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- get_schema()
+    @property
+    def get_schema(self) -> str:
+        """Schema text in the Neo4jGraph format."""
+        nodes = "\n".join(
+            label + " {" + ", ".join(f"{prop['property']}: {prop['type']}" for prop in props) + "}"
+            for label, props in self._structured_schema["node_props"].items()
+        )
+        relationships = "\n".join(
+            f"(:{rel['start']})-[:{rel['type']}]->(:{rel['end']})"
+            for rel in self._structured_schema["relationships"]
+        )
+        return (f"Node properties:\n{nodes}\nRelationship properties:\n\n"
+                f"The relationships:\n{relationships}")
+    # ------------------------------------------------------------------------- end get_schema()
+
+    # ------------------------------------------------------------------------- get_structured_schema()
+    @property
+    def get_structured_schema(self) -> Dict[str, Any]:
+        """Structured schema used for Cypher validation."""
+        return self._structured_schema
+    # ------------------------------------------------------------------------- end get_structured_schema()
+
+    # ------------------------------------------------------------------------- structured_schema()
+    @property
+    def structured_schema(self) -> Dict[str, Any]:
+        """Neo4jGraph attribute read by the Cypher query corrector (validate_cypher)."""
+        return self._structured_schema
+    # ------------------------------------------------------------------------- end structured_schema()
+
+    # ------------------------------------------------------------------------- query()
+    def query(self, query: str, params: dict = {}) -> List[Dict[str, Any]]:
+        """Wait one sampled latency and return corpus rows chosen from the query."""
+        self.counter.increment("graph")
+        self.latency.sleep()
+        return _rows(self.corpus, f"{query}{sorted(params.items())}")
+    # ------------------------------------------------------------------------- end query()
+
+    # ------------------------------------------------------------------------- refresh_schema()
+    def refresh_schema(self) -> None:
+        """The stub schema is static."""
+    # ------------------------------------------------------------------------- end refresh_schema()
+
+    # ------------------------------------------------------------------------- add_graph_documents()
+    def add_graph_documents(self, graph_documents: List[Any], include_source: bool = False) -> None:
+        """Not supported: the stub graph is read-only."""
+        raise NotImplementedError("StubGraph is read-only")
+    # ------------------------------------------------------------------------- end add_graph_documents()
+
+# ------------------------------------------------------------------------- end class StubGraph
+
+# ------------------------------------------------------------------------- class StubRecord
+class StubRecord:
+    """neo4j Record stand-in exposing data()."""
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, row: Dict[str, Any]) -> None:
+        """Wrap a row dictionary."""
+        self._row = row
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- data()
+    def data(self) -> Dict[str, Any]:
+        """Return the row as a dictionary."""
+        return dict(self._row)
+    # ------------------------------------------------------------------------- end data()
+
+# ------------------------------------------------------------------------- end class StubRecord
+
+# ------------------------------------------------------------------------- class StubDatabase
+class StubDatabase:
+    """Neo4jDatabase stand-in used by the Cypher intent templates, cached Cypher and the async path.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        corpus (StubCorpus): Rows returned by queries.
+        latency (LatencyModel): Query latency.
+        counter (StubCallCounter): Call counter ("database").
+
+    Methods:
+        execute_query(): Blocking query.
+        execute_query_async(): Asyncio query.
+    """
+
+    # ------------------------------------------------------------------------- __init__()
+    def __init__(self, corpus: StubCorpus, latency: LatencyModel, counter: StubCallCounter) -> None:
+        """Initialize the stub database.
+
+        Args:
+            corpus (StubCorpus): Rows returned by queries.
+            latency (LatencyModel): Query latency.
+            counter (StubCallCounter): Call counter.
+        """
+        self.corpus = corpus
+        self.latency = latency
+        self.counter = counter
+    # ------------------------------------------------------------------------- end __init__()
+
+    # ------------------------------------------------------------------------- execute_query()
+    def execute_query(self, query: str, parameters: Optional[Dict] = None) -> List[StubRecord]:
+        """Wait one sampled latency and return records chosen from the query."""
+        self.counter.increment("database")
+        self.latency.sleep()
+        return [StubRecord(row) for row in _rows(self.corpus, f"{query}{sorted((parameters or {}).items())}")]
+    # ------------------------------------------------------------------------- end execute_query()
+
+    # ------------------------------------------------------------------------- execute_query_async()
+    async def execute_query_async(self, query: str, parameters: Optional[Dict] = None) -> List[StubRecord]:
+        """Asyncio counterpart of execute_query()."""
+        self.counter.increment("database")
+        await self.latency.asleep()
+        return [StubRecord(row) for row in _rows(self.corpus, f"{query}{sorted((parameters or {}).items())}")]
+    # ------------------------------------------------------------------------- end execute_query_async()
+
+# ------------------------------------------------------------------------- end class StubDatabase
+
+# ------------------------------------------------------------------------- class StubServices
+@dataclass
+class StubServices:
+    """The stub instances installed into the pipeline.
+
+    Class Attributes:
+        None
+
+    Instance Attributes:
+        latency (Dict[str, LatencyModel]): Latency model per service.
+        counter (StubCallCounter): Shared call counter.
+        llm (StubChatModel): Chat model returned by get_llm().
+        embeddings (StubEmbeddings): Embeddings returned by get_embeddings().
+        graph (StubGraph): Graph returned by get_graph().
+        database (StubDatabase): Database returned by get_database().
+        vector_store (StubVectorStore): Store returned by get_neo4j_vector().
+        corpus (StubCorpus): Corpus shared by the retrieval stubs.
+
+    Methods:
+        None (dataclass with automatic methods)
+    """
+    latency: Dict[str, LatencyModel]
+    counter: StubCallCounter
+    llm: StubChatModel
+    embeddings: StubEmbeddings
+    graph: StubGraph
+    database: StubDatabase
+    vector_store: StubVectorStore
+    corpus: StubCorpus
+# ------------------------------------------------------------------------- end class StubServices
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ---------------------------------------------
+# --- Callable Functions from other modules ---
+# ---------------------------------------------
+
+# ------------------------------------------------------------------------- build_latency_profile()
+def build_latency_profile(profile: str = "fast", overrides: Optional[Dict[str, str]] = None,
+                          seed: int = 0) -> Dict[str, LatencyModel]:
+    """Build per-service latency models from a named preset.
+
+    Args:
+        profile (str): Key of LATENCY_PROFILES.
+        overrides (Optional[Dict[str, str]]): Per-service spec overrides (None values are ignored).
+        seed (int): Base random seed; each service gets its own derived seed.
+
+    Returns:
+        Dict[str, LatencyModel]: Latency model per service in STUB_SERVICES.
+
+    Raises:
+        ValueError: If the profile is unknown or a spec is malformed.
+
+    Examples:
+        >>> latency = build_latency_profile("realistic", {"llm": "constant:500"})
+    """
+    if profile not in LATENCY_PROFILES:
+        raise ValueError(f"Unknown latency profile '{profile}', expected one of {sorted(LATENCY_PROFILES)}")
+    specs = dict(LATENCY_PROFILES[profile])
+    specs.update({service: spec for service, spec in (overrides or {}).items() if spec})
+    return {
+        service: LatencyModel.parse(specs[service], seed=seed + index)
+        for index, service in enumerate(STUB_SERVICES)
+    }
+# ------------------------------------------------------------------------- end build_latency_profile()
+
+# ------------------------------------------------------------------------- install_stubs()
+def install_stubs(latency: Dict[str, LatencyModel], response_sentences: int = 6) -> StubServices:
+    """Point every service factory the pipeline uses at deterministic stubs.
+
+    Replaces get_llm, get_embeddings, get_graph, get_database and
+    get_neo4j_vector in the modules that imported them, re-registers the
+    vector store factory, and invalidates all registry components so chains are
+    rebuilt around the stubs on first use.
+
+    Args:
+        latency (Dict[str, LatencyModel]): Latency model per service (see build_latency_profile()).
+        response_sentences (int): Sentences per stub LLM answer.
+
+    Returns:
+        StubServices: The installed stubs.
+    """
+    # Imported here so the stubs themselves can be used without loading the backend
+    import backend.llm as llm_module
+    import backend.graph as graph_module
+    import backend.database as database_module
+    import backend.context_fusion as context_fusion_module
+    import backend.parallel_hybrid as parallel_hybrid_module
+    import backend.tools.cypher as cypher_module
+    import backend.tools.vector as vector_module
+    import backend.tools.general as general_module
+    from backend.tools.registry import get_component_registry
+
+    counter = StubCallCounter()
+    corpus = StubCorpus()
+    embeddings = StubEmbeddings(latency["embeddings"], counter)
+    services = StubServices(
+        latency=latency,
+        counter=counter,
+        llm=StubChatModel(latency=latency["llm"], counter=counter, response_sentences=response_sentences),
+        embeddings=embeddings,
+        graph=StubGraph(corpus, latency["graph"], counter),
+        database=StubDatabase(corpus, latency["graph"], counter),
+        vector_store=StubVectorStore(embeddings, corpus, latency["graph"], counter),
+        corpus=corpus,
+    )
+
+    factories = {
+        "get_llm": lambda: services.llm,
+        "get_embeddings": lambda: services.embeddings,
+        "get_graph": lambda: services.graph,
+        "get_database": lambda: services.database,
+        "get_neo4j_vector": lambda: services.vector_store,
+    }
+    modules = (llm_module, graph_module, database_module, context_fusion_module,
+               parallel_hybrid_module, cypher_module, vector_module, general_module)
+    for module in modules:
+        for name, factory in factories.items():
+            if hasattr(module, name):
+                setattr(module, name, factory)
+
+    registry = get_component_registry()
+    registry.register(vector_module.VECTOR_STORE_COMPONENT, factories["get_neo4j_vector"])
+    registry.invalidate()
+    return services
+# ------------------------------------------------------------------------- end install_stubs()
+
+# ------------------------
+# --- Helper Functions ---
+# ------------------------
+
+# ------------------------------------------------------------------------- _stable_hash()
+def _stable_hash(text: str) -> int:
+    """Process-independent hash of a text (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+# ------------------------------------------------------------------------- end _stable_hash()
+
+# ------------------------------------------------------------------------- _rows()
+def _rows(corpus: StubCorpus, key: str, k: int = 5) -> List[Dict[str, Any]]:
+    """Query result rows chosen deterministically from a query key."""
+    return [
+        {"chunk_id": chunk["chunk_id"], "document": chunk["document"], "text": chunk["text"]}
+        for chunk, _ in corpus.select(key, k)
+    ]
+# ------------------------------------------------------------------------- end _rows()
+
+# =========================================================================
+# Module Initialization / Main Execution Guard
+# =========================================================================
+# This module is designed to be imported, not executed directly.
+# No main execution guard is needed.
+
+# =========================================================================
+# End of File
+# =========================================================================
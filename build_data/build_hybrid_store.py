@@ -39,14 +39,23 @@
 #   - langchain_google_genai: Google Gemini AI models and embeddings
 #   - langchain_core.documents: Document structure for text processing
 #   - langchain.text_splitter: Text chunking for hybrid processing
-# - Local Project Modules: None (standalone hybrid store builder)
+# - Local Project Modules:
+#   - backend/cfr_compliance_enhanced.py: EnhancedCFRParser for the CFR section index
+#     (imported from the backend directory, without the backend package)
 # -------------------------------------------------------------------------
 
 # --- Usage / Integration ---
 # This module is designed as a standalone script for building the complete hybrid
 # knowledge store required by the MRCA Advanced Parallel Hybrid system. It reads
 # PDF documents from the data/cfr_pdf directory and creates both graph structures
-# (entities and relationships) and vector embeddings in a single Neo4j database.
+# (entities and relationships) and vector embeddings in a single Neo4j database,
+# plus the CFR section index: (:Section {id: "75.400"}) nodes linked to every chunk
+# that references them, used by backend/tools/section_index.py for exact-citation
+# questions, and the CFR structure parsed from the volume text:
+# (:Title)-[:CONTAINS]->(:Part)-[:CONTAINS]->(:Subpart)-[:CONTAINS]->(:Section)-[:CONTAINS]->(:Chunk),
+# with range-indexed part and section numbers, traversed by the structural intent
+# templates of backend/tools/cypher.py, and a (:StoreBuild) marker whose build id
+# tells backend/tools/local_vector_index.py that its embedding mirror is stale.
 # The resulting hybrid store enables simultaneous GraphRAG and VectorRAG operations
 # for superior regulatory query processing. This module should be executed during
 # system setup or when rebuilding the knowledge base with updated regulatory documents.
@@ -72,6 +81,7 @@ from Title 30 CFR regulatory documents for Advanced Parallel Hybrid search capab
 # =========================================================================
 # Standard library imports
 import os
+import sys
 import logging
 from io import BytesIO
 import time
@@ -87,7 +97,10 @@ from langchain_core.documents import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 # Local application/library specific imports
-# (None for this standalone module)
+# The CFR parser is standard-library only; importing it from the backend directory
+# avoids loading the backend package and its server configuration
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+from cfr_compliance_enhanced import CFRHierarchyLevel, EnhancedCFRParser
 
 # =========================================================================
 # Global Constants / Variables
@@ -140,8 +153,11 @@ class HybridStoreBuilder:
         llm (ChatGoogleGenerativeAI): Gemini LLM for entity extraction
         embedding_model (GoogleGenerativeAIEmbeddings): Gemini embeddings for vectors
         text_splitter (RecursiveCharacterTextSplitter): Text chunking utility
+        cfr_parser (EnhancedCFRParser): CFR citation and structure parser for the section index
         total_chunks_processed (int): Progress tracking for processed chunks
         total_entities_created (int): Progress tracking for extracted entities
+        total_section_links (int): Progress tracking for chunk-to-section links
+        total_structure_sections (int): Progress tracking for sections placed in the CFR structure
         start_time (datetime): Processing start time for performance metrics
 
     Methods:
@@ -152,6 +168,12 @@ class HybridStoreBuilder:
         process_directory(): Process all PDF files to build complete hybrid store
         process_pdf(): Process PDF to create hybrid store components
         create_vector_index(): Create vector index for semantic search component
+        create_fulltext_index(): Create the full-text index for keyword search of chunks
+        create_section_index(): Create the Section uniqueness constraint used for section lookups
+        link_chunk_sections(): Link a chunk to the CFR sections it references
+        create_structure_indexes(): Create the Part, Subpart, Section and Chunk indexes of the CFR structure
+        create_cfr_structure(): Materialize the Part/Subpart/Section hierarchy of a volume
+        stamp_build(): Stamp the store build marker read by the local vector index
         print_final_summary(): Print final hybrid store construction completion summary
     """
 
@@ -222,9 +244,14 @@ class HybridStoreBuilder:
                 chunk_overlap=200
             )
             
+            # CFR citation parser for the section index
+            self.cfr_parser = EnhancedCFRParser()
+            
             # Progress tracking
             self.total_chunks_processed = 0
             self.total_entities_created = 0
+            self.total_section_links = 0
+            self.total_structure_sections = 0
             self.start_time = datetime.now()
             
             print("✅ MRCA Advanced Hybrid Store Builder ready!")
@@ -279,12 +306,14 @@ class HybridStoreBuilder:
             total_nodes = self.graph.query("MATCH (n) RETURN count(n) as count")[0]['count']
             total_chunks = self.graph.query("MATCH (c:Chunk) RETURN count(c) as count")[0]['count']
             total_entities = self.graph.query("MATCH (e:Entity) RETURN count(e) as count")[0]['count']
+            total_sections = self.graph.query("MATCH (s:Section) RETURN count(s) as count")[0]['count']
             total_docs = self.graph.query("MATCH (d:Document) RETURN count(d) as count")[0]['count']
             
             print(f"\nHYBRID STORE PROGRESS - Elapsed: {elapsed_str}")
             print(f"   Documents: {total_docs}")
             print(f"   Chunks (w/ vectors): {total_chunks}")
             print(f"   Entities (graph nodes): {total_entities}")
+            print(f"   CFR Sections (indexed): {total_sections}")
             print(f"   Total Nodes: {total_nodes}")
             
             if total_chunks > 0:
@@ -315,6 +344,7 @@ class HybridStoreBuilder:
             total_rels = self.graph.query("MATCH ()-[r]-() RETURN count(r) as count")[0]['count']
             total_chunks = self.graph.query("MATCH (c:Chunk) RETURN count(c) as count")[0]['count']
             total_entities = self.graph.query("MATCH (e:Entity) RETURN count(e) as count")[0]['count']
+            total_sections = self.graph.query("MATCH (s:Section) RETURN count(s) as count")[0]['count']
             total_docs = self.graph.query("MATCH (d:Document) RETURN count(d) as count")[0]['count']
             
             print(f"\n" + "="*80)
@@ -324,6 +354,8 @@ class HybridStoreBuilder:
             print(f"Documents: {total_docs}")
             print(f"Hybrid Chunks: {total_chunks:,} (with vector embeddings)")
             print(f"Graph Entities: {total_entities:,}")
+            print(f"CFR Sections: {total_sections:,} ({self.total_section_links:,} chunk links, "
+                  f"{self.total_structure_sections:,} in the Part/Subpart structure)")
             print(f"Total Graph Nodes: {total_nodes:,}")
             print(f"Graph Relationships: {total_rels:,}")
             print(f"Processing Rate: {total_chunks / (elapsed.total_seconds() / 3600):.1f} hybrid chunks/hour")
@@ -331,6 +363,9 @@ class HybridStoreBuilder:
             print("✅ HYBRID STORE COMPONENTS READY:")
             print("    GraphRAG: Entity-relationship graph for structural queries")
             print("    VectorRAG: Semantic embeddings for similarity search")
+            print("    Full-text index: Keyword search for hybrid retrieval")
+            print("    Section index: Exact CFR section lookups")
+            print("    CFR structure: Part/Subpart/Section traversals")
             print("    Advanced Parallel Hybrid system ready for deployment!")
             print("="*80)
             
@@ -548,6 +583,9 @@ MERGE (d)<-[:PART_OF]-(c)
                             "embedding": chunk_embedding
                         })
                         
+                        # Link the chunk to the CFR sections it references (section index)
+                        self.total_section_links += self.link_chunk_sections(chunk_id, chunk_text)
+                        
                         # Extract and create entities for graph component
                         print(f"   Extracting entities for graph relationships...")
                         entities = self.extract_entities_msha(chunk_text)
@@ -586,6 +624,9 @@ MERGE (c)-[:HAS_ENTITY]->(e)
                     print(f"Pausing 10 seconds before next hybrid batch...")
                     time.sleep(10)
 
+            # Place the chunks in the Part/Subpart/Section structure of the volume
+            self.total_structure_sections += self.create_cfr_structure(filename, full_text, text_chunks)
+
             print(f"✅ Completed hybrid store for {filename}: {len(text_chunks)} chunks processed")
             return True
 
@@ -631,6 +672,231 @@ OPTIONS {{
             print(f"❌ Vector index creation failed: {e}")
     # --------------------------------------------------------------------------------- end create_vector_index()
 
+    # --------------------------------------------------------------------------------- create_fulltext_index()
+    def create_fulltext_index(self):
+        """Create the full-text (Lucene) index for keyword search of chunk text.
+
+        The index backs the keyword half of hybrid retrieval in backend/tools/vector.py
+        (vector_retrieval_mode "hybrid"), which finds exact terms such as section
+        numbers, "SCSR" or "cfm" that embeddings blur. The English analyzer drops stop
+        words and stems ("escapeways" matches "escapeway"), and keeps section numbers
+        ("75.1714") as single terms.
+
+        Raises:
+            Exception: If full-text index creation fails due to database connectivity
+                      or configuration issues
+        """
+        print(f"\nCreating full-text index for hybrid keyword search...")
+        try:
+            self.graph.query("""
+CREATE FULLTEXT INDEX `chunkText` IF NOT EXISTS
+FOR (c:Chunk) ON EACH [c.text]
+OPTIONS {
+  indexConfig: {
+    `fulltext.analyzer`: 'english'
+  }
+}
+""")
+            print("✅ Full-text index created - hybrid keyword search ready")
+        except Exception as e:
+            print(f"❌ Full-text index creation failed: {e}")
+    # --------------------------------------------------------------------------------- end create_fulltext_index()
+
+    # --------------------------------------------------------------------------------- create_section_index()
+    def create_section_index(self):
+        """Create the uniqueness constraint that indexes CFR Section nodes by number.
+
+        The constraint's backing index serves both the MERGE of Section nodes during
+        ingest and the `s.id IN $sections` seek of exact-citation lookups, so it is
+        created before any PDF is processed.
+
+        Raises:
+            Exception: If constraint creation fails due to database connectivity
+                      or configuration issues
+        """
+        print(f"\nCreating CFR section index...")
+        try:
+            self.graph.query("""
+CREATE CONSTRAINT `sectionId` IF NOT EXISTS
+FOR (s:Section) REQUIRE s.id IS UNIQUE
+""")
+            print("✅ Section index created - exact CFR section lookups ready")
+        except Exception as e:
+            print(f"❌ Section index creation failed: {e}")
+    # --------------------------------------------------------------------------------- end create_section_index()
+
+    # --------------------------------------------------------------------------------- link_chunk_sections()
+    def link_chunk_sections(self, chunk_id, chunk_text):
+        """Link a chunk to the CFR sections it references.
+
+        Section numbers ("75.400") are extracted with EnhancedCFRParser from section
+        headings, "§" and "section" references and "§§" lists. Each becomes a Section
+        node linked by [:MENTIONS_SECTION {count}], the number of references in the
+        chunk, which ranks chunks at lookup time (the chunk holding a section's text
+        repeats its number in headings and running page heads).
+
+        Args:
+            chunk_id (str): Id of the Chunk node
+            chunk_text (str): Chunk text
+
+        Returns:
+            int: Number of sections linked
+
+        Examples:
+            >>> builder.link_chunk_sections("CFR-2024-title30-vol1.pdf_12", "§ 75.400 Accumulation ...")
+            1
+        """
+        sections = self.cfr_parser.extract_section_numbers(chunk_text)
+        if not sections:
+            return 0
+        
+        self.graph.query("""
+MATCH (c:Chunk {id: $chunk_id})
+UNWIND $sections AS section
+MERGE (s:Section {id: section.id})
+ON CREATE SET s.part = section.part, s.number = section.number
+MERGE (c)-[m:MENTIONS_SECTION]->(s)
+SET m.count = section.count
+""", {
+            "chunk_id": chunk_id,
+            "sections": [
+                {"id": number, "part": int(number.split('.')[0]), "number": int(number.split('.')[1]), "count": count}
+                for number, count in sections.items()
+            ]
+        })
+        return len(sections)
+    # --------------------------------------------------------------------------------- end link_chunk_sections()
+
+    # --------------------------------------------------------------------------------- create_structure_indexes()
+    def create_structure_indexes(self):
+        """Create the indexes that bound traversals of the CFR structure.
+
+        Part numbers and Subpart ids ("75.D") are unique-constrained, so a structural
+        query starts from one index seek; the composite range index on Section
+        (part, number) serves section range queries ("75.300 through 75.399"); and the
+        Chunk id constraint serves the MERGE and MATCH of chunks by id during ingest.
+
+        Raises:
+            Exception: If index creation fails due to database connectivity
+                      or configuration issues
+        """
+        print(f"\nCreating CFR structure indexes...")
+        try:
+            for index_query in [
+                "CREATE CONSTRAINT `partNumber` IF NOT EXISTS FOR (p:Part) REQUIRE p.number IS UNIQUE",
+                "CREATE CONSTRAINT `subpartId` IF NOT EXISTS FOR (sp:Subpart) REQUIRE sp.id IS UNIQUE",
+                "CREATE CONSTRAINT `chunkId` IF NOT EXISTS FOR (c:Chunk) REQUIRE c.id IS UNIQUE",
+                "CREATE RANGE INDEX `sectionPartNumber` IF NOT EXISTS FOR (s:Section) ON (s.part, s.number)",
+            ]:
+                self.graph.query(index_query)
+            print("✅ CFR structure indexes created - bounded Part/Subpart/Section traversals ready")
+        except Exception as e:
+            print(f"❌ CFR structure index creation failed: {e}")
+    # --------------------------------------------------------------------------------- end create_structure_indexes()
+
+    # --------------------------------------------------------------------------------- stamp_build()
+    def stamp_build(self):
+        """Stamp the store build marker with a new build id.
+
+        backend/tools/local_vector_index.py compares this single node with the id
+        read when its embedding mirror was exported, instead of scanning the chunks.
+        It is stamped when a build starts and when it completes, so a mirror exported
+        from a partial build is stale once the build finishes.
+
+        Raises:
+            Exception: If the marker cannot be written
+        """
+        self.graph.query("""
+MERGE (b:StoreBuild {id: 'hybrid_store'})
+SET b.build_id = randomUUID(), b.stamped_at = datetime()
+""")
+    # --------------------------------------------------------------------------------- end stamp_build()
+
+    # --------------------------------------------------------------------------------- create_cfr_structure()
+    def create_cfr_structure(self, filename, full_text, text_chunks):
+        """Materialize the Part/Subpart/Section hierarchy of a CFR volume.
+
+        Headings are parsed from the volume text with EnhancedCFRParser. A section
+        spans from its heading to the next heading, and contains every chunk that
+        overlaps that span (chunks are located in the text in order, since they
+        overlap). Parts without subparts contain their sections directly.
+
+        Args:
+            filename (str): PDF file name (chunk ids are "<filename>_<n>")
+            full_text (str): Extracted text of the volume
+            text_chunks (List[str]): Chunks of the volume text, in order
+
+        Returns:
+            int: Number of sections placed in the structure
+
+        Examples:
+            >>> builder.create_cfr_structure("CFR-2024-title30-vol1.pdf", full_text, text_chunks)
+            1043
+        """
+        headings = self.cfr_parser.parse_cfr_structure(full_text)
+        if not headings:
+            return 0
+
+        # Chunk offsets in the volume text
+        spans, cursor = [], 0
+        for chunk_num, chunk_text in enumerate(text_chunks, start=1):
+            start = full_text.find(chunk_text, cursor)
+            if start < 0:
+                continue
+            spans.append((start, start + len(chunk_text), f"{filename}_{chunk_num}"))
+            cursor = start + 1
+
+        parts, subparts, sections = {}, {}, []
+        for position, heading in enumerate(headings):
+            parts.setdefault(heading.part, "")
+            if heading.level == CFRHierarchyLevel.PART:
+                parts[heading.part] = parts[heading.part] or heading.title
+            elif heading.level == CFRHierarchyLevel.SUBPART:
+                subparts.setdefault(f"{heading.part}.{heading.subpart}", {
+                    "id": f"{heading.part}.{heading.subpart}", "part": heading.part,
+                    "letter": heading.subpart, "title": heading.title,
+                })
+            else:
+                end = headings[position + 1].start if position + 1 < len(headings) else len(full_text)
+                sections.append({
+                    "id": heading.section, "part": heading.part, "number": int(heading.section.split('.')[1]),
+                    "title": heading.title,
+                    "parent": f"{heading.part}.{heading.subpart}" if heading.subpart else None,
+                    "chunks": [chunk_id for chunk_start, chunk_end, chunk_id in spans
+                               if chunk_start < end and chunk_end > heading.start],
+                })
+
+        self.graph.query("""
+MERGE (t:Title {number: 30})
+WITH t
+UNWIND $parts AS part
+MERGE (p:Part {number: part.number})
+SET p.title = CASE WHEN part.title = '' THEN p.title ELSE part.title END
+MERGE (t)-[:CONTAINS]->(p)
+""", {"parts": [{"number": number, "title": title} for number, title in parts.items()]})
+        self.graph.query("""
+UNWIND $subparts AS subpart
+MATCH (p:Part {number: subpart.part})
+MERGE (sp:Subpart {id: subpart.id})
+ON CREATE SET sp.part = subpart.part, sp.letter = subpart.letter, sp.title = subpart.title
+MERGE (p)-[:CONTAINS]->(sp)
+""", {"subparts": list(subparts.values())})
+        self.graph.query("""
+UNWIND $sections AS section
+MERGE (s:Section {id: section.id})
+SET s.part = section.part, s.number = section.number, s.title = section.title
+WITH s, section
+OPTIONAL MATCH (sp:Subpart {id: section.parent})
+MATCH (p:Part {number: section.part})
+FOREACH (parent IN CASE WHEN sp IS NULL THEN [p] ELSE [sp] END | MERGE (parent)-[:CONTAINS]->(s))
+WITH s, section
+UNWIND section.chunks AS chunk_id
+MATCH (c:Chunk {id: chunk_id})
+MERGE (s)-[:CONTAINS]->(c)
+""", {"sections": sections})
+        return len(sections)
+    # --------------------------------------------------------------------------------- end create_cfr_structure()
+
 # ------------------------------------------------------------------------- end HybridStoreBuilder
 
 # =========================================================================
@@ -680,8 +946,13 @@ def main():
         print("✅ Database cleared - starting fresh hybrid store build")
         
         # Process all PDFs to build hybrid store
+        builder.stamp_build()
+        builder.create_section_index()
+        builder.create_structure_indexes()
         builder.process_directory(data_path)
         builder.create_vector_index()
+        builder.create_fulltext_index()
+        builder.stamp_build()
         
         # Final summary
         builder.print_final_summary()
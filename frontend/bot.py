@@ -26,6 +26,9 @@
 # - Function: display_system_health()
 # - Function: get_welcome_message()
 # - Function: call_parallel_hybrid_api()
+# - Function: stream_parallel_hybrid_api()
+# - Functions: is_streaming_unavailable(), is_server_busy(), get_busy_message()
+# - Function: render_streaming_response()
 # - Function: handle_submit()
 # - Function: process_template_response()
 # - Function: display_post_processing_feedback()
@@ -40,7 +43,8 @@
 # This file relies on several standard and third-party libraries for its
 # functionality, as well as an environment variable for backend configuration.
 # - Standard Library: datetime (for timestamps), os (for environment variables),
-#                     json (for data serialization), uuid (for session IDs)
+#                     json (for data serialization), time (for time-to-first-token),
+#                     uuid (for session IDs)
 # - Third-Party: streamlit (for UI framework), requests (for HTTP communication)
 # - Local Project Modules: None (this is a standalone script communicating via HTTP)
 # -------------------------------------------------------------------------
@@ -49,7 +53,7 @@
 # This module is the primary entry point for the MRCA frontend application.
 # It is designed to be run directly as a Streamlit application (e.g., `streamlit run bot.py`).
 # It integrates with the `backend` FastAPI service by making HTTP requests to its
-# `/generate_parallel_hybrid` endpoint. It handles user input, displays responses,
+# `/generate_parallel_hybrid/stream` endpoint (falling back to `/generate_parallel_hybrid`). It handles user input, displays responses,
 # manages session state, and provides configuration options for the Advanced Parallel Hybrid RAG.
 # -------------------------------------------------------------------------
 
@@ -71,8 +75,9 @@ Hybrid RAG technology for mining safety regulation queries.
 # =========================================================================
 # Standard library imports
 from datetime import datetime  # Used for displaying current date in sidebar.
+import json  # Used to decode server-sent event payloads.
 import os  # Used to retrieve environment variables like BACKEND_URL.
-
+import time  # Used to measure time to first token.
 import uuid  # Used for generating unique session IDs.
 
 # Third-party library imports
@@ -179,16 +184,32 @@ def display_parallel_hybrid_metrics(metadata: dict) -> None:
     This function visually presents key performance indicators and analytical insights
     from the backend's Advanced Parallel Hybrid processing, including total processing
     time, confidence scores, quality scores, and the contribution of VectorRAG and GraphRAG.
+    Responses served from the backend semantic cache are flagged above the metrics.
 
     Args:
         metadata (dict): A dictionary containing the processing metadata from the
                          backend API response. Expected to contain keys like
-                         'processing_time' and nested 'metadata' for 'context_fusion'
-                         and 'hybrid_template'.
+                         'processing_time' and nested 'metadata' for 'context_fusion',
+                         'hybrid_template', 'cache' and 'streaming'.
     """
     if not metadata:
         return
 
+    # Indicate responses served from the backend semantic cache
+    cache_data = metadata.get('metadata', {}).get('cache', {})
+    if cache_data.get('hit'):
+        st.caption(
+            f"⚡ Served from semantic cache (similarity {cache_data.get('similarity', 0):.1%}, "
+            f"cached {cache_data.get('age_seconds', 0):.0f}s ago)"
+        )
+
+    # Report time to first token for streamed responses
+    streaming_data = metadata.get('metadata', {}).get('streaming', {})
+    if streaming_data.get('time_to_first_token_ms') is not None:
+        client_ttft = metadata.get('client_time_to_first_token_ms')
+        client_note = f", {client_ttft:.0f} ms in browser" if client_ttft is not None else ""
+        st.caption(f"⏱️ Time to first token: {streaming_data['time_to_first_token_ms']} ms on server{client_note}")
+
     # Create expandable metrics section
     with st.expander("🔬 Advanced Parallel HybridRAG Metrics", expanded=False):
         col1, col2, col3 = st.columns(3)
@@ -281,7 +302,7 @@ def display_parallel_hybrid_config() -> None:
     with col1:
         fusion_strategy = st.selectbox(
             "Fusion Strategy",
-            options=["advanced_hybrid", "weighted_linear", "max_confidence", "adaptive_fusion"],
+            options=["advanced_hybrid", "weighted_linear", "max_confidence", "adaptive_fusion", "extractive"],
             index=0,
             key="fusion_strategy",
             help="Algorithm for combining VectorRAG and GraphRAG results"
@@ -301,7 +322,8 @@ def display_parallel_hybrid_config() -> None:
         "advanced_hybrid": "**Advanced Hybrid**: Research-based fusion with complementarity analysis",
         "weighted_linear": "**Weighted Linear**: Confidence-based linear combination",
         "max_confidence": "**Max Confidence**: Select highest confidence result with context",
-        "adaptive_fusion": "**Adaptive**: Dynamic strategy selection based on content"
+        "adaptive_fusion": "**Adaptive**: Dynamic strategy selection based on content",
+        "extractive": "**Extractive**: Fast LLM-free sentence selection that keeps every CFR citation"
     }
 
     template_descriptions = {
@@ -536,6 +558,219 @@ def call_parallel_hybrid_api(user_input: str, session_id: str, fusion_strategy:
         return f"Error calling parallel hybrid API: {str(e)}", None
 # --------------------------------------------------------------------------------- end call_parallel_hybrid_api()
 
+# --------------------------------------------------------------------------------- stream_parallel_hybrid_api()
+def stream_parallel_hybrid_api(user_input: str, session_id: str, fusion_strategy: str, template_type: str):
+    """Calls the streaming parallel hybrid backend API and yields its server-sent events.
+
+    The backend emits `stage` events as retrieval and fusion complete, `token` events
+    for each chunk of the answer, then a single `done` event carrying the complete
+    response, or an `error` event if processing failed.
+
+    Args:
+        user_input (str): The natural language query from the user.
+        session_id (str): The unique identifier for the current user session.
+        fusion_strategy (str): The chosen fusion strategy (e.g., "advanced_hybrid").
+        template_type (str): The chosen template type (e.g., "regulatory_compliance").
+
+    Yields:
+        tuple: `(event, data)` pairs where `event` is the event name and `data`
+               the decoded JSON payload.
+
+    Raises:
+        requests.exceptions.RequestException: If the connection fails or the
+                                              backend returns a non-200 status.
+    """
+    payload = {
+        "user_input": user_input,
+        "session_id": session_id,
+        "fusion_strategy": fusion_strategy,
+        "template_type": template_type
+    }
+
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "text/event-stream",
+        "X-Session-ID": session_id
+    }
+
+    with requests.post(
+        f"{BACKEND_URL}/generate_parallel_hybrid/stream",
+        json=payload,
+        headers=headers,
+        stream=True,
+        timeout=None # No timeout - allow unlimited processing time for active sessions
+    ) as response:
+        response.raise_for_status()
+
+        event = "message"
+        data_lines = []
+        for line in response.iter_lines(decode_unicode=True):
+            if line is None:
+                continue
+            if line == "":
+                # A blank line terminates the current event
+                if data_lines:
+                    yield event, json.loads("\n".join(data_lines))
+                event = "message"
+                data_lines = []
+            elif line.startswith("event:"):
+                event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                data_lines.append(line[len("data:"):].strip())
+# --------------------------------------------------------------------------------- end stream_parallel_hybrid_api()
+
+# --------------------------------------------------------------------------------- is_streaming_unavailable()
+def is_streaming_unavailable(error: Exception) -> bool:
+    """Checks whether a streaming failure means the blocking endpoint should be tried.
+
+    Only a failed connection or a backend without the streaming endpoint (404/405)
+    qualifies; any other failure would recur or repeat the work on the blocking endpoint.
+
+    Args:
+        error (Exception): The exception raised while streaming.
+
+    Returns:
+        bool: True if the request can be retried on `/generate_parallel_hybrid`.
+    """
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return True
+    return (isinstance(error, requests.exceptions.HTTPError) and error.response is not None
+            and error.response.status_code in (404, 405))
+# --------------------------------------------------------------------------------- end is_streaming_unavailable()
+
+# --------------------------------------------------------------------------------- is_server_busy()
+def is_server_busy(error: Exception) -> bool:
+    """Checks whether the backend shed the request under load (503 from admission control).
+
+    Args:
+        error (Exception): The exception raised while streaming.
+
+    Returns:
+        bool: True for a 503 response.
+    """
+    return (isinstance(error, requests.exceptions.HTTPError) and error.response is not None
+            and error.response.status_code == 503)
+# --------------------------------------------------------------------------------- end is_server_busy()
+
+# --------------------------------------------------------------------------------- get_busy_message()
+def get_busy_message(error: requests.exceptions.HTTPError) -> str:
+    """Builds the message shown when the backend is too busy to take the question.
+
+    Args:
+        error (requests.exceptions.HTTPError): The 503 error, carrying the Retry-After header.
+
+    Returns:
+        str: Message asking the user to resubmit after the suggested delay.
+    """
+    retry_after = error.response.headers.get("Retry-After")
+    wait = f"in about {retry_after} seconds" if retry_after and retry_after.isdigit() else "in a moment"
+    return f"⏳ The compliance assistant is handling many questions right now. Please submit your question again {wait}."
+# --------------------------------------------------------------------------------- end get_busy_message()
+
+# --------------------------------------------------------------------------------- render_streaming_response()
+def render_streaming_response(message: str, session_id: str, fusion_strategy: str, template_type: str) -> tuple:
+    """Renders a streamed backend response incrementally in the assistant chat bubble.
+
+    Stage events update a status panel (retrieval confidences, fusion results) and
+    answer tokens are appended to the message as they arrive. Once the `done` event
+    is received the placeholder is replaced with the final, template-processed response.
+
+    Args:
+        message (str): The user's question.
+        session_id (str): The unique identifier for the current user session.
+        fusion_strategy (str): The chosen fusion strategy.
+        template_type (str): The chosen template type.
+
+    Only a missing streaming endpoint (404/405) or a failed connection returns None,
+    letting the caller retry on the blocking endpoint; the assistant bubble is then
+    removed. A busy server (503) and backend `error` events are shown to the user,
+    since retrying would add load or re-run the whole pipeline.
+
+    Returns:
+        tuple: A tuple containing:
+               - str | None: The final response text or error message, or None if
+                             streaming is unavailable.
+               - dict | None: Response metadata, including client-side time to
+                              first token, or None on failure.
+    """
+    start_time = time.time()
+    client_ttft_ms = None
+    streamed_text = ""
+    final_data = None
+
+    # Held in a placeholder so the bubble can be removed if the caller retries without streaming
+    bubble = st.empty()
+    with bubble.container(), st.chat_message("assistant"):
+        status = st.status("🔬 Running parallel VectorRAG + GraphRAG retrieval...", expanded=False)
+        placeholder = st.empty()
+
+        try:
+            for event, data in stream_parallel_hybrid_api(message, session_id, fusion_strategy, template_type):
+                if event == "stage" and data.get("stage") == "cache":
+                    status.update(label=f"⚡ Semantic cache hit (similarity {data.get('similarity', 0):.1%})", state="complete")
+                elif event == "stage" and data.get("stage") == "retrieval":
+                    status.write(
+                        f"Retrieval done in {data.get('elapsed_ms', 0)} ms — "
+                        f"Vector {data.get('vector_confidence', 0):.1%}, Graph {data.get('graph_confidence', 0):.1%}"
+                    )
+                    status.update(label="🔗 Fusing contexts...")
+                elif event == "stage" and data.get("stage") == "fusion":
+                    status.write(
+                        f"Fusion done in {data.get('elapsed_ms', 0)} ms — "
+                        f"confidence {data.get('final_confidence', 0):.1%}, quality {data.get('quality_score', 0):.1%}"
+                    )
+                    status.update(label="✍️ Generating response...")
+                elif event == "token":
+                    if client_ttft_ms is None:
+                        client_ttft_ms = (time.time() - start_time) * 1000
+                    streamed_text += data.get("text", "")
+                    placeholder.markdown(streamed_text + "▌")
+                elif event == "done":
+                    final_data = data
+                elif event == "error":
+                    raise RuntimeError(data.get("message", "Streaming error"))
+        except Exception as e:
+            if streamed_text:
+                status.update(label="❌ Response interrupted", state="error")
+                placeholder.markdown(streamed_text)
+                return streamed_text + f"\n\n*Response interrupted: {str(e)}*", None
+            if is_streaming_unavailable(e):
+                bubble.empty()
+                return None, None
+            status.update(label="❌ Request failed", state="error")
+            error_message = (get_busy_message(e) if is_server_busy(e)
+                             else handle_processing_error(e, fusion_strategy, template_type))
+            placeholder.markdown(error_message)
+            return error_message, None
+
+        if final_data is None:
+            status.update(label="❌ Response interrupted", state="error")
+            interrupted = ((streamed_text + "\n\n" if streamed_text else "")
+                           + "*Response interrupted: the stream ended before the response was complete.*")
+            placeholder.markdown(interrupted)
+            return interrupted, None
+
+        status.update(label="✅ Response complete", state="complete")
+
+        metadata = {
+            "processing_time": final_data.get("processing_time", 0),
+            "mode": "parallel_hybrid",
+            "metadata": final_data.get("metadata", {}),
+            "client_time_to_first_token_ms": client_ttft_ms,
+            "config": {
+                'fusion_strategy': fusion_strategy,
+                'template_type': template_type,
+                'processing_mode': 'advanced_parallel_hybrid'
+            }
+        }
+        response = process_template_response(final_data.get("response", streamed_text), template_type, metadata)
+        placeholder.markdown(response)
+        display_parallel_hybrid_metrics(metadata)
+        display_post_processing_feedback(fusion_strategy, template_type, metadata)
+
+    return response, metadata
+# --------------------------------------------------------------------------------- end render_streaming_response()
+
 # --------------------------------------------------------------------------------- handle_submit()
 def handle_submit(message: str) -> None:
     """Handles the user's message submission, orchestrating the request to the
@@ -543,8 +778,10 @@ def handle_submit(message: str) -> None:
 
     This function acts as the central logic for processing user input. It
     validates the selected fusion strategy and template type, displays
-    processing information, calls the backend API, and then formats and
-    displays the assistant's response, including detailed metrics and feedback.
+    processing information, streams the response from the backend as it is
+    generated, and then formats and displays the assistant's response, including
+    detailed metrics and feedback. If streaming is unavailable, it falls back
+    to the blocking backend API.
 
     Args:
         message (str): The user's input message to be processed.
@@ -557,7 +794,7 @@ def handle_submit(message: str) -> None:
     template_type = st.session_state.get("template_type", "regulatory_compliance")
 
     # Validate fusion strategy
-    valid_fusion_strategies = ["advanced_hybrid", "weighted_linear", "max_confidence", "adaptive_fusion"]
+    valid_fusion_strategies = ["advanced_hybrid", "weighted_linear", "max_confidence", "adaptive_fusion", "extractive"]
     if fusion_strategy not in valid_fusion_strategies:
         st.warning(f"⚠️ Invalid fusion strategy '{fusion_strategy}'. Using default 'advanced_hybrid'.")
         fusion_strategy = "advanced_hybrid"
@@ -578,15 +815,29 @@ def handle_submit(message: str) -> None:
     • Mode: Simultaneous VectorRAG + GraphRAG
     """
 
-    # Generate response using Advanced Parallel Hybrid
-    with st.spinner(f'🔬 Be patient! Processing with {fusion_strategy.replace("_", " ").title()} fusion and {template_type.replace("_", " ").title()} template...'):
-        try:
-            session_id = get_session_id()
+    try:
+        session_id = get_session_id()
 
-            # Show brief processing info
-            with st.expander("Current Processing Configuration", expanded=False):
-                st.markdown(processing_info)
+        # Show brief processing info
+        with st.expander("Current Processing Configuration", expanded=False):
+            st.markdown(processing_info)
 
+        # Stream the response incrementally; already rendered, so only saved here
+        response, metadata = render_streaming_response(message, session_id, fusion_strategy, template_type)
+        if response is not None:
+            message_data: dict = {"role": "assistant", "content": response}
+            if metadata:
+                message_data["metadata"] = metadata
+            st.session_state.messages.append(message_data)
+            return
+    except Exception as e:
+        error_message = handle_processing_error(e, fusion_strategy, template_type)
+        write_message('assistant', error_message)
+        return
+
+    # Fall back to the blocking endpoint if there is no streaming endpoint or connection
+    with st.spinner(f'🔬 Be patient! Processing with {fusion_strategy.replace("_", " ").title()} fusion and {template_type.replace("_", " ").title()} template...'):
+        try:
             # Call API with selected configuration
             response, metadata = call_parallel_hybrid_api(message, session_id, fusion_strategy, template_type)
 
@@ -690,7 +941,8 @@ def display_post_processing_feedback(fusion_strategy: str, template_type: str, m
         "advanced_hybrid": f"Advanced Parallel Hybrid executed simultaneous VectorRAG ({vector_contrib:.0%}) and GraphRAG ({graph_contrib:.0%}) with multi-factor fusion: complementarity analysis, quality assessment ({quality_score*100:.0f}%), and semantic coherence optimization achieving {confidence*100:.1f}% confidence",
         "weighted_linear": f"Weighted linear fusion combined VectorRAG ({vector_contrib:.0%}) and GraphRAG ({graph_contrib:.0%}) using confidence-based dynamic weighting achieving {confidence*100:.1f}% confidence with {quality_score*100:.0f}% content quality",
         "max_confidence": f"Max confidence selection chose the highest-scoring source ({('VectorRAG' if vector_contrib > graph_contrib else 'GraphRAG')}) with context enrichment achieving {confidence*100:.1f}% confidence and {quality_score*100:.0f}% quality",
-        "adaptive_fusion": f"Adaptive fusion analyzed content complexity and dynamically selected optimal strategy, processing VectorRAG ({vector_contrib:.0%}) and GraphRAG ({graph_contrib:.0%}) to achieve {confidence*100:.1f}% confidence with {quality_score*100:.0f}% quality"
+        "adaptive_fusion": f"Adaptive fusion analyzed content complexity and dynamically selected optimal strategy, processing VectorRAG ({vector_contrib:.0%}) and GraphRAG ({graph_contrib:.0%}) to achieve {confidence*100:.1f}% confidence with {quality_score*100:.0f}% quality",
+        "extractive": f"Extractive fusion selected and deduplicated the most relevant sentences from VectorRAG ({vector_contrib:.0%}) and GraphRAG ({graph_contrib:.0%}) without an LLM call, preserving every CFR citation, achieving {confidence*100:.1f}% confidence with {quality_score*100:.0f}% quality"
     }
 
     # Template-specific feedback messages
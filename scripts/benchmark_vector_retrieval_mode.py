@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -------------------------------------------------------------------------
+# File: benchmark_vector_retrieval_mode.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: scripts/benchmark_vector_retrieval_mode.py
+# -------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Benchmark comparing the two vector branch modes of the parallel retrieval engine
+# end to end (retrieval -> context fusion -> hybrid response generation):
+# - "answer": vector retrieval + answer LLM call (stuff-documents chain)
+# - "chunks": retrieval only, ranked chunks handed to context fusion directly
+# It reports per-stage and end-to-end latency plus LLM call and token counts.
+# Runs against the live services configured in .streamlit/secrets.toml.
+# -------------------------------------------------------------------------
+
+# --- Module Contents Overview ---
+# - Class: TokenUsageHandler - LangChain callback counting LLM calls and tokens
+# - Class: ModeRun - Measurements for one query in one mode
+# - Function: install_token_counter() - Attaches the token counter to every LLM the pipeline creates
+# - Function: run_query() - Runs one query through the full pipeline
+# - Function: run_benchmark() - Runs every query in every mode and prints a summary
+# - Function: main() - Command-line entry point
+# -------------------------------------------------------------------------
+
+# --- Dependencies / Imports ---
+# - Standard Library:
+#   - argparse: Command-line interface
+#   - asyncio: Runs the async pipeline
+#   - statistics: Latency summaries
+#   - sys, pathlib: Project root on sys.path
+#   - threading: Thread-safe token counting
+#   - time: Latency measurement
+#   - dataclasses, typing: Result containers and type hints
+# - Third-Party:
+#   - langchain_core.callbacks.BaseCallbackHandler: Token usage collection
+# - Local Project Modules:
+#   - backend.parallel_hybrid, backend.context_fusion, backend.hybrid_templates: The pipeline
+#   - backend.llm, backend.tools.vector, backend.tools.cypher: LLM factories instrumented for tokens
+# -------------------------------------------------------------------------
+
+# --- Usage / Integration ---
+# python scripts/benchmark_vector_retrieval_mode.py [--runs 2] [--modes answer chunks]
+# Queries run sequentially so latencies are not distorted by contention.
+# Set vector_retrieval_mode in BackendConfig to adopt the faster mode.
+# -------------------------------------------------------------------------
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+MRCA Vector Retrieval Mode Benchmark
+
+End-to-end latency and token comparison of the "answer" and "chunks" vector
+branch modes of the Advanced Parallel Hybrid pipeline.
+"""
+
+# =========================================================================
+# Imports
+# =========================================================================
+# Standard library imports
+import argparse
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Make the project root importable when run as a script
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Third-party library imports
+from langchain_core.callbacks import BaseCallbackHandler
+
+# Local application/library specific imports
+import backend.llm as llm_module
+import backend.context_fusion as context_fusion_module
+import backend.tools.cypher as cypher_module
+import backend.tools.vector as vector_module
+from backend.context_fusion import HybridContextFusion, FusionStrategy
+from backend.hybrid_templates import generate_hybrid_response, TemplateType
+from backend.parallel_hybrid import ParallelRetrievalEngine, VECTOR_RETRIEVAL_MODES
+
+# =========================================================================
+# Global Constants / Variables
+# =========================================================================
+# Representative regulatory questions (mix of semantic and structural queries)
+BENCHMARK_QUERIES = [
+    "What are the methane monitoring requirements in underground coal mines?",
+    "What personal protective equipment is required for surface metal mines?",
+    "How often must roof bolts be examined in underground coal mines?",
+    "What are the requirements for escapeways in underground mines?",
+    "What training must new miners receive before starting work?",
+]
+
+# =========================================================================
+# Class Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- class TokenUsageHandler
+class TokenUsageHandler(BaseCallbackHandler):
+    """LangChain callback handler counting LLM calls and token usage."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+            }
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        """Record one LLM call and its reported token usage."""
+        usage = (response.llm_output or {}).get("token_usage", {}) or {}
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+            self.completion_tokens += usage.get("completion_tokens", 0) or 0
+# ------------------------------------------------------------------------- end class TokenUsageHandler
+
+# ------------------------------------------------------------------------- class ModeRun
+@dataclass
+class ModeRun:
+    """Measurements for one query in one vector retrieval mode."""
+    mode: str
+    query: str
+    retrieval_ms: float
+    fusion_ms: float
+    generation_ms: float
+    total_ms: float
+    llm_calls: int
+    prompt_tokens: int
+    completion_tokens: int
+# ------------------------------------------------------------------------- end class ModeRun
+
+# =========================================================================
+# Standalone Function Definitions
+# =========================================================================
+
+# ------------------------------------------------------------------------- install_token_counter()
+def install_token_counter(handler: TokenUsageHandler) -> None:
+    """Attach the handler to every LLM instance the pipeline creates.
+
+    Wraps get_llm() in each module that imported it so chains built afterwards
+    report their token usage to the handler.
+
+    Args:
+        handler (TokenUsageHandler): Counter to attach.
+    """
+    original_get_llm = llm_module.get_llm
+
+    def counted_get_llm():
+        llm = original_get_llm()
+        llm.callbacks = [handler]
+        return llm
+
+    for module in (llm_module, context_fusion_module, cypher_module, vector_module):
+        module.get_llm = counted_get_llm
+# ------------------------------------------------------------------------- end install_token_counter()
+
+# ------------------------------------------------------------------------- run_query()
+async def run_query(engine: ParallelRetrievalEngine, fusion: HybridContextFusion,
+                    handler: TokenUsageHandler, query: str) -> ModeRun:
+    """Run one query through retrieval, fusion and response generation.
+
+    Args:
+        engine (ParallelRetrievalEngine): Engine configured for the mode under test.
+        fusion (HybridContextFusion): Fusion engine.
+        handler (TokenUsageHandler): Token counter (reset per query).
+        query (str): User question.
+
+    Returns:
+        ModeRun: Stage latencies and token usage for the query.
+    """
+    handler.reset()
+    start = time.perf_counter()
+
+    retrieval = await engine.retrieve_parallel(query)
+    retrieved = time.perf_counter()
+
+    fusion_result = await fusion.fuse_contexts(retrieval, FusionStrategy.ADVANCED_HYBRID)
+    fused = time.perf_counter()
+
+    await generate_hybrid_response(query, fusion_result, TemplateType.REGULATORY_COMPLIANCE)
+    generated = time.perf_counter()
+
+    usage = handler.snapshot()
+    return ModeRun(
+        mode=engine.vector_retrieval_mode,
+        query=query,
+        retrieval_ms=(retrieved - start) * 1000,
+        fusion_ms=(fused - retrieved) * 1000,
+        generation_ms=(generated - fused) * 1000,
+        total_ms=(generated - start) * 1000,
+        llm_calls=usage["calls"],
+        prompt_tokens=usage["prompt_tokens"],
+        completion_tokens=usage["completion_tokens"],
+    )
+# ------------------------------------------------------------------------- end run_query()
+
+# ------------------------------------------------------------------------- run_benchmark()
+async def run_benchmark(modes: List[str], runs: int) -> List[ModeRun]:
+    """Run every benchmark query in every mode and print a summary table.
+
+    A warm-up query per mode builds the shared chains first so the numbers
+    exclude one-time initialization.
+
+    Args:
+        modes (List[str]): Vector retrieval modes to compare.
+        runs (int): Repetitions of the query set per mode.
+
+    Returns:
+        List[ModeRun]: All measurements.
+    """
+    handler = TokenUsageHandler()
+    install_token_counter(handler)
+    fusion = HybridContextFusion()
+    results: List[ModeRun] = []
+
+    for mode in modes:
+        engine = ParallelRetrievalEngine(vector_retrieval_mode=mode)
+        try:
+            await run_query(engine, fusion, handler, BENCHMARK_QUERIES[0])
+            for _ in range(runs):
+                for query in BENCHMARK_QUERIES:
+                    run = await run_query(engine, fusion, handler, query)
+                    results.append(run)
+                    print(f"  [{mode:7}] {run.total_ms:8.0f} ms  {run.llm_calls} LLM calls  "
+                          f"{run.prompt_tokens + run.completion_tokens:6} tokens  {query[:50]}")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+    print("\nMode     | retrieval p50 | fusion p50 | total p50 | total p95 | LLM calls | tokens/query")
+    print("---------|---------------|------------|-----------|-----------|-----------|-------------")
+    for mode in modes:
+        runs_for_mode = [r for r in results if r.mode == mode]
+        if not runs_for_mode:
+            continue
+        totals = sorted(r.total_ms for r in runs_for_mode)
+        p95 = totals[min(len(totals) - 1, int(0.95 * len(totals)))]
+        print(f"{mode:8} | {statistics.median(r.retrieval_ms for r in runs_for_mode):10.0f} ms"
+              f" | {statistics.median(r.fusion_ms for r in runs_for_mode):7.0f} ms"
+              f" | {statistics.median(totals):6.0f} ms | {p95:6.0f} ms"
+              f" | {statistics.mean(r.llm_calls for r in runs_for_mode):9.1f}"
+              f" | {statistics.mean(r.prompt_tokens + r.completion_tokens for r in runs_for_mode):12.0f}")
+    return results
+# ------------------------------------------------------------------------- end run_benchmark()
+
+# ------------------------------------------------------------------------- main()
+def main() -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Compare vector retrieval modes end to end")
+    parser.add_argument("--runs", type=int, default=2, help="Repetitions of the query set per mode")
+    parser.add_argument("--modes", nargs="+", default=list(VECTOR_RETRIEVAL_MODES),
+                        choices=VECTOR_RETRIEVAL_MODES, help="Modes to benchmark")
+    args = parser.parse_args()
+
+    print("🚀 MRCA Vector Retrieval Mode Benchmark")
+    asyncio.run(run_benchmark(args.modes, args.runs))
+    return 0
+# ------------------------------------------------------------------------- end main()
+
+# =========================================================================
+# Entry Point
+# =========================================================================
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# =========================================================================
+# End of File
+# =========================================================================
@@ -0,0 +1,142 @@
+# -------------------------------------------------------------------------
+# File: test_admission.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_admission.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for admission control in backend/admission.py
+# Tests the concurrency bound, bounded wait queue, queue timeouts,
+# Retry-After hints, metrics, and the ASGI middleware 503 response.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Admission Control Unit Tests
+
+Testing of the AdmissionController and AdmissionControlMiddleware classes:
+- No more than max_concurrent requests hold a slot
+- Requests beyond the queue bound are shed immediately
+- Queued requests are shed after max_queue_wait_seconds
+- Shed requests get a 503 with a Retry-After header
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from backend.admission import AdmissionController, AdmissionControlMiddleware, AdmissionRejectedError
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+async def hold_slot(controller, seconds, tracker):
+    """Hold an admission slot for a while, tracking the peak concurrency."""
+    async with controller.admit():
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        await asyncio.sleep(seconds)
+        tracker["active"] -= 1
+
+
+# =========================================================================
+# Unit Tests for AdmissionController
+# =========================================================================
+
+@pytest.mark.unit
+class TestAdmissionController:
+    """Test AdmissionController concurrency and queue bounds."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bound_and_queue_waits(self):
+        """Test that queued requests wait for a slot and are then admitted."""
+        controller = AdmissionController(max_concurrent=2, max_queue_size=10, max_queue_wait_seconds=5)
+        tracker = {"active": 0, "peak": 0}
+
+        await asyncio.gather(*(hold_slot(controller, 0.02, tracker) for _ in range(6)))
+        stats = controller.get_stats()
+
+        assert tracker["peak"] == 2
+        assert stats["admitted"] == 6
+        assert stats["admitted_immediately"] == 2
+        assert stats["peak_queue_depth"] == 4
+        assert stats["wait_ms_max"] > 0
+        assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects_immediately(self):
+        """Test that a request is shed when the wait queue is full."""
+        controller = AdmissionController(max_concurrent=1, max_queue_size=1, max_queue_wait_seconds=5,
+                                         retry_after_seconds=3)
+        tracker = {"active": 0, "peak": 0}
+        holder = asyncio.create_task(hold_slot(controller, 0.1, tracker))
+        queued = asyncio.create_task(hold_slot(controller, 0.0, tracker))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire()
+        await asyncio.gather(holder, queued)
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.retry_after_seconds >= 3
+        assert controller.get_stats()["rejected_queue_full"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects(self):
+        """Test that a queued request is shed after max_queue_wait_seconds."""
+        controller = AdmissionController(max_concurrent=1, max_queue_size=5, max_queue_wait_seconds=0.02)
+        tracker = {"active": 0, "peak": 0}
+        holder = asyncio.create_task(hold_slot(controller, 0.2, tracker))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire()
+        await holder
+
+        assert exc_info.value.reason == "queue_timeout"
+        stats = controller.get_stats()
+        assert stats["rejected_queue_timeout"] == 1
+        assert stats["queue_depth"] == 0
+
+
+# =========================================================================
+# Unit Tests for AdmissionControlMiddleware
+# =========================================================================
+
+@pytest.mark.unit
+class TestAdmissionControlMiddleware:
+    """Test the ASGI middleware path filtering and 503 response."""
+
+    @pytest.mark.asyncio
+    async def test_shed_request_gets_503_with_retry_after(self):
+        """Test that a shed request is answered with 503 and Retry-After."""
+        controller = AdmissionController(max_concurrent=1, max_queue_size=0, retry_after_seconds=7)
+        await controller.acquire()
+        app_calls = []
+
+        async def app(scope, receive, send):
+            app_calls.append(scope["path"])
+
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        middleware = AdmissionControlMiddleware(app, paths=("/generate_parallel_hybrid",))
+        scope = {"type": "http", "path": "/generate_parallel_hybrid", "method": "POST", "headers": []}
+        with patch("backend.admission.get_admission_controller", return_value=controller):
+            await middleware(scope, None, send)
+            await middleware({**scope, "path": "/health"}, None, send)
+
+        start = messages[0]
+        assert start["status"] == 503
+        assert (b"retry-after", b"7") in start["headers"]
+        assert app_calls == ["/health"]
@@ -0,0 +1,228 @@
+# -------------------------------------------------------------------------
+# File: test_batch_endpoint.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_batch_endpoint.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the NDJSON batch endpoint /generate_parallel_hybrid/batch in
+# backend/main.py, with question answering and embedding faked.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Batch Endpoint Unit Tests
+
+Testing of batch_parallel_hybrid_response():
+- Whitespace variants of a question are answered once
+- Distinct questions are embedded with one batched call
+- A failing question does not fail the batch
+- Closing the stream cancels the questions still running
+- processing_time counts from batch receipt
+- Each running question holds its own admission control slot
+- Questions shed by admission control fail individually
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("fastapi")
+
+from backend import main
+from backend.admission import AdmissionController
+from backend.main import ParallelHybridBatchRequest, ParallelHybridResponse, batch_parallel_hybrid_response
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+QUESTIONS = [
+    "What are the methane monitoring requirements?",
+    "How often must roof bolts be examined?",
+    "When is a self-rescuer required?",
+    "What are the ventilation plan requirements?",
+]
+
+class FakeAnswer:
+    """Replacement for _answer_request recording questions, embeddings, cancellations and admission load."""
+
+    def __init__(self, controller=None, seconds=0.02, errors=None, slow=None):
+        self.controller = controller
+        self.seconds = seconds
+        self.errors = errors or {}
+        self.slow = slow or {}
+        self.questions = []
+        self.embeddings = []
+        self.cancelled = []
+        self.peak_in_flight = 0
+
+    async def __call__(self, request, session_id, start_time, query_embedding=None, emit=None):
+        self.questions.append(request.user_input)
+        self.embeddings.append(query_embedding)
+        if self.controller is not None:
+            self.peak_in_flight = max(self.peak_in_flight, self.controller.get_stats()["in_flight"])
+        try:
+            await asyncio.sleep(self.slow.get(request.user_input, self.seconds))
+        except asyncio.CancelledError:
+            self.cancelled.append(request.user_input)
+            raise
+        if request.user_input in self.errors:
+            raise self.errors[request.user_input]
+        return ParallelHybridResponse(response=f"answer to {request.user_input}", session_id=session_id,
+                                      processing_time=time.time() - start_time, timestamp="", metadata={})
+
+class FakeEmbeddings:
+    """Cached embeddings client counting batched query embedding calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_queries(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+async def no_embeddings(queries):
+    """Batch embedding stand-in that embeds nothing."""
+    return [None] * len(queries)
+
+async def run_batch(queries, max_concurrency=None):
+    """Run the endpoint and parse its NDJSON lines."""
+    request = ParallelHybridBatchRequest(queries=queries, max_concurrency=max_concurrency)
+    response = await batch_parallel_hybrid_response(request, session_id="batch-session")
+    return [json.loads(line) async for line in response.body_iterator]
+
+
+# =========================================================================
+# Unit Tests for Batch Processing
+# =========================================================================
+
+@pytest.mark.unit
+class TestBatchProcessing:
+    """Test batch deduplication, embedding, error isolation and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_whitespace_duplicates_answered_once(self):
+        """Test that questions equal after whitespace normalization share one answer."""
+        answer = FakeAnswer()
+        queries = [QUESTIONS[0], f"  {QUESTIONS[0]}\n", QUESTIONS[1]]
+
+        with patch.object(main, "get_admission_controller", return_value=None), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            lines = await run_batch(queries)
+
+        results = sorted((line for line in lines if line["type"] == "result"), key=lambda line: line["index"])
+        assert sorted(answer.questions) == sorted([QUESTIONS[0], QUESTIONS[1]])
+        assert [line["deduplicated"] for line in results] == [False, True, False]
+        assert results[1]["response"] == results[0]["response"]
+        assert lines[-1]["distinct"] == 2 and lines[-1]["succeeded"] == 3
+
+    @pytest.mark.asyncio
+    async def test_distinct_questions_embedded_in_one_call(self):
+        """Test that one batched embedding call feeds every question's cache lookup."""
+        answer = FakeAnswer()
+        embeddings = FakeEmbeddings()
+
+        with patch.object(main, "get_admission_controller", return_value=None), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "embeddings", embeddings):
+            await run_batch(QUESTIONS + [QUESTIONS[0]])
+
+        assert embeddings.calls == [QUESTIONS]
+        assert sorted(answer.embeddings) == sorted([[float(len(question))] for question in QUESTIONS])
+
+    @pytest.mark.asyncio
+    async def test_failed_question_does_not_fail_batch(self):
+        """Test that an exception is reported on its own line while the rest succeed."""
+        answer = FakeAnswer(errors={QUESTIONS[1]: RuntimeError("graph store unavailable")})
+
+        with patch.object(main, "get_admission_controller", return_value=None), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            lines = await run_batch(QUESTIONS[:3] + [QUESTIONS[1]])
+
+        failed = [line for line in lines if line["type"] == "result" and line["status"] == "error"]
+        assert sorted(line["index"] for line in failed) == [1, 3]
+        assert all(line["error"] == "graph store unavailable" for line in failed)
+        assert lines[-1]["succeeded"] == 2 and lines[-1]["failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_running_questions(self):
+        """Test that a client disconnect cancels the questions still in flight."""
+        answer = FakeAnswer(seconds=0.0, slow={QUESTIONS[1]: 10.0})
+
+        with patch.object(main, "get_admission_controller", return_value=None), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            request = ParallelHybridBatchRequest(queries=QUESTIONS[:2], max_concurrency=2)
+            response = await batch_parallel_hybrid_response(request, session_id="batch-session")
+            first = json.loads(await response.body_iterator.__anext__())
+            await response.body_iterator.aclose()
+            await asyncio.sleep(0)
+
+        assert first["query"] == QUESTIONS[0]
+        assert answer.cancelled == [QUESTIONS[1]]
+
+    @pytest.mark.asyncio
+    async def test_processing_time_includes_queueing(self):
+        """Test that processing_time counts from batch receipt, not from the slot."""
+        answer = FakeAnswer(seconds=0.05)
+
+        with patch.object(main, "get_admission_controller", return_value=None), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            lines = await run_batch(QUESTIONS[:2], max_concurrency=1)
+
+        second = next(line for line in lines if line["type"] == "result" and line["index"] == 1)
+        assert second["processing_time"] >= 0.1
+
+
+# =========================================================================
+# Unit Tests for Batch Admission Control
+# =========================================================================
+
+@pytest.mark.unit
+class TestBatchAdmission:
+    """Test that batch questions are admitted individually."""
+
+    @pytest.mark.asyncio
+    async def test_each_running_question_holds_a_slot(self):
+        """Test that a batch occupies one admission slot per concurrent question."""
+        controller = AdmissionController(max_concurrent=8, max_queue_size=8)
+        answer = FakeAnswer(controller)
+
+        with patch.object(main, "get_admission_controller", return_value=controller), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            lines = await run_batch(QUESTIONS, max_concurrency=3)
+
+        assert answer.peak_in_flight == 3
+        assert controller.get_stats()["admitted"] == 4
+        assert controller.get_stats()["in_flight"] == 0
+        assert lines[-1]["succeeded"] == 4
+
+    @pytest.mark.asyncio
+    async def test_shed_question_fails_alone(self):
+        """Test that a question rejected by admission control is a failed item, not a failed batch."""
+        controller = AdmissionController(max_concurrent=1, max_queue_size=0)
+        answer = FakeAnswer(controller)
+
+        with patch.object(main, "get_admission_controller", return_value=controller), \
+                patch.object(main, "_answer_request", answer), \
+                patch.object(main, "_embed_batch", no_embeddings):
+            lines = await run_batch(QUESTIONS[:2], max_concurrency=2)
+
+        results = [line for line in lines if line["type"] == "result"]
+        assert sorted(line["status"] for line in results) == ["error", "ok"]
+        assert "Server busy" in next(line["error"] for line in results if line["status"] == "error")
+        assert lines[-1]["failed"] == 1
@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------
+# File: test_cfr_parser.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_cfr_parser.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the single-pass CFR citation parser in backend/cfr_compliance_enhanced.py
+# Tests that EnhancedCFRParser.parse_cfr_citations() returns exactly the citations
+# of the original six-pass implementation (benchmarks/bench_cfr_parser.py), and that
+# parse_cfr_structure() finds the part, subpart and section headings of volume text.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+CFR Citation Parser Unit Tests
+
+Testing of EnhancedCFRParser.parse_cfr_citations():
+- Overlapping and adjacent citation forms parse as before
+- Case variants, including Unicode case folds, are still found
+- Randomized citation fragments match the original implementation
+- Structure headings are found, and running heads and contents entries are not
+"""
+
+import random
+import pytest
+
+from backend.cfr_compliance_enhanced import CFRHierarchyLevel, EnhancedCFRParser
+from benchmarks.bench_cfr_parser import citation_signature, legacy_parse_cfr_citations
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+TRICKY_TEXTS = [
+    "§§",
+    "30 CFR Part 75 § 75.400(a) applies to underground coal mines.",
+    "Subpart D of part 77 covers surface installations.",
+    "Escapeways under section 75.380(d)(1) shall be examined weekly.",
+    "130 CFR",
+    "30 CFR §§ 75.1, 75.2 30 CFR § 75.3 in an emergency",
+    "30 cfr PART 75 SECTION 75.360(B) and subPART c",
+    "ſection 75.1720 and ſubpart B and SECTİON 75.2 and sectıon 75.3",
+    "30 CFR 30 CFR Part 75 30  CFR\n§75.1720(a)(1)",
+]
+
+FRAGMENTS = [
+    "30 CFR", " CFR ", "Part 75", " § ", "§", "§§ ", "75.1720", "(a)", "(1)", "section ", "Subpart D",
+    " and ", ", ", "75.2", "  ", "\n", "surface ", "underground ", "coal ", "immediately ", "30 ", "CFR",
+]
+
+# Volume text as extracted by PyPDF2: contents entries, running heads, wrapped titles
+VOLUME_TEXT = """PART 75—MANDATORY SAFETY STANDARDS—UNDERGROUND COAL MINES
+Subpart A—General
+Sec.
+75.1 Scope.
+Subpart D—Ventilation
+75.300 Scope.
+Subpart A—General
+§ 75.1 Scope.
+This part sets out mandatory safety standards.
+Subpart D—Ventilation
+§ 75.300 Scope.
+This subpart sets out ventilation standards.
+30 CFR Ch. I (7–1–24 Edition) § 75.300
+§ 75.301 Definitions of air quality
+terms. As used in this part:
+PART 77—MANDATORY SAFETY STANDARDS, SURFACE COAL MINES
+§ 77.1 Scope.
+This part sets out surface standards. See § 75.301.
+"""
+
+def assert_same_citations(parser, text):
+    """Assert the single-pass parser and the original return the same citations."""
+    expected = [citation_signature(c) for c in legacy_parse_cfr_citations(parser, text)]
+    actual = [citation_signature(c) for c in parser.parse_cfr_citations(text)]
+    assert actual == expected, text
+
+
+# =========================================================================
+# Unit Tests for Single-Pass Citation Parsing
+# =========================================================================
+
+@pytest.mark.unit
+class TestSinglePassCitationParsing:
+    """Test equivalence with the original six-pass parser."""
+
+    @pytest.mark.parametrize("text", TRICKY_TEXTS)
+    def test_tricky_texts_match_original(self, text):
+        """Test that overlapping, adjacent and case-folded citations parse as before."""
+        assert_same_citations(EnhancedCFRParser(), text)
+
+    def test_case_folded_anchors_are_found(self):
+        """Test that 'ſection' is still recognized as a cross-reference."""
+        citations = EnhancedCFRParser().parse_cfr_citations("See ſection 75.1720(a).")
+
+        assert len(citations) == 1
+        assert citations[0].paragraph == "(a)"
+
+    def test_random_fragments_match_original(self):
+        """Test that random combinations of citation fragments parse as before."""
+        parser = EnhancedCFRParser()
+        rng = random.Random(21)
+
+        for _ in range(300):
+            assert_same_citations(parser, "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 25))))
+
+
+# =========================================================================
+# Unit Tests for CFR Structure Parsing
+# =========================================================================
+
+@pytest.mark.unit
+class TestCFRStructureParsing:
+    """Test part, subpart and section heading parsing."""
+
+    def test_sections_belong_to_the_preceding_subpart(self):
+        """Test section headings, their subparts, and that a new part closes the subpart."""
+        headings = EnhancedCFRParser().parse_cfr_structure(VOLUME_TEXT)
+        sections = [(h.section, h.part, h.subpart, h.title) for h in headings
+                    if h.level == CFRHierarchyLevel.SECTION]
+
+        assert sections == [
+            ("75.1", 75, "A", "Scope"),
+            ("75.300", 75, "D", "Scope"),
+            ("75.301", 75, "D", "Definitions of air quality terms"),
+            ("77.1", 77, None, "Scope"),
+        ]
+
+    def test_part_and_subpart_titles(self):
+        """Test part and subpart headings, including contents entries of subparts."""
+        headings = EnhancedCFRParser().parse_cfr_structure(VOLUME_TEXT)
+
+        assert [(h.part, h.title) for h in headings if h.level == CFRHierarchyLevel.PART] == [
+            (75, "MANDATORY SAFETY STANDARDS—UNDERGROUND COAL MINES"),
+            (77, "MANDATORY SAFETY STANDARDS, SURFACE COAL MINES"),
+        ]
+        assert [(h.subpart, h.title) for h in headings if h.level == CFRHierarchyLevel.SUBPART] == [
+            ("A", "General"), ("D", "Ventilation"), ("A", "General"), ("D", "Ventilation"),
+        ]
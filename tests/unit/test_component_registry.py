@@ -0,0 +1,240 @@
+# -------------------------------------------------------------------------
+# File: test_component_registry.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_component_registry.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the warm component registry in backend/tools/registry.py
+# Tests build-once reuse, concurrent cold starts, fingerprint/store driven
+# rebuilds, invalidation on connection errors, and cold/warm metrics reporting.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Component Registry Unit Tests
+
+Testing of the ComponentRegistry used to share retrieval chains:
+- Components are built once and reused
+- Concurrent cold callers trigger a single build
+- Configuration and store changes trigger rebuilds
+- Connection failures invalidate the component; other errors keep it warm
+- Build counts and cold/warm latencies are reported
+"""
+
+import pytest
+import threading
+import time
+from unittest.mock import patch
+
+from backend.tools.registry import ComponentRegistry, ComponentMetrics
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+@pytest.fixture(autouse=True)
+def fixed_fingerprint():
+    """Pin the configuration fingerprint so tests do not depend on settings."""
+    with patch("backend.tools.registry.compute_config_fingerprint", return_value="cfg-a") as fingerprint:
+        yield fingerprint
+
+@pytest.fixture
+def registry():
+    """Provide a registry with a counting factory registered as 'chain'."""
+    registry = ComponentRegistry()
+    builds = []
+
+    def factory():
+        builds.append(object())
+        return builds[-1]
+
+    registry.register("chain", factory)
+    registry.builds = builds
+    return registry
+
+
+# =========================================================================
+# Unit Tests for ComponentRegistry
+# =========================================================================
+
+@pytest.mark.unit
+class TestComponentRegistry:
+    """Test ComponentRegistry build, reuse and rebuild behavior."""
+
+    def test_builds_once_and_reuses(self, registry):
+        """Test that repeated gets return the same instance."""
+        first = registry.get("chain")
+        second = registry.get("chain")
+
+        assert first is second
+        assert len(registry.builds) == 1
+
+    def test_unknown_component_raises(self, registry):
+        """Test that unregistered names raise KeyError."""
+        with pytest.raises(KeyError):
+            registry.get("missing")
+
+    def test_concurrent_cold_start_builds_once(self):
+        """Test that concurrent cold callers share a single build."""
+        registry = ComponentRegistry()
+        build_count = []
+
+        def slow_factory():
+            build_count.append(1)
+            time.sleep(0.05)
+            return object()
+
+        registry.register("chain", slow_factory)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("chain"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(build_count) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_config_change_triggers_rebuild(self, registry, fixed_fingerprint):
+        """Test that a new configuration fingerprint rebuilds the component."""
+        first = registry.get("chain")
+        fixed_fingerprint.return_value = "cfg-b"
+        second = registry.get("chain")
+
+        assert first is not second
+        assert registry.get_status()["components"]["chain"]["last_rebuild_reason"] == "config_or_store_changed"
+
+    def test_store_change_triggers_rebuild(self, registry):
+        """Test that mark_store_changed() rebuilds the component."""
+        first = registry.get("chain")
+        registry.mark_store_changed()
+
+        assert registry.get("chain") is not first
+        assert registry.get_status()["store_generation"] == 1
+
+    def test_max_age_triggers_rebuild(self, registry):
+        """Test that components older than max_age_seconds are rebuilt."""
+        registry.max_age_seconds = 0.01
+        first = registry.get("chain")
+        time.sleep(0.02)
+
+        assert registry.get("chain") is not first
+
+    def test_failed_call_invalidates_component(self, registry):
+        """Test that a connection error during run() drops the component."""
+        first = registry.get("chain")
+
+        def failing(_component):
+            raise ConnectionError("connection lost")
+
+        with pytest.raises(ConnectionError):
+            registry.run("chain", failing)
+
+        assert registry.get("chain") is not first
+        status = registry.get_status()["components"]["chain"]
+        assert status["invalidations"] == 1
+        assert status["last_rebuild_reason"] == "invalidated"
+
+    def test_query_error_keeps_component(self, registry):
+        """Test that a non-connection error (bad generated Cypher) is re-raised unchanged."""
+        first = registry.get("chain")
+        error = ValueError("Generated Cypher Statement is not valid")
+
+        def failing(_component):
+            raise error
+
+        with pytest.raises(ValueError) as raised:
+            registry.run("chain", failing)
+
+        assert raised.value is error
+        assert registry.get("chain") is first
+        assert registry.get_status()["components"]["chain"]["invalidations"] == 0
+
+    def test_wrapped_connection_error_invalidates(self, registry):
+        """Test that a connection error raised from inside a wrapper still drops the component."""
+        first = registry.get("chain")
+
+        def failing(_component):
+            try:
+                raise ConnectionError("defunct connection")
+            except ConnectionError as e:
+                raise ValueError("Neo4j query failed") from e
+
+        with pytest.raises(ValueError):
+            registry.run("chain", failing)
+
+        assert registry.get("chain") is not first
+
+    def test_run_records_cold_and_warm_calls(self, registry):
+        """Test that run() separates cold and warm call latencies."""
+        registry.run("chain", lambda component: component)
+        registry.run("chain", lambda component: component)
+        registry.run("chain", lambda component: component)
+
+        status = registry.get_status()["components"]["chain"]
+        assert status["builds"] == 1
+        assert status["cold_calls"] == 1
+        assert status["warm_calls"] == 2
+        assert status["warm"] is True
+
+    @pytest.mark.asyncio
+    async def test_arun_records_calls_and_invalidates(self, registry):
+        """Test that arun() builds cold components and invalidates on connection errors."""
+        async def identity(component):
+            return component
+
+        async def failing(_component):
+            raise ConnectionError("connection lost")
+
+        first = await registry.arun("chain", identity)
+        assert await registry.arun("chain", identity) is first
+
+        with pytest.raises(ConnectionError):
+            await registry.arun("chain", failing)
+
+        status = registry.get_status()["components"]["chain"]
+        assert status["builds"] == 1
+        assert status["cold_calls"] == 1
+        assert status["warm_calls"] == 2
+        assert status["invalidations"] == 1
+
+    def test_build_failure_is_counted(self):
+        """Test that factory errors propagate and are counted."""
+        registry = ComponentRegistry()
+
+        def broken_factory():
+            raise ConnectionError("neo4j unavailable")
+
+        registry.register("chain", broken_factory)
+        with pytest.raises(ConnectionError):
+            registry.get("chain")
+
+        assert registry.get_status()["components"]["chain"]["build_failures"] == 1
+
+
+# =========================================================================
+# Unit Tests for ComponentMetrics
+# =========================================================================
+
+@pytest.mark.unit
+class TestComponentMetrics:
+    """Test ComponentMetrics aggregation."""
+
+    def test_average_latencies(self):
+        """Test average cold and warm latency reporting."""
+        metrics = ComponentMetrics()
+        metrics.record_call(100.0, cold=True)
+        metrics.record_call(10.0, cold=False)
+        metrics.record_call(20.0, cold=False)
+
+        summary = metrics.to_dict()
+        assert summary["avg_cold_ms"] == 100.0
+        assert summary["avg_warm_ms"] == 15.0
@@ -0,0 +1,168 @@
+# -------------------------------------------------------------------------
+# File: test_content_analysis.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_content_analysis.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for backend/content_analysis.py
+# Tests the single-pass scanner counts, that quality scores are identical to the
+# original per-pattern implementation, and the per-request analysis memo.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Regulatory Content Analysis Unit Tests
+
+Testing of scan_regulatory_content() and ContentAnalyzer:
+- Citations, cross-references, measurements and terms are counted
+- Constructs inside other constructs are still counted
+- Scores match the original implementation exactly
+- Each content is analyzed once per request scope
+"""
+
+import random
+import re
+import pytest
+
+from backend.content_analysis import (
+    ContentAnalyzer, content_analysis_scope, get_content_analysis, scan_regulatory_content
+)
+from benchmarks.bench_regulatory_quality import CONTEXT_SENTENCES, legacy_regulatory_quality
+
+
+# =========================================================================
+# Unit Tests for Counts
+# =========================================================================
+
+@pytest.mark.unit
+class TestRegulatoryScanCounts:
+    """Test the individual scan counts."""
+
+    def test_citations_and_cross_references(self):
+        """Test that each citation form is counted separately."""
+        scan = scan_regulatory_content(
+            "See 30 CFR § 75.400, 30 CFR Part 75 § 75.323 and section 75.380(d)(1)."
+        )
+
+        assert scan.cfr_citations == 1
+        assert scan.complete_citations == 1
+        assert scan.cross_references == 1
+
+    def test_measurements_inside_citations_are_counted(self):
+        """Test that a measurement starting inside a citation is not hidden by it."""
+        scan = scan_regulatory_content("Section 5 feet from 30 CFR § 12 percent")
+
+        assert scan.cross_references == 1
+        assert scan.cfr_citations == 1
+        assert scan.measurements == 2
+
+    def test_terms_are_distinct_substrings(self):
+        """Test that terms count once each, matching inside longer words and phrases."""
+        scan = scan_regulatory_content("The MINE OPERATOR shall determine; the mine operator shall.")
+
+        assert scan.regulatory_terms == 3  # shall, operator, mine
+        assert scan.msha_terms == 1
+
+
+# =========================================================================
+# Unit Tests for Score Equivalence
+# =========================================================================
+
+@pytest.mark.unit
+class TestRegulatoryScoreEquivalence:
+    """Test that scores match the original implementation."""
+
+    @pytest.mark.parametrize("content", [
+        "",
+        "30 CFR § 5 feet",
+        "3 CFR § 5 CFR § 6",
+        "a30 CFR § 5 and 12a psi",
+        "subsection 5 % and SECTIONS 7",
+        "ſection 5 and mİne",
+        "30 CFR §５ ft and ٣ ft",
+        "12.5 ft, 9,000 CFM, 3 rpm, 120 Volt, 40 amps, 90 degrees",
+    ])
+    def test_edge_cases(self, content):
+        """Test overlapping, Unicode and boundary cases."""
+        assert scan_regulatory_content(content).quality_score() == legacy_regulatory_quality(content)
+
+    def test_random_contexts(self):
+        """Test seeded random mixes of regulatory sentences and noise."""
+        rng = random.Random(7)
+        pieces = CONTEXT_SENTENCES + ["section 12 feet", "30 CFR § 75 percent", "lorem ipsum", "x" * 40]
+        for _ in range(300):
+            content = " ".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            if rng.random() < 0.3:
+                content = content.upper()
+            assert scan_regulatory_content(content).quality_score() == legacy_regulatory_quality(content)
+
+
+# =========================================================================
+# Unit Tests for Per-Request Content Analysis
+# =========================================================================
+
+def legacy_quality_score(content):
+    """Original HybridContextFusion._calculate_quality_score() implementation."""
+    sentences = content.split('.')
+    avg_sentence_length = sum(len(s.split()) for s in sentences) / max(1, len(sentences))
+    technical_patterns = [r'\d+', r'CFR', r'§', r'percent', r'psi', r'feet']
+    tech_count = sum(len(re.findall(pattern, content, re.IGNORECASE)) for pattern in technical_patterns)
+    quality_score = (
+        legacy_regulatory_quality(content) * 0.4 +
+        min(1.0, avg_sentence_length / 25.0) * 0.2 +
+        min(1.0, tech_count / 10.0) * 0.3 +
+        min(1.0, len(content) / 1000.0) * 0.1
+    )
+    return min(1.0, quality_score)
+
+
+@pytest.mark.unit
+class TestContentAnalyzer:
+    """Test the per-request analysis memo."""
+
+    def test_quality_score_matches_original(self):
+        """Test that the shared quality score equals the original computation."""
+        rng = random.Random(11)
+        for _ in range(100):
+            content = " ".join(rng.choice(CONTEXT_SENTENCES + ["30 CFR § 5 PSI feet"]) for _ in range(rng.randint(0, 8)))
+            assert get_content_analysis(content).quality_score == legacy_quality_score(content)
+
+    def test_content_is_analyzed_once_per_scope(self):
+        """Test that repeated lookups reuse one analysis and count the reuse."""
+        content = CONTEXT_SENTENCES[0]
+        with content_analysis_scope() as analyzer:
+            first = get_content_analysis(content)
+            first.quality_score
+            second = get_content_analysis(content)
+            second.characteristics
+            second.regulatory_quality
+
+        stats = analyzer.get_stats()
+        assert first is second
+        assert stats["contents"] == 1
+        assert stats["lookups"] == 2
+        assert stats["reused"] == 1
+        assert stats["computations"] == 2  # regulatory scan and characteristics
+
+    def test_explicit_analyzer_outside_scope(self):
+        """Test that an explicit analyzer is used and no scope leaks afterwards."""
+        analyzer = ContentAnalyzer()
+        content = "See 30 CFR § 75.400 and 30 CFR Part 75 § 75.323(a)."
+
+        assert get_content_analysis(content, analyzer) is analyzer.analyze(content)
+        assert analyzer.analyze(content).cfr_citations == ["30 CFR § 75", "30 CFR Part 75 § 75"]
+        assert get_content_analysis(content) is not analyzer.analyze(content)
+
+    def test_characteristics_are_copies(self):
+        """Test that callers cannot modify the cached characteristics."""
+        analysis = ContentAnalyzer().analyze("Methane shall be below 1.0 percent.")
+        analysis.characteristics["complexity"] = 5.0
+
+        assert analysis.characteristics["complexity"] <= 1.0
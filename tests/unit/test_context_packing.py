@@ -0,0 +1,177 @@
+# -------------------------------------------------------------------------
+# File: test_context_packing.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_context_packing.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for token-budget context packing in backend/context_packing.py
+# Tests the budget is respected, sentences and citations stay whole, paragraph
+# priority, the per-chunk token count cache and per-model budgets.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Context Packing Unit Tests
+
+Testing of pack_context(), TokenCounter and get_context_budget():
+- Content within budget is returned unchanged
+- Packed content fits the budget and never cuts a sentence or citation
+- Later paragraphs use budget a long paragraph leaves unused
+- A paragraph that does not fit keeps only its leading sentences
+- Packing counts match the content after the final budget check drops parts
+- Token counts are cached per chunk, not for whole contexts or packed output
+- Prompt building reports packing in a copy of the fusion metadata
+"""
+
+import pytest
+
+from backend.context_packing import (
+    DEFAULT_CONTEXT_BUDGET, TRUNCATION_MARKER, TokenCounter, get_context_budget, pack_context
+)
+from backend.context_packing import _PARAGRAPH_BREAK
+from backend.context_fusion import FusionResult
+from backend.hybrid_templates import HybridPromptTemplate, TemplateType
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+SENTENCES = [
+    "Under 30 CFR § 75.1720(a), miners shall wear approved eye protection.",
+    "The operator shall examine escapeways weekly under 30 CFR § 75.380(d)(1).",
+    "Coal dust shall be cleaned up as required by 30 CFR Part 75 § 75.400.",
+    "Methane tests are required under § 75.323(b) before energizing equipment.",
+]
+
+CONTENT = "## Semantic Search Results\n" + " ".join(SENTENCES) + "\n\nSee § 75.360 for preshift examinations."
+
+RUN_ON_SENTENCE = "The operator shall " + "inspect and record " * 100 + "daily."
+
+class JoinPenaltyCounter(TokenCounter):
+    """Word counter where joined paragraphs count more than their parts, as token merges can."""
+
+    def _encode_count(self, text):
+        return len(text.split()) + 3 * len(_PARAGRAPH_BREAK.findall(text.strip()))
+
+
+# =========================================================================
+# Unit Tests for Context Packing
+# =========================================================================
+
+@pytest.mark.unit
+class TestPackContext:
+    """Test budget filling with whole chunks and sentences."""
+
+    def test_content_within_budget_is_unchanged(self):
+        """Test that nothing is cut when the content fits."""
+        counter = TokenCounter("gpt-4o")
+        packed = pack_context(CONTENT, 10000, counter)
+
+        assert packed.content == CONTENT
+        assert not packed.truncated
+        assert packed.used_tokens == counter.count(CONTENT)
+        assert packed.available_tokens == 10000
+
+    def test_budget_is_respected_and_sentences_stay_whole(self):
+        """Test that only whole sentences are kept, under the heading, within the budget."""
+        counter = TokenCounter("gpt-4o")
+        budget = counter.count(SENTENCES[0]) + counter.count(SENTENCES[1]) + counter.count(TRUNCATION_MARKER) + 12
+        packed = pack_context(CONTENT, budget, counter)
+
+        assert packed.truncated
+        assert packed.used_tokens <= packed.available_tokens == budget
+        assert packed.content.startswith("## Semantic Search Results\n" + SENTENCES[0])
+        assert packed.content.endswith(TRUNCATION_MARKER)
+        body = packed.content[:-len(TRUNCATION_MARKER)].split("\n", 1)[1]
+        for sentence in SENTENCES:
+            assert sentence in body or sentence[:20] not in body
+        assert packed.sentences_packed >= 1
+
+    def test_later_paragraph_uses_leftover_budget(self):
+        """Test that a short later paragraph is packed when an earlier one cannot fit."""
+        counter = TokenCounter("gpt-4o")
+        content = f"{SENTENCES[0]}\n\n{RUN_ON_SENTENCE}\n\nSee § 75.360."
+        packed = pack_context(content, counter.count(RUN_ON_SENTENCE) // 2, counter)
+
+        assert packed.content == f"{SENTENCES[0]}\n\nSee § 75.360.{TRUNCATION_MARKER}"
+        assert packed.units_packed == 2
+        assert packed.units_total == 3
+
+    def test_sentence_fallback_keeps_leading_sentences_only(self):
+        """Test that a sentence after one that does not fit is not packed out of order."""
+        counter = TokenCounter("gpt-4o")
+        content = f"{SENTENCES[0]} {RUN_ON_SENTENCE} {SENTENCES[1]}"
+        budget = counter.count(SENTENCES[0]) + counter.count(SENTENCES[1]) + counter.count(TRUNCATION_MARKER) + 4
+        packed = pack_context(content, budget, counter)
+
+        assert packed.content == f"{SENTENCES[0]}{TRUNCATION_MARKER}"
+        assert packed.sentences_packed == 1
+
+    def test_counts_follow_parts_dropped_by_final_check(self):
+        """Test that units_packed reflects the content after over-budget parts are dropped."""
+        counter = JoinPenaltyCounter("gpt-4o")
+        paragraphs = ["one two three four five", "six seven eight nine ten", "eleven twelve thirteen fourteen fifteen"]
+        budget = 15 + counter.count(TRUNCATION_MARKER)
+        packed = pack_context("\n\n".join(paragraphs), budget, counter)
+
+        assert packed.content == paragraphs[0] + TRUNCATION_MARKER
+        assert packed.used_tokens <= budget
+        assert packed.units_packed == 1
+        assert packed.sentences_packed == 0
+
+    def test_whole_context_and_output_are_not_cached(self):
+        """Test that only chunk and sentence counts enter the cache."""
+        counter = TokenCounter("gpt-4o")
+        budget = counter.count(SENTENCES[0]) + counter.count(TRUNCATION_MARKER) + 12
+        packed = pack_context(CONTENT, budget, counter)
+
+        cached = set(counter._cache)
+        assert CONTENT not in cached
+        assert packed.content not in cached
+        assert SENTENCES[0] in cached
+
+    def test_token_counts_are_cached_per_chunk(self):
+        """Test that repeated chunks are served from the count cache."""
+        counter = TokenCounter("gpt-4o")
+        counter.count(SENTENCES[0])
+        counter.count(SENTENCES[0])
+
+        stats = counter.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+
+@pytest.mark.unit
+class TestPromptPackingReport:
+    """Test the packing report attached to fusion results."""
+
+    def test_shared_metadata_is_not_modified(self):
+        """Test that the report goes into a copy of the fusion metadata."""
+        shared = {"fusion_method": "llm_enhanced"}
+        fusion_result = FusionResult(fused_content=CONTENT, fusion_strategy="advanced_hybrid",
+                                     vector_contribution=0.5, graph_contribution=0.5, final_confidence=0.8,
+                                     fusion_quality_score=0.7, metadata=shared)
+
+        HybridPromptTemplate().create_hybrid_prompt("methane tests", fusion_result, TemplateType.BASIC_HYBRID)
+
+        assert shared == {"fusion_method": "llm_enhanced"}
+        assert fusion_result.metadata["context_packing"]["available_tokens"] > 0
+        assert fusion_result.metadata["fusion_method"] == "llm_enhanced"
+
+
+@pytest.mark.unit
+class TestContextBudget:
+    """Test per-model budgets."""
+
+    def test_longest_model_prefix_wins(self):
+        """Test that dated model names use their family budget."""
+        assert get_context_budget("gpt-4o-2024-08-06") == get_context_budget("gpt-4o")
+        assert get_context_budget("unknown-model") == DEFAULT_CONTEXT_BUDGET
@@ -0,0 +1,164 @@
+# -------------------------------------------------------------------------
+# File: test_cypher_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_cypher_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the generated-Cypher cache in backend/cypher_cache.py
+# Tests key normalization, schema isolation, SQLite persistence across
+# instances, eviction counters, and the cached path in query_regulations().
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Generated-Cypher Cache Unit Tests
+
+Testing of the CypherQueryCache class and its use by the Cypher tool:
+- Trivially different questions share a key; schema changes do not
+- Cached statements survive a restart (new instance on the same SQLite file)
+- Evictions are counted by reason
+- A cache hit skips Cypher generation; an empty result evicts the entry
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from backend.cypher_cache import CypherQueryCache, schema_fingerprint
+from backend.tools import cypher
+from backend.tools.cypher import query_regulations
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+QUESTION = "What are the ventilation requirements for underground coal mines?"
+GENERATED_CYPHER = "MATCH (c:Chunk) WHERE c.text CONTAINS 'ventilation' RETURN c.text AS text LIMIT 5"
+
+class FakeRecord:
+    """Minimal neo4j Record stand-in."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return self._data
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Provide a temporary SQLite cache path."""
+    return str(tmp_path / "cypher_cache.sqlite3")
+
+@pytest.fixture
+def fake_chain():
+    """Provide a fake Cypher QA chain that reports its generated Cypher."""
+    chain = MagicMock()
+    chain.graph_schema = "Node properties: Chunk {text: STRING}"
+    chain.top_k = 5
+    chain.qa_chain.invoke.return_value = "Answer from cached Cypher"
+    chain.invoke.return_value = {
+        "result": "Answer from generated Cypher",
+        "intermediate_steps": [{"query": GENERATED_CYPHER}, {"context": [{"text": "ventilation ..."}]}],
+    }
+    registry = MagicMock()
+    registry.run.side_effect = lambda name, operation: operation(chain)
+    with patch.object(cypher, "get_component_registry", return_value=registry):
+        yield chain
+
+
+# =========================================================================
+# Unit Tests for CypherQueryCache
+# =========================================================================
+
+@pytest.mark.unit
+class TestCypherQueryCache:
+    """Test CypherQueryCache keys, persistence and counters."""
+
+    def test_key_normalization(self):
+        """Test that case, whitespace and trailing punctuation variants share a key."""
+        key_a = CypherQueryCache.make_key("Show  methane limits?", "s1")
+        key_b = CypherQueryCache.make_key(" show methane LIMITS ", "s1")
+
+        assert key_a == key_b
+
+    def test_key_includes_schema(self):
+        """Test that a schema change invalidates cached statements."""
+        assert schema_fingerprint("schema a") != schema_fingerprint("schema b")
+        assert CypherQueryCache.make_key("q", schema_fingerprint("schema a")) != \
+            CypherQueryCache.make_key("q", schema_fingerprint("schema b"))
+
+    def test_persists_across_instances(self, db_path):
+        """Test that a new cache instance reads statements from SQLite."""
+        key = CypherQueryCache.make_key(QUESTION, "s1")
+        CypherQueryCache(db_path=db_path).put(key, QUESTION, GENERATED_CYPHER)
+
+        restarted = CypherQueryCache(db_path=db_path)
+        assert restarted.get(key) == GENERATED_CYPHER
+        assert restarted.get_stats()["hits"] == 1
+
+    def test_evict_removes_from_both_tiers(self, db_path):
+        """Test that evicted statements are gone after a restart and counted by reason."""
+        cache = CypherQueryCache(db_path=db_path)
+        cache.put("k1", QUESTION, GENERATED_CYPHER)
+        cache.put("k2", QUESTION, GENERATED_CYPHER)
+        cache.evict("k1", "error")
+        cache.evict("k2", "empty")
+
+        stats = cache.get_stats()
+        assert stats["evictions_error"] == 1 and stats["evictions_empty"] == 1
+        assert CypherQueryCache(db_path=db_path).get("k1") is None
+
+
+# =========================================================================
+# Unit Tests for the Cached Query Path
+# =========================================================================
+
+@pytest.mark.unit
+class TestCachedCypherPath:
+    """Test query_regulations with the generated-Cypher cache."""
+
+    def test_repeat_question_skips_generation(self, fake_chain):
+        """Test that a repeated question executes the cached Cypher directly."""
+        cache = CypherQueryCache()
+        database = MagicMock()
+        database.execute_query.return_value = [FakeRecord({"text": "ventilation ..."})]
+        with patch.object(cypher, "get_cypher_cache", return_value=cache), \
+                patch.object(cypher, "get_database", return_value=database):
+            first = query_regulations(QUESTION)
+            second = query_regulations(QUESTION.lower())
+
+        assert first == "Answer from generated Cypher"
+        assert second == "Answer from cached Cypher"
+        assert fake_chain.invoke.call_count == 1
+        database.execute_query.assert_called_once_with(GENERATED_CYPHER)
+
+    def test_empty_result_evicts_and_regenerates(self, fake_chain):
+        """Test that cached Cypher returning no records is evicted and regenerated."""
+        cache = CypherQueryCache()
+        key = cache.make_key(QUESTION, schema_fingerprint(fake_chain.graph_schema))
+        cache.put(key, QUESTION, "MATCH (n:Retired) RETURN n")
+        database = MagicMock()
+        database.execute_query.return_value = []
+        with patch.object(cypher, "get_cypher_cache", return_value=cache), \
+                patch.object(cypher, "get_database", return_value=database):
+            answer = query_regulations(QUESTION)
+
+        assert answer == "Answer from generated Cypher"
+        assert cache.get_stats()["evictions_empty"] == 1
+        assert cache.get(key) == GENERATED_CYPHER
+
+    def test_write_statements_are_not_cached(self, fake_chain):
+        """Test that generated Cypher with write clauses is never stored."""
+        fake_chain.invoke.return_value["intermediate_steps"][0]["query"] = "MATCH (n) DETACH DELETE n"
+        cache = CypherQueryCache()
+        with patch.object(cypher, "get_cypher_cache", return_value=cache):
+            query_regulations(QUESTION)
+
+        assert cache.get_stats()["stores"] == 0
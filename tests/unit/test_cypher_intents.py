@@ -0,0 +1,148 @@
+# -------------------------------------------------------------------------
+# File: test_cypher_intents.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_cypher_intents.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the deterministic Cypher intent templates in backend/tools/cypher.py
+# Tests intent matching, template validation, the template query path and
+# the LLM-generation fallback, with the database and QA chain replaced by fakes.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Cypher Intent Template Unit Tests
+
+Testing of the Cypher intent matcher:
+- Section lookups, related entities and entity mentions are recognized
+- Unrecognized and multi-section questions fall back to LLM generation
+- Templates are read-only and parameterized
+- Template hits skip Cypher generation; empty templates fall back
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from backend.tools import cypher
+from backend.tools.cypher import CYPHER_INTENTS, match_cypher_intent, query_regulations
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+class FakeRecord:
+    """Minimal neo4j Record stand-in."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return self._data
+
+@pytest.fixture
+def fake_chain():
+    """Provide a fake Cypher QA chain run through the component registry."""
+    chain = MagicMock()
+    chain.qa_chain.invoke.return_value = "Per § 75.400, coal dust shall be cleaned up."
+    chain.invoke.return_value = {"result": "LLM-generated Cypher answer"}
+    registry = MagicMock()
+    registry.run.side_effect = lambda name, operation: operation(chain)
+    with patch.object(cypher, "get_component_registry", return_value=registry), \
+            patch.object(cypher, "get_cypher_cache", return_value=None):
+        yield chain
+
+
+# =========================================================================
+# Unit Tests for Intent Matching
+# =========================================================================
+
+@pytest.mark.unit
+class TestCypherIntentMatching:
+    """Test mapping questions to intent templates."""
+
+    @pytest.mark.parametrize("question, intent_name, parameter", [
+        ("What does 30 CFR 75.400 require?", "section_lookup", ("section", "75.400")),
+        ("Show me § 57.15030", "section_lookup", ("section", "57.15030")),
+        ("Which entities are related to methane?", "related_entities", ("term", "methane")),
+        ("Find chunks mentioning self-rescuers", "entity_mentions", ("term", "self-rescuer")),
+        ("Summarize sections 75.300 through 75.399", "section_range", ("last", "399")),
+        ("Everything in Part 75 Subpart D about ventilation", "subpart_sections", ("term", "ventilation")),
+        ("What subparts are in Part 75?", "part_subparts", ("part", "75")),
+    ])
+    def test_recognized_questions(self, question, intent_name, parameter):
+        """Test that regular question shapes map to their templates."""
+        intent, parameters = match_cypher_intent(question)
+
+        assert intent.name == intent_name
+        assert parameters[parameter[0]] == parameter[1]
+        assert parameters["limit"] == intent.limit
+
+    @pytest.mark.parametrize("question", [
+        "What are the ventilation requirements for underground coal mines?",
+        "Compare § 75.400 and § 75.401",
+    ])
+    def test_unrecognized_questions(self, question):
+        """Test that other questions are left to LLM Cypher generation."""
+        assert match_cypher_intent(question) is None
+
+    def test_optional_group_defaults_to_empty(self):
+        """Test that a subpart question without a topic matches with an empty term."""
+        intent, parameters = match_cypher_intent("Show Part 77, Subpart Q")
+
+        assert intent.name == "subpart_sections"
+        assert (parameters["part"], parameters["subpart"], parameters["term"]) == ("77", "q", "")
+
+    def test_enhanced_graph_question_still_matches(self):
+        """Test that the engine's enhanced question (which repeats the query) is recognized."""
+        question = "What does 30 CFR 75.400 require?"
+        enhanced = f"MSHA Regulatory Query: {question}\n\nContext: Title 30 CFR.\n\nQuery: {question}"
+        intent, parameters = match_cypher_intent(enhanced)
+
+        assert intent.name == "section_lookup"
+        assert parameters["section"] == "75.400"
+
+    def test_templates_are_read_only(self):
+        """Test that no template writes to the graph."""
+        for intent in CYPHER_INTENTS:
+            assert not cypher._WRITE_CLAUSE_PATTERN.search(intent.cypher)
+
+
+# =========================================================================
+# Unit Tests for the Template Query Path
+# =========================================================================
+
+@pytest.mark.unit
+class TestCypherTemplatePath:
+    """Test query_regulations with intent templates."""
+
+    def test_template_hit_skips_cypher_generation(self, fake_chain):
+        """Test that a recognized question runs its template and the QA step only."""
+        database = MagicMock()
+        database.execute_query.return_value = [FakeRecord({"document": "CFR-2024-title30-vol1", "text": "§ 75.400 ..."})]
+        with patch.object(cypher, "get_database", return_value=database):
+            answer = query_regulations("What does 30 CFR 75.400 require?")
+
+        assert answer.startswith("Per § 75.400")
+        query, parameters = database.execute_query.call_args[0]
+        assert "$section" in query and parameters["section"] == "75.400"
+        fake_chain.invoke.assert_not_called()
+        assert cypher.get_cypher_path_stats()["paths"]["section_lookup"]["count"] >= 1
+
+    def test_empty_template_falls_back_to_llm(self, fake_chain):
+        """Test that a template returning no records falls back to Cypher generation."""
+        database = MagicMock()
+        database.execute_query.return_value = []
+        with patch.object(cypher, "get_database", return_value=database):
+            answer = query_regulations("Which entities are related to unobtainium?")
+
+        assert answer == "LLM-generated Cypher answer"
+        fake_chain.qa_chain.invoke.assert_not_called()
+        assert cypher.get_cypher_path_stats()["template_misses"] >= 1
@@ -0,0 +1,223 @@
+# -------------------------------------------------------------------------
+# File: test_embedding_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_embedding_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the two-tier embedding cache in backend/embedding_cache.py
+# Tests key normalization, memory LRU eviction, SQLite persistence across
+# instances, counters, and the CachedEmbeddings wrapper.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Embedding Cache Unit Tests
+
+Testing of the EmbeddingCache and CachedEmbeddings classes:
+- Whitespace-normalized cache keys scoped to model and task type
+- Memory LRU bounds and eviction counters
+- SQLite tier persistence shared between cache instances
+- Only cache misses reach the underlying embeddings client
+- Query and document vectors never share entries
+- Disk hits do not write to SQLite
+"""
+
+import sqlite3
+import pytest
+
+from backend.embedding_cache import (
+    EmbeddingCache, CachedEmbeddings, DOCUMENT_TASK, QUERY_TASK, normalize_embedding_text
+)
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+class FakeEmbeddings:
+    """Deterministic embeddings client that records every API call."""
+
+    def __init__(self):
+        self.query_calls = []
+        self.document_calls = []
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return [float(len(text)), 0.5, -0.25]
+
+    def embed_documents(self, texts):
+        self.document_calls.append(list(texts))
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+class FakeTaskEmbeddings(FakeEmbeddings):
+    """Fake client whose embed_documents takes a Gemini task_type."""
+
+    def embed_documents(self, texts, task_type=None):
+        self.document_calls.append((list(texts), task_type))
+        return [[float(len(text)), 0.5, -0.25] for text in texts]
+
+@pytest.fixture
+def fake_embeddings():
+    """Provide a fresh fake embeddings client."""
+    return FakeEmbeddings()
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Provide a temporary SQLite cache path."""
+    return str(tmp_path / "embedding_cache.sqlite3")
+
+
+# =========================================================================
+# Unit Tests for EmbeddingCache
+# =========================================================================
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test EmbeddingCache tiers and counters."""
+
+    def test_key_normalization(self):
+        """Test that whitespace variants share a key and case variants do not."""
+        key_a = EmbeddingCache.make_key("What are  methane requirements?", "m1", QUERY_TASK)
+        key_b = EmbeddingCache.make_key(" What are methane\nrequirements? ", "m1", QUERY_TASK)
+        key_c = EmbeddingCache.make_key("What are METHANE requirements?", "m1", QUERY_TASK)
+
+        assert key_a == key_b
+        assert key_a != key_c
+        assert normalize_embedding_text("  MSHA\tB  ") == "MSHA B"
+
+    def test_key_includes_model_and_task(self):
+        """Test that different models or task types never share entries."""
+        assert EmbeddingCache.make_key("text", "m1", QUERY_TASK) != EmbeddingCache.make_key("text", "m2", QUERY_TASK)
+        assert EmbeddingCache.make_key("text", "m1", QUERY_TASK) != \
+            EmbeddingCache.make_key("text", "m1", DOCUMENT_TASK)
+
+    def test_memory_lru_eviction(self):
+        """Test that the memory tier evicts least recently used entries."""
+        cache = EmbeddingCache(max_memory_entries=2)
+        cache.put("a", "m", [1.0])
+        cache.put("b", "m", [2.0])
+        cache.get("a")              # "a" becomes most recently used
+        cache.put("c", "m", [3.0])  # evicts "b"
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        stats = cache.get_stats()
+        assert stats["memory_evictions"] == 1
+        assert stats["memory_entries"] == 2
+
+    def test_disk_tier_shared_between_instances(self, db_path):
+        """Test that a second cache instance reads vectors from SQLite."""
+        writer = EmbeddingCache(db_path=db_path)
+        writer.put("key", "m", [0.1, 0.2, 0.3])
+
+        reader = EmbeddingCache(db_path=db_path)
+        assert reader.get("key") == [0.1, 0.2, 0.3]
+        assert reader.get_stats()["disk_hits"] == 1
+        # Promoted into memory on the disk hit
+        reader.get("key")
+        assert reader.get_stats()["memory_hits"] == 1
+
+    def test_disk_hit_defers_last_used_write(self, db_path):
+        """Test that a disk hit writes its last-used time with the next put, not on read."""
+        writer = EmbeddingCache(db_path=db_path)
+        writer.put("key", "m", [0.1])
+        conn = sqlite3.connect(db_path)
+        written = conn.execute("SELECT last_used FROM embeddings WHERE key = 'key'").fetchone()[0]
+
+        reader = EmbeddingCache(db_path=db_path)
+        assert reader.get("key") == [0.1]
+        assert conn.execute("SELECT last_used FROM embeddings WHERE key = 'key'").fetchone()[0] == written
+
+        reader.put("other", "m", [0.2])
+        assert conn.execute("SELECT last_used FROM embeddings WHERE key = 'key'").fetchone()[0] > written
+
+    def test_disk_tier_size_bound(self, db_path):
+        """Test that the disk tier evicts old entries beyond its bound."""
+        cache = EmbeddingCache(max_memory_entries=1, db_path=db_path, max_disk_entries=10)
+        for i in range(15):
+            cache.put(f"k{i}", "m", [float(i)])
+
+        stats = cache.get_stats()
+        assert stats["disk_entries"] <= 10
+        assert stats["disk_evictions"] >= 5
+
+    def test_memory_only_when_path_missing(self):
+        """Test that the cache works without a disk tier."""
+        cache = EmbeddingCache()
+        cache.put("k", "m", [1.0])
+
+        assert cache.get("k") == [1.0]
+        assert cache.get_stats()["disk_enabled"] is False
+
+
+# =========================================================================
+# Unit Tests for CachedEmbeddings
+# =========================================================================
+
+@pytest.mark.unit
+class TestCachedEmbeddings:
+    """Test the CachedEmbeddings wrapper."""
+
+    def test_repeated_query_hits_cache(self, fake_embeddings):
+        """Test that repeated questions call the API once."""
+        cached = CachedEmbeddings(fake_embeddings, "m", EmbeddingCache())
+        first = cached.embed_query("What are methane monitoring requirements?")
+        second = cached.embed_query(" What are  methane monitoring requirements?")
+
+        assert first == second
+        assert len(fake_embeddings.query_calls) == 1
+        stats = cached.cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_documents_batch_only_misses(self, fake_embeddings):
+        """Test that embed_documents sends only uncached texts to the API."""
+        cached = CachedEmbeddings(fake_embeddings, "m", EmbeddingCache())
+        cached.embed_documents(["alpha", "beta"])
+        vectors = cached.embed_documents(["alpha", "gamma", "beta"])
+
+        assert fake_embeddings.document_calls == [["alpha", "beta"], ["gamma"]]
+        assert vectors[1] == [5.0, 1.0, 0.0]
+        assert len(vectors) == 3
+
+    def test_query_and_document_vectors_are_separate(self, fake_embeddings):
+        """Test that a document embedding of a text is not served to embed_query."""
+        cached = CachedEmbeddings(fake_embeddings, "m", EmbeddingCache())
+        cached.embed_documents(["methane limits"])
+
+        assert cached.embed_query("methane limits") == [14.0, 0.5, -0.25]
+        assert fake_embeddings.query_calls == ["methane limits"]
+
+    def test_queries_batch_as_query_vectors(self):
+        """Test that embed_queries batches misses as query vectors shared with embed_query."""
+        client = FakeTaskEmbeddings()
+        cached = CachedEmbeddings(client, "m", EmbeddingCache())
+        cached.embed_query("alpha")
+        vectors = cached.embed_queries(["alpha", "gamma"])
+
+        assert client.document_calls == [(["gamma"], QUERY_TASK)]
+        assert vectors == [[5.0, 0.5, -0.25], [5.0, 0.5, -0.25]]
+        cached.embed_query("gamma")
+        assert client.query_calls == ["alpha"]
+
+    def test_queries_without_task_type_support(self, fake_embeddings):
+        """Test that clients without task_type embed query misses one at a time."""
+        cached = CachedEmbeddings(fake_embeddings, "m", EmbeddingCache())
+        cached.embed_queries(["alpha", "beta"])
+
+        assert fake_embeddings.query_calls == ["alpha", "beta"]
+        assert fake_embeddings.document_calls == []
+
+    def test_attribute_proxy(self, fake_embeddings):
+        """Test that unknown attributes are proxied to the underlying client."""
+        fake_embeddings.model = "models/embedding-001"
+        cached = CachedEmbeddings(fake_embeddings, "m", EmbeddingCache())
+
+        assert cached.model == "models/embedding-001"
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------------------
+# File: test_extractive_fusion.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_extractive_fusion.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the LLM-free extractive fusion in backend/extractive_fusion.py
+# Tests sentence splitting, near-duplicate removal, query ranking, budget
+# packing and CFR citation preservation.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Extractive Fusion Unit Tests
+
+Testing of extractive_fuse() and split_sentences():
+- Sentences split without breaking citations or on hard line wraps
+- Near-duplicates across sources are removed
+- Query-relevant sentences win the budget
+- Every CFR citation survives even a tiny budget
+"""
+
+import pytest
+
+from backend.extractive_fusion import extractive_fuse, split_sentences
+
+
+VECTOR_CONTEXT = (
+    "Under 30 CFR § 75.323(b), when 1.0 percent or more methane is present the operator shall act. "
+    "Records shall be kept on the surface and made available to authorized representatives. "
+    "Escapeways shall be examined weekly under 30 CFR § 75.380."
+)
+
+GRAPH_CONTEXT = (
+    "Records shall be kept on the surface and made available to authorized representatives.\n\n"
+    "Coal dust shall be cleaned up as required by 30 CFR Part 75 § 75.400. "
+    "The mine operator must keep a ventilation plan."
+)
+
+
+# =========================================================================
+# Unit Tests for Sentence Splitting
+# =========================================================================
+
+@pytest.mark.unit
+class TestSplitSentences:
+    """Test sentence segmentation."""
+
+    def test_citations_and_wrapped_lines_stay_whole(self):
+        """Test that section numbers and hard-wrapped lines do not split sentences."""
+        blocks = split_sentences("The operator shall examine 30 CFR\n§ 75.360(b) areas daily. See section 75.402.")
+
+        assert blocks == [["The operator shall examine 30 CFR § 75.360(b) areas daily.", "See section 75.402."]]
+
+    def test_chunk_headers_and_list_markers_are_dropped(self):
+        """Test that retrieval-only chunk headers and markdown markers are not sentences."""
+        text = "[1] CFR-2024-title30-vol3 (chunk 75-12, similarity 0.91)\nEntities: methane\n- **First** item.\n- Second item."
+
+        assert split_sentences(text) == [["First item.", "Second item."]]
+
+
+# =========================================================================
+# Unit Tests for Extractive Fusion
+# =========================================================================
+
+@pytest.mark.unit
+class TestExtractiveFuse:
+    """Test deduplication, ranking and packing."""
+
+    def test_near_duplicates_are_removed(self):
+        """Test that a sentence restated by both sources appears once."""
+        output = extractive_fuse(VECTOR_CONTEXT, GRAPH_CONTEXT, "record keeping")
+
+        assert output.duplicates_removed == 1
+        assert output.content.count("Records shall be kept") == 1
+
+    def test_every_citation_survives_a_tiny_budget(self):
+        """Test that citation sentences are kept even when they exceed the budget."""
+        output = extractive_fuse(VECTOR_CONTEXT, GRAPH_CONTEXT, "methane", budget_tokens=1)
+
+        assert output.citations_total > 0
+        assert output.citations_kept == output.citations_total
+        for citation in ("30 CFR § 75.323(b)", "30 CFR § 75.380", "30 CFR Part 75 § 75.400"):
+            assert citation in output.content
+        assert "Records shall be kept" not in output.content
+
+    def test_query_relevant_sentences_fill_the_budget(self):
+        """Test that remaining budget goes to the sentences matching the query."""
+        vector = "Hoists shall be inspected daily. Ventilation plans must list the main fan location."
+        graph = "Belt conveyors need guarding. Hoist ropes shall be replaced when worn."
+
+        output = extractive_fuse(vector, graph, "ventilation plan main fan", budget_tokens=14)
+
+        assert "Ventilation plans must list the main fan location." in output.content
+        assert output.selected_sentences == 1
+
+    def test_chunks_and_source_headings(self):
+        """Test that ranked chunks replace the rendered vector context and sources are labelled."""
+        chunks = [{"text": "§ 75.400 Coal dust shall be cleaned up.", "score": 0.9}]
+        output = extractive_fuse("[1] ignored header text.", "Operators must train miners.", "coal dust",
+                                 vector_weight=0.7, graph_weight=0.3, vector_chunks=chunks)
+
+        assert output.content.startswith("## Semantic Search Results\n§ 75.400 Coal dust")
+        assert "## Regulatory Structure Analysis\nOperators must train miners." in output.content
+        assert "ignored" not in output.content
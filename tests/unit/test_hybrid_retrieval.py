@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------
+# File: test_hybrid_retrieval.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_hybrid_retrieval.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for hybrid keyword + vector chunk retrieval in backend/tools/vector.py:
+# reciprocal rank fusion, full-text query escaping, and the concurrent hybrid search
+# with the keyword and vector searches faked.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Hybrid Retrieval Unit Tests
+
+Testing of keyword + vector chunk retrieval:
+- Chunks found by both searches rank first, once each
+- Chunks keep their vector similarity as score; keyword-only chunks get the lowest one
+- Questions are escaped for the Lucene query parser
+- The hybrid search merges both rankings, or uses the vector ranking alone when
+  the keyword search fails
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from backend.tools import vector
+from backend.tools.vector import _lucene_query, aretrieve_hybrid_chunks, reciprocal_rank_fusion
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+def chunk(chunk_id, score=0.8):
+    """Build a retrieval-only chunk."""
+    return {"text": f"Text of {chunk_id}", "score": score, "document": "CFR-2024-title30-vol2.pdf",
+            "chunk_id": chunk_id, "entities": []}
+
+
+# =========================================================================
+# Unit Tests for Reciprocal Rank Fusion
+# =========================================================================
+
+@pytest.mark.unit
+class TestReciprocalRankFusion:
+    """Test merging of ranked chunk lists."""
+
+    def test_chunks_found_by_both_rank_first(self):
+        """Test that a chunk in both rankings outranks the top chunk of one ranking."""
+        fused = reciprocal_rank_fusion({"vector": [chunk("a"), chunk("b")], "keyword": [chunk("c"), chunk("b")]},
+                                       limit=5)
+
+        assert [c["chunk_id"] for c in fused] == ["b", "a", "c"]
+        assert fused[0]["retrievers"] == ["vector", "keyword"]
+        assert fused[0]["rrf_score"] == pytest.approx(1 / 62 + 1 / 62)
+        assert fused[1]["rrf_score"] == pytest.approx(1 / 61)
+
+    def test_score_stays_vector_similarity(self):
+        """Test that fused chunks keep cosine scores and keyword-only chunks get the lowest one."""
+        fused = reciprocal_rank_fusion({"vector": [chunk("a", 0.91), chunk("b", 0.84)],
+                                        "keyword": [chunk("c", 12.7), chunk("b", 9.3)]}, limit=5)
+
+        scores = {c["chunk_id"]: c["score"] for c in fused}
+        assert scores == {"a": 0.91, "b": 0.84, "c": 0.84}
+        assert reciprocal_rank_fusion({"vector": [], "keyword": [chunk("c", 12.7)]})[0]["score"] == 0.0
+
+    def test_limit_and_empty_rankings(self):
+        """Test that the fused list is cut to the limit and empty rankings are ignored."""
+        fused = reciprocal_rank_fusion({"vector": [chunk(str(i)) for i in range(10)], "keyword": []}, limit=3)
+
+        assert [c["chunk_id"] for c in fused] == ["0", "1", "2"]
+        assert reciprocal_rank_fusion({"vector": [], "keyword": []}) == []
+
+
+# =========================================================================
+# Unit Tests for Keyword Search
+# =========================================================================
+
+@pytest.mark.unit
+class TestLuceneQuery:
+    """Test question escaping for the full-text index."""
+
+    def test_special_characters_and_operators(self):
+        """Test that query syntax in a question is searched as plain terms."""
+        assert _lucene_query('Are SCSRs (§ 75.1714-2) stored AND "checked"?') == \
+            r'Are SCSRs \(§ 75.1714\-2\) stored and \"checked\"\?'
+
+    def test_blank_question(self):
+        """Test that a blank question gives an empty query."""
+        assert _lucene_query("   ") == ""
+
+
+# =========================================================================
+# Unit Tests for Hybrid Search
+# =========================================================================
+
+@pytest.mark.unit
+class TestHybridSearch:
+    """Test the concurrent keyword + vector search."""
+
+    def test_rankings_are_merged(self):
+        """Test that both searches run and their rankings are fused."""
+        async def vector_search(question, k):
+            return [chunk("a"), chunk("b")]
+
+        async def keyword_search(question, k):
+            return [chunk("b"), chunk("c")]
+
+        with patch.object(vector, "aretrieve_regulation_chunks", vector_search), \
+                patch.object(vector, "akeyword_search_chunks", keyword_search):
+            fused = asyncio.run(aretrieve_hybrid_chunks("SCSR storage", k=2))
+
+        assert [c["chunk_id"] for c in fused] == ["b", "a"]
+
+    def test_keyword_failure_uses_vector_ranking(self):
+        """Test that a store without the full-text index still returns vector results."""
+        async def vector_search(question, k):
+            return [chunk("a"), chunk("b")]
+
+        async def keyword_search(question, k):
+            raise RuntimeError("There is no such fulltext schema index: chunkText")
+
+        with patch.object(vector, "aretrieve_regulation_chunks", vector_search), \
+                patch.object(vector, "akeyword_search_chunks", keyword_search):
+            fused = asyncio.run(aretrieve_hybrid_chunks("SCSR storage"))
+
+        assert [c["chunk_id"] for c in fused] == ["a", "b"]
+        assert fused[0]["retrievers"] == ["vector"]
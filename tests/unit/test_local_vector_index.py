@@ -0,0 +1,236 @@
+# -------------------------------------------------------------------------
+# File: test_local_vector_index.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_local_vector_index.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the in-process chunk embedding mirror (backend/tools/local_vector_index.py):
+# export, exact top-k search, chunk fetches and the fallback to the remote index,
+# with the database faked.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Local Vector Index Unit Tests
+
+Testing of the chunk embedding mirror:
+- Export pages through the store and reopens from disk
+- Top-k matches a brute-force cosine ranking, with Neo4j cosine scores
+- Only the winning chunks are fetched
+- Missing, stale or inconsistent mirrors hand the search back to the remote index
+- A new store build id makes the mirror stale; the check reads only the build marker
+- A rebuilt mirror is picked up from disk
+- Exports run in the serving process only with auto_export
+- A missing numpy disables the index without changing the config
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+np = pytest.importorskip("numpy")
+
+from backend.tools import local_vector_index
+from backend.tools.local_vector_index import (
+    CHUNK_COUNT_CYPHER, EXPORT_EMBEDDINGS_CYPHER, STORE_BUILD_CYPHER, FETCH_CHUNKS_CYPHER, LocalVectorIndex
+)
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+class FakeDatabase:
+    """In-memory store answering the mirror's Cypher statements."""
+
+    def __init__(self, embeddings):
+        self.embeddings = dict(embeddings)
+        self.build_id = "build-1"
+        self.fetched = []
+        self.queries = []
+
+    def execute_query(self, query, parameters=None):
+        self.queries.append(query)
+        if query == STORE_BUILD_CYPHER:
+            return [{"build_id": self.build_id}]
+        if query == CHUNK_COUNT_CYPHER:
+            return [{"count": len(self.embeddings)}]
+        if query == EXPORT_EMBEDDINGS_CYPHER:
+            ids = sorted(i for i in self.embeddings if i > parameters["after"])[:parameters["limit"]]
+            return [{"chunk_id": i, "embedding": self.embeddings[i]} for i in ids]
+        if query == FETCH_CHUNKS_CYPHER:
+            self.fetched.append([hit["chunk_id"] for hit in parameters["hits"]])
+            return [{"text": f"Text of {hit['chunk_id']}", "score": hit["score"], "document": "CFR-2024-title30-vol2.pdf",
+                     "chunk_id": hit["chunk_id"], "entities": ["Self-Contained Self-Rescuer", None]}
+                    for hit in parameters["hits"] if hit["chunk_id"] in self.embeddings]
+        raise AssertionError(f"unexpected query: {query}")
+
+    async def execute_query_async(self, query, parameters=None):
+        return self.execute_query(query, parameters)
+
+@pytest.fixture
+def store():
+    """Fake store of 50 random 8-d chunk embeddings."""
+    rng = np.random.default_rng(7)
+    return FakeDatabase({f"chunk_{i:03d}": rng.normal(size=8).tolist() for i in range(50)})
+
+@pytest.fixture
+def exported(tmp_path, store):
+    """Mirror exported from the fake store in small pages."""
+    with patch.object(local_vector_index, "get_database", return_value=store), \
+            patch.object(local_vector_index, "LOCAL_INDEX_EXPORT_BATCH", 16):
+        index = LocalVectorIndex(str(tmp_path))
+        assert index.export() == 50
+    return index
+
+
+# =========================================================================
+# Unit Tests for Export and Search
+# =========================================================================
+
+@pytest.mark.unit
+class TestExportAndSearch:
+    """Test the mirror files and exact top-k search."""
+
+    def test_top_k_matches_brute_force(self, exported, store):
+        """Test that search ranks like a full cosine scan and scores like Neo4j."""
+        query = [0.5, -1.0, 0.2, 0.0, 1.5, -0.3, 0.8, 0.1]
+        ids = sorted(store.embeddings)
+        vectors = np.asarray([store.embeddings[i] for i in ids])
+        cosines = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        expected = [ids[i] for i in np.argsort(-cosines)[:5]]
+
+        hits = exported.search(query, 5)
+
+        assert [chunk_id for chunk_id, _ in hits] == expected
+        assert hits[0][1] == pytest.approx((1 + cosines.max()) / 2, rel=1e-5)
+
+    def test_mirror_reopens_from_disk(self, exported, tmp_path):
+        """Test that a new instance loads the exported files."""
+        reopened = LocalVectorIndex(str(tmp_path))
+
+        assert reopened.is_ready()
+        assert reopened.get_stats()["chunks"] == 50
+        assert reopened.get_stats()["dimensions"] == 8
+
+    def test_inconsistent_files_are_ignored(self, exported, tmp_path):
+        """Test that a truncated matrix is not loaded."""
+        matrix_path = tmp_path / local_vector_index.LOCAL_INDEX_MATRIX_FILE
+        matrix_path.write_bytes(matrix_path.read_bytes()[:-4])
+
+        assert not LocalVectorIndex(str(tmp_path)).is_ready()
+
+
+# =========================================================================
+# Unit Tests for Retrieval and Fallback
+# =========================================================================
+
+@pytest.mark.unit
+class TestRetrieve:
+    """Test chunk retrieval through the mirror."""
+
+    def test_only_winning_chunks_are_fetched(self, exported, store):
+        """Test that retrieve fetches the top k by id in the retrieval-only chunk format."""
+        query = store.embeddings["chunk_042"]
+
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            chunks = asyncio.run(exported.aretrieve(query, 3))
+
+        assert store.fetched == [[chunk["chunk_id"] for chunk in chunks]]
+        assert chunks[0]["chunk_id"] == "chunk_042"
+        assert chunks[0]["score"] == pytest.approx(1.0, rel=1e-5)
+        assert chunks[0]["entities"] == ["Self-Contained Self-Rescuer"]
+        assert exported.get_stats()["local_searches"] == 1
+
+    def test_missing_mirror_falls_back(self, tmp_path, store):
+        """Test that a search without a mirror uses the remote index without exporting one."""
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            index = LocalVectorIndex(str(tmp_path))
+            assert index.retrieve([1.0] * 8, 3) is None
+
+        assert index._export_thread is None
+        assert not index.is_ready()
+        assert index.get_stats()["fallbacks"] == 1
+
+    def test_auto_export_on_fallback(self, tmp_path, store):
+        """Test that with auto_export a fallback exports the mirror in the background."""
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            index = LocalVectorIndex(str(tmp_path), auto_export=True)
+            assert index.retrieve([1.0] * 8, 3) is None
+            index._export_thread.join(timeout=5)
+
+        assert index.is_ready()
+        assert index.get_stats()["exports"] == 1
+
+    def test_stale_mirror_falls_back(self, exported, store):
+        """Test that a new store build id marks the mirror stale."""
+        store.build_id = "build-2"
+        exported.check_interval_seconds = 0
+
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            assert exported.retrieve([1.0] * 8, 3) is None
+
+        assert exported.get_stats()["stale"]
+
+    def test_check_reads_only_build_marker(self, exported, store):
+        """Test that the freshness check on a search adds one marker lookup and no chunk scan."""
+        exported.check_interval_seconds = 0
+        store.queries.clear()
+
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            assert exported.retrieve([1.0] * 8, 3) is not None
+
+        assert store.queries == [STORE_BUILD_CYPHER, FETCH_CHUNKS_CYPHER]
+        assert exported.get_stats()["build_id"] == "build-1"
+
+    def test_rebuilt_mirror_is_picked_up(self, exported, store, tmp_path):
+        """Test that a stale mirror reopens the files written by the build step."""
+        store.embeddings["chunk_999"] = [1.0] * 8
+        store.build_id = "build-2"
+        exported.check_interval_seconds = 0
+
+        with patch.object(local_vector_index, "get_database", return_value=store):
+            assert exported.retrieve([1.0] * 8, 3) is None
+            LocalVectorIndex(str(tmp_path)).export()
+            chunks = exported.retrieve([1.0] * 8, 3)
+
+        assert chunks[0]["chunk_id"] == "chunk_999"
+        assert exported.get_stats()["chunks"] == 51
+
+    def test_deleted_chunk_falls_back(self, exported, store):
+        """Test that a winner missing from the store marks the mirror stale."""
+        query = store.embeddings.pop("chunk_007")
+
+        with patch.object(local_vector_index, "get_database", return_value=store), \
+                patch.object(LocalVectorIndex, "_export_in_background", lambda self: None):
+            assert exported.retrieve(query, 3) is None
+
+        assert not exported.is_ready()
+
+
+# =========================================================================
+# Unit Tests for the Singleton Accessor
+# =========================================================================
+
+@pytest.mark.unit
+class TestGetLocalVectorIndex:
+    """Test get_local_vector_index() configuration handling."""
+
+    def test_missing_numpy_leaves_config_unchanged(self):
+        """Test that without numpy the accessor returns None and does not disable the setting."""
+        config = SimpleNamespace(local_vector_index_enabled=True)
+
+        with patch.object(local_vector_index, "get_config", return_value=config), \
+                patch.object(local_vector_index, "np", None), \
+                patch.object(local_vector_index, "_local_vector_index", None):
+            assert local_vector_index.get_local_vector_index() is None
+
+        assert config.local_vector_index_enabled is True
@@ -0,0 +1,402 @@
+# -------------------------------------------------------------------------
+# File: test_parallel_hybrid.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_parallel_hybrid.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the ParallelRetrievalEngine in backend/parallel_hybrid.py
+# Tests the concurrent GraphRAG fallback strategies, per-branch deadlines and
+# the asyncio retrieval path with the retrieval tools replaced by
+# deterministic, timed fakes, and the retrieval-only vector mode.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Parallel Retrieval Engine Unit Tests
+
+Testing of the ParallelRetrievalEngine class:
+- GraphRAG fallback strategies run concurrently, first viable answer wins
+- Fallback concurrency cap is respected
+- Winning strategy and time saved are reported in RetrievalResult metadata
+- A slow branch gets a grace period, then is marked timed out
+- The asyncio retrieval path falls back to the thread pool only when it is unavailable
+- Retrieval-only vector mode returns ranked chunks without an answer LLM call
+- Hybrid vector mode returns keyword + vector fused chunks
+"""
+
+import asyncio
+import pytest
+import threading
+import time
+from unittest.mock import patch
+
+from backend.database import AsyncDriverUnavailableError, DatabaseQueryError
+from backend.parallel_hybrid import ParallelRetrievalEngine, RetrievalResult
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+VIABLE_ANSWER = "Per 30 CFR § 75.323, methane shall be monitored at the working face " * 2
+
+class FakeGraphTool:
+    """Fake query_regulations with per-strategy latency and answers."""
+
+    def __init__(self, answers):
+        # answers: list of (query prefix, delay seconds, answer)
+        self.answers = answers
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, query):
+        with self._lock:
+            self.calls.append(query)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            for prefix, delay, answer in self.answers:
+                if query.startswith(prefix):
+                    time.sleep(delay)
+                    return answer
+            return "I don't know the answer."
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+def make_branch(method, delay, content, confidence):
+    """Build a fake branch coroutine returning a RetrievalResult after a delay."""
+    async def branch(query):
+        await asyncio.sleep(delay)
+        return RetrievalResult(content=content, method=method, confidence=confidence,
+                               response_time_ms=int(delay * 1000))
+    return branch
+
+@pytest.fixture
+def engine():
+    """Provide an engine on the threaded retrieval path."""
+    engine = ParallelRetrievalEngine(timeout_seconds=5, max_concurrent_fallbacks=3, async_retrieval=False)
+    yield engine
+    engine.executor.shutdown(wait=True)
+
+
+# =========================================================================
+# Unit Tests for GraphRAG Fallback Strategies
+# =========================================================================
+
+@pytest.mark.unit
+class TestGraphFallbackStrategies:
+    """Test concurrent first-viable-wins GraphRAG fallbacks."""
+
+    @pytest.mark.asyncio
+    async def test_fastest_viable_strategy_wins(self, engine):
+        """Test that a fast later strategy beats slow earlier ones."""
+        fake = FakeGraphTool([
+            ("Find any entities", 0.3, "I don't know."),
+            ("Find information about mining", 0.3, "I don't know."),
+            ("Provide general MSHA guidance", 0.05, VIABLE_ANSWER),
+        ])
+        with patch("backend.parallel_hybrid.query_regulations", fake):
+            start = time.time()
+            content, metadata = await engine._try_alternative_graph_queries("methane monitoring in coal mines")
+            elapsed = time.time() - start
+
+        assert content.startswith("General MSHA guidance: ")
+        assert metadata["fallback_strategy"] == "general_guidance"
+        assert metadata["fallback_cancelled"] == 2
+        assert metadata["fallback_time_saved_ms"] > 0
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_earlier_strategy_preferred_when_both_viable(self, engine):
+        """Test that an earlier viable strategy wins a tie within the same wake-up."""
+        fake = FakeGraphTool([
+            ("Find any entities", 0.01, VIABLE_ANSWER),
+            ("Find information about mining", 0.01, VIABLE_ANSWER),
+            ("Provide general MSHA guidance", 0.3, VIABLE_ANSWER),
+        ])
+        with patch("backend.parallel_hybrid.query_regulations", fake):
+            content, metadata = await engine._try_alternative_graph_queries("coal mine safety")
+
+        assert metadata["fallback_strategy"] in ("broad_entity_search", "keyword_search")
+        assert content.startswith(("Related regulatory information: ", "Mining safety regulations related to"))
+
+    @pytest.mark.asyncio
+    async def test_no_viable_strategy(self, engine):
+        """Test the helpful message when every strategy misses."""
+        fake = FakeGraphTool([])
+        with patch("backend.parallel_hybrid.query_regulations", fake):
+            content, metadata = await engine._try_alternative_graph_queries("coal mine safety")
+
+        assert "couldn't find specific graph data" in content
+        assert metadata["fallback_strategy"] is None
+        assert len(fake.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """Test that no more than max_concurrent_fallbacks run at once."""
+        engine = ParallelRetrievalEngine(max_concurrent_fallbacks=1, async_retrieval=False)
+        fake = FakeGraphTool([
+            ("Find any entities", 0.02, "I don't know."),
+            ("Find information about mining", 0.02, "I don't know."),
+            ("Provide general MSHA guidance", 0.02, "I don't know."),
+        ])
+        try:
+            with patch("backend.parallel_hybrid.query_regulations", fake):
+                await engine._try_alternative_graph_queries("coal mine safety")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert fake.max_in_flight == 1
+        assert len(fake.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_queued_time_not_counted_as_saved(self):
+        """Test that strategies run one at a time save nothing, even though later ones queued."""
+        engine = ParallelRetrievalEngine(max_concurrent_fallbacks=1, async_retrieval=False)
+        fake = FakeGraphTool([
+            ("Find any entities", 0.1, "I don't know."),
+            ("Find information about mining", 0.1, "I don't know."),
+            ("Provide general MSHA guidance", 0.1, VIABLE_ANSWER),
+        ])
+        try:
+            with patch("backend.parallel_hybrid.query_regulations", fake):
+                _, metadata = await engine._try_alternative_graph_queries("coal mine safety")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert metadata["fallback_strategy"] == "general_guidance"
+        assert metadata["fallback_time_saved_ms"] < 50
+
+    @pytest.mark.asyncio
+    async def test_queued_strategies_not_reported_as_tried(self):
+        """Test that strategies cancelled before their slot opened are not reported or run."""
+        engine = ParallelRetrievalEngine(max_concurrent_fallbacks=1, async_retrieval=False)
+        fake = FakeGraphTool([("Find any entities", 0.02, VIABLE_ANSWER)])
+        try:
+            with patch("backend.parallel_hybrid.query_regulations", fake):
+                _, metadata = await engine._try_alternative_graph_queries("coal mine safety")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert metadata["fallback_strategies_tried"] == ["broad_entity_search"]
+        assert metadata["fallback_cancelled"] == 2
+        assert len(fake.calls) == 1
+
+
+# =========================================================================
+# Unit Tests for Per-Branch Deadlines
+# =========================================================================
+
+@pytest.mark.unit
+class TestBranchDeadlines:
+    """Test independent per-branch deadlines in retrieve_parallel."""
+
+    @pytest.mark.asyncio
+    async def test_slow_graph_branch_times_out_after_grace(self):
+        """Test that a viable vector result survives a slow graph branch."""
+        engine = ParallelRetrievalEngine(timeout_seconds=5, branch_grace_seconds=0.05)
+        engine._async_vector_retrieve = make_branch("vector_rag", 0.01, VIABLE_ANSWER, 0.9)
+        engine._async_graph_retrieve = make_branch("graph_rag", 2.0, VIABLE_ANSWER, 0.9)
+        try:
+            start = time.time()
+            result = await engine.retrieve_parallel("methane monitoring")
+            elapsed = time.time() - start
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert elapsed < 0.5
+        assert result.fusion_ready is True
+        assert result.vector_result.timed_out is False
+        assert result.vector_result.content == VIABLE_ANSWER
+        assert result.graph_result.timed_out is True
+        assert result.graph_result.method == "graph_rag"
+
+    @pytest.mark.asyncio
+    async def test_late_branch_within_grace_is_kept(self):
+        """Test that a branch finishing inside the grace period is used."""
+        engine = ParallelRetrievalEngine(timeout_seconds=5, branch_grace_seconds=0.5)
+        engine._async_vector_retrieve = make_branch("vector_rag", 0.01, VIABLE_ANSWER, 0.9)
+        engine._async_graph_retrieve = make_branch("graph_rag", 0.1, VIABLE_ANSWER, 0.9)
+        try:
+            result = await engine.retrieve_parallel("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result.graph_result.timed_out is False
+        assert result.graph_result.confidence == 0.9
+
+    @pytest.mark.asyncio
+    async def test_no_grace_when_first_branch_not_viable(self):
+        """Test that a failed first branch leaves the other its full deadline."""
+        engine = ParallelRetrievalEngine(timeout_seconds=5, branch_grace_seconds=0.01)
+        engine._async_vector_retrieve = make_branch("vector_rag", 0.01, "", 0.0)
+        engine._async_graph_retrieve = make_branch("graph_rag", 0.1, VIABLE_ANSWER, 0.9)
+        try:
+            result = await engine.retrieve_parallel("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result.graph_result.timed_out is False
+        assert result.fusion_ready is True
+
+    @pytest.mark.asyncio
+    async def test_both_branches_time_out(self):
+        """Test the timeout response when neither branch meets the deadline."""
+        engine = ParallelRetrievalEngine(timeout_seconds=0.05)
+        engine._async_vector_retrieve = make_branch("vector_rag", 1.0, VIABLE_ANSWER, 0.9)
+        engine._async_graph_retrieve = make_branch("graph_rag", 1.0, VIABLE_ANSWER, 0.9)
+        try:
+            result = await engine.retrieve_parallel("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result.fusion_ready is False
+        assert result.vector_result.timed_out and result.graph_result.timed_out
+
+
+# =========================================================================
+# Unit Tests for the Asyncio Retrieval Path
+# =========================================================================
+
+@pytest.mark.unit
+class TestAsyncRetrievalPath:
+    """Test the native asyncio tool path and its threaded fallback."""
+
+    @pytest.mark.asyncio
+    async def test_async_path_skips_thread_pool(self):
+        """Test that async tools are awaited without using the thread pool."""
+        engine = ParallelRetrievalEngine(async_retrieval=True)
+        threaded = FakeGraphTool([])
+
+        async def fake_aquery(query):
+            return VIABLE_ANSWER
+
+        try:
+            with patch("backend.parallel_hybrid.aquery_regulations", fake_aquery), \
+                 patch("backend.parallel_hybrid.query_regulations", threaded):
+                result = await engine._run_graph_query("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result == VIABLE_ANSWER
+        assert threaded.calls == []
+        assert engine.async_fallback_count == 0
+
+    @pytest.mark.asyncio
+    async def test_unavailable_async_path_falls_back_to_threads(self):
+        """Test that an unavailable asyncio driver retries the query on the threaded path."""
+        engine = ParallelRetrievalEngine(async_retrieval=True)
+        threaded = FakeGraphTool([("methane", 0.0, VIABLE_ANSWER)])
+
+        async def failing_aquery(query):
+            raise AsyncDriverUnavailableError("async driver unavailable")
+
+        try:
+            with patch("backend.parallel_hybrid.aquery_regulations", failing_aquery), \
+                 patch("backend.parallel_hybrid.query_regulations", threaded):
+                result = await engine._run_graph_query("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result == VIABLE_ANSWER
+        assert threaded.calls == ["methane monitoring"]
+        assert engine.async_fallback_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_query_error_propagates(self):
+        """Test that a failing query on a working asyncio path is not retried on the thread pool."""
+        engine = ParallelRetrievalEngine(async_retrieval=True)
+        threaded = FakeGraphTool([("methane", 0.0, VIABLE_ANSWER)])
+
+        async def failing_aquery(query):
+            raise DatabaseQueryError("Query failed: invalid Cypher")
+
+        try:
+            with patch("backend.parallel_hybrid.aquery_regulations", failing_aquery), \
+                 patch("backend.parallel_hybrid.query_regulations", threaded):
+                with pytest.raises(DatabaseQueryError):
+                    await engine._run_graph_query("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert threaded.calls == []
+        assert engine.async_fallback_count == 0
+
+
+# =========================================================================
+# Unit Tests for Retrieval-Only Vector Mode
+# =========================================================================
+
+@pytest.mark.unit
+class TestChunkRetrievalMode:
+    """Test the retrieval-only vector mode."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_mode_returns_structured_chunks(self):
+        """Test that chunks mode skips the answer chain and returns ranked chunks."""
+        engine = ParallelRetrievalEngine(async_retrieval=True, vector_retrieval_mode="chunks")
+        chunks = [
+            {"text": "Methane shall be monitored ... 30 CFR § 75.323", "score": 0.92,
+             "document": "30 CFR Part 75", "chunk_id": "75-1", "entities": ["Methane"]},
+            {"text": "Examinations shall be made ...", "score": 0.81,
+             "document": "30 CFR Part 75", "chunk_id": "75-2", "entities": []},
+        ]
+        answer_calls = []
+
+        async def fake_chunks(query):
+            return chunks
+
+        async def fake_answer(query):
+            answer_calls.append(query)
+            return VIABLE_ANSWER
+
+        try:
+            with patch("backend.parallel_hybrid.aretrieve_regulation_chunks", fake_chunks), \
+                 patch("backend.parallel_hybrid.asearch_regulations_semantic", fake_answer):
+                result = await engine._async_vector_retrieve("methane monitoring")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert answer_calls == []
+        assert result.chunks == chunks
+        assert result.metadata["retrieval_mode"] == "chunks"
+        assert result.content.startswith("[1] 30 CFR Part 75 (chunk 75-1, similarity 0.92)")
+        assert 0.0 < result.confidence <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_hybrid_mode_uses_fused_chunks(self):
+        """Test that hybrid mode returns the keyword + vector fused chunks."""
+        engine = ParallelRetrievalEngine(async_retrieval=True, vector_retrieval_mode="hybrid")
+        chunks = [{"text": "Self-rescue devices shall be stored ...", "score": 1.0,
+                   "document": "30 CFR Part 75", "chunk_id": "75-9", "entities": [],
+                   "rrf_score": 0.033, "retrievers": ["vector", "keyword"]}]
+
+        async def fake_hybrid(query):
+            return chunks
+
+        try:
+            with patch("backend.parallel_hybrid.aretrieve_hybrid_chunks", fake_hybrid):
+                result = await engine._async_vector_retrieve("SCSR storage")
+        finally:
+            engine.executor.shutdown(wait=True)
+
+        assert result.chunks == chunks
+        assert result.metadata["retrieval_mode"] == "hybrid"
+        assert result.metadata["retrieval_type"] == "hybrid_rrf"
+
+    def test_unknown_mode_falls_back_to_answer(self):
+        """Test that an unknown vector retrieval mode is rejected."""
+        engine = ParallelRetrievalEngine(vector_retrieval_mode="bogus")
+        engine.executor.shutdown(wait=True)
+
+        assert engine.vector_retrieval_mode == "answer"
@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------
+# File: test_section_index.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_section_index.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for exact-citation section lookups: section number extraction
+# (backend/cfr_compliance_enhanced.py), chunk ranking (backend/tools/section_index.py),
+# and the lookup replacing the parallel branches and fusion LLM call
+# (backend/parallel_hybrid.py, backend/context_fusion.py), with the database faked.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+CFR Section Index Unit Tests
+
+Testing of exact-citation section lookups:
+- Section numbers are counted once per reference, including "§§" lists and "30 CFR 75.400"
+- Chunks are ordered by cited section, then references, without duplicates
+- Chunk scores grow with references, stay below 1.0 and ignore other chunks
+- A section index hit skips both retrieval branches and the fusion LLM, recording the override
+- An explicitly requested strategy keeps the graph branch and its fusion
+- A slow lookup falls back to the parallel branches
+- Questions without a hit use the parallel branches
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from backend.cfr_compliance_enhanced import EnhancedCFRParser
+from backend.context_fusion import HybridContextFusion, FusionStrategy
+from backend.parallel_hybrid import ParallelRetrievalEngine, RetrievalResult
+from backend.tools.section_index import _to_section_chunks
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+SECTION_TEXT = ("§ 75.400 Accumulation of combustible materials. Coal dust, including float coal dust "
+                "deposited on rock-dusted surfaces, shall be cleaned up and not be permitted to accumulate.")
+
+class FakeRecord:
+    """Minimal neo4j Record stand-in."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return self._data
+
+def record(section, chunk_id, mentions, text=SECTION_TEXT):
+    """Build a section lookup record."""
+    return FakeRecord({"section": section, "document": "CFR-2024-title30-vol1.pdf", "chunk_id": chunk_id,
+                       "text": text, "mentions": mentions, "entities": ["Coal Dust"]})
+
+async def failing_branch(query):
+    raise AssertionError("retrieval branch should not run")
+
+async def graph_branch(query):
+    return RetrievalResult(content="Graph: " + SECTION_TEXT, method="graph_rag", confidence=0.7, response_time_ms=1)
+
+class CountingLLM:
+    """Fake fusion LLM that counts invoke() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return "Fused answer."
+
+
+# =========================================================================
+# Unit Tests for Section Number Extraction
+# =========================================================================
+
+@pytest.mark.unit
+class TestExtractSectionNumbers:
+    """Test section number counting."""
+
+    def test_references_are_counted_once(self):
+        """Test that "§", "section" and "§§" list references are each counted once."""
+        sections = EnhancedCFRParser().extract_section_numbers(
+            "What does 30 CFR § 75.400 say? See section 75.400(a) and 30 CFR §§ 75.1, 75.2 and 75.3."
+        )
+
+        assert sections == {"75.400": 2, "75.1": 1, "75.2": 1, "75.3": 1}
+
+    def test_title_qualified_sections_without_symbol(self):
+        """Test that "30 CFR 75.400" and "30 CFR 75.400(a)" are section references."""
+        sections = EnhancedCFRParser().extract_section_numbers(
+            "What does 30 CFR 75.400 require, and how does 30 CFR 75.400(a) relate to 30 cfr 77.1710?"
+        )
+
+        assert sections == {"75.400": 2, "77.1710": 1}
+
+    def test_parts_are_not_sections(self):
+        """Test that bare part numbers are not indexed as sections."""
+        assert EnhancedCFRParser().extract_section_numbers("30 CFR Part 75 and § 75 apply.") == {}
+
+
+# =========================================================================
+# Unit Tests for Section Lookup
+# =========================================================================
+
+@pytest.mark.unit
+class TestSectionLookup:
+    """Test chunk ranking and the lookup path of the retrieval engine."""
+
+    def test_chunks_follow_question_order_without_duplicates(self):
+        """Test ordering by cited section then references, one entry per chunk."""
+        records = [record("75.401", "c3", 2), record("75.400", "c2", 1), record("75.400", "c1", 4),
+                   record("75.401", "c1", 1)]
+
+        chunks = _to_section_chunks(records, ["75.400", "75.401"], limit=5)
+
+        assert [chunk["chunk_id"] for chunk in chunks] == ["c1", "c2", "c3"]
+        assert [chunk["score"] for chunk in chunks] == [0.9, 0.75, pytest.approx(5 / 6)]
+
+    def test_scores_are_not_normalized_per_section(self):
+        """Test that a lone chunk citing a section once is not scored as a perfect match."""
+        lone = _to_section_chunks([record("75.400", "c1", 1)], ["75.400"], limit=5)
+        crowded = _to_section_chunks([record("75.400", "c1", 1), record("75.400", "c2", 9)], ["75.400"], limit=5)
+
+        assert lone[0]["score"] == 0.75
+        assert {chunk["chunk_id"]: chunk["score"] for chunk in crowded}["c1"] == 0.75
+        assert all(chunk["score"] < 1.0 for chunk in crowded)
+
+    def test_section_hit_skips_branches_and_fusion_llm(self):
+        """Test that a hit replaces both branches and is fused without an LLM call."""
+        engine = ParallelRetrievalEngine(section_lookup=True)
+        chunks = _to_section_chunks([record("75.400", "c1", 3)], ["75.400"], limit=5)
+
+        async def lookup(sections):
+            assert sections == ["75.400"]
+            return chunks
+
+        with patch("backend.parallel_hybrid.alookup_section_chunks", lookup), \
+                patch.object(engine, "_async_vector_retrieve", failing_branch), \
+                patch.object(engine, "_async_graph_retrieve", failing_branch):
+            response = asyncio.run(engine.retrieve_parallel("What does 30 CFR § 75.400 say?"))
+
+        assert response.section_lookup == ["75.400"]
+        assert response.fusion_ready
+        assert response.vector_result.chunks == chunks
+        assert SECTION_TEXT in response.vector_result.content
+
+        fusion = HybridContextFusion()
+        fusion.llm = CountingLLM()
+        result = asyncio.run(fusion.fuse_contexts(response, FusionStrategy.ADVANCED_HYBRID, single_shot=False))
+
+        assert fusion.llm.calls == 0
+        assert result.fusion_strategy == "section_lookup"
+        assert result.fused_content == response.vector_result.content
+        assert result.metadata["sections"] == ["75.400"]
+        assert result.metadata["strategy_override"]["requested"] == "advanced_hybrid"
+        assert result.metadata["strategy_override"]["applied"] == "section_lookup"
+
+    def test_requested_strategy_keeps_graph_branch(self):
+        """Test that without the shortcut the section chunks are fused with the graph result."""
+        engine = ParallelRetrievalEngine(section_lookup=True)
+        chunks = _to_section_chunks([record("75.400", "c1", 3)], ["75.400"], limit=5)
+
+        async def lookup(sections):
+            return chunks
+
+        with patch("backend.parallel_hybrid.alookup_section_chunks", lookup), \
+                patch.object(engine, "_async_vector_retrieve", failing_branch), \
+                patch.object(engine, "_async_graph_retrieve", graph_branch):
+            response = asyncio.run(engine.retrieve_parallel("What does 30 CFR § 75.400 say?",
+                                                            skip_graph_on_section_hit=False))
+
+        assert response.section_lookup == ["75.400"]
+        assert response.vector_result.method == "section_lookup"
+        assert response.graph_result.content.startswith("Graph: ")
+
+        fusion = HybridContextFusion()
+        fusion.llm = CountingLLM()
+        result = asyncio.run(fusion.fuse_contexts(response, FusionStrategy.MAX_CONFIDENCE))
+
+        assert result.fusion_strategy != "section_lookup"
+        assert "strategy_override" not in result.metadata
+
+    def test_slow_lookup_falls_back_to_branches(self):
+        """Test that a lookup past the branch timeout is abandoned for the parallel branches."""
+        engine = ParallelRetrievalEngine(timeout_seconds=0.05, section_lookup=True)
+
+        async def lookup(sections):
+            await asyncio.sleep(1)
+            return _to_section_chunks([record("75.400", "c1", 3)], ["75.400"], limit=5)
+
+        with patch("backend.parallel_hybrid.alookup_section_chunks", lookup):
+            response = asyncio.run(engine.retrieve_sections("What does 30 CFR § 75.400 say?"))
+
+        assert response is None
+
+    def test_section_miss_uses_parallel_branches(self):
+        """Test that a question without indexed chunks runs both branches."""
+        engine = ParallelRetrievalEngine(section_lookup=True)
+
+        async def lookup(sections):
+            return []
+
+        async def branch(query):
+            return RetrievalResult(content=SECTION_TEXT, method="vector_rag", confidence=0.8, response_time_ms=1)
+
+        with patch("backend.parallel_hybrid.alookup_section_chunks", lookup), \
+                patch.object(engine, "_async_vector_retrieve", branch), \
+                patch.object(engine, "_async_graph_retrieve", branch):
+            response = asyncio.run(engine.retrieve_parallel("What does 30 CFR § 75.400 say?"))
+
+        assert response.section_lookup is None
+        assert response.vector_result.method == "vector_rag"
@@ -0,0 +1,144 @@
+# -------------------------------------------------------------------------
+# File: test_semantic_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_semantic_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the semantic response cache in backend/semantic_cache.py
+# Tests similarity threshold, strategy/template partitioning, TTL expiry,
+# size bounds, duplicate replacement, and hit metadata.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Semantic Cache Unit Tests
+
+Testing of the SemanticResponseCache class:
+- Hits above the similarity threshold, misses below it
+- Entries are scoped to (fusion_strategy, template_type, cited CFR sections)
+- Matrix and pure-Python scans agree
+- TTL expiry and LRU size bounds
+- Near-duplicate stores replace existing entries
+"""
+
+import pytest
+import time
+from unittest.mock import patch
+
+from backend import semantic_cache
+from backend.semantic_cache import SemanticResponseCache
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+STRATEGY = "advanced_hybrid"
+TEMPLATE = "regulatory_compliance"
+QUESTION = "What are the methane monitoring rules?"
+
+@pytest.fixture
+def cache():
+    """Provide a cache with a 0.9 similarity threshold."""
+    return SemanticResponseCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=3)
+
+def store(cache, query, embedding, strategy=STRATEGY, template=TEMPLATE):
+    """Store a response whose text mirrors the query."""
+    cache.store(query, embedding, strategy, template, f"answer to {query}", {"context_fusion": {"strategy": strategy}})
+
+
+# =========================================================================
+# Unit Tests for SemanticResponseCache
+# =========================================================================
+
+@pytest.mark.unit
+class TestSemanticResponseCache:
+    """Test SemanticResponseCache lookup and storage behavior."""
+
+    def test_hit_above_threshold(self, cache):
+        """Test that a near-identical embedding returns the stored response."""
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+        hit = cache.lookup(QUESTION, [0.99, 0.05, 0.0], STRATEGY, TEMPLATE)
+
+        assert hit is not None
+        assert hit.entry.response == "answer to methane monitoring"
+        assert hit.similarity > 0.9
+        assert hit.to_metadata()["hit"] is True
+
+    def test_miss_below_threshold(self, cache):
+        """Test that dissimilar embeddings miss."""
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+
+        assert cache.lookup(QUESTION, [0.0, 1.0, 0.0], STRATEGY, TEMPLATE) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_partitioned_by_strategy_and_template(self, cache):
+        """Test that entries only match the same fusion strategy and template type."""
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0], "weighted_linear", TEMPLATE) is None
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0], STRATEGY, "basic_hybrid") is None
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0], STRATEGY, TEMPLATE) is not None
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are not served."""
+        cache = SemanticResponseCache(similarity_threshold=0.9, ttl_seconds=0.01)
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+        time.sleep(0.02)
+
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0], STRATEGY, TEMPLATE) is None
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 0
+
+    def test_size_bound_evicts_least_recently_used(self, cache):
+        """Test LRU eviction once max_entries is exceeded."""
+        store(cache, "a", [1.0, 0.0, 0.0, 0.0])
+        store(cache, "b", [0.0, 1.0, 0.0, 0.0])
+        store(cache, "c", [0.0, 0.0, 1.0, 0.0])
+        cache.lookup(QUESTION, [1.0, 0.0, 0.0, 0.0], STRATEGY, TEMPLATE)  # "a" becomes most recent
+        store(cache, "d", [0.0, 0.0, 0.0, 1.0])                # evicts "b"
+
+        assert cache.lookup(QUESTION, [0.0, 1.0, 0.0, 0.0], STRATEGY, TEMPLATE) is None
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0, 0.0], STRATEGY, TEMPLATE) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_near_duplicate_store_replaces_entry(self, cache):
+        """Test that storing a paraphrase replaces the existing entry."""
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+        store(cache, "methane monitoring rules", [0.99, 0.05, 0.0])
+
+        assert cache.get_stats()["entries"] == 1
+        hit = cache.lookup(QUESTION, [1.0, 0.0, 0.0], STRATEGY, TEMPLATE)
+        assert hit.entry.query == "methane monitoring rules"
+
+    def test_partitioned_by_cited_sections(self, cache):
+        """Test that questions citing other CFR sections are never served the cached answer."""
+        store(cache, "What does 30 CFR § 75.400 require?", [1.0, 0.0, 0.0])
+
+        assert cache.lookup("What does 30 CFR § 75.401 require?", [1.0, 0.0, 0.0], STRATEGY, TEMPLATE) is None
+        assert cache.lookup(QUESTION, [1.0, 0.0, 0.0], STRATEGY, TEMPLATE) is None
+        hit = cache.lookup("Explain section 75.400 requirements", [0.99, 0.05, 0.0], STRATEGY, TEMPLATE)
+        assert hit.entry.query == "What does 30 CFR § 75.400 require?"
+
+    def test_python_scan_matches_matrix_scan(self, cache):
+        """Test that lookups without numpy return the same match."""
+        store(cache, "methane monitoring", [1.0, 0.0, 0.0])
+        store(cache, "roof control", [0.0, 1.0, 0.0])
+
+        with patch.object(semantic_cache, "np", None):
+            fallback = SemanticResponseCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=3)
+            store(fallback, "methane monitoring", [1.0, 0.0, 0.0])
+            store(fallback, "roof control", [0.0, 1.0, 0.0])
+            expected = fallback.lookup(QUESTION, [0.1, 0.98, 0.0], STRATEGY, TEMPLATE)
+
+        hit = cache.lookup(QUESTION, [0.1, 0.98, 0.0], STRATEGY, TEMPLATE)
+        assert hit.entry.query == expected.entry.query == "roof control"
+        assert hit.similarity == pytest.approx(expected.similarity, rel=1e-5)
@@ -0,0 +1,138 @@
+# -------------------------------------------------------------------------
+# File: test_single_flight.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_single_flight.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for single-flight request coalescing in backend/single_flight.py
+# Tests that concurrent duplicates share one execution, that errors propagate,
+# that follower waits are bounded, and that flights end with their leader.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Single-Flight Coalescing Unit Tests
+
+Testing of the SingleFlight class:
+- Concurrent identical keys run the operation once
+- Different keys and sequential calls are not coalesced
+- Leader errors reach every follower
+- Followers fail after follower_timeout_seconds (never less than request_timeout)
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend import single_flight as single_flight_module
+from backend.single_flight import SingleFlight, SingleFlightTimeoutError
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+class CountingOperation:
+    """Slow operation factory that counts executions."""
+
+    def __init__(self, seconds=0.02, result="answer", error=None):
+        self.seconds = seconds
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.seconds)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+# =========================================================================
+# Unit Tests for SingleFlight
+# =========================================================================
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test SingleFlight coalescing and bounds."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_execution(self):
+        """Test that concurrent identical requests run the operation once."""
+        single_flight = SingleFlight()
+        operation = CountingOperation()
+        key = SingleFlight.make_key("What are methane limits?", "advanced_hybrid", "regulatory_compliance")
+
+        results = await asyncio.gather(*(single_flight.run(key, operation) for _ in range(10)))
+        stats = single_flight.get_stats()
+
+        assert operation.calls == 1
+        assert all(result == "answer" for result, _ in results)
+        assert sum(coalesced for _, coalesced in results) == 9
+        assert stats["leaders"] == 1 and stats["coalesced"] == 9
+        assert stats["in_flight"] == 0 and stats["waiting_followers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_keys_and_sequential_calls_not_coalesced(self):
+        """Test that different keys, and calls after a flight ends, run separately."""
+        single_flight = SingleFlight()
+        operation = CountingOperation(seconds=0.0)
+        key_a = SingleFlight.make_key("methane limits", "advanced_hybrid", "regulatory_compliance")
+        key_b = SingleFlight.make_key("methane limits", "vector_focused", "regulatory_compliance")
+
+        await asyncio.gather(single_flight.run(key_a, operation), single_flight.run(key_b, operation))
+        await single_flight.run(key_a, operation)
+
+        assert operation.calls == 3
+        assert single_flight.get_stats()["coalesced"] == 0
+
+    def test_key_normalization(self):
+        """Test that case and whitespace variants share a key."""
+        assert SingleFlight.make_key("Methane  LIMITS", "s", "t") == SingleFlight.make_key(" methane limits", "s", "t")
+
+    @pytest.mark.asyncio
+    async def test_leader_error_propagates_to_followers(self):
+        """Test that followers receive the leader's exception."""
+        single_flight = SingleFlight()
+        operation = CountingOperation(error=RuntimeError("graph unavailable"))
+
+        results = await asyncio.gather(*(single_flight.run("k", operation) for _ in range(3)),
+                                       return_exceptions=True)
+
+        assert operation.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert single_flight.get_stats()["leader_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_follower_wait_is_bounded(self):
+        """Test that a follower fails instead of running the operation when the leader is stuck."""
+        single_flight = SingleFlight(follower_timeout_seconds=0.02)
+        stuck = CountingOperation(seconds=0.5, result="late")
+        fast = CountingOperation(seconds=0.0, result="own")
+
+        leader = asyncio.create_task(single_flight.run("k", stuck))
+        await asyncio.sleep(0)
+        with pytest.raises(SingleFlightTimeoutError):
+            await single_flight.run("k", fast)
+        leader.cancel()
+
+        assert fast.calls == 0
+        assert single_flight.get_stats()["follower_timeouts"] == 1
+
+    def test_follower_timeout_at_least_request_timeout(self):
+        """Test that the configured follower wait is raised to the request timeout."""
+        config = SimpleNamespace(single_flight_enabled=True, single_flight_follower_timeout_seconds=30.0,
+                                 request_timeout=120)
+
+        with patch.object(single_flight_module, "get_config", return_value=config), \
+                patch.object(single_flight_module, "_single_flight", None):
+            assert single_flight_module.get_single_flight().follower_timeout_seconds == 120
@@ -0,0 +1,106 @@
+# -------------------------------------------------------------------------
+# File: test_single_shot_generation.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_single_shot_generation.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for single-shot generation: advanced hybrid fusion without its LLM
+# call (backend/context_fusion.py) and the template prompt built from the raw
+# contexts and adaptive weights (backend/hybrid_templates.py).
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Single-Shot Generation Unit Tests
+
+Testing of single-shot advanced hybrid fusion:
+- No fusion LLM call is made
+- Weights, complementarity and confidence match two-stage fusion
+- Every template receives both raw contexts and their weights
+"""
+
+import asyncio
+import pytest
+
+from backend.context_fusion import HybridContextFusion, FusionStrategy
+from backend.hybrid_templates import HybridPromptTemplate, TemplateType
+from backend.parallel_hybrid import ParallelRetrievalResponse, RetrievalResult
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+VECTOR_CONTENT = "Under 30 CFR § 75.323(b), the operator shall act when 1.0 percent methane is present."
+GRAPH_CONTENT = "Escapeways shall be examined weekly under 30 CFR § 75.380 by a certified person."
+
+class CountingLLM:
+    """Fake fusion LLM that counts invoke() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return "Fused answer citing § 75.323(b) and § 75.380."
+
+def make_response():
+    """Build a fusion-ready parallel retrieval response."""
+    return ParallelRetrievalResponse(
+        vector_result=RetrievalResult(content=VECTOR_CONTENT, method="vector_rag", confidence=0.8, response_time_ms=10),
+        graph_result=RetrievalResult(content=GRAPH_CONTENT, method="graph_rag", confidence=0.6, response_time_ms=10),
+        query="methane and escapeway rules",
+        total_time_ms=10,
+        success=True,
+        fusion_ready=True
+    )
+
+def fuse(single_shot):
+    """Fuse the fixture response with advanced hybrid fusion; returns (result, llm)."""
+    engine = HybridContextFusion()
+    engine.llm = CountingLLM()
+    result = asyncio.run(engine.fuse_contexts(make_response(), FusionStrategy.ADVANCED_HYBRID,
+                                              single_shot=single_shot))
+    return result, engine.llm
+
+
+# =========================================================================
+# Unit Tests for Single-Shot Fusion
+# =========================================================================
+
+@pytest.mark.unit
+class TestSingleShotFusion:
+    """Test advanced hybrid fusion with the LLM call deferred to the template."""
+
+    def test_no_fusion_llm_call_and_metrics_unchanged(self):
+        """Test that single-shot skips the fusion LLM and keeps the two-stage metrics."""
+        two_stage, two_stage_llm = fuse(single_shot=False)
+        single_shot, single_shot_llm = fuse(single_shot=True)
+
+        assert two_stage_llm.calls == 1
+        assert single_shot_llm.calls == 0
+        assert two_stage.single_shot is None
+        assert single_shot.vector_contribution == two_stage.vector_contribution
+        assert single_shot.graph_contribution == two_stage.graph_contribution
+        assert single_shot.final_confidence == two_stage.final_confidence
+        assert single_shot.metadata["complementarity_score"] == two_stage.metadata["complementarity_score"]
+        assert single_shot.metadata["fusion_method"] == "single_shot_deferred"
+
+    def test_every_template_receives_raw_contexts_and_weights(self):
+        """Test that the prompt holds both raw contexts, their weights and merge instructions."""
+        result, _ = fuse(single_shot=True)
+        template = HybridPromptTemplate()
+
+        for template_type in TemplateType:
+            prompt = template.create_hybrid_prompt("methane and escapeway rules", result, template_type)
+
+            assert f"Vector Search Results (Weight: {result.vector_contribution:.2f}):\n{VECTOR_CONTENT}" in prompt
+            assert f"Graph Analysis Results (Weight: {result.graph_contribution:.2f}):\n{GRAPH_CONTENT}" in prompt
+            assert "have not been merged" in prompt
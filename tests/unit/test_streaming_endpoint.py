@@ -0,0 +1,312 @@
+# -------------------------------------------------------------------------
+# File: test_streaming_endpoint.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_streaming_endpoint.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the server-sent event endpoint /generate_parallel_hybrid/stream
+# in backend/main.py, with the retrieval, fusion and generation engines faked.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Streaming Endpoint Unit Tests
+
+Testing of stream_parallel_hybrid_response():
+- Events arrive in order: retrieval and fusion stages, tokens, then done
+- Pipeline failures end the stream with an error event
+- Semantic cache hits stream the stored answer without running the pipeline
+- Streaming requests join the single-flight coalescing of /generate_parallel_hybrid
+- Only an explicitly requested fusion strategy keeps the graph branch on a section index hit
+- Fallback answers and answers from a timed-out branch are not stored in the semantic cache
+- An LLM failure after the first token ends the stream with an error event
+- Streamed generation records prompt construction and LLM spans with the time to first token
+"""
+
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+pytest.importorskip("fastapi")
+
+from backend import hybrid_templates, llm, main
+from backend.main import ParallelHybridRequest, stream_parallel_hybrid_response
+from backend.semantic_cache import SemanticResponseCache
+from backend.single_flight import SingleFlight
+from backend.tracing import start_trace
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+QUESTION = "What are the methane monitoring requirements?"
+TOKENS = ["Methane ", "must be ", "tested."]
+
+class FakeParallelEngine:
+    """Parallel retrieval engine returning one fusion-ready result."""
+
+    def __init__(self, error=None, delay=0.0):
+        self.error = error
+        self.delay = delay
+        self.graph_timed_out = False
+        self.calls = 0
+        self.skip_graph_flags = []
+
+    async def retrieve_parallel(self, query, skip_graph_on_section_hit=True):
+        self.calls += 1
+        self.skip_graph_flags.append(skip_graph_on_section_hit)
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        vector = SimpleNamespace(method="vector_rag", confidence=0.8, timed_out=False, error=None,
+                                 chunks=None, metadata={})
+        graph = SimpleNamespace(method="graph_rag", confidence=0.8, timed_out=self.graph_timed_out,
+                                error="Timed out" if self.graph_timed_out else None, chunks=None, metadata={})
+        return SimpleNamespace(fusion_ready=True, vector_result=vector, graph_result=graph,
+                               total_time_ms=12.0, section_lookup=None)
+
+class FakeFusionEngine:
+    """Context fusion engine returning a fixed fusion result."""
+
+    async def fuse_contexts(self, parallel_response, strategy):
+        return SimpleNamespace(fusion_strategy=strategy.value, fused_content="Methane must be tested.",
+                               final_confidence=0.75, fusion_quality_score=0.7,
+                               vector_contribution=0.5, graph_contribution=0.5, content_analysis=None,
+                               single_shot=None, metadata={})
+
+async def fake_stream_hybrid_response(**kwargs):
+    """Stream the fixed answer tokens."""
+    for text in TOKENS:
+        yield text
+
+async def fake_generate_hybrid_response(**kwargs):
+    """Return the fixed answer in one piece."""
+    return "".join(TOKENS)
+
+@pytest.fixture
+def engines():
+    """Patch the pipeline engines, disable the semantic cache, and use a fresh coalescer."""
+    parallel_engine = FakeParallelEngine()
+    with patch.object(main, "get_parallel_engine", return_value=parallel_engine), \
+            patch.object(main, "get_fusion_engine", return_value=FakeFusionEngine()), \
+            patch.object(main, "stream_hybrid_response", fake_stream_hybrid_response), \
+            patch.object(main, "generate_hybrid_response", fake_generate_hybrid_response), \
+            patch.object(main, "get_semantic_cache", return_value=None), \
+            patch.object(main, "get_single_flight", return_value=SingleFlight()):
+        yield parallel_engine
+
+class FailingLLM:
+    """LLM whose calls raise, as during an OpenAI outage."""
+
+    def invoke(self, prompt):
+        raise RuntimeError("OpenAI unavailable")
+
+class StreamingLLM:
+    """LLM streaming fixed chunks, optionally failing after them."""
+
+    def __init__(self, parts, error=None):
+        self.parts = parts
+        self.error = error
+
+    async def astream(self, prompt):
+        for part in self.parts:
+            yield SimpleNamespace(content=part)
+        if self.error:
+            raise self.error
+
+@pytest.fixture
+def real_generation():
+    """Use the real template streaming and generation functions with a stub template engine."""
+    template_engine = SimpleNamespace(create_hybrid_prompt=lambda *args: "prompt")
+    with patch.object(main, "stream_hybrid_response", hybrid_templates.stream_hybrid_response), \
+            patch.object(main, "generate_hybrid_response", hybrid_templates.generate_hybrid_response), \
+            patch.object(hybrid_templates, "get_template_engine", return_value=template_engine):
+        yield
+
+@pytest.fixture
+def cache():
+    """Semantic cache wired into the pipeline, with every question embedded to the same vector."""
+    semantic_cache = SemanticResponseCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+
+    async def embed(user_input):
+        return [1.0, 0.0]
+
+    with patch.object(main, "get_semantic_cache", return_value=semantic_cache), \
+            patch.object(main, "_embed_for_semantic_cache", embed):
+        yield semantic_cache
+
+async def collect_events(request):
+    """Run the endpoint and parse its server-sent events into (event, data) pairs."""
+    response = await stream_parallel_hybrid_response(request, session_id="stream-session")
+    frames = [frame async for frame in response.body_iterator]
+    events = []
+    for frame in frames:
+        event_line, data_line = frame.strip().split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+    return events
+
+
+# =========================================================================
+# Unit Tests for the Streaming Endpoint
+# =========================================================================
+
+@pytest.mark.unit
+class TestStreamingEndpoint:
+    """Test /generate_parallel_hybrid/stream event sequences."""
+
+    @pytest.mark.asyncio
+    async def test_event_order(self, engines):
+        """Test that stages precede tokens and done carries the joined answer."""
+        events = await collect_events(ParallelHybridRequest(user_input=QUESTION))
+
+        assert [event for event, _ in events] == ["stage", "stage", "token", "token", "token", "done"]
+        assert [data["stage"] for event, data in events if event == "stage"] == ["retrieval", "fusion"]
+        assert [data["text"] for event, data in events if event == "token"] == TOKENS
+        done = events[-1][1]
+        assert done["response"] == "".join(TOKENS)
+        assert done["metadata"]["streaming"]["chunks"] == 3
+        assert done["metadata"]["streaming"]["time_to_first_token_ms"] is not None
+        assert done["metadata"]["single_flight"] == {"coalesced": False}
+
+    @pytest.mark.asyncio
+    async def test_error_event(self, engines):
+        """Test that a pipeline failure ends the stream with an error event."""
+        engines.error = RuntimeError("graph store unavailable")
+
+        events = await collect_events(ParallelHybridRequest(user_input=QUESTION))
+
+        assert [event for event, _ in events] == ["error"]
+        assert events[0][1]["message"] == "graph store unavailable"
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_streams_stored_answer(self, engines):
+        """Test that a cache hit reports the cache stage and skips the pipeline."""
+        request = ParallelHybridRequest(user_input=QUESTION)
+        cache = SemanticResponseCache(similarity_threshold=0.9, ttl_seconds=60, max_entries=10)
+        cache.store(QUESTION, [1.0, 0.0], main._fusion_strategy_key(request), "regulatory_compliance",
+                    "Cached methane answer.", {"context_fusion": {"strategy": "advanced_hybrid"}})
+
+        async def embed(user_input):
+            return [1.0, 0.0]
+
+        with patch.object(main, "get_semantic_cache", return_value=cache), \
+                patch.object(main, "_embed_for_semantic_cache", embed):
+            events = await collect_events(request)
+
+        assert [event for event, _ in events] == ["stage", "token", "done"]
+        assert events[0][1]["stage"] == "cache" and events[0][1]["hit"] is True
+        assert events[1][1]["text"] == "Cached methane answer."
+        assert events[2][1]["metadata"]["cache"]["hit"] is True
+        assert events[2][1]["metadata"]["streaming"]["chunks"] == 1
+        assert engines.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_joins_single_flight(self, engines):
+        """Test that a stream and a concurrent identical request share one pipeline run."""
+        engines.delay = 0.05
+        request = ParallelHybridRequest(user_input=QUESTION)
+
+        events, response = await asyncio.gather(
+            collect_events(request),
+            main._answer_request(request, "other-session", 0.0)
+        )
+
+        assert engines.calls == 1
+        assert events[-1][1]["response"] == response.response == "".join(TOKENS)
+        coalesced = [events[-1][1]["metadata"]["single_flight"]["coalesced"],
+                     response.metadata["single_flight"]["coalesced"]]
+        assert sorted(coalesced) == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_requested_strategy_keeps_graph_branch(self, engines):
+        """Test that only a request naming a fusion strategy disables the section index shortcut."""
+        await collect_events(ParallelHybridRequest(user_input=QUESTION))
+        events = await collect_events(ParallelHybridRequest(user_input=QUESTION, fusion_strategy="advanced_hybrid"))
+
+        assert engines.skip_graph_flags == [True, False]
+        assert events[-1][1]["metadata"]["context_fusion"]["applied_strategy"] == "advanced_hybrid"
+
+
+# =========================================================================
+# Unit Tests for Semantic Cache Stores
+# =========================================================================
+
+@pytest.mark.unit
+class TestSemanticCacheStore:
+    """Test which pipeline answers are stored in the semantic cache."""
+
+    @pytest.mark.asyncio
+    async def test_complete_answer_is_cached(self, engines, cache):
+        """Test that an answer from both branches and the LLM is stored."""
+        await main._answer_request(ParallelHybridRequest(user_input=QUESTION), "session", 0.0)
+
+        assert cache.get_stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_is_not_cached(self, engines, cache, real_generation):
+        """Test that the fallback answer served during an LLM failure is not stored."""
+        with patch.object(llm, "get_llm", return_value=FailingLLM()):
+            response = await main._answer_request(ParallelHybridRequest(user_input=QUESTION), "session", 0.0)
+
+        assert "Methane must be tested." in response.response
+        assert response.metadata["hybrid_template"]["generation"]["outcome"] == "fallback"
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_branch_is_not_cached(self, engines, cache):
+        """Test that an answer built without the timed-out graph branch is not stored."""
+        engines.graph_timed_out = True
+
+        await main._answer_request(ParallelHybridRequest(user_input=QUESTION), "session", 0.0)
+
+        assert cache.get_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_after_first_token_sends_error(self, engines, cache, real_generation):
+        """Test that a stream failing part way ends with an error event and is not stored."""
+        streaming_llm = StreamingLLM(["Methane must be tested at the start of each shift ", "and "],
+                                     error=RuntimeError("connection reset"))
+
+        with patch.object(llm, "get_llm", return_value=streaming_llm):
+            events = await collect_events(ParallelHybridRequest(user_input=QUESTION))
+
+        assert [event for event, _ in events][-2:] == ["token", "error"]
+        assert events[-1][1]["message"] == "connection reset"
+        assert cache.get_stats()["entries"] == 0
+
+
+# =========================================================================
+# Unit Tests for Streamed Generation Tracing
+# =========================================================================
+
+@pytest.mark.unit
+class TestStreamedGenerationTracing:
+    """Test the spans recorded by stream_hybrid_response()."""
+
+    @pytest.mark.asyncio
+    async def test_llm_span_records_time_to_first_token(self, real_generation):
+        """Test that prompt construction and the streamed LLM call are traced."""
+        fusion_result = SimpleNamespace(fused_content="", fusion_strategy="advanced_hybrid",
+                                        final_confidence=0.75, metadata={})
+        config = SimpleNamespace(tracing_enabled=True, tracing_export_path="", tracing_otlp_endpoint="")
+
+        with patch("backend.tracing.get_config", return_value=config), \
+                patch.object(llm, "get_llm", return_value=StreamingLLM(["Methane ", "must be ", "tested."])):
+            with start_trace("request") as trace:
+                chunks = [text async for text in hybrid_templates.stream_hybrid_response(QUESTION, fusion_result)]
+
+        spans = {recorded.name: recorded for recorded in trace.spans}
+        assert "".join(chunks) == "Methane must be tested."
+        assert "prompt_construction" in spans
+        assert spans["llm.generate"].attributes["streamed"] is True
+        assert spans["llm.generate"].attributes["time_to_first_token_ms"] >= 0
@@ -0,0 +1,161 @@
+# -------------------------------------------------------------------------
+# File: test_tracing.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_tracing.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for span-based request tracing in backend/tracing.py
+# Tests span nesting across asyncio tasks and thread pool work, the
+# metadata summary, OTLP/JSON conversion and the file exporter.
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Request Tracing Unit Tests
+
+Testing of the tracing helpers:
+- Spans nest under the current span, including concurrent tasks and bound threads
+- Spans outside a trace are no-ops
+- Errors are recorded on the span
+- Traces convert to OTLP/JSON and export as JSON lines
+"""
+
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.tracing import OTLPJsonExporter, bind_context, span, start_trace, traced
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+@pytest.fixture(autouse=True)
+def tracing_config():
+    """Enable tracing without an exporter."""
+    config = SimpleNamespace(tracing_enabled=True, tracing_export_path="", tracing_otlp_endpoint="")
+    with patch("backend.tracing.get_config", return_value=config):
+        yield config
+
+@traced("branch")
+async def branch(seconds):
+    """Traced coroutine with a nested span."""
+    with span("inner", seconds=seconds):
+        await asyncio.sleep(seconds)
+
+
+# =========================================================================
+# Unit Tests for Spans
+# =========================================================================
+
+@pytest.mark.unit
+class TestSpans:
+    """Test span recording and nesting."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_nest_under_parent(self):
+        """Test that spans in gathered tasks get the enclosing span as parent."""
+        with start_trace("request") as trace:
+            with span("retrieve_parallel") as parent:
+                await asyncio.gather(branch(0.01), branch(0.02))
+
+        by_name = {}
+        for recorded in trace.spans:
+            by_name.setdefault(recorded.name, []).append(recorded)
+        assert parent.parent_id == trace.root.span_id
+        assert all(recorded.parent_id == parent.span_id for recorded in by_name["branch"])
+        branch_ids = {recorded.span_id for recorded in by_name["branch"]}
+        assert all(recorded.parent_id in branch_ids for recorded in by_name["inner"])
+
+        summary = trace.summary()
+        assert summary["stages"]["branch"]["count"] == 2
+        assert summary["stages"]["inner"]["max_ms"] >= 15
+        assert list(summary["stages"])[0] == "retrieve_parallel"
+
+    @pytest.mark.asyncio
+    async def test_bound_thread_work_joins_trace(self):
+        """Test that bind_context() carries the trace into run_in_executor work."""
+        def blocking_query():
+            with span("neo4j.query"):
+                return 42
+
+        with start_trace("request") as trace:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, bind_context(blocking_query))
+            await loop.run_in_executor(None, blocking_query)
+
+        assert [recorded.name for recorded in trace.spans] == ["neo4j.query"]
+
+    def test_span_outside_trace_is_noop(self):
+        """Test that spans without a trace record nothing."""
+        with span("orphan") as current:
+            assert current is None
+
+    def test_error_recorded(self):
+        """Test that an exception marks the span as failed and propagates."""
+        with pytest.raises(ValueError):
+            with start_trace("request") as trace:
+                with span("cypher.generate"):
+                    raise ValueError("bad cypher")
+
+        assert trace.spans[0].error == "bad cypher"
+        assert trace.summary()["stages"]["cypher.generate"]["errors"] == 1
+
+    def test_disabled(self, tracing_config):
+        """Test that start_trace yields None when tracing is disabled."""
+        tracing_config.tracing_enabled = False
+        with start_trace("request") as trace:
+            assert trace is None
+
+
+# =========================================================================
+# Unit Tests for OTLP/JSON Export
+# =========================================================================
+
+@pytest.mark.unit
+class TestOTLPExport:
+    """Test OTLP/JSON conversion and the file exporter."""
+
+    def test_otlp_payload(self):
+        """Test the ExportTraceServiceRequest structure."""
+        with start_trace("request", session_id="abc") as trace:
+            with span("fuse_contexts", strategy="advanced_hybrid", chunks=3):
+                pass
+
+        payload = trace.to_otlp("mrca-backend")
+        resource_spans = payload["resourceSpans"][0]
+        spans = resource_spans["scopeSpans"][0]["spans"]
+        assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "mrca-backend"}
+        assert len(spans) == 2
+        root, child = spans
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert "parentSpanId" not in root
+        assert child["parentSpanId"] == root["spanId"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+        assert {"key": "chunks", "value": {"intValue": "3"}} in child["attributes"]
+
+    def test_file_exporter_writes_json_lines(self, tmp_path, tracing_config):
+        """Test that finished traces are appended to the export file."""
+        export_path = tmp_path / "traces" / "otlp.jsonl"
+        exporter = OTLPJsonExporter(file_path=str(export_path))
+        with patch("backend.tracing.get_trace_exporter", return_value=exporter):
+            for _ in range(2):
+                with start_trace("request"):
+                    with span("llm.generate"):
+                        pass
+        exporter.flush()
+
+        lines = export_path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][1]["name"] == "llm.generate"
+        assert exporter.get_stats()["exported"] == 2
@@ -0,0 +1,106 @@
+# -------------------------------------------------------------------------
+# File: test_two_tier_cache.py
+# Project: MRCA - Mining Regulatory Compliance Assistant
+#          Advanced Parallel HybridRAG - Intelligent Fusion System
+# Author: Alexander Ricciardi
+# Last Modified: 2025-07-25
+# File Path: tests/unit/test_two_tier_cache.py
+# ------------------------------------------------------------------------
+
+# --- Module Objective ---
+# Unit tests for the memory LRU + SQLite store shared by the embedding and
+# generated-Cypher caches (backend/two_tier_cache.py).
+
+# --- Apache-2.0 ---
+# © 2025 Alexander Samuel Ricciardi - Mining Regulatory Compliance Assistant
+# License: Apache-2.0 | Technology: Advanced Parallel HybridRAG - Intelligent Fusion System
+# -------------------------------------------------------------------------
+
+"""
+Two-Tier Store Unit Tests
+
+Testing of the TwoTierStore class:
+- Values are encoded on disk and decoded on disk hits
+- delete() removes a key from both tiers
+- Buffered last-used times are flushed once LAST_USED_FLUSH_BATCH hits accumulate
+- A table with an older column layout is replaced
+"""
+
+import sqlite3
+import pytest
+from unittest.mock import patch
+
+from backend import two_tier_cache
+from backend.two_tier_cache import TwoTierStore
+
+
+# =========================================================================
+# Test Fixtures
+# =========================================================================
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Provide a temporary SQLite path."""
+    return str(tmp_path / "store.sqlite3")
+
+def make_store(db_path, **kwargs):
+    """Store of upper-cased strings encoded as lower case on disk."""
+    return TwoTierStore("Test cache", "entries", max_memory_entries=kwargs.pop("max_memory_entries", 8),
+                        db_path=db_path, encode=str.lower, decode=str.upper, **kwargs)
+
+
+# =========================================================================
+# Unit Tests for TwoTierStore
+# =========================================================================
+
+@pytest.mark.unit
+class TestTwoTierStore:
+    """Test TwoTierStore tiers, encoding and maintenance."""
+
+    def test_disk_values_are_encoded(self, db_path):
+        """Test that a second instance decodes what the first encoded."""
+        make_store(db_path).put("k", "ROOF CONTROL PLAN", info="diagnostic")
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT value, info FROM entries").fetchone() == ("roof control plan", "diagnostic")
+        reader = make_store(db_path)
+        assert reader.get("k") == "ROOF CONTROL PLAN"
+        assert reader.get_stats()["disk_hits"] == 1
+
+    def test_delete_removes_both_tiers(self, db_path):
+        """Test that a deleted key misses in memory and on disk."""
+        store = make_store(db_path)
+        store.put("k", "VALUE")
+        store.delete("k")
+
+        assert store.get("k") is None
+        assert make_store(db_path).get("k") is None
+
+    def test_last_used_flushed_in_batches(self, db_path):
+        """Test that disk hits write their last-used times together once the buffer fills."""
+        writer = make_store(db_path)
+        for key in ("a", "b"):
+            writer.put(key, "VALUE")
+        conn = sqlite3.connect(db_path)
+        before = dict(conn.execute("SELECT key, last_used FROM entries"))
+
+        with patch.object(two_tier_cache, "LAST_USED_FLUSH_BATCH", 2):
+            reader = make_store(db_path)
+            reader.get("a")
+            assert dict(conn.execute("SELECT key, last_used FROM entries")) == before
+            reader.get("b")
+
+        after = dict(conn.execute("SELECT key, last_used FROM entries"))
+        assert all(after[key] > before[key] for key in before)
+
+    def test_old_table_layout_is_replaced(self, db_path):
+        """Test that a table from an older cache layout is dropped instead of failing writes."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, model TEXT, vector BLOB, last_used REAL)")
+        conn.commit()
+
+        store = make_store(db_path)
+        store.put("k", "VALUE")
+
+        assert store.get_stats()["disk_errors"] == 0
+        assert make_store(db_path).get("k") == "VALUE"